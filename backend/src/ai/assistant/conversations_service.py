@@ -3,9 +3,10 @@ from datetime import UTC, datetime
 from typing import TypedDict, cast
 
 from pydantic import JsonValue
-from sqlalchemy import func, select
+from sqlalchemy import Text, and_, func, literal, select
 from sqlalchemy.dialects.postgresql import insert as postgres_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from src.exceptions import NotFoundError, ValidationError
 
@@ -17,6 +18,8 @@ MAX_CONVERSATIONS_PAGE_SIZE = 100
 CONVERSATION_PREVIEW_LENGTH = 140
 CONVERSATION_STATUS_REGULAR = "regular"
 CONVERSATION_STATUS_ARCHIVED = "archived"
+# Guards the branch walk against parent-link cycles in malformed history.
+_MAX_BRANCH_DEPTH = 10_000
 
 
 class AssistantConversationHistoryItemPayload(TypedDict):
@@ -34,6 +37,14 @@ class AssistantConversationHistoryPayload(TypedDict):
     messages: list[AssistantConversationHistoryItemPayload]
 
 
+class AssistantConversationBranchPayload(TypedDict):
+    """Newest-first slice of one conversation branch and where its walk ended."""
+
+    messages: list[dict[str, JsonValue]]
+    reached_start: bool
+    reached_stop: bool
+
+
 class AssistantConversationPayload(TypedDict):
     """Assistant conversation summary payload returned by the service."""
 
@@ -422,6 +433,111 @@ async def delete_assistant_conversation(
     await session.flush()
 
 
+async def lock_assistant_conversation(
+    *,
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    conversation_id: uuid.UUID,
+) -> AssistantConversation:
+    """Load one owned conversation and lock its row until the transaction ends."""
+    conversation = await session.scalar(
+        select(AssistantConversation)
+        .where(
+            AssistantConversation.id == conversation_id,
+            AssistantConversation.user_id == user_id,
+        )
+        .with_for_update()
+    )
+    if conversation is None:
+        raise AssistantConversationNotFoundError
+    return conversation
+
+
+async def get_assistant_conversation_head_item(
+    *,
+    session: AsyncSession,
+    conversation: AssistantConversation,
+) -> AssistantConversationHistoryItem | None:
+    """Return the conversation's head history item, falling back to the latest inserted one."""
+    query = select(AssistantConversationHistoryItem).where(
+        AssistantConversationHistoryItem.conversation_id == conversation.id
+    )
+    if conversation.head_message_id:
+        query = query.where(AssistantConversationHistoryItem.aui_message_id == conversation.head_message_id)
+    else:
+        query = query.order_by(AssistantConversationHistoryItem.seq.desc()).limit(1)
+    return await session.scalar(query)
+
+
+async def load_assistant_conversation_branch(
+    *,
+    session: AsyncSession,
+    conversation_id: uuid.UUID,
+    from_message_id: str | None,
+    stop_before_message_id: str | None,
+    max_chars: int,
+) -> AssistantConversationBranchPayload:
+    """Load the active branch ending at ``from_message_id``, newest first, by following parent links.
+
+    The walk stops before ``stop_before_message_id`` (the last message a rolling
+    summary covers), at the first message of the thread, or once the loaded
+    messages exceed ``max_chars`` of JSON, so the rows read stay bounded however
+    long the thread is.
+    """
+    if from_message_id is None:
+        return {"messages": [], "reached_start": True, "reached_stop": False}
+    if from_message_id == stop_before_message_id:
+        return {"messages": [], "reached_start": False, "reached_stop": True}
+
+    item = AssistantConversationHistoryItem
+    message_chars = func.length(item.message_json.cast(Text))
+    branch = (
+        select(
+            item.aui_message_id,
+            item.parent_aui_message_id,
+            item.message_json,
+            literal(1).label("depth"),
+            message_chars.label("loaded_chars"),
+        )
+        .where(item.conversation_id == conversation_id, item.aui_message_id == from_message_id)
+        .cte("branch", recursive=True)
+    )
+    parent = aliased(AssistantConversationHistoryItem)
+    branch = branch.union_all(
+        select(
+            parent.aui_message_id,
+            parent.parent_aui_message_id,
+            parent.message_json,
+            branch.c.depth + 1,
+            branch.c.loaded_chars + func.length(parent.message_json.cast(Text)),
+        )
+        .join(
+            branch,
+            and_(
+                parent.conversation_id == conversation_id,
+                parent.aui_message_id == branch.c.parent_aui_message_id,
+            ),
+        )
+        .where(
+            branch.c.loaded_chars < max_chars,
+            branch.c.depth < _MAX_BRANCH_DEPTH,
+            parent.aui_message_id.is_distinct_from(stop_before_message_id),
+        )
+    )
+    rows = (
+        await session.execute(
+            select(branch.c.parent_aui_message_id, branch.c.message_json).order_by(branch.c.depth.asc())
+        )
+    ).all()
+
+    oldest_parent_id = rows[-1].parent_aui_message_id if rows else None
+    return {
+        "messages": [_normalize_history_message_payload(row.message_json) for row in rows],
+        "reached_start": bool(rows) and oldest_parent_id is None,
+        "reached_stop": oldest_parent_id is not None and oldest_parent_id == stop_before_message_id,
+    }
+
+
 async def load_assistant_conversation_history(
     *,
     session: AsyncSession,
@@ -431,16 +547,9 @@ async def load_assistant_conversation_history(
 ) -> AssistantConversationHistoryPayload:
     """Load assistant-ui exported history in stable insertion order."""
     if lock_for_update:
-        conversation = await session.scalar(
-            select(AssistantConversation)
-            .where(
-                AssistantConversation.id == conversation_id,
-                AssistantConversation.user_id == user_id,
-            )
-            .with_for_update()
+        conversation = await lock_assistant_conversation(
+            session=session, user_id=user_id, conversation_id=conversation_id
         )
-        if conversation is None:
-            raise AssistantConversationNotFoundError
     else:
         conversation = await get_assistant_conversation(session=session, user_id=user_id, conversation_id=conversation_id)
 
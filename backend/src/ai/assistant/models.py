@@ -59,6 +59,8 @@ class AssistantConversation(Base):
         server_default=text("'{}'::jsonb"),
     )
     head_message_id: Mapped[str | None] = mapped_column(Text, nullable=True)
+    history_summary: Mapped[str | None] = mapped_column(Text, nullable=True)
+    history_summary_through_message_id: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
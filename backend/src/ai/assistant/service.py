@@ -5,18 +5,30 @@ import json
 import logging
 import uuid
 from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from typing import Literal, cast
 
+import litellm
 from pydantic import BaseModel, ConfigDict, Field, JsonValue
+from sqlalchemy import update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.ai import AGENT_ID_ASSISTANT
 from src.ai.client import LLMClient
+from src.ai.context_assembly import ContextAssembly
 from src.ai.errors import AIRuntimeError
-from src.ai.prompts import ASSISTANT_CHAT_SYSTEM_PROMPT
+from src.ai.prompts import (
+    ASSISTANT_CHAT_SYSTEM_PROMPT,
+    ASSISTANT_HISTORY_SUMMARY_PROMPT,
+    ASSISTANT_HISTORY_SUMMARY_SYSTEM_PROMPT,
+)
+from src.ai.turn_embeddings import turn_embedding_scope
+from src.config.settings import get_settings
+from src.database.session import async_session_maker
 from src.exceptions import DomainError
+from src.jobs import JobKind, enqueue_job
 from src.learning_capabilities.facade import LearningCapabilitiesFacade
 from src.learning_capabilities.schemas import (
     BuildContextBundleCapabilityInput,
@@ -27,6 +39,7 @@ from src.learning_capabilities.schemas import (
 )
 
 from . import conversations_service
+from .models import AssistantConversation
 from .schemas import ChatRequest, LanguageModelMessage
 
 
@@ -43,7 +56,13 @@ def _as_object_dict(value: object) -> dict[str, object] | None:
 logger = logging.getLogger(__name__)
 
 ASSISTANT_MAX_USER_MESSAGE_LENGTH = 8_000
-ASSISTANT_MAX_HISTORY_MESSAGES = 40
+ASSISTANT_HISTORY_SUMMARY_MAX_WORDS = 400
+# Branch JSON read per turn is capped at this many characters per budgeted history token.
+_HISTORY_MAX_CHARS_PER_TOKEN = 16
+# A summary fold may read this many times the per-turn cap, to reach the previous summary's end.
+_HISTORY_SUMMARY_INPUT_MULTIPLIER = 4
+_HISTORY_SUMMARY_MESSAGE_MAX_CHARS = 2_000
+_HISTORY_IMAGE_TOKEN_ESTIMATE = 1_000
 ASSISTANT_REQUIRE_THREAD_ID = True
 ASSISTANT_PUBLIC_ERROR_TEXT = "Sorry, I'm having trouble responding right now. Please try again."
 RETRIEVAL_TRIGGER_THRESHOLD = 0.35
@@ -179,20 +198,13 @@ def _normalize_chat_request(request: ChatRequest) -> NormalizedChatRequest:
         msg = "threadId is required"
         raise ValueError(msg)
 
-    normalized_messages: list[ChatMessagePayload] = []
+    # Only the latest user turn is taken from the payload; prior turns are loaded from the stored
+    # branch within ASSISTANT_HISTORY_TOKEN_BUDGET (see _persist_latest_user_and_load_server_history).
     latest_user_blocks: list[OpenAIContentBlock] = []
     latest_user_text = ""
-    last_user_index = -1
 
     for item in request.messages:
-        if item.role not in {"user", "assistant"}:
-            continue
-
-        if item.role == "assistant":
-            text = _extract_message_text(item.content)
-            if not text:
-                continue
-            normalized_messages.append({"role": "assistant", "content": text})
+        if item.role != "user":
             continue
 
         blocks = _convert_user_content_to_openai_blocks(item.content)
@@ -201,10 +213,8 @@ def _normalize_chat_request(request: ChatRequest) -> NormalizedChatRequest:
 
         latest_user_text = _extract_message_text(item.content)
         latest_user_blocks = blocks
-        normalized_messages.append({"role": "user", "content": blocks})
-        last_user_index = len(normalized_messages) - 1
 
-    if last_user_index < 0 or not latest_user_blocks:
+    if not latest_user_blocks:
         msg = "Latest user message is required"
         raise ValueError(msg)
 
@@ -217,12 +227,9 @@ def _normalize_chat_request(request: ChatRequest) -> NormalizedChatRequest:
         latest_user_blocks = [{"type": "text", "text": f"{pending_quote}\n\n"}, *latest_user_blocks]
         latest_user_text = f"{pending_quote}\n\n{latest_user_text}" if latest_user_text else pending_quote
 
-    history_start_index = max(last_user_index - ASSISTANT_MAX_HISTORY_MESSAGES, 0)
-
     return NormalizedChatRequest(
         latest_user_text=latest_user_text,
         latest_user_blocks=latest_user_blocks,
-        conversation_history=normalized_messages[history_start_index:last_user_index],
         model=request.model_name or request.model,
         thread_id=request.thread_id,
         context_type=request.context_type,
@@ -285,56 +292,113 @@ def _attach_pending_quote_to_history_message(
     return quoted_message
 
 
-def _build_server_conversation_history(
-    history_payload: conversations_service.AssistantConversationHistoryPayload,
-    *,
-    exclude_message_id: str,
-) -> list[ChatMessagePayload]:
-    messages: list[ChatMessagePayload] = []
-    history_items = history_payload.get("messages")
-    if not isinstance(history_items, list):
-        return messages
-
-    for item in history_items:
-        if not isinstance(item, dict):
-            continue
-        message = item.get("message")
-        if not isinstance(message, dict):
-            continue
-        if message.get("id") == exclude_message_id:
-            continue
+def _history_message_to_chat_payload(message: dict[str, JsonValue]) -> ChatMessagePayload | None:
+    role = message.get("role")
+    if role == "assistant":
+        text = _extract_message_text(message.get("content"))
+        return {"role": "assistant", "content": text} if text else None
+    if role == "user":
+        blocks = _convert_user_content_to_openai_blocks(message.get("content"))
+        return {"role": "user", "content": blocks} if blocks else None
+    return None
 
-        role = message.get("role")
-        if role == "assistant":
-            text = _extract_message_text(message.get("content"))
-            if text:
-                messages.append({"role": "assistant", "content": text})
-            continue
 
-        if role == "user":
-            blocks = _convert_user_content_to_openai_blocks(message.get("content"))
-            if blocks:
-                messages.append({"role": "user", "content": blocks})
+def _history_token_model(requested_model: str | None) -> str | None:
+    """Return the model whose tokenizer should count history, or None for LiteLLM's default."""
+    if requested_model:
+        return requested_model
+    try:
+        return get_settings().primary_llm_model
+    except ValueError:
+        return None
 
-    return messages[-ASSISTANT_MAX_HISTORY_MESSAGES:]
 
+def _count_history_tokens(message: ChatMessagePayload, model: str | None) -> int:
+    content = message.get("content")
+    image_blocks = 0
+    if isinstance(content, list):
+        image_blocks = sum(
+            1 for block in content if isinstance(block, dict) and block.get("type") not in {None, "text"}
+        )
+    text = _extract_message_text(content)
+    text_tokens = litellm.token_counter(model=model, text=text) if text else 0
+    return text_tokens + image_blocks * _HISTORY_IMAGE_TOKEN_ESTIMATE
 
-def _find_history_message_role(
-    history_payload: conversations_service.AssistantConversationHistoryPayload, message_id: str
-) -> str | None:
-    history_items = history_payload.get("messages")
-    if not isinstance(history_items, list):
-        return None
 
-    for item in history_items:
-        if not isinstance(item, dict):
+def _build_server_conversation_history(
+    branch: conversations_service.AssistantConversationBranchPayload,
+    *,
+    summary: str | None,
+    model: str | None,
+    token_budget: int,
+) -> tuple[list[ChatMessagePayload], bool]:
+    """Return the newest prior messages that fit ``token_budget``, and whether older ones need folding.
+
+    The persisted summary is prepended when the branch walk reached the message
+    it ends at; if the walk stopped anywhere else the summary may describe a
+    different branch and is left out until the next fold replaces it.
+    """
+    messages: list[ChatMessagePayload] = []
+    used_tokens = 0
+    over_budget = False
+    for message in branch["messages"]:
+        payload = _history_message_to_chat_payload(message)
+        if payload is None:
             continue
-        message = item.get("message")
-        if not isinstance(message, dict) or message.get("id") != message_id:
+        tokens = _count_history_tokens(payload, model)
+        if messages and used_tokens + tokens > token_budget:
+            over_budget = True
+            break
+        messages.append(payload)
+        used_tokens += tokens
+    messages.reverse()
+
+    if summary and branch["reached_stop"]:
+        summary_message: ChatMessagePayload = {
+            "role": "system",
+            "content": ASSISTANT_HISTORY_SUMMARY_SYSTEM_PROMPT.format(summary=summary),
+        }
+        messages.insert(0, summary_message)
+    needs_summary = over_budget or not (branch["reached_start"] or branch["reached_stop"])
+    return messages, needs_summary
+
+
+def _plan_history_fold(
+    branch_messages: list[dict[str, JsonValue]], *, model: str | None, keep_tokens: int
+) -> list[dict[str, JsonValue]]:
+    """Return the messages to fold into the summary, oldest first.
+
+    The newest messages worth ``keep_tokens`` stay out of the summary, and the
+    kept tail always starts at a user message so no exchange is split.
+    """
+    kept_tokens = 0
+    cut = 0
+    for index, message in enumerate(branch_messages):
+        payload = _history_message_to_chat_payload(message)
+        tokens = _count_history_tokens(payload, model) if payload is not None else 0
+        if index > 0 and kept_tokens + tokens > keep_tokens:
+            cut = index
+            break
+        kept_tokens += tokens
+    else:
+        return []
+
+    while cut > 0 and branch_messages[cut - 1].get("role") != "user":
+        cut -= 1
+    if cut == 0:
+        return []
+    return list(reversed(branch_messages[cut:]))
+
+
+def _format_history_transcript(messages: list[dict[str, JsonValue]]) -> str:
+    lines: list[str] = []
+    for message in messages:
+        text = _extract_message_text(message.get("content"))
+        if not text:
             continue
-        role = message.get("role")
-        return role if isinstance(role, str) else None
-    return None
+        speaker = "Learner" if message.get("role") == "user" else "Assistant"
+        lines.append(f"{speaker}: {text[:_HISTORY_SUMMARY_MESSAGE_MAX_CHARS]}")
+    return "\n".join(lines)
 
 
 def _model_dump_jsonable(value: BaseModel | None) -> dict[str, JsonValue]:
@@ -1055,11 +1119,10 @@ async def _persist_latest_user_and_load_server_history(
     request: ChatRequest,
     normalized_request: NormalizedChatRequest,
 ) -> tuple[NormalizedChatRequest, str]:
-    existing_history = await conversations_service.load_assistant_conversation_history(
+    conversation = await conversations_service.lock_assistant_conversation(
         session=session,
         user_id=user_id,
         conversation_id=normalized_request.thread_id,
-        lock_for_update=True,
     )
     latest_user_message = _extract_latest_user_history_item(request)
     if latest_user_message is None:
@@ -1071,42 +1134,133 @@ async def _persist_latest_user_and_load_server_history(
         msg = "Latest user message id is required"
         raise ValueError(msg)
 
-    head_id = existing_history.get("head_id")
-    if isinstance(head_id, str) and head_id != raw_user_message_id:
-        head_role = _find_history_message_role(existing_history, head_id)
-        if head_role == "user":
-            msg = "Previous user message is still awaiting assistant response"
-            raise ValueError(msg)
+    head_item = await conversations_service.get_assistant_conversation_head_item(
+        session=session,
+        conversation=conversation,
+    )
+    head_id = head_item.aui_message_id if head_item is not None else None
+    if head_item is not None and head_id != raw_user_message_id and head_item.message_json.get("role") == "user":
+        msg = "Previous user message is still awaiting assistant response"
+        raise ValueError(msg)
 
-    latest_user_parent_id = head_id if isinstance(head_id, str) and head_id.strip() else None
     inserted = await conversations_service.append_assistant_conversation_history_item(
         session=session,
         user_id=user_id,
         conversation_id=normalized_request.thread_id,
         message=latest_user_message,
-        parent_id=latest_user_parent_id,
+        parent_id=head_id,
         run_config=request.run_config,
     )
-    if inserted:
-        await session.commit()
-    else:
+    if not inserted:
         msg = "Latest user message already exists"
         raise ValueError(msg)
 
-    persisted_history = await conversations_service.load_assistant_conversation_history(
+    token_budget = get_settings().ASSISTANT_HISTORY_TOKEN_BUDGET
+    branch = await conversations_service.load_assistant_conversation_branch(
         session=session,
+        conversation_id=conversation.id,
+        from_message_id=head_id,
+        stop_before_message_id=conversation.history_summary_through_message_id,
+        max_chars=token_budget * _HISTORY_MAX_CHARS_PER_TOKEN,
+    )
+    history, needs_summary = _build_server_conversation_history(
+        branch,
+        summary=conversation.history_summary,
+        model=_history_token_model(normalized_request.model),
+        token_budget=token_budget,
+    )
+    if needs_summary:
+        await enqueue_job(
+            session,
+            JobKind.ASSISTANT_SUMMARIZE_HISTORY,
+            {"conversation_id": str(conversation.id)},
+            dedupe_key=f"{JobKind.ASSISTANT_SUMMARIZE_HISTORY}:{conversation.id}",
+        )
+    await session.commit()
+
+    request_with_server_history = normalized_request.model_copy(update={"conversation_history": history})
+    return request_with_server_history, raw_user_message_id
+
+
+async def summarize_assistant_conversation_history(conversation_id: uuid.UUID) -> None:
+    """Fold the older part of a conversation's active branch into its rolling summary.
+
+    Keeps roughly half of ``ASSISTANT_HISTORY_TOKEN_BUDGET`` of the newest turns
+    out of the summary so the next turns have room to grow before another fold.
+    """
+    token_budget = get_settings().ASSISTANT_HISTORY_TOKEN_BUDGET
+    async with async_session_maker() as session:
+        conversation = await session.get(AssistantConversation, conversation_id)
+        if conversation is None:
+            return
+        previous_summary = conversation.history_summary
+        previous_through_id = conversation.history_summary_through_message_id
+        branch = await conversations_service.load_assistant_conversation_branch(
+            session=session,
+            conversation_id=conversation.id,
+            from_message_id=conversation.head_message_id,
+            stop_before_message_id=previous_through_id,
+            max_chars=token_budget * _HISTORY_MAX_CHARS_PER_TOKEN * _HISTORY_SUMMARY_INPUT_MULTIPLIER,
+        )
+        if not branch["reached_stop"]:
+            # The summary belongs to another branch, or the walk could not reach it: start over.
+            previous_summary = None
+        to_fold = _plan_history_fold(branch["messages"], model=_history_token_model(None), keep_tokens=token_budget // 2)
+        if not to_fold:
+            return
+        transcript = _format_history_transcript(to_fold)
+        through_message_id = to_fold[-1].get("id")
+        if not isinstance(through_message_id, str):
+            return
+        user_id = conversation.user_id
+
+    summary = await LLMClient(agent_id=AGENT_ID_ASSISTANT).get_completion(
+        messages=[
+            {
+                "role": "user",
+                "content": ASSISTANT_HISTORY_SUMMARY_PROMPT.format(
+                    summary=previous_summary or "(none yet)",
+                    transcript=transcript,
+                    max_words=ASSISTANT_HISTORY_SUMMARY_MAX_WORDS,
+                ),
+            }
+        ],
         user_id=user_id,
-        conversation_id=normalized_request.thread_id,
+        model=get_settings().FAST_LLM_MODEL.strip() or None,
+        temperature=0.2,
+        enable_memory=False,
+        enable_tools=False,
     )
-    request_with_server_history = normalized_request.model_copy(
-        update={
-            "conversation_history": _build_server_conversation_history(
-                persisted_history,
-                exclude_message_id=raw_user_message_id,
+    if not isinstance(summary, str) or not summary.strip():
+        logger.warning("assistant.history_summary.empty", extra={"conversation_id": str(conversation_id)})
+        return
+
+    async with async_session_maker() as session:
+        # Compare-and-set: if another fold landed first, the next turn schedules a fresh one if still needed.
+        # updated_at is kept so a background fold does not reorder the conversation list.
+        result = await session.execute(
+            update(AssistantConversation)
+            .where(
+                AssistantConversation.id == conversation_id,
+                AssistantConversation.history_summary_through_message_id.is_not_distinct_from(previous_through_id),
             )
-        }
+            .values(
+                history_summary=summary.strip(),
+                history_summary_through_message_id=through_message_id,
+                updated_at=AssistantConversation.updated_at,
+            )
+        )
+        await session.commit()
+    if not getattr(result, "rowcount", 0):
+        return
+    logger.info(
+        "assistant.history_summary.updated",
+        extra={
+            "conversation_id": str(conversation_id),
+            "folded_messages": len(to_fold),
+            "through_message_id": through_message_id,
+        },
     )
-    return request_with_server_history, raw_user_message_id
 
 
 async def assistant_chat(
@@ -1130,26 +1284,30 @@ async def assistant_chat(
             normalized_request=normalized_request,
         )
 
-        # Build messages with context if available
-        messages, probe_submitted, prefetched_learning_tools = await _build_messages(normalized_request, user_id, session)
+        # Concept matching, source focus and memory search all embed the latest user text; embed it once.
+        with turn_embedding_scope("assistant_turn"):
+            # Build messages with context if available
+            messages, probe_submitted, prefetched_learning_tools = await _build_messages(
+                normalized_request, user_id, session
+            )
 
-        # Run completion through shared LLM client so memories and MCP tools are available
-        llm_client = LLMClient(agent_id=AGENT_ID_ASSISTANT)
-        metadata = _build_completion_metadata(
-            request=normalized_request,
-            probe_submitted=probe_submitted,
-            prefetched_learning_tools=prefetched_learning_tools,
-        )
-        stream = cast(
-            "AsyncGenerator[object]",
-            await llm_client.get_completion(
-                messages=messages,
-                user_id=user_id,
-                model=normalized_request.model,
-                stream=True,
-                metadata=metadata,
-            ),
-        )
+            # Run completion through shared LLM client so memories and MCP tools are available
+            llm_client = LLMClient(agent_id=AGENT_ID_ASSISTANT)
+            metadata = _build_completion_metadata(
+                request=normalized_request,
+                probe_submitted=probe_submitted,
+                prefetched_learning_tools=prefetched_learning_tools,
+            )
+            stream = cast(
+                "AsyncGenerator[object]",
+                await llm_client.get_completion(
+                    messages=messages,
+                    user_id=user_id,
+                    model=normalized_request.model,
+                    stream=True,
+                    metadata=metadata,
+                ),
+            )
 
         async for event in _stream_completion_and_persist_history(
             stream=stream,
@@ -1265,83 +1423,203 @@ def _append_prefetched_learning_blocks(
         )
 
 
+class _TurnContext(BaseModel):
+    """Context gathered for one assistant turn before the completion starts."""
+
+    context_bundle: BuildContextBundleCapabilityOutput
+    chat_probe_result: dict[str, object] | None = None
+    requested_frontier: dict[str, object] | None = None
+    topic_switch_concepts: dict[str, object] | None = None
+    topic_switch_probe: dict[str, object] | None = None
+    tutor_context: dict[str, object] | None = None
+    tutor_lesson_grounding: dict[str, object] | None = None
+    follow_up_probe: dict[str, object] | None = None
+
+
+class _TurnContextPrefetch:
+    """Dependency-ordered context stages for one assistant turn.
+
+    Read-only prefetches each use their own short session and run
+    concurrently, up to the assembly's session cap. The context bundle, probe
+    submission and probe generation use the request session, one stage at a
+    time, so their writes commit with the turn. The bundle's own lookups run
+    as stages of the same assembly, so the whole turn shares one budget.
+    Optional prefetches that miss the latency budget are dropped; the model
+    can still fetch them through tools.
+    """
+
+    def __init__(
+        self,
+        *,
+        request: NormalizedChatRequest,
+        user_id: uuid.UUID,
+        session: AsyncSession,
+        assembly: ContextAssembly,
+    ) -> None:
+        self._request = request
+        self._user_id = user_id
+        self._session = session
+        self._assembly = assembly
+        self._learning_facade = LearningCapabilitiesFacade(session)
+        self._session_lock = asyncio.Lock()
+        self._bundle_task = assembly.start("context_bundle", self._context_bundle())
+        self._chat_probe_task = assembly.start("chat_probe_submission", self._chat_probe_submission())
+        self._requested_frontier_task = assembly.start("requested_frontier", self._requested_frontier())
+        self._topic_switch_concepts_task = assembly.start("topic_switch_concepts", self._topic_switch_concepts())
+        self._topic_switch_probe_task = assembly.start("topic_switch_probe", self._topic_switch_probe())
+        self._tutor_context_task = assembly.start("tutor_context", self._tutor_context())
+        self._tutor_lesson_grounding_task = assembly.start("tutor_lesson_grounding", self._tutor_lesson_grounding())
+        self._follow_up_probe_task = assembly.start("tutor_follow_up_probe", self._follow_up_probe())
+
+    async def collect(self) -> _TurnContext:
+        """Wait for required stages and for optional ones within the budget."""
+        assembly = self._assembly
+        return _TurnContext(
+            context_bundle=await assembly.required(self._bundle_task),
+            chat_probe_result=await assembly.required(self._chat_probe_task),
+            topic_switch_probe=await assembly.required(self._topic_switch_probe_task),
+            follow_up_probe=await assembly.required(self._follow_up_probe_task),
+            requested_frontier=await assembly.optional(self._requested_frontier_task),
+            topic_switch_concepts=await assembly.optional(self._topic_switch_concepts_task),
+            tutor_context=await assembly.optional(self._tutor_context_task),
+            tutor_lesson_grounding=await assembly.optional(self._tutor_lesson_grounding_task),
+        )
+
+    async def _context_bundle(self) -> BuildContextBundleCapabilityOutput:
+        context_meta = dict(self._request.context_meta or {})
+        context_meta["thread_id"] = str(self._request.thread_id)
+        async with self._session_lock:
+            context_bundle = await self._learning_facade.build_context_bundle(
+                user_id=self._user_id,
+                payload=BuildContextBundleCapabilityInput(
+                    context_type=self._request.context_type,
+                    context_id=self._request.context_id,
+                    context_meta=context_meta,
+                    latest_user_text=self._request.latest_user_text,
+                    selected_quote=None,
+                ),
+                assembly=self._assembly,
+            )
+        logger.info(
+            "learning_capability.context_bundle.injected",
+            extra={
+                "user_id": str(self._user_id),
+                "context_type": context_bundle.context_type,
+                "has_course_state": context_bundle.course_state is not None,
+                "has_lesson_state": context_bundle.lesson_state is not None,
+                "has_frontier_state": context_bundle.frontier_state is not None,
+                "relevant_course_count": len(context_bundle.relevant_courses),
+            },
+        )
+        return context_bundle
+
+    async def _chat_probe_submission(self) -> dict[str, object] | None:
+        context_bundle = await self._bundle_task
+        async with self._session_lock:
+            return await _maybe_submit_active_chat_probe(
+                learning_facade=self._learning_facade,
+                user_id=self._user_id,
+                request=self._request,
+                context_bundle=context_bundle,
+                session=self._session,
+            )
+
+    async def _requested_frontier(self) -> dict[str, object] | None:
+        context_bundle = await self._bundle_task
+        # A submitted probe answer moves the frontier; read it only once the submission has committed.
+        await self._chat_probe_task
+        async with _scoped_learning_facade(self._assembly) as learning_facade:
+            return await _maybe_get_requested_course_frontier(
+                learning_facade=learning_facade,
+                user_id=self._user_id,
+                request=self._request,
+                context_bundle=context_bundle,
+            )
+
+    async def _topic_switch_concepts(self) -> dict[str, object] | None:
+        context_bundle = await self._bundle_task
+        async with _scoped_learning_facade(self._assembly) as learning_facade:
+            return await _maybe_search_switched_topic(
+                learning_facade=learning_facade,
+                user_id=self._user_id,
+                request=self._request,
+                context_bundle=context_bundle,
+            )
+
+    async def _topic_switch_probe(self) -> dict[str, object] | None:
+        topic_switch_concepts = await self._assembly.optional(self._topic_switch_concepts_task)
+        async with self._session_lock:
+            return await _maybe_generate_topic_switch_probe(
+                learning_facade=self._learning_facade,
+                user_id=self._user_id,
+                request=self._request,
+                topic_switch_concepts=topic_switch_concepts,
+            )
+
+    async def _tutor_context(self) -> dict[str, object] | None:
+        context_bundle = await self._bundle_task
+        chat_probe_result = await self._chat_probe_task
+        async with _scoped_learning_facade(self._assembly) as learning_facade:
+            return await _maybe_get_tutor_context(
+                learning_facade=learning_facade,
+                user_id=self._user_id,
+                request=self._request,
+                context_bundle=context_bundle,
+                chat_probe_result=chat_probe_result,
+            )
+
+    async def _tutor_lesson_grounding(self) -> dict[str, object] | None:
+        tutor_context = await self._assembly.optional(self._tutor_context_task)
+        async with _scoped_learning_facade(self._assembly) as learning_facade:
+            return await _maybe_get_tutor_lesson_grounding(
+                learning_facade=learning_facade,
+                user_id=self._user_id,
+                tutor_context=tutor_context,
+            )
+
+    async def _follow_up_probe(self) -> dict[str, object] | None:
+        context_bundle = await self._bundle_task
+        chat_probe_result = await self._chat_probe_task
+        tutor_context = await self._assembly.optional(self._tutor_context_task)
+        async with self._session_lock:
+            return await _maybe_generate_tutor_follow_up_probe(
+                learning_facade=self._learning_facade,
+                user_id=self._user_id,
+                request=self._request,
+                context_bundle=context_bundle,
+                tutor_context=tutor_context,
+                chat_probe_result=chat_probe_result,
+            )
+
+
 async def _build_messages(
     request: NormalizedChatRequest,
     user_id: uuid.UUID,
     session: AsyncSession,
 ) -> tuple[list[ChatMessagePayload], bool, list[str]]:
     """Build message list with capability-backed context packet injection."""
-    learning_facade = LearningCapabilitiesFacade(session)
-    context_meta = dict(request.context_meta or {})
-    context_meta["thread_id"] = str(request.thread_id)
-    context_bundle = await learning_facade.build_context_bundle(
-        user_id=user_id,
-        payload=BuildContextBundleCapabilityInput(
-            context_type=request.context_type,
-            context_id=request.context_id,
-            context_meta=context_meta,
-            latest_user_text=request.latest_user_text,
-            selected_quote=None,
-        ),
-    )
-    logger.info(
-        "learning_capability.context_bundle.injected",
-        extra={
-            "user_id": str(user_id),
-            "context_type": context_bundle.context_type,
-            "has_course_state": context_bundle.course_state is not None,
-            "has_lesson_state": context_bundle.lesson_state is not None,
-            "has_frontier_state": context_bundle.frontier_state is not None,
-            "relevant_course_count": len(context_bundle.relevant_courses),
-        },
-    )
-
-    chat_probe_result = await _maybe_submit_active_chat_probe(
-        learning_facade=learning_facade,
-        user_id=user_id,
-        request=request,
-        context_bundle=context_bundle,
-        session=session,
-    )
+    settings = get_settings()
+    async with ContextAssembly(
+        "assistant_turn",
+        budget_seconds=settings.ASSISTANT_CONTEXT_BUDGET_SECONDS,
+        max_sessions=settings.ASSISTANT_CONTEXT_MAX_SESSIONS,
+    ) as assembly:
+        turn_context = await _TurnContextPrefetch(
+            request=request,
+            user_id=user_id,
+            session=session,
+            assembly=assembly,
+        ).collect()
+
+    context_bundle = turn_context.context_bundle
+    chat_probe_result = turn_context.chat_probe_result
+    requested_frontier = turn_context.requested_frontier
+    topic_switch_concepts = turn_context.topic_switch_concepts
+    topic_switch_probe = turn_context.topic_switch_probe
+    tutor_context = turn_context.tutor_context
+    tutor_lesson_grounding = turn_context.tutor_lesson_grounding
+    follow_up_probe = turn_context.follow_up_probe
     probe_submitted = chat_probe_result is not None
-    requested_frontier = await _maybe_get_requested_course_frontier(
-        learning_facade=learning_facade,
-        user_id=user_id,
-        request=request,
-        context_bundle=context_bundle,
-    )
-    topic_switch_concepts = await _maybe_search_switched_topic(
-        learning_facade=learning_facade,
-        user_id=user_id,
-        request=request,
-        context_bundle=context_bundle,
-    )
-    topic_switch_probe = await _maybe_generate_topic_switch_probe(
-        learning_facade=learning_facade,
-        user_id=user_id,
-        request=request,
-        topic_switch_concepts=topic_switch_concepts,
-    )
-    tutor_context = await _maybe_get_tutor_context(
-        learning_facade=learning_facade,
-        user_id=user_id,
-        request=request,
-        context_bundle=context_bundle,
-        chat_probe_result=chat_probe_result,
-    )
-    tutor_lesson_grounding = await _maybe_get_tutor_lesson_grounding(
-        learning_facade=learning_facade,
-        user_id=user_id,
-        tutor_context=tutor_context,
-    )
-    follow_up_probe = await _maybe_generate_tutor_follow_up_probe(
-        learning_facade=learning_facade,
-        user_id=user_id,
-        request=request,
-        context_bundle=context_bundle,
-        tutor_context=tutor_context,
-        chat_probe_result=chat_probe_result,
-    )
     if topic_switch_probe is not None or follow_up_probe is not None:
         await session.commit()
     prefetched_learning_tools: list[str] = []
@@ -1422,6 +1700,13 @@ async def _build_messages(
     return messages, probe_submitted, prefetched_learning_tools
 
 
+@asynccontextmanager
+async def _scoped_learning_facade(assembly: ContextAssembly) -> AsyncGenerator[LearningCapabilitiesFacade]:
+    """Yield a learning facade on its own short session so a read-only prefetch can run concurrently."""
+    async with assembly.session_slot(), async_session_maker() as session:
+        yield LearningCapabilitiesFacade(session)
+
+
 async def _maybe_submit_active_chat_probe(
     *,
     learning_facade: LearningCapabilitiesFacade,
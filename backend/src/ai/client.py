@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from typing import TypeVar, cast
 
 import litellm
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 from pydantic import BaseModel, JsonValue, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -70,6 +70,23 @@ _MAX_STRUCTURED_GENERATION_ATTEMPTS = 2
 _BACKGROUND_TASK_SHUTDOWN_TIMEOUT_SECONDS = 5.0
 _BACKGROUND_TASKS: set[asyncio.Task[object]] = set()
 
+# Providers that only reuse a cached prompt prefix up to explicit ``cache_control`` breakpoints.
+# Others (OpenAI, DeepSeek) cache the longest repeated prefix automatically.
+_EXPLICIT_PROMPT_CACHE_PROVIDERS = frozenset({"anthropic"})
+_PROMPT_CACHE_CONTROL: JsonDict = {"type": "ephemeral"}
+
+_meter = metrics.get_meter(__name__)
+_prompt_tokens_counter = _meter.create_counter(
+    "ai.llm.prompt_tokens",
+    unit="1",
+    description="Prompt tokens sent to the model, by agent and model",
+)
+_cached_prompt_tokens_counter = _meter.create_counter(
+    "ai.llm.prompt_tokens.cached",
+    unit="1",
+    description="Prompt tokens the provider served from its prompt cache, by agent and model",
+)
+
 _LITELLM_PROVIDER_ERROR_TYPES = (
     litellm.APIError,
     litellm.APIConnectionError,
@@ -590,8 +607,8 @@ class LLMClient:
 
     async def _load_mcp_tool_definitions(self, user_id: uuid.UUID) -> tuple[list[FunctionToolDefinition], MCPConfig]:
         async with self._mcp_session() as session:
-            bindings = await load_user_tool_bindings(session, user_id)
             config = await get_user_mcp_config(session, user_id)
+            bindings = await load_user_tool_bindings(session, user_id, config=config)
 
         definitions: list[FunctionToolDefinition] = []
         counts: dict[str, int] = {}
@@ -751,14 +768,7 @@ class LLMClient:
 
         return merged
 
-    def _record_response_observability_fields(self, response: object, *, tool_names: list[str]) -> None:
-        span = trace.get_current_span()
-        if not span.is_recording():
-            return
-
-        if tool_names:
-            span.set_attribute("llm.tool_names", json.dumps(tool_names))
-
+    def _record_response_observability_fields(self, response: object, *, model: str, tool_names: list[str]) -> None:
         usage = getattr(response, "usage", None)
         if usage is None and isinstance(response, Mapping):
             usage = cast("Mapping[str, object]", response).get("usage")
@@ -775,12 +785,27 @@ class LLMClient:
             completion_tokens = getattr(usage, "completion_tokens", None)
             total_tokens = getattr(usage, "total_tokens", None)
 
-        if isinstance(prompt_tokens, int):
-            span.set_attribute("llm.prompt_tokens", prompt_tokens)
-        if isinstance(completion_tokens, int):
-            span.set_attribute("llm.completion_tokens", completion_tokens)
-        if isinstance(total_tokens, int):
-            span.set_attribute("llm.total_tokens", total_tokens)
+        cached_prompt_tokens, cache_creation_tokens = self._record_prompt_token_metrics(
+            usage, model=model, prompt_tokens=prompt_tokens
+        )
+
+        span = trace.get_current_span()
+        if not span.is_recording():
+            return
+
+        if tool_names:
+            span.set_attribute("llm.tool_names", json.dumps(tool_names))
+
+        token_fields = (
+            ("llm.prompt_tokens", prompt_tokens),
+            ("llm.completion_tokens", completion_tokens),
+            ("llm.total_tokens", total_tokens),
+            ("llm.cached_prompt_tokens", cached_prompt_tokens),
+            ("llm.cache_creation_tokens", cache_creation_tokens),
+        )
+        for attribute, value in token_fields:
+            if isinstance(value, int):
+                span.set_attribute(attribute, value)
 
         hidden_params = getattr(response, "_hidden_params", None)
         if hidden_params is None and isinstance(response, Mapping):
@@ -790,7 +815,62 @@ class LLMClient:
             if isinstance(response_cost, (int, float)):
                 span.set_attribute("llm.cost_usd", float(response_cost))
 
-    async def complete(  # noqa: C901, PLR0912
+    def _record_prompt_token_metrics(
+        self, usage: object, *, model: str, prompt_tokens: object
+    ) -> tuple[int | None, int | None]:
+        """Count prompt and cached prompt tokens per agent; return tokens read from and written to the prompt cache."""
+        # Reads are reported OpenAI-style under prompt_tokens_details; Anthropic also reports writes.
+        cached = self._read_attr_or_key(self._read_attr_or_key(usage, "prompt_tokens_details"), "cached_tokens")
+        if not isinstance(cached, int):
+            cached = self._read_attr_or_key(usage, "cache_read_input_tokens")
+        created = self._read_attr_or_key(usage, "cache_creation_input_tokens")
+
+        attributes = {"agent_id": self._agent_id, "model": model}
+        if isinstance(prompt_tokens, int):
+            _prompt_tokens_counter.add(prompt_tokens, attributes)
+        if isinstance(cached, int):
+            _cached_prompt_tokens_counter.add(cached, attributes)
+        return (
+            cached if isinstance(cached, int) else None,
+            created if isinstance(created, int) else None,
+        )
+
+    def _mark_prompt_cache_breakpoints(
+        self,
+        messages: Sequence[ChatMessage],
+        *,
+        models: list[str],
+        cache_tail: bool,
+    ) -> list[ChatMessage]:
+        """Return a copy of ``messages`` with explicit prompt cache breakpoints when every model needs them.
+
+        The leading system messages (system prompt and tool instruction) end the
+        prefix shared by every call for this agent. With tools, the last message
+        is marked as well, so each autonomy round reads the previous round's prefix.
+        """
+        marked = list(messages)
+        if not all(self._extract_provider_name(name) in _EXPLICIT_PROMPT_CACHE_PROVIDERS for name in models):
+            return marked
+        breakpoints: set[int] = set()
+        stable_end = 0
+        while stable_end < len(marked) and marked[stable_end].get("role") == "system":
+            stable_end += 1
+        if stable_end:
+            breakpoints.add(stable_end - 1)
+        if cache_tail and marked:
+            breakpoints.add(len(marked) - 1)
+        for index in breakpoints:
+            message = marked[index]
+            content = message.get("content")
+            if isinstance(content, str) and content:
+                marked[index] = {**message, "cache_control": _PROMPT_CACHE_CONTROL}
+            elif isinstance(content, list) and content and isinstance(content[-1], Mapping):
+                blocks = cast("list[JsonDict]", content)
+                last_block = {**blocks[-1], "cache_control": _PROMPT_CACHE_CONTROL}
+                marked[index] = {**message, "content": [*blocks[:-1], last_block]}
+        return marked
+
+    async def complete(  # noqa: C901, PLR0912, PLR0915
         self,
         messages: Sequence[ChatMessage],
         temperature: float | None = None,
@@ -851,22 +931,30 @@ class LLMClient:
                     response_kwargs["previous_response_id"] = previous_response_id
                 response = await asyncio.wait_for(litellm.responses(**response_kwargs), timeout=settings.ai_request_timeout)
                 if not stream:
-                    self._record_response_observability_fields(response, tool_names=tool_names)
+                    self._record_response_observability_fields(response, model=request_model, tool_names=tool_names)
                 return response
 
-            completion_kwargs = dict(common_kwargs)
-            completion_kwargs["messages"] = list(messages)
-            if response_format is not None:
-                completion_kwargs["response_format"] = response_format
             # When the caller did not pin a specific model, let LiteLLM fall back
             # through the remaining configured primary models on failure.
             # See: litellm.acompletion(..., fallbacks=[...]).
-            if model is None and len(settings.primary_llm_models) > 1:
-                completion_kwargs["fallbacks"] = settings.primary_llm_models[1:]
+            fallback_models = settings.primary_llm_models[1:] if model is None else []
+            completion_kwargs = dict(common_kwargs)
+            completion_kwargs["messages"] = self._mark_prompt_cache_breakpoints(
+                messages,
+                models=[request_model, *fallback_models],
+                cache_tail=bool(tools),
+            )
+            if response_format is not None:
+                completion_kwargs["response_format"] = response_format
+            if stream:
+                # Ask for the final usage chunk so streamed turns report (cached) prompt tokens too.
+                completion_kwargs["stream_options"] = {"include_usage": True}
+            if fallback_models:
+                completion_kwargs["fallbacks"] = fallback_models
 
             response = await asyncio.wait_for(litellm.acompletion(**completion_kwargs), timeout=settings.ai_request_timeout)
             if not stream:
-                self._record_response_observability_fields(response, tool_names=tool_names)
+                self._record_response_observability_fields(response, model=request_model, tool_names=tool_names)
             return response
 
         except _COMPLETION_RUNTIME_ERROR_TYPES as error:
@@ -1288,7 +1376,12 @@ class LLMClient:
                         round_text.append(delta)
                         yield delta
 
-                built_message = self._rebuild_stream_message(chunks, conversation)
+                built_message = self._rebuild_stream_message(
+                    chunks,
+                    conversation,
+                    model=model,
+                    tool_names=self._collect_tool_names(available_tools),
+                )
                 tool_calls = self._extract_message_tool_calls(built_message)
                 assistant_content = self._extract_message_content(built_message)
 
@@ -1368,12 +1461,21 @@ class LLMClient:
             "isError": executed_call.failed,
         }
 
-    def _rebuild_stream_message(self, chunks: list[object], conversation: list[ChatMessage]) -> object | None:
+    def _rebuild_stream_message(
+        self,
+        chunks: list[object],
+        conversation: list[ChatMessage],
+        *,
+        model: str,
+        tool_names: list[str],
+    ) -> object | None:
         try:
             built = litellm.stream_chunk_builder(chunks, messages=conversation)
         except litellm.APIError:
             self._logger.debug("ai.stream.chunk_builder.failed", exc_info=True)
             return None
+        if built is not None:
+            self._record_response_observability_fields(built, model=model, tool_names=tool_names)
         return self._extract_first_choice_message(built)
 
     def _extract_first_choice_message(self, payload: object) -> object | None:
@@ -1718,11 +1820,19 @@ class LLMClient:
             return messages
 
         memory_context = MEMORY_CONTEXT_SYSTEM_PROMPT.format(memory_context="\n".join(memory_lines))
-        memory_message = {"role": "system", "content": memory_context}
+        return self._insert_before_latest_user_message(messages, {"role": "system", "content": memory_context})
 
-        if messages and messages[0].get("role") == "system":
-            return [messages[0], memory_message, *messages[1:]]
-        return [memory_message, *messages]
+    @staticmethod
+    def _insert_before_latest_user_message(messages: list[ChatMessage], message: ChatMessage) -> list[ChatMessage]:
+        """Place per-turn context right before the latest user message, or first when there is none.
+
+        Memory changes from turn to turn; the system prompt, tool instruction and
+        earlier history ahead of it stay a cacheable prefix.
+        """
+        for index in range(len(messages) - 1, -1, -1):
+            if messages[index].get("role") == "user":
+                return [*messages[:index], message, *messages[index:]]
+        return [message, *messages]
 
     def _build_memory_query(self, messages: Sequence[ChatMessage]) -> str | None:
         """Return the most recent user utterance to drive mem0 vector search."""
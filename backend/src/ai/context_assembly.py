@@ -0,0 +1,155 @@
+"""Concurrent, latency-budgeted assembly of per-turn LLM context."""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncGenerator, Coroutine
+from contextlib import asynccontextmanager
+from types import TracebackType
+from typing import Any, Self
+
+from opentelemetry import metrics
+
+
+logger = logging.getLogger(__name__)
+
+_meter = metrics.get_meter(__name__)
+_stage_duration = _meter.create_histogram(
+    "ai.context_assembly.stage.duration",
+    unit="ms",
+    description="Time per context assembly stage, from start until it finished, failed or was dropped",
+)
+_dropped_stages = _meter.create_counter(
+    "ai.context_assembly.stage.dropped",
+    unit="1",
+    description="Optional context stages dropped because the turn's latency budget ran out",
+)
+
+
+class ContextAssembly:
+    """Run context lookups as concurrent stages under one latency budget.
+
+    Every stage starts as a task immediately. A stage that needs another
+    stage's result awaits that stage's task (or :meth:`optional` for an
+    optional one), so independent lookups overlap and dependent ones chain.
+    :meth:`required` waits for a stage however long it takes; :meth:`optional`
+    waits only while budget remains, then cancels the stage and returns None.
+    On exit, unfinished stages are cancelled and the per-stage timing
+    breakdown is logged. A budget of 0 disables dropping.
+
+    Stages that open their own database session hold a :meth:`session_slot`
+    while it is open, so one turn cannot check out more than ``max_sessions``
+    pooled connections at once (0 means no limit).
+    """
+
+    def __init__(self, name: str, *, budget_seconds: float, max_sessions: int = 0) -> None:
+        self.name = name
+        self.budget_seconds = budget_seconds
+        self._session_slots = asyncio.Semaphore(max_sessions) if max_sessions > 0 else None
+        self.stage_ms: dict[str, float] = {}
+        self.dropped: list[str] = []
+        self._stages: dict[asyncio.Task[Any], str] = {}
+        self._work: list[Coroutine[Any, Any, Any]] = []
+        self._started_at = time.perf_counter()
+
+    async def __aenter__(self) -> Self:
+        """Start the budget clock."""
+        self._started_at = time.perf_counter()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Cancel unfinished stages and log the per-stage timing breakdown."""
+        pending = [task for task in self._stages if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        for task in self._stages:
+            if not task.cancelled():
+                # Dependents re-raise a failed stage's error; mark it retrieved so it is not reported twice.
+                task.exception()
+        for work in self._work:
+            # Stages cancelled before their first step never ran their coroutine.
+            work.close()
+        logger.info(
+            "ai.context_assembly.completed",
+            extra={
+                "assembly": self.name,
+                "total_ms": round((time.perf_counter() - self._started_at) * 1000, 2),
+                "budget_ms": round(self.budget_seconds * 1000, 2),
+                "stage_ms": self.stage_ms,
+                "dropped_stages": self.dropped,
+                "failed": exc_type is not None,
+            },
+        )
+
+    def start[T](self, stage: str, work: Coroutine[Any, Any, T]) -> asyncio.Task[T]:
+        """Start ``work`` as a timed stage and return its task."""
+        task = asyncio.create_task(self._run_stage(stage, work), name=f"{self.name}.{stage}")
+        self._stages[task] = stage
+        self._work.append(work)
+        return task
+
+    async def required[T](self, task: asyncio.Task[T]) -> T:
+        """Wait for a stage regardless of the budget; its errors propagate."""
+        return await task
+
+    async def optional[T](self, task: asyncio.Task[T]) -> T | None:
+        """Wait for a stage while budget remains; past that, cancel it and return None.
+
+        Errors raised by the stage itself still propagate.
+        """
+        if not task.done():
+            await asyncio.wait({task}, timeout=self.remaining_seconds())
+        if not task.done():
+            task.cancel()
+            self._record_drop(task)
+            return None
+        if task.cancelled():
+            self._record_drop(task)
+            return None
+        return task.result()
+
+    @asynccontextmanager
+    async def session_slot(self) -> AsyncGenerator[None]:
+        """Hold one of the assembly's session slots; do not await other stages while holding it."""
+        if self._session_slots is None:
+            yield
+            return
+        async with self._session_slots:
+            yield
+
+    def remaining_seconds(self) -> float | None:
+        """Return the budget left for optional stages, or None when there is no budget."""
+        if self.budget_seconds <= 0:
+            return None
+        return max(self.budget_seconds - (time.perf_counter() - self._started_at), 0.0)
+
+    async def _run_stage[T](self, stage: str, work: Coroutine[Any, Any, T]) -> T:
+        started_at = time.perf_counter()
+        outcome = "failed"
+        try:
+            result = await work
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        else:
+            outcome = "completed"
+            return result
+        finally:
+            elapsed_ms = (time.perf_counter() - started_at) * 1000
+            self.stage_ms[stage] = round(elapsed_ms, 2)
+            _stage_duration.record(elapsed_ms, {"assembly": self.name, "stage": stage, "outcome": outcome})
+
+    def _record_drop(self, task: asyncio.Task[Any]) -> None:
+        stage = self._stages[task]
+        if stage in self.dropped:
+            return
+        self.dropped.append(stage)
+        _dropped_stages.add(1, {"assembly": self.name, "stage": stage})
+        logger.info("ai.context_assembly.stage_dropped", extra={"assembly": self.name, "stage": stage})
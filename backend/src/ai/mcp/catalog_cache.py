@@ -0,0 +1,153 @@
+"""Per-user cache of the tool descriptors listed from MCP servers."""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import lru_cache
+
+from opentelemetry import metrics
+
+from src.ai.mcp.config import MCPConfig
+from src.config.settings import get_settings
+
+
+logger = logging.getLogger(__name__)
+
+_meter = metrics.get_meter(__name__)
+_catalog_lookups = _meter.create_counter(
+    "ai.mcp.tool_catalog.lookups",
+    unit="1",
+    description="Per-user MCP tool catalog lookups by outcome (hit, stale, miss)",
+)
+
+_MAX_CACHED_USERS = 1024
+
+type ServerFingerprint = tuple[tuple[str, tuple[str, tuple[tuple[str, str], ...]]], ...]
+type ToolCatalog = dict[str, list[object]]
+type CatalogLoader = Callable[[MCPConfig], Awaitable[tuple[ToolCatalog, bool]]]
+
+
+@dataclass(slots=True)
+class _CatalogEntry:
+    fingerprint: ServerFingerprint
+    tools: ToolCatalog
+    expires_at: float
+
+
+@dataclass(slots=True)
+class _CatalogLoad:
+    fingerprint: ServerFingerprint
+    task: asyncio.Task[ToolCatalog]
+
+
+def _fingerprint(config: MCPConfig) -> ServerFingerprint:
+    return tuple(sorted((name, server.cache_key()) for name, server in config.servers.items()))
+
+
+class MCPToolCatalogCache:
+    """Cache each user's tool descriptors, per server, for ``ttl_seconds``.
+
+    An entry only serves a config with the same servers (names, URLs and
+    headers) it was loaded for. Past its TTL an entry is still served while a
+    background refresh replaces it, and an entry from a load where some server
+    failed starts out stale so the next lookup retries. Concurrent loads for
+    one user are shared. A TTL of 0 disables caching.
+    """
+
+    def __init__(self, *, ttl_seconds: float, max_users: int = _MAX_CACHED_USERS) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_users = max_users
+        self._entries: OrderedDict[uuid.UUID, _CatalogEntry] = OrderedDict()
+        self._loads: dict[uuid.UUID, _CatalogLoad] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def get(self, user_id: uuid.UUID, config: MCPConfig, load: CatalogLoader) -> ToolCatalog:
+        """Return the user's tool descriptors keyed by server name, loading them with ``load`` when needed."""
+        if self._ttl_seconds <= 0:
+            tools, _complete = await load(config)
+            return tools
+        if self._loop is not asyncio.get_running_loop():
+            # Loads from another (likely closed) loop cannot be awaited here; entries are plain data.
+            self._loads.clear()
+            self._loop = asyncio.get_running_loop()
+
+        fingerprint = _fingerprint(config)
+        entry = self._entries.get(user_id)
+        if entry is not None and entry.fingerprint == fingerprint:
+            self._entries.move_to_end(user_id)
+            if time.monotonic() < entry.expires_at:
+                _catalog_lookups.add(1, {"outcome": "hit"})
+                return entry.tools
+            _catalog_lookups.add(1, {"outcome": "stale"})
+            self._start_load(user_id, fingerprint, config, load)
+            return entry.tools
+
+        _catalog_lookups.add(1, {"outcome": "miss"})
+        return await asyncio.shield(self._start_load(user_id, fingerprint, config, load))
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        """Forget the user's catalog; a load already running for them is not stored."""
+        self._entries.pop(user_id, None)
+        self._loads.pop(user_id, None)
+
+    def _start_load(
+        self,
+        user_id: uuid.UUID,
+        fingerprint: ServerFingerprint,
+        config: MCPConfig,
+        load: CatalogLoader,
+    ) -> asyncio.Task[ToolCatalog]:
+        running = self._loads.get(user_id)
+        if running is not None and running.fingerprint == fingerprint:
+            return running.task
+        task = asyncio.create_task(self._load(user_id, fingerprint, config, load), name="mcp.tool_catalog.load")
+        task.add_done_callback(_log_background_failure)
+        self._loads[user_id] = _CatalogLoad(fingerprint=fingerprint, task=task)
+        return task
+
+    async def _load(
+        self,
+        user_id: uuid.UUID,
+        fingerprint: ServerFingerprint,
+        config: MCPConfig,
+        load: CatalogLoader,
+    ) -> ToolCatalog:
+        try:
+            tools, complete = await load(config)
+            current = self._loads.get(user_id)
+            # Invalidated, or superseded by a load for a newer config, while running.
+            if current is not None and current.task is asyncio.current_task():
+                expires_at = time.monotonic() + self._ttl_seconds if complete else 0.0
+                self._entries[user_id] = _CatalogEntry(fingerprint=fingerprint, tools=tools, expires_at=expires_at)
+                self._entries.move_to_end(user_id)
+                while len(self._entries) > self._max_users:
+                    self._entries.popitem(last=False)
+            return tools
+        finally:
+            current = self._loads.get(user_id)
+            if current is not None and current.task is asyncio.current_task():
+                del self._loads[user_id]
+
+
+def _log_background_failure(task: asyncio.Task[ToolCatalog]) -> None:
+    if task.cancelled() or task.exception() is None:
+        return
+    logger.warning("mcp.tool_catalog.load_failed", exc_info=task.exception())
+
+
+@lru_cache(maxsize=1)
+def get_tool_catalog_cache() -> MCPToolCatalogCache:
+    """Return the process-wide MCP tool catalog cache."""
+    return MCPToolCatalogCache(ttl_seconds=get_settings().MCP_TOOL_CATALOG_TTL_SECONDS)
+
+
+def invalidate_user_tool_catalog(user_id: uuid.UUID) -> None:
+    """Drop the cached tool catalog for ``user_id`` after their servers change."""
+    get_tool_catalog_cache().invalidate(user_id)
+
+
+__all__ = ["MCPToolCatalogCache", "get_tool_catalog_cache", "invalidate_user_tool_catalog"]
@@ -1,16 +1,33 @@
 """HTTP MCP client utilities."""
 
 import asyncio
-from collections.abc import AsyncIterator, Iterable
+import logging
+import time
+from collections.abc import AsyncGenerator, Iterable
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import Protocol, cast
 
 import httpx
+from opentelemetry import metrics
 from pydantic import JsonValue
 
 from src.ai.mcp.config import MCPConfig, MCPServerConfig
+from src.config.settings import get_settings
+
+
+logger = logging.getLogger(__name__)
+
+_meter = metrics.get_meter(__name__)
+_sessions_opened = _meter.create_counter(
+    "ai.mcp.sessions.opened",
+    unit="1",
+    description="MCP sessions opened (transport connect plus initialize handshake)",
+)
+
+# A pooled session unused for this long is pinged before reuse.
+_HEALTH_CHECK_INTERVAL_SECONDS = 30.0
 
 
 class MCPClientDependencyError(RuntimeError):
@@ -26,6 +43,8 @@ class ClientSession(Protocol):
 
     async def initialize(self) -> object: ...
 
+    async def send_ping(self) -> object: ...
+
 
 class StreamableHTTPClient(Protocol):
     """Callable shape used from the MCP SDK streamable HTTP transport."""
@@ -72,14 +91,204 @@ class MCPServerInfo:
     version: str
 
 
+class _PooledSession:
+    """One long-lived MCP session, held open by its own owner task.
+
+    The SDK's transport and session run anyio task groups that must be entered
+    and exited by the same task, so the owner task keeps them open until
+    :meth:`close`; requests from other tasks go through the session's streams.
+    """
+
+    def __init__(self, server: MCPServerConfig, *, timeout: float) -> None:
+        self.server = server
+        self.in_use = 0
+        self.last_used = time.monotonic()
+        self.last_checked = self.last_used
+        self._timeout = timeout
+        self._ready: asyncio.Future[ClientSession] = asyncio.get_running_loop().create_future()
+        self._stop = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def alive(self) -> bool:
+        """Whether the owner task still holds the session open."""
+        return self._ready.done() and not self._ready.cancelled() and not self._stop.is_set()
+
+    @property
+    def session(self) -> ClientSession:
+        """The initialized session."""
+        return self._ready.result()
+
+    async def open(self) -> ClientSession:
+        """Start the owner task and wait until the session is initialized."""
+        self._task = asyncio.create_task(self._run(), name=f"mcp.session.{self.server.name}")
+        try:
+            return await asyncio.shield(self._ready)
+        except BaseException:
+            await self.close()
+            raise
+
+    async def ping(self) -> bool:
+        """Return whether the server still answers on this session."""
+        if not self.alive:
+            return False
+        try:
+            await asyncio.wait_for(self.session.send_ping(), timeout=self._timeout)
+        except Exception:
+            logger.info("mcp.session.ping_failed", extra={"server_name": self.server.name}, exc_info=True)
+            return False
+        self.last_checked = time.monotonic()
+        return True
+
+    async def close(self) -> None:
+        """Ask the owner task to exit, cancelling it if the transport does not shut down in time."""
+        self._stop.set()
+        if self._task is None:
+            return
+        await asyncio.wait({self._task}, timeout=self._timeout)
+        if not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self) -> None:
+        try:
+            await self._hold_open()
+        except asyncio.CancelledError:
+            if not self._ready.done():
+                self._ready.cancel()
+            raise
+        except Exception as exc:
+            if not self._ready.done():
+                self._ready.set_exception(exc)
+            else:
+                logger.warning("mcp.session.lost", extra={"server_name": self.server.name}, exc_info=True)
+        finally:
+            self._stop.set()
+
+    async def _hold_open(self) -> None:
+        client_session_cls, http_transport_client = _ensure_mcp_sdk()
+        async with (
+            httpx.AsyncClient(headers=self.server.headers()) as http_client,
+            http_transport_client(str(self.server.url), http_client=http_client) as (read, write, _),
+            client_session_cls(read, write) as session,
+        ):
+            try:
+                await asyncio.wait_for(session.initialize(), timeout=self._timeout)
+            except TimeoutError as exc:
+                msg = f"MCP session initialization for '{self.server.name}' timed out after {self._timeout}s"
+                raise TimeoutError(msg) from exc
+            self._ready.set_result(session)
+            await self._stop.wait()
+
+
+class _MCPSessionPool:
+    """Long-lived MCP sessions keyed by :meth:`MCPServerConfig.cache_key`.
+
+    Concurrent calls share one session per server. Sessions idle for
+    ``idle_seconds`` are closed, and one that sat unused past the health-check
+    interval, or whose last call failed, is pinged before reuse and replaced if
+    it does not answer. ``idle_seconds`` of 0 disables pooling.
+    """
+
+    def __init__(self, *, timeout: float, idle_seconds: float) -> None:
+        self._timeout = timeout
+        self._idle_seconds = idle_seconds
+        self._sessions: dict[tuple[str, tuple[tuple[str, str], ...]], _PooledSession] = {}
+        self._locks: dict[tuple[str, tuple[tuple[str, str], ...]], asyncio.Lock] = {}
+        self._closing: set[asyncio.Task[None]] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @asynccontextmanager
+    async def session(self, server: MCPServerConfig) -> AsyncGenerator[ClientSession]:
+        """Yield a ready session for ``server``, reusing a pooled one when possible."""
+        if self._idle_seconds <= 0:
+            pooled = _PooledSession(server, timeout=self._timeout)
+            _sessions_opened.add(1, {"pooled": False})
+            try:
+                yield await pooled.open()
+            finally:
+                await pooled.close()
+            return
+
+        pooled = await self._acquire(server)
+        pooled.in_use += 1
+        try:
+            yield pooled.session
+        except TimeoutError:
+            raise
+        except Exception:
+            # The call may have broken the transport; check it before anyone reuses it.
+            pooled.last_checked = 0.0
+            raise
+        finally:
+            pooled.in_use -= 1
+            pooled.last_used = time.monotonic()
+
+    async def aclose(self) -> None:
+        """Close every pooled session owned by the running event loop."""
+        if self._loop is not asyncio.get_running_loop():
+            self._reset_for_loop()
+            return
+        for key in list(self._sessions):
+            self._schedule_close(self._sessions.pop(key))
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
+    async def _acquire(self, server: MCPServerConfig) -> _PooledSession:
+        if self._loop is not asyncio.get_running_loop():
+            self._reset_for_loop()
+        self._evict_idle()
+        key = server.cache_key()
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            pooled = self._sessions.get(key)
+            if pooled is not None and not await self._usable(pooled):
+                del self._sessions[key]
+                self._schedule_close(pooled)
+                pooled = None
+            if pooled is None:
+                pooled = _PooledSession(server, timeout=self._timeout)
+                await pooled.open()
+                _sessions_opened.add(1, {"pooled": True})
+                self._sessions[key] = pooled
+            return pooled
+
+    async def _usable(self, pooled: _PooledSession) -> bool:
+        if not pooled.alive:
+            return False
+        if time.monotonic() - pooled.last_checked < _HEALTH_CHECK_INTERVAL_SECONDS:
+            return True
+        return await pooled.ping()
+
+    def _evict_idle(self) -> None:
+        now = time.monotonic()
+        for key, pooled in list(self._sessions.items()):
+            if pooled.in_use == 0 and (now - pooled.last_used > self._idle_seconds or not pooled.alive):
+                del self._sessions[key]
+                self._schedule_close(pooled)
+
+    def _schedule_close(self, pooled: _PooledSession) -> None:
+        task = asyncio.create_task(pooled.close(), name=f"mcp.session.{pooled.server.name}.close")
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def _reset_for_loop(self) -> None:
+        # Sessions from another (likely closed) loop cannot be awaited here; drop them.
+        self._sessions.clear()
+        self._locks.clear()
+        self._closing.clear()
+        self._loop = asyncio.get_running_loop()
+
+
 class MCPClient:
-    """Thin asynchronous MCP client built on the official SDK."""
+    """Thin asynchronous MCP client built on the official SDK, with pooled sessions."""
 
-    def __init__(self, *, default_timeout: float = 10.0) -> None:
+    def __init__(self, *, default_timeout: float = 10.0, idle_seconds: float = 0.0) -> None:
         self._default_timeout = default_timeout
+        self._pool = _MCPSessionPool(timeout=default_timeout, idle_seconds=idle_seconds)
 
     async def close(self) -> None:
-        """Preserved for compatibility; sessions are created per call."""
+        """Close pooled sessions."""
+        await self._pool.aclose()
 
     async def call_tool(
         self,
@@ -94,7 +303,7 @@ class MCPClient:
         server = self._require_server(server_name, config=config)
         timeout_seconds = call_timeout or self._default_timeout
         payload = arguments or {}
-        async with self._session(server) as session:
+        async with self._pool.session(server) as session:
             try:
                 return await asyncio.wait_for(
                     session.call_tool(tool_name, arguments=payload),
@@ -107,11 +316,11 @@ class MCPClient:
     async def list_tools(self, server_name: str, *, config: MCPConfig | None = None) -> list[object]:
         """Return tool metadata exposed by the server."""
         server = self._require_server(server_name, config=config)
-        async with self._session(server) as session:
+        async with self._pool.session(server) as session:
             response = await asyncio.wait_for(
                 session.list_tools(),
                 timeout=self._default_timeout,
-        )
+            )
         tools = getattr(response, "tools", response)
         if isinstance(tools, Iterable):
             return list(tools)
@@ -135,22 +344,6 @@ class MCPClient:
             raise MCPServerNotConfiguredError(msg)
         return server
 
-    @asynccontextmanager
-    async def _session(self, server: MCPServerConfig) -> AsyncIterator[ClientSession]:
-        client_session_cls, http_transport_client = _ensure_mcp_sdk()
-        timeout = self._default_timeout
-        async with (
-            httpx.AsyncClient(headers=server.headers()) as http_client,
-            http_transport_client(str(server.url), http_client=http_client) as (read, write, _),
-            client_session_cls(read, write) as session,
-        ):
-            try:
-                await asyncio.wait_for(session.initialize(), timeout=timeout)
-            except TimeoutError as exc:
-                msg = f"MCP session initialization for '{server.name}' timed out after {timeout}s"
-                raise TimeoutError(msg) from exc
-            yield session
-
 
 class MCPServerNotConfiguredError(RuntimeError):
     """Raised when a requested MCP server is not configured."""
@@ -176,7 +369,7 @@ async def probe_mcp_server(url: str, headers: dict[str, str] | None = None) -> M
 
 @lru_cache(maxsize=1)
 def _client_singleton() -> MCPClient:
-    return MCPClient()
+    return MCPClient(idle_seconds=get_settings().MCP_SESSION_IDLE_SECONDS)
 
 
 def get_mcp_client() -> MCPClient:
@@ -185,7 +378,7 @@ def get_mcp_client() -> MCPClient:
 
 
 async def shutdown_mcp_client() -> None:
-    """Close the shared MCP client (mostly for tests)."""
+    """Close the shared MCP client and its pooled sessions."""
     if _client_singleton.cache_info().currsize == 0:
         return
     client = _client_singleton()
@@ -19,6 +19,7 @@ from cryptography.fernet import Fernet, InvalidToken
 from pydantic import ValidationError
 from sqlalchemy import Select, select
 
+from src.ai.mcp.catalog_cache import invalidate_user_tool_catalog
 from src.ai.mcp.client import MCPClientDependencyError, get_mcp_client, probe_mcp_server
 from src.ai.mcp.config import MCPAuthConfig, MCPConfig, MCPServerConfig
 from src.config.settings import get_settings
@@ -194,6 +195,7 @@ async def create_user_mcp_server(
     session.add(server)
     await session.flush()
     await session.refresh(server)
+    invalidate_user_tool_catalog(user_id)
     return server
 
 
@@ -204,6 +206,7 @@ async def delete_user_mcp_server(session: AsyncSession, *, user_id: uuid.UUID, s
         raise NotFoundError(message="MCP server not found", feature_area="mcp")
     await session.delete(server)
     await session.flush()
+    invalidate_user_tool_catalog(user_id)
 
 
 def _to_mcp_config(server: UserMCPServer) -> MCPServerConfig:
@@ -8,6 +8,7 @@ from src.ai.mcp.config import MCPConfig
 
 """Helpers for exposing user MCP tools to the LLM client."""
 
+import asyncio
 import json
 import logging
 from collections.abc import Mapping
@@ -17,8 +18,9 @@ from typing import Protocol, cast, runtime_checkable
 import httpx
 from pydantic import JsonValue
 
+from src.ai.mcp.catalog_cache import get_tool_catalog_cache
 from src.ai.mcp.client import MCPClientDependencyError, MCPServerNotConfiguredError, get_mcp_client
-from src.ai.mcp.service import get_user_mcp_config, list_user_mcp_tools
+from src.ai.mcp.service import get_user_mcp_config
 
 
 logger = logging.getLogger(__name__)
@@ -39,6 +41,8 @@ _MCP_TOOL_EXECUTION_ERROR_TYPES = (
     TypeError,
 )
 
+_MCP_TOOL_LISTING_ERROR_TYPES = (RuntimeError, *_MCP_TOOL_EXECUTION_ERROR_TYPES)
+
 
 @dataclass(slots=True)
 class MCPToolBinding:
@@ -63,21 +67,21 @@ class MCPToolBinding:
         }
 
 
-async def load_user_tool_bindings(session: AsyncSession, user_id: uuid.UUID) -> list[MCPToolBinding]:
-    """Load and normalize every MCP tool configured by the user."""
-    config = await get_user_mcp_config(session, user_id)
+async def load_user_tool_bindings(
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    *,
+    config: MCPConfig | None = None,
+) -> list[MCPToolBinding]:
+    """Load and normalize every MCP tool configured by the user.
+
+    Tool lists come from the per-user catalog cache; on a miss, every server
+    is listed concurrently.
+    """
+    resolved_config = config or await get_user_mcp_config(session, user_id)
+    catalog = await get_tool_catalog_cache().get(user_id, resolved_config, _list_server_tools)
     bindings: list[MCPToolBinding] = []
-    for server in config.servers.values():
-        try:
-            tool_descriptors = await list_user_mcp_tools(
-                session,
-                user_id=user_id,
-                server_name=server.name,
-                config=config,
-            )
-        except (TypeError, ValueError, RuntimeError) as exc:
-            logger.warning("Failed to load MCP tools for server %s: %s", server.name, exc)
-            continue
+    for server_name, tool_descriptors in catalog.items():
         for tool in tool_descriptors:
             name = _get_attr(tool, "name")
             if not isinstance(name, str) or not name:
@@ -86,7 +90,7 @@ async def load_user_tool_bindings(session: AsyncSession, user_id: uuid.UUID) ->
             schema = _coerce_schema(_get_attr(tool, "input_schema")) or _coerce_schema(_get_attr(tool, "inputSchema"))
             bindings.append(
                 MCPToolBinding(
-                    server_name=server.name,
+                    server_name=server_name,
                     tool_name=name,
                     description=str(description or ""),
                     input_schema=schema or {},
@@ -95,6 +99,26 @@ async def load_user_tool_bindings(session: AsyncSession, user_id: uuid.UUID) ->
     return bindings
 
 
+async def _list_server_tools(config: MCPConfig) -> tuple[dict[str, list[object]], bool]:
+    """List every server's tools concurrently; return them with whether all servers answered."""
+    client = get_mcp_client()
+    # Sorted so the tool schemas sent to the model keep one order, which provider prompt caching needs.
+    server_names = sorted(config.servers)
+    results = await asyncio.gather(
+        *(client.list_tools(name, config=config) for name in server_names),
+        return_exceptions=True,
+    )
+    catalog: dict[str, list[object]] = {}
+    for server_name, result in zip(server_names, results, strict=True):
+        if isinstance(result, _MCP_TOOL_LISTING_ERROR_TYPES):
+            logger.warning("Failed to load MCP tools for server %s: %s", server_name, result)
+            continue
+        if isinstance(result, BaseException):
+            raise result
+        catalog[server_name] = result
+    return catalog, len(catalog) == len(server_names)
+
+
 async def execute_user_tool_call(
     *,
     user_id: uuid.UUID,
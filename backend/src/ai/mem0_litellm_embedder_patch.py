@@ -32,6 +32,7 @@ from mem0.embeddings.base import EmbeddingBase
 from mem0.utils.factory import EmbedderFactory
 
 from src.ai.litellm_config import configure_litellm
+from src.ai.turn_embeddings import precomputed_embedding, shared_embedding
 
 
 logger = logging.getLogger(__name__)
@@ -53,10 +54,39 @@ class Mem0LiteLLMEmbedding(EmbeddingBase):
         """Return embedding vector for input text."""
         del memory_action  # unused by LiteLLM router today
 
-        cleaned = (text or "").replace("\n", " ").strip()
+        cleaned = _clean_text(text)
         if not cleaned:
             return []
 
+        # mem0 calls this from a worker thread; reuse a vector the current turn already computed.
+        precomputed = precomputed_embedding(model=self.config.model, dimensions=self._dimensions(), text=cleaned)
+        if precomputed is not None:
+            return precomputed
+
+        response = litellm.embedding(**self._embedding_kwargs(cleaned))
+        return _embedding_from_response(response)
+
+    async def aembed(self, text: str) -> list[float]:
+        """Embed ``text`` on the event loop, shared with the current turn so :meth:`embed` can reuse it."""
+        cleaned = _clean_text(text)
+        if not cleaned:
+            return []
+
+        async def compute() -> list[float]:
+            response = await litellm.aembedding(**self._embedding_kwargs(cleaned))
+            return _embedding_from_response(response)
+
+        return await shared_embedding(
+            model=self.config.model,
+            dimensions=self._dimensions(),
+            text=cleaned,
+            compute=compute,
+        )
+
+    def _dimensions(self) -> int | None:
+        return int(self.config.embedding_dims) if self.config.embedding_dims else None
+
+    def _embedding_kwargs(self, cleaned: str) -> dict[str, object]:
         kwargs: dict[str, object] = {
             "model": self.config.model,
             "input": [cleaned],
@@ -65,24 +95,30 @@ class Mem0LiteLLMEmbedding(EmbeddingBase):
             "max_retries": 0,
         }
 
-        if self.config.embedding_dims:
+        dimensions = self._dimensions()
+        if dimensions:
             # Some providers support this (e.g., OpenAI). Others don't.
-            kwargs["dimensions"] = int(self.config.embedding_dims)
+            kwargs["dimensions"] = dimensions
+        return kwargs
+
+
+def _clean_text(text: str) -> str:
+    return (text or "").replace("\n", " ").strip()
 
-        response = litellm.embedding(**kwargs)
 
-        data = getattr(response, "data", None)
-        if isinstance(data, Sequence) and data:
-            item = data[0]
-            embedding = item.get("embedding") if isinstance(item, dict) else getattr(item, "embedding", None)
-        else:
-            embedding = None
+def _embedding_from_response(response: object) -> list[float]:
+    data = getattr(response, "data", None)
+    if isinstance(data, Sequence) and data:
+        item = data[0]
+        embedding = item.get("embedding") if isinstance(item, dict) else getattr(item, "embedding", None)
+    else:
+        embedding = None
 
-        if not isinstance(embedding, Sequence) or isinstance(embedding, (str, bytes)):
-            msg = f"Unexpected LiteLLM embedding response shape: {type(response)}"
-            raise TypeError(msg)
+    if not isinstance(embedding, Sequence) or isinstance(embedding, (str, bytes)):
+        msg = f"Unexpected LiteLLM embedding response shape: {type(response)}"
+        raise TypeError(msg)
 
-        return [float(value) for value in embedding]
+    return [float(value) for value in embedding]
 
 
 def apply_mem0_litellm_embedder_patch() -> None:
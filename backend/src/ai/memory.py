@@ -31,7 +31,8 @@ from mem0.configs.base import MemoryConfig
 
 apply_mem0_telemetry_disable_patch()
 
-from src.ai.mem0_litellm_embedder_patch import apply_mem0_litellm_embedder_patch
+from src.ai.mem0_litellm_embedder_patch import Mem0LiteLLMEmbedding, apply_mem0_litellm_embedder_patch
+from src.ai.turn_embeddings import turn_embedding_scope_active
 from src.config.settings import get_settings
 
 
@@ -284,6 +285,12 @@ async def search_memories(
         return []
 
     async def _execute(client: AsyncMemory) -> list[MemoryRecord]:
+        embedder = client.embedding_model
+        if isinstance(embedder, Mem0LiteLLMEmbedding) and turn_embedding_scope_active():
+            # Embed through the turn's shared embeddings; mem0's threaded embed() then reuses the vector.
+            # It is shared with VectorRAG's query embedding only when the memory and RAG embedding model and
+            # dimensions are configured the same.
+            await embedder.aembed(query)
         if threshold is not None:
             results = await client.search(
                 query=query,
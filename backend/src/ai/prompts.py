@@ -710,6 +710,29 @@ Be concise, helpful, and honest about what the product can and cannot route dire
 # Memory Context System Prompt Template
 MEMORY_CONTEXT_SYSTEM_PROMPT = "Personal Context: {memory_context}"
 
+# Assistant Conversation History Prompts
+ASSISTANT_HISTORY_SUMMARY_SYSTEM_PROMPT = "Summary of the earlier part of this conversation:\n{summary}"
+
+ASSISTANT_HISTORY_SUMMARY_PROMPT = """You maintain a running summary of a tutoring conversation between a learner and Talimio's assistant.
+
+Update the existing summary with the new transcript so the assistant can continue the conversation without the full text.
+
+Keep:
+- Topics, courses, lessons and concepts discussed, and where the learner is in them
+- What the learner understood, struggled with, or got wrong, and explanations that worked
+- Open questions, promised follow-ups, and the learner's stated goals or preferences
+
+Rules:
+- Write compact plain-text bullet points, at most {max_words} words in total.
+- Prefer recent information when it contradicts older summary content.
+- Do not invent details that are not in the summary or transcript.
+
+Existing summary:
+{summary}
+
+New transcript:
+{transcript}"""
+
 
 # Code Execution Planning Prompt
 E2B_EXECUTION_SYSTEM_PROMPT = """
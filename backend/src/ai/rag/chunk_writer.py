@@ -0,0 +1,233 @@
+"""Bulk persistence of embedded RAG chunks into pgvector."""
+
+import json
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Literal, cast
+
+import psycopg
+from pgvector.psycopg import register_vector_async
+from pydantic import JsonValue
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.ai.rag.exceptions import RagUnavailableError
+
+
+type ChunkWriteMode = Literal["copy", "statement"]
+
+CHUNK_WRITE_MODE_COPY: ChunkWriteMode = "copy"
+CHUNK_WRITE_MODE_STATEMENT: ChunkWriteMode = "statement"
+
+_COPY_COLUMN_TYPES = ["int4", "text", "jsonb", "vector"]
+
+
+@dataclass(frozen=True, slots=True)
+class EmbeddedChunk:
+    """One chunk row ready to be written to rag_document_chunks."""
+
+    chunk_index: int
+    content: str
+    metadata: dict[str, JsonValue]
+    embedding: Sequence[float]
+
+
+@dataclass(frozen=True, slots=True)
+class ReusedChunk:
+    """A chunk row whose content is already embedded under ``source_chunk_index`` of the same document."""
+
+    chunk_index: int
+    source_chunk_index: int
+    content: str
+    metadata: dict[str, JsonValue]
+
+
+async def write_embedded_chunks(
+    session: AsyncSession,
+    *,
+    doc_id: uuid.UUID,
+    doc_type: str,
+    chunks: Sequence[EmbeddedChunk],
+    mode: ChunkWriteMode = CHUNK_WRITE_MODE_COPY,
+) -> None:
+    """Upsert a batch of embedded chunks in a constant number of round trips."""
+    if not chunks:
+        return
+
+    if mode == CHUNK_WRITE_MODE_COPY:
+        await _copy_embedded_chunks(session, doc_id=doc_id, doc_type=doc_type, chunks=chunks)
+        return
+
+    await _insert_embedded_chunks(session, doc_id=doc_id, doc_type=doc_type, chunks=chunks)
+
+
+async def _insert_embedded_chunks(
+    session: AsyncSession,
+    *,
+    doc_id: uuid.UUID,
+    doc_type: str,
+    chunks: Sequence[EmbeddedChunk],
+) -> None:
+    """Upsert a batch with one multi-row statement built from parallel arrays."""
+    await session.execute(
+        text(
+            """
+            INSERT INTO rag_document_chunks
+            (doc_id, doc_type, chunk_index, content, metadata, embedding, created_at)
+            SELECT :doc_id, :doc_type, chunk.chunk_index, chunk.content, chunk.metadata,
+                   CAST(chunk.embedding AS vector), NOW()
+            FROM unnest(
+                CAST(:chunk_indexes AS integer[]),
+                CAST(:contents AS text[]),
+                CAST(:metadata AS jsonb[]),
+                CAST(:embeddings AS text[])
+            ) AS chunk(chunk_index, content, metadata, embedding)
+            ON CONFLICT (doc_id, chunk_index)
+            DO UPDATE SET
+                content = EXCLUDED.content,
+                metadata = EXCLUDED.metadata,
+                embedding = EXCLUDED.embedding
+            """
+        ),
+        {
+            "doc_id": str(doc_id),
+            "doc_type": doc_type,
+            "chunk_indexes": [chunk.chunk_index for chunk in chunks],
+            "contents": [chunk.content for chunk in chunks],
+            "metadata": [json.dumps(chunk.metadata) for chunk in chunks],
+            "embeddings": [format_vector(chunk.embedding) for chunk in chunks],
+        },
+    )
+
+
+async def _copy_embedded_chunks(
+    session: AsyncSession,
+    *,
+    doc_id: uuid.UUID,
+    doc_type: str,
+    chunks: Sequence[EmbeddedChunk],
+) -> None:
+    """Stream a batch through binary COPY, then merge it with one upsert."""
+    # Binary COPY cannot resolve ON CONFLICT itself, so each batch lands in a
+    # transaction-scoped staging table first and is merged with a single upsert.
+    await session.execute(
+        text(
+            """
+            CREATE TEMP TABLE IF NOT EXISTS rag_chunk_ingest_staging (
+                chunk_index INTEGER NOT NULL,
+                content TEXT NOT NULL,
+                metadata JSONB,
+                embedding vector
+            ) ON COMMIT DROP
+            """
+        )
+    )
+
+    copy_sql = "COPY rag_chunk_ingest_staging (chunk_index, content, metadata, embedding) FROM STDIN (FORMAT BINARY)"
+    try:
+        driver_connection = await _get_driver_connection(session)
+        async with driver_connection.cursor() as cursor, cursor.copy(copy_sql) as copy:
+            copy.set_types(_COPY_COLUMN_TYPES)
+            for chunk in chunks:
+                await copy.write_row((chunk.chunk_index, chunk.content, chunk.metadata, list(chunk.embedding)))
+    except psycopg.Error as error:
+        message = "RAG chunk COPY into pgvector failed"
+        raise RagUnavailableError(message) from error
+
+    await session.execute(
+        text(
+            """
+            WITH staged AS (
+                DELETE FROM rag_chunk_ingest_staging
+                RETURNING chunk_index, content, metadata, embedding
+            )
+            INSERT INTO rag_document_chunks
+            (doc_id, doc_type, chunk_index, content, metadata, embedding, created_at)
+            SELECT :doc_id, :doc_type, chunk_index, content, metadata, embedding, NOW()
+            FROM staged
+            ON CONFLICT (doc_id, chunk_index)
+            DO UPDATE SET
+                content = EXCLUDED.content,
+                metadata = EXCLUDED.metadata,
+                embedding = EXCLUDED.embedding
+            """
+        ),
+        {"doc_id": str(doc_id), "doc_type": doc_type},
+    )
+
+
+async def reuse_chunk_embeddings(
+    session: AsyncSession,
+    *,
+    doc_id: uuid.UUID,
+    doc_type: str,
+    chunks: Sequence[ReusedChunk],
+) -> None:
+    """Upsert chunks whose embeddings already exist elsewhere in the same document."""
+    if not chunks:
+        return
+
+    # One statement reads every source row from its starting snapshot, so a chunk may
+    # reuse an embedding from an index that the same statement overwrites.
+    await session.execute(
+        text(
+            """
+            INSERT INTO rag_document_chunks
+            (doc_id, doc_type, chunk_index, content, metadata, embedding, created_at)
+            SELECT :doc_id, :doc_type, chunk.chunk_index, chunk.content, chunk.metadata, source.embedding, NOW()
+            FROM unnest(
+                CAST(:chunk_indexes AS integer[]),
+                CAST(:source_chunk_indexes AS integer[]),
+                CAST(:contents AS text[]),
+                CAST(:metadata AS jsonb[])
+            ) AS chunk(chunk_index, source_chunk_index, content, metadata)
+            JOIN rag_document_chunks AS source
+              ON source.doc_id = :doc_id
+             AND source.chunk_index = chunk.source_chunk_index
+            ON CONFLICT (doc_id, chunk_index)
+            DO UPDATE SET
+                content = EXCLUDED.content,
+                metadata = EXCLUDED.metadata,
+                embedding = EXCLUDED.embedding
+            """
+        ),
+        {
+            "doc_id": str(doc_id),
+            "doc_type": doc_type,
+            "chunk_indexes": [chunk.chunk_index for chunk in chunks],
+            "source_chunk_indexes": [chunk.source_chunk_index for chunk in chunks],
+            "contents": [chunk.content for chunk in chunks],
+            "metadata": [json.dumps(chunk.metadata) for chunk in chunks],
+        },
+    )
+
+
+async def delete_orphaned_chunks(session: AsyncSession, *, doc_id: uuid.UUID, keep_indexes: Sequence[int]) -> int:
+    """Delete stored chunks whose index is no longer produced by the document, returning the count."""
+    result = await session.execute(
+        text(
+            """
+            DELETE FROM rag_document_chunks
+            WHERE doc_id = :doc_id
+              AND chunk_index <> ALL(CAST(:keep_indexes AS integer[]))
+            """
+        ),
+        {"doc_id": str(doc_id), "keep_indexes": list(keep_indexes)},
+    )
+    return int(getattr(result, "rowcount", 0) or 0)
+
+
+async def _get_driver_connection(session: AsyncSession) -> psycopg.AsyncConnection:
+    """Return the psycopg connection behind the session with pgvector adapters registered."""
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = cast("psycopg.AsyncConnection", raw_connection.driver_connection)
+    if driver_connection.adapters.types.get("vector") is None:
+        await register_vector_async(driver_connection)
+    return driver_connection
+
+
+def format_vector(values: Sequence[float]) -> str:
+    """Format embedding sequence as a pgvector text literal."""
+    return "[" + ",".join(str(value) for value in values) + "]"
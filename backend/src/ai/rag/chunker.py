@@ -3,18 +3,35 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
+from functools import lru_cache
 
-from chonkie import Chunk, RecursiveChunker, RecursiveLevel, RecursiveRules
+from chonkie import AutoTokenizer, Chunk, RecursiveChunker, RecursiveLevel, RecursiveRules
 from chonkie.refinery import OverlapRefinery
 from fastapi.concurrency import run_in_threadpool
 
 from src.ai.rag.exceptions import RagUnavailableError
+from src.ai.rag.ingest_pool import get_ingest_pool
 
 
 _CHUNK_OVERLAP_RATIO = 0.12
 _MIN_CHARS_PER_CHUNK = 120
 _CHONKIE_TOKENIZER = "cl100k_base"
 _HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
+# Pages are chunked in windows of roughly this many characters so memory stays flat for any book size.
+_STREAM_WINDOW_CHARS = 200_000
+_PAGE_SEPARATOR = "\n\n"
+
+
+@lru_cache(maxsize=1)
+def _get_tokenizer() -> AutoTokenizer:
+    """Load the Chonkie tokenizer once per process; loading it dominates small chunking jobs."""
+    return AutoTokenizer(_CHONKIE_TOKENIZER)
+
+
+def preload_chunk_tokenizer() -> None:
+    """Load the chunking tokenizer ahead of the first document, e.g. in a pool worker."""
+    _get_tokenizer()
 
 
 def _build_markdown_rules() -> RecursiveRules:
@@ -30,24 +47,48 @@ def _build_markdown_rules() -> RecursiveRules:
     )
 
 
-def _collect_heading_context(text: str) -> list[tuple[int, str, str]]:
-    """Collect heading offsets and section paths from Markdown-ish text."""
+def _collect_heading_context(
+    text: str,
+    inherited_stack: dict[int, str] | None = None,
+) -> list[tuple[int, str, str]]:
+    """Collect heading offsets and section paths from Markdown-ish text.
+
+    ``inherited_stack`` carries the open sections from earlier text, so chunks
+    before the first heading in ``text`` still get a section path.
+    """
     headings: list[tuple[int, str, str]] = []
-    stack: dict[int, str] = {}
+    stack = dict(inherited_stack or {})
+    if stack:
+        headings.append((-1, stack[max(stack)], _section_path(stack)))
 
     for match in _HEADING_RE.finditer(text):
         level = len(match.group(1))
         title = match.group(2).strip()
-        for existing_level in list(stack):
-            if existing_level >= level:
-                del stack[existing_level]
-        stack[level] = title
-        section_path = " > ".join(stack[key] for key in sorted(stack))
-        headings.append((match.start(), title, section_path))
+        _push_heading(stack, level, title)
+        headings.append((match.start(), title, _section_path(stack)))
 
     return headings
 
 
+def _advance_heading_stack(text: str, stack: dict[int, str]) -> dict[int, str]:
+    """Return the open sections after reading ``text`` on top of ``stack``."""
+    advanced = dict(stack)
+    for match in _HEADING_RE.finditer(text):
+        _push_heading(advanced, len(match.group(1)), match.group(2).strip())
+    return advanced
+
+
+def _push_heading(stack: dict[int, str], level: int, title: str) -> None:
+    for existing_level in list(stack):
+        if existing_level >= level:
+            del stack[existing_level]
+    stack[level] = title
+
+
+def _section_path(stack: dict[int, str]) -> str:
+    return " > ".join(stack[key] for key in sorted(stack))
+
+
 def _metadata_for_chunk(start_index: int, headings: list[tuple[int, str, str]]) -> dict[str, object]:
     """Return source-section metadata for a chunk offset."""
     metadata: dict[str, object] = {}
@@ -88,53 +129,128 @@ def _chunk_text_with_metadata_sync(
     chunk_overlap_ratio: float = 0.12,
 ) -> tuple[list[str], list[dict[str, object]]]:
     """Chunk text and keep source-section metadata beside each chunk."""
-    normalized_text = text.strip()
-    if not normalized_text:
-        return [], []
+    return chunk_pages_with_metadata(
+        [text],
+        document_title=document_title,
+        chunk_size=chunk_size,
+        chunk_overlap_ratio=chunk_overlap_ratio,
+    )
+
+
+def _iter_page_windows(pages: Iterable[str], window_chars: int) -> Iterable[tuple[str, bool]]:
+    """Group non-empty pages into windows of at least ``window_chars``; flag the last one."""
+    buffered: list[str] = []
+    buffered_chars = 0
+    for page in pages:
+        page_text = page.strip()
+        if not page_text:
+            continue
+        buffered.append(page_text)
+        buffered_chars += len(page_text)
+        if buffered_chars >= window_chars:
+            yield _PAGE_SEPARATOR.join(buffered), False
+            buffered = []
+            buffered_chars = 0
+    yield _PAGE_SEPARATOR.join(buffered), True
 
-    heading_context = _collect_heading_context(normalized_text)
+
+def chunk_pages_with_metadata(
+    pages: Iterable[str],
+    *,
+    document_title: str | None = None,
+    chunk_size: int = 400,
+    chunk_overlap_ratio: float = 0.12,
+    window_chars: int | None = None,
+) -> tuple[list[str], list[dict[str, object]]]:
+    """Chunk a stream of pages without joining the whole document into one string.
+
+    Each window's trailing chunk may be cut at the window edge, so its text is
+    carried into the next window and re-chunked there together with the open
+    heading sections, so no emitted chunk is split at a window edge. Blocks
+    while tokenizing; use :func:`chunk_pages_with_metadata_async` on the event loop.
+    """
     chunker = RecursiveChunker(
-        tokenizer=_CHONKIE_TOKENIZER,
+        tokenizer=_get_tokenizer(),
         chunk_size=chunk_size,
         rules=_build_markdown_rules(),
         min_characters_per_chunk=_MIN_CHARS_PER_CHUNK,
     )
-    raw_chunks = []
-    for chunk in chunker.chunk(normalized_text):
-        if not _is_useful_chunk(chunk.text):
-            continue
-        chunk.metadata.update(_metadata_for_chunk(chunk.start_index, heading_context))
-        chunk.metadata["contextualized"] = True
-        token_count = getattr(chunk, "token_count", None)
-        if isinstance(token_count, int):
-            chunk.metadata["token_count"] = token_count
-        raw_chunks.append(chunk)
-
-    if not raw_chunks:
-        return [], []
-
     overlap_refinery = OverlapRefinery(
-        tokenizer=_CHONKIE_TOKENIZER,
+        tokenizer=_get_tokenizer(),
         context_size=chunk_overlap_ratio,
         method="prefix",
         merge=False,
     )
-    refined_chunks: list[Chunk] = overlap_refinery.refine(raw_chunks)
 
     chunks: list[str] = []
     metadata: list[dict[str, object]] = []
-    for chunk in refined_chunks:
-        chunk_text = chunk.text.strip()
-        chunk_metadata = dict(chunk.metadata)
-        token_count = getattr(chunk, "token_count", None)
-        if isinstance(token_count, int):
-            chunk_metadata["token_count"] = token_count
-        chunks.append(_add_chunk_context(chunk_text, document_title, chunk_metadata))
-        metadata.append(chunk_metadata)
+    carried_text = ""
+    heading_stack: dict[int, str] = {}
+    previous_chunk: Chunk | None = None
+    for window_pages, is_last_window in _iter_page_windows(pages, window_chars or _STREAM_WINDOW_CHARS):
+        window_text = _PAGE_SEPARATOR.join(part for part in (carried_text, window_pages) if part).strip()
+        if not window_text:
+            continue
+
+        window_chunks = chunker.chunk(window_text)
+        carried_text = ""
+        if not is_last_window and len(window_chunks) > 1:
+            carry_start = window_chunks[-1].start_index
+            carried_text = window_text[carry_start:]
+            window_chunks = window_chunks[:-1]
+            next_heading_stack = _advance_heading_stack(window_text[:carry_start], heading_stack)
+        elif not is_last_window:
+            # A single chunk may itself be cut at the window edge; re-chunk it with the next window.
+            carried_text = window_text
+            continue
+        else:
+            next_heading_stack = heading_stack
+
+        raw_chunks = _select_useful_chunks(window_chunks, _collect_heading_context(window_text, heading_stack))
+        heading_stack = next_heading_stack
+        if not raw_chunks:
+            continue
+
+        # The previous window's last chunk is refined again only to give this window's first chunk its overlap.
+        refined_chunks: list[Chunk] = overlap_refinery.refine(
+            [previous_chunk, *raw_chunks] if previous_chunk is not None else raw_chunks
+        )
+        if previous_chunk is not None:
+            refined_chunks = refined_chunks[1:]
+        previous_chunk = raw_chunks[-1]
+
+        for chunk in refined_chunks:
+            chunk_text, chunk_metadata = _finalize_chunk(chunk, document_title)
+            chunks.append(chunk_text)
+            metadata.append(chunk_metadata)
 
     return chunks, metadata
 
 
+def _finalize_chunk(chunk: Chunk, document_title: str | None) -> tuple[str, dict[str, object]]:
+    """Return the contextualized chunk text to embed and its metadata."""
+    chunk_metadata = dict(chunk.metadata)
+    token_count = getattr(chunk, "token_count", None)
+    if isinstance(token_count, int):
+        chunk_metadata["token_count"] = token_count
+    return _add_chunk_context(chunk.text.strip(), document_title, chunk_metadata), chunk_metadata
+
+
+def _select_useful_chunks(window_chunks: Iterable[Chunk], headings: list[tuple[int, str, str]]) -> list[Chunk]:
+    """Drop noise chunks and attach section metadata to the rest."""
+    raw_chunks: list[Chunk] = []
+    for chunk in window_chunks:
+        if not _is_useful_chunk(chunk.text):
+            continue
+        chunk.metadata.update(_metadata_for_chunk(chunk.start_index, headings))
+        chunk.metadata["contextualized"] = True
+        token_count = getattr(chunk, "token_count", None)
+        if isinstance(token_count, int):
+            chunk.metadata["token_count"] = token_count
+        raw_chunks.append(chunk)
+    return raw_chunks
+
+
 async def chunk_text_with_metadata_async(
     text: str,
     *,
@@ -142,8 +258,20 @@ async def chunk_text_with_metadata_async(
     chunk_size: int = 400,
     chunk_overlap_ratio: float = 0.12,
 ) -> tuple[list[str], list[dict[str, object]]]:
-    """Chunk text and return metadata aligned by chunk index."""
+    """Chunk text and return metadata aligned by chunk index.
+
+    Runs in the ingest process pool when one is configured, otherwise on a worker thread.
+    """
+    ingest_pool = get_ingest_pool()
     try:
+        if ingest_pool is not None:
+            return await ingest_pool.run(
+                _chunk_text_with_metadata_sync,
+                text,
+                document_title,
+                chunk_size=chunk_size,
+                chunk_overlap_ratio=chunk_overlap_ratio,
+            )
         return await run_in_threadpool(
             _chunk_text_with_metadata_sync,
             text,
@@ -154,3 +282,27 @@ async def chunk_text_with_metadata_async(
     except OSError as error:
         message = "RAG text chunking failed"
         raise RagUnavailableError(message) from error
+
+
+async def chunk_pages_with_metadata_async(
+    pages: Iterable[str],
+    *,
+    document_title: str | None = None,
+    chunk_size: int = 400,
+    chunk_overlap_ratio: float = 0.12,
+) -> tuple[list[str], list[dict[str, object]]]:
+    """Chunk pages as they are produced and return metadata aligned by chunk index.
+
+    ``pages`` is consumed on a worker thread, so it may be a lazy page parser.
+    """
+    try:
+        return await run_in_threadpool(
+            chunk_pages_with_metadata,
+            pages,
+            document_title=document_title,
+            chunk_size=chunk_size,
+            chunk_overlap_ratio=chunk_overlap_ratio,
+        )
+    except OSError as error:
+        message = "RAG text chunking failed"
+        raise RagUnavailableError(message) from error
@@ -1,10 +1,20 @@
 """Plain RAG configuration derived from canonical application settings."""
 
 from dataclasses import dataclass
+from typing import Literal
 
+from src.ai.rag.chunk_writer import ChunkWriteMode
+from src.ai.rag.reindex import ReindexMode
 from src.config.settings import Settings, get_settings
 
 
+type SearchMode = Literal["fused", "staged"]
+type HnswIterativeScan = Literal["off", "relaxed_order", "strict_order"]
+
+SEARCH_MODE_FUSED: SearchMode = "fused"
+SEARCH_MODE_STAGED: SearchMode = "staged"
+
+
 @dataclass(frozen=True, slots=True)
 class RAGConfig:
     """RAG system configuration used by the LiteLLM + pgvector pipeline."""
@@ -14,12 +24,22 @@ class RAGConfig:
     embedding_manual_retries: int
     embedding_retry_delay_seconds: float
     embedding_batch_size: int
+    embedding_max_in_flight_batches: int
+    embedding_rate_limit_retries: int
+    embedding_cache_max_entries: int
     embedding_output_dim: int | None
     hnsw_ef_search: int
+    hnsw_iterative_scan: HnswIterativeScan
     rerank_model: str
     max_file_size_mb: int
     chunk_size: int
     chunk_overlap_ratio: float
+    ingest_pool_workers: int
+    chunk_write_mode: ChunkWriteMode
+    reindex_mode: ReindexMode
+    search_mode: SearchMode
+    search_cache_ttl_seconds: float
+    search_cache_max_entries: int
 
 
 def get_rag_config(settings: Settings | None = None) -> RAGConfig:
@@ -31,10 +51,20 @@ def get_rag_config(settings: Settings | None = None) -> RAGConfig:
         embedding_manual_retries=resolved_settings.RAG_EMBEDDING_MANUAL_RETRIES,
         embedding_retry_delay_seconds=resolved_settings.RAG_EMBEDDING_RETRY_DELAY_SECONDS,
         embedding_batch_size=resolved_settings.RAG_EMBEDDING_BATCH_SIZE,
+        embedding_max_in_flight_batches=resolved_settings.RAG_EMBEDDING_MAX_IN_FLIGHT_BATCHES,
+        embedding_rate_limit_retries=resolved_settings.RAG_EMBEDDING_RATE_LIMIT_RETRIES,
+        embedding_cache_max_entries=resolved_settings.RAG_EMBEDDING_CACHE_MAX_ENTRIES,
         embedding_output_dim=resolved_settings.RAG_EMBEDDING_OUTPUT_DIM,
         hnsw_ef_search=resolved_settings.RAG_HNSW_EF_SEARCH,
+        hnsw_iterative_scan=resolved_settings.RAG_HNSW_ITERATIVE_SCAN,
         rerank_model=resolved_settings.RAG_RERANK_MODEL,
         max_file_size_mb=resolved_settings.RAG_MAX_FILE_SIZE_MB,
         chunk_size=resolved_settings.RAG_CHUNK_SIZE,
         chunk_overlap_ratio=resolved_settings.RAG_CHUNK_OVERLAP_RATIO,
+        ingest_pool_workers=resolved_settings.RAG_INGEST_POOL_WORKERS,
+        chunk_write_mode=resolved_settings.RAG_CHUNK_WRITE_MODE,
+        reindex_mode=resolved_settings.RAG_REINDEX_MODE,
+        search_mode=resolved_settings.RAG_SEARCH_MODE,
+        search_cache_ttl_seconds=resolved_settings.RAG_SEARCH_CACHE_TTL_SECONDS,
+        search_cache_max_entries=resolved_settings.RAG_SEARCH_CACHE_MAX_ENTRIES,
     )
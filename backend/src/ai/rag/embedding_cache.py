@@ -0,0 +1,194 @@
+"""Content-addressed embedding cache shared across documents and re-ingests."""
+
+import hashlib
+import json
+import logging
+from collections.abc import Mapping, Sequence
+
+from opentelemetry import metrics
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.ai.rag.chunk_writer import format_vector
+
+
+logger = logging.getLogger(__name__)
+
+_meter = metrics.get_meter(__name__)
+_cache_hits = _meter.create_counter(
+    "rag.embedding_cache.hits",
+    unit="{embedding}",
+    description="Embeddings served from the content-addressed cache",
+)
+_cache_misses = _meter.create_counter(
+    "rag.embedding_cache.misses",
+    unit="{embedding}",
+    description="Embeddings that had to be requested from the provider",
+)
+
+# Eviction sorts the whole cache by recency, so it runs after a batch of new rows rather than per write.
+_PRUNE_EVERY_NEW_ENTRIES = 1_000
+
+
+class _PruneSchedule:
+    """Process-wide count of rows written since the last eviction pass.
+
+    Callers build a new :class:`EmbeddingCache` per request, so the count must
+    outlive any one instance for eviction to ever run.
+    """
+
+    def __init__(self) -> None:
+        self.new_entries = 0
+
+    def record(self, count: int, *, max_entries: int) -> bool:
+        """Add ``count`` new rows; return whether an eviction pass is due now."""
+        self.new_entries += count
+        # Small caches prune sooner so they never overshoot their capacity by more than a tenth.
+        if self.new_entries < min(_PRUNE_EVERY_NEW_ENTRIES, max(max_entries // 10, 1)):
+            return False
+        self.new_entries = 0
+        return True
+
+
+_prune_schedule = _PruneSchedule()
+
+
+def content_hash(content: str) -> bytes:
+    """Return the cache key digest for one embedding input."""
+    return hashlib.sha256(content.encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """Postgres-backed embedding cache keyed by (model, dimensions, sha256(text)).
+
+    The cache is best-effort: database failures are logged and treated as misses
+    so ingestion and search never fail because of it. Rows are evicted least
+    recently used first once the table grows past ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        *,
+        model: str,
+        dimensions: int | None,
+        max_entries: int,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        self.model = model
+        # 0 stands for "provider default" so the key stays NOT NULL.
+        self.dimensions = dimensions or 0
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._session_factory = session_factory
+
+    async def get_many(self, hashes: Sequence[bytes]) -> dict[bytes, list[float]]:
+        """Return cached embeddings for the given content hashes, touching their recency."""
+        unique_hashes = list(dict.fromkeys(hashes))
+        if not unique_hashes:
+            return {}
+
+        try:
+            async with self._session_factory() as session:
+                result = await session.execute(
+                    text(
+                        """
+                        WITH hits AS (
+                            SELECT content_sha256, embedding, last_used_at
+                            FROM rag_embedding_cache
+                            WHERE model = :model
+                              AND dimensions = :dimensions
+                              AND content_sha256 = ANY(CAST(:hashes AS bytea[]))
+                        ),
+                        touched AS (
+                            -- Recency only needs hour granularity for LRU, so hot rows are not rewritten on every hit.
+                            UPDATE rag_embedding_cache AS cache
+                            SET last_used_at = NOW()
+                            FROM hits
+                            WHERE cache.model = :model
+                              AND cache.dimensions = :dimensions
+                              AND cache.content_sha256 = hits.content_sha256
+                              AND hits.last_used_at < NOW() - INTERVAL '1 hour'
+                        )
+                        SELECT content_sha256, CAST(embedding AS text) AS embedding
+                        FROM hits
+                        """
+                    ),
+                    {"model": self.model, "dimensions": self.dimensions, "hashes": unique_hashes},
+                )
+                rows = result.all()
+                await session.commit()
+        except SQLAlchemyError as error:
+            logger.warning("rag.embedding_cache.lookup_failed", extra={"model": self.model, "error": str(error)})
+            rows = []
+
+        cached = {bytes(row.content_sha256): [float(value) for value in json.loads(row.embedding)] for row in rows}
+        self._record_lookup(hit_count=len(cached), miss_count=len(unique_hashes) - len(cached))
+        return cached
+
+    async def put_many(self, embeddings: Mapping[bytes, Sequence[float]]) -> None:
+        """Store freshly generated embeddings, evicting least recently used rows when over capacity."""
+        if not embeddings:
+            return
+
+        try:
+            async with self._session_factory() as session:
+                result = await session.execute(
+                    text(
+                        """
+                        INSERT INTO rag_embedding_cache (model, dimensions, content_sha256, embedding)
+                        SELECT :model, :dimensions, entry.content_sha256, CAST(entry.embedding AS vector)
+                        FROM unnest(
+                            CAST(:hashes AS bytea[]),
+                            CAST(:embeddings AS text[])
+                        ) AS entry(content_sha256, embedding)
+                        ON CONFLICT (model, dimensions, content_sha256) DO NOTHING
+                        """
+                    ),
+                    {
+                        "model": self.model,
+                        "dimensions": self.dimensions,
+                        "hashes": list(embeddings),
+                        "embeddings": [format_vector(embedding) for embedding in embeddings.values()],
+                    },
+                )
+                inserted = int(getattr(result, "rowcount", 0) or 0)
+                if _prune_schedule.record(inserted, max_entries=self.max_entries):
+                    await self._evict_least_recently_used(session)
+                await session.commit()
+        except SQLAlchemyError as error:
+            logger.warning("rag.embedding_cache.store_failed", extra={"model": self.model, "error": str(error)})
+
+    async def _evict_least_recently_used(self, session: AsyncSession) -> None:
+        """Delete rows beyond the configured capacity, oldest use first."""
+        result = await session.execute(
+            text(
+                """
+                DELETE FROM rag_embedding_cache
+                WHERE ctid IN (
+                    SELECT ctid
+                    FROM rag_embedding_cache
+                    ORDER BY last_used_at DESC
+                    OFFSET :max_entries
+                )
+                """
+            ),
+            {"max_entries": self.max_entries},
+        )
+        evicted = int(getattr(result, "rowcount", 0) or 0)
+        if evicted:
+            logger.info("rag.embedding_cache.evicted", extra={"evicted": evicted, "max_entries": self.max_entries})
+
+    def _record_lookup(self, *, hit_count: int, miss_count: int) -> None:
+        self.hits += hit_count
+        self.misses += miss_count
+        attributes = {"model": self.model}
+        if hit_count:
+            _cache_hits.add(hit_count, attributes)
+        if miss_count:
+            _cache_misses.add(miss_count, attributes)
+        logger.debug(
+            "rag.embedding_cache.lookup",
+            extra={"model": self.model, "hits": hit_count, "misses": miss_count},
+        )
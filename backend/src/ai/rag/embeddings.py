@@ -1,16 +1,18 @@
 """Vector-based RAG implementation using LiteLLM embeddings and pgvector."""
 
 import asyncio
-import json
 import logging
 import math
+import time
 import uuid
 from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import partial
 from itertools import batched
 from typing import cast
 
 import litellm
+from opentelemetry import metrics
 from pydantic import JsonValue
 from sqlalchemy import text
 from sqlalchemy.engine import RowMapping
@@ -18,9 +20,28 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.ai.litellm_config import configure_litellm
-from src.ai.rag.config import get_rag_config
+from src.ai.rag.chunk_writer import (
+    EmbeddedChunk,
+    delete_orphaned_chunks,
+    format_vector,
+    reuse_chunk_embeddings,
+    write_embedded_chunks,
+)
+from src.ai.rag.config import SEARCH_MODE_FUSED, get_rag_config
+from src.ai.rag.embedding_cache import EmbeddingCache, content_hash
 from src.ai.rag.exceptions import RagUnavailableError, RagValidationError
+from src.ai.rag.reindex import (
+    REINDEX_MODE_INCREMENTAL,
+    ChunkPayload,
+    ChunkReindexReport,
+    fetch_existing_chunks,
+    plan_chunk_reindex,
+    plan_full_reindex,
+)
 from src.ai.rag.schemas import SearchResult
+from src.ai.rag.search_cache import RAGSearchCache, SearchCacheKey, get_rag_search_cache, normalize_query
+from src.ai.turn_embeddings import shared_embedding
+from src.database.session import async_session_maker
 
 
 logger = logging.getLogger(__name__)
@@ -50,9 +71,12 @@ _EMBEDDING_RUNTIME_ERROR_TYPES = (
     ConnectionError,
     OSError,
     litellm.Timeout,
+    litellm.RateLimitError,
     *_LITELLM_PROVIDER_ERROR_TYPES,
 )
 
+_EMBEDDING_RATE_LIMIT_ERROR_TYPES = (litellm.RateLimitError,)
+
 _VECTOR_SEARCH_FALLBACK_ERROR_TYPES = (
     SQLAlchemyError,
     *_EMBEDDING_RUNTIME_ERROR_TYPES,
@@ -61,6 +85,14 @@ _NEIGHBOR_CONTEXT_WINDOW = 1
 _NEIGHBOR_CONTEXT_MAX_CHARS = 5_500
 _HYBRID_CANDIDATE_MULTIPLIER = 4
 _RRF_K = 60
+_HNSW_SETTINGS_TRANSACTION_KEY = "rag_hnsw_settings_transaction"
+
+_meter = metrics.get_meter(__name__)
+_search_stage_duration = _meter.create_histogram(
+    "rag.search.stage.duration",
+    unit="ms",
+    description="Hybrid search latency per stage (embed, retrieve, expand, total)",
+)
 
 
 @dataclass
@@ -89,6 +121,56 @@ class _FusedSearchItem:
         return metadata
 
 
+class _EmbeddingRateLimitGate:
+    """Provider backoff shared by every in-flight embedding batch for one model."""
+
+    def __init__(self) -> None:
+        self._resume_at = 0.0
+        self._consecutive_hits = 0
+
+    async def wait(self) -> None:
+        """Sleep until the shared backoff window has passed."""
+        delay_seconds = self._resume_at - time.monotonic()
+        if delay_seconds > 0:
+            await asyncio.sleep(delay_seconds)
+
+    def record_rate_limit(self, *, base_delay_seconds: float, retry_after_seconds: float | None) -> float:
+        """Extend the shared backoff window after a 429 and return its length."""
+        self._consecutive_hits += 1
+        delay_seconds = retry_after_seconds
+        if delay_seconds is None:
+            delay_seconds = base_delay_seconds * math.pow(2, self._consecutive_hits - 1)
+        self._resume_at = max(self._resume_at, time.monotonic() + delay_seconds)
+        return delay_seconds
+
+    def record_success(self) -> None:
+        """Reset exponential growth once the provider accepts requests again."""
+        self._consecutive_hits = 0
+
+
+_RATE_LIMIT_GATES: dict[str, _EmbeddingRateLimitGate] = {}
+
+
+def _get_rate_limit_gate(model: str) -> _EmbeddingRateLimitGate:
+    gate = _RATE_LIMIT_GATES.get(model)
+    if gate is None:
+        gate = _EmbeddingRateLimitGate()
+        _RATE_LIMIT_GATES[model] = gate
+    return gate
+
+
+def _retry_after_seconds(error: BaseException) -> float | None:
+    """Read a provider Retry-After header from a rate-limit error when present."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is None:
+        return None
+    try:
+        raw_value = headers.get("retry-after")
+        return max(float(raw_value), 0.0) if raw_value is not None else None
+    except AttributeError, TypeError, ValueError:
+        return None
+
+
 def _is_json_value(value: object) -> bool:
     if isinstance(value, float) and not math.isfinite(value):
         return False
@@ -117,6 +199,20 @@ class VectorRAG:
         self.manual_retry_attempts = config.embedding_manual_retries
         self.retry_backoff_seconds = config.embedding_retry_delay_seconds
         self.batch_size = config.embedding_batch_size
+        self.max_in_flight_batches = config.embedding_max_in_flight_batches
+        self.rate_limit_retry_attempts = config.embedding_rate_limit_retries
+        self.chunk_write_mode = config.chunk_write_mode
+        self.reindex_mode = config.reindex_mode
+        self.search_mode = config.search_mode
+        self.embedding_cache: EmbeddingCache | None = None
+        if config.embedding_cache_max_entries > 0:
+            self.embedding_cache = EmbeddingCache(
+                model=self.embedding_model,
+                dimensions=self.configured_embedding_dim,
+                max_entries=config.embedding_cache_max_entries,
+                session_factory=async_session_maker,
+            )
+        self.search_cache: RAGSearchCache = get_rag_search_cache()
 
         self._db_embedding_dim: int | None = None
         self._effective_embedding_dim: int | None = self.configured_embedding_dim
@@ -128,13 +224,41 @@ class VectorRAG:
                 "model": self.embedding_model,
                 "configured_dim": self.configured_embedding_dim,
                 "batch_size": self.batch_size,
+                "max_in_flight_batches": self.max_in_flight_batches,
+                "chunk_write_mode": self.chunk_write_mode,
+                "reindex_mode": self.reindex_mode,
+                "search_mode": self.search_mode,
+                "embedding_cache_enabled": self.embedding_cache is not None,
+                "search_cache_enabled": self.search_cache.enabled,
                 "context_size": self.embedding_context_size,
             },
         )
 
     async def generate_embedding(self, text: str) -> list[float]:
-        """Generate embedding for a single text input."""
-        embeddings = await self._embed_texts([text])
+        """Generate embedding for a single text input, reusing this turn's and recent query embeddings."""
+        return await shared_embedding(
+            model=self.embedding_model,
+            dimensions=self.configured_embedding_dim,
+            text=text,
+            compute=partial(self._generate_query_embedding, text),
+        )
+
+    async def _generate_query_embedding(self, text: str) -> list[float]:
+        cached = self.search_cache.get_embedding(
+            model=self.embedding_model,
+            dimensions=self.configured_embedding_dim,
+            text=text,
+        )
+        if cached is not None:
+            return cached
+        # One-off search queries stay out of the persistent cache, which holds chunk and document embeddings.
+        embeddings = await self._request_embeddings([text])
+        self.search_cache.put_embedding(
+            model=self.embedding_model,
+            dimensions=self.configured_embedding_dim,
+            text=text,
+            embedding=embeddings[0],
+        )
         return embeddings[0]
 
     async def generate_embeddings(self, texts: Sequence[str]) -> list[list[float]]:
@@ -152,12 +276,18 @@ class VectorRAG:
         course_id: uuid.UUID | None = None,
         extra_metadata: dict[str, object] | None = None,
         per_chunk_metadata: Sequence[dict[str, object]] | None = None,
-    ) -> None:
-        """Store document chunks with their embeddings in pgvector."""
+    ) -> ChunkReindexReport:
+        """Store document chunks with their embeddings in pgvector.
+
+        In incremental re-index mode only chunks whose content the document does not
+        already hold are embedded; stored chunk indexes that the new chunking no
+        longer produces are deleted in both modes.
+        """
+        self.search_cache.invalidate_scope_on_commit(session, doc_type=doc_type, doc_id=doc_id, course_id=course_id)
         try:
             await self._ensure_dimensions(session)
 
-            chunk_payloads: list[tuple[int, str, dict[str, JsonValue]]] = []
+            chunk_payloads: list[ChunkPayload] = []
             total_chunks = len(chunks)
             for index, raw_chunk in enumerate(chunks):
                 chunk_text = raw_chunk.strip()
@@ -184,56 +314,146 @@ class VectorRAG:
                 message = "No valid chunks to store"
                 raise RagValidationError(message)
 
+            if self.reindex_mode == REINDEX_MODE_INCREMENTAL:
+                existing_chunks = await fetch_existing_chunks(session, doc_id)
+                plan = plan_chunk_reindex(chunk_payloads, existing_chunks)
+            else:
+                plan = plan_full_reindex(chunk_payloads)
+
             logger.info(
-                "Storing %s chunks for doc_id=%s doc_type=%s (batch_size=%s)",
+                "Storing %s chunks for doc_id=%s doc_type=%s (embed=%s, reuse=%s, unchanged=%s, batch_size=%s, "
+                "max_in_flight_batches=%s)",
                 len(chunk_payloads),
                 doc_id,
                 doc_type,
+                len(plan.to_embed),
+                len(plan.to_reuse),
+                plan.unchanged_count,
                 self.batch_size,
+                self.max_in_flight_batches,
             )
 
-            for batch in batched(chunk_payloads, self.batch_size, strict=False):
-                texts = [payload[1] for payload in batch]
-                embeddings = await self._embed_texts(texts)
-
-                for (chunk_index, chunk_text, chunk_metadata), embedding in zip(batch, embeddings, strict=True):
-                    embedding_str = self._format_vector(embedding)
-                    await session.execute(
-                        text(
-                            """
-                            INSERT INTO rag_document_chunks
-                            (doc_id, doc_type, chunk_index, content, metadata, embedding, created_at)
-                            VALUES (:doc_id, :doc_type, :chunk_index, :content, CAST(:metadata AS jsonb),
-                                    CAST(:embedding AS vector), NOW())
-                            ON CONFLICT (doc_id, chunk_index)
-                            DO UPDATE SET
-                                content = EXCLUDED.content,
-                                metadata = EXCLUDED.metadata,
-                                embedding = EXCLUDED.embedding
-                            """
-                        ),
-                        {
-                            "doc_id": str(doc_id),
-                            "doc_type": doc_type,
-                            "chunk_index": chunk_index,
-                            "content": chunk_text,
-                            "metadata": json.dumps(chunk_metadata),
-                            "embedding": embedding_str,
-                        },
-                    )
+            started_at = time.perf_counter()
+            # Reused rows are copied first: their source rows may be overwritten by newly embedded chunks.
+            await reuse_chunk_embeddings(session, doc_id=doc_id, doc_type=doc_type, chunks=plan.to_reuse)
+            if plan.to_embed:
+                await self._embed_and_write_pipelined(
+                    session,
+                    doc_id=doc_id,
+                    doc_type=doc_type,
+                    chunk_payloads=plan.to_embed,
+                )
+            deleted_chunks = await delete_orphaned_chunks(session, doc_id=doc_id, keep_indexes=plan.keep_indexes)
 
             await session.flush()
+            elapsed_seconds = time.perf_counter() - started_at
+            report = ChunkReindexReport(
+                mode=self.reindex_mode,
+                total_chunks=len(chunk_payloads),
+                embedded_chunks=len(plan.to_embed),
+                reused_chunks=len(plan.to_reuse),
+                unchanged_chunks=plan.unchanged_count,
+                deleted_chunks=deleted_chunks,
+            )
             logger.info(
-                "Persisted %s chunks for doc_id=%s doc_type=%s",
-                len(chunk_payloads),
-                doc_id,
-                doc_type,
+                "rag.ingest.reindexed",
+                extra={
+                    "doc_id": str(doc_id),
+                    "doc_type": doc_type,
+                    "reindex_mode": report.mode,
+                    "total_chunks": report.total_chunks,
+                    "embedded_chunks": report.embedded_chunks,
+                    "reused_chunks": report.reused_chunks,
+                    "unchanged_chunks": report.unchanged_chunks,
+                    "deleted_chunks": report.deleted_chunks,
+                    "skipped_embeddings": report.skipped_embeddings,
+                    "write_mode": self.chunk_write_mode,
+                    "elapsed_ms": round(elapsed_seconds * 1000, 1),
+                },
             )
+            return report
 
         except (SQLAlchemyError, RagUnavailableError, RagValidationError, *_EMBEDDING_RUNTIME_ERROR_TYPES):
             logger.exception("Failed to store chunks with embeddings for doc_id=%s", doc_id)
             raise
 
+    async def _embed_and_write_pipelined(
+        self,
+        session: AsyncSession,
+        *,
+        doc_id: uuid.UUID,
+        doc_type: str,
+        chunk_payloads: Sequence[ChunkPayload],
+    ) -> None:
+        """Embed upcoming batches while the session writes completed ones, in chunk order.
+
+        Up to ``max_in_flight_batches`` embedding calls run concurrently. A single writer
+        awaits them in submission order, so the session is never shared across tasks and
+        batches land in the same order as the sequential path.
+        """
+        batches = list(batched(chunk_payloads, self.batch_size, strict=False))
+        in_flight_limit = max(1, self.max_in_flight_batches)
+        in_flight = asyncio.Semaphore(in_flight_limit)
+        pending: asyncio.Queue[asyncio.Task[list[list[float]]]] = asyncio.Queue(maxsize=in_flight_limit)
+        embed_wait_seconds = 0.0
+        write_seconds = 0.0
+
+        async def schedule_embeddings() -> None:
+            for batch in batches:
+                await in_flight.acquire()
+                await pending.put(asyncio.create_task(self._embed_texts([payload[1] for payload in batch])))
+
+        scheduler = asyncio.create_task(schedule_embeddings())
+        embedding_task: asyncio.Task[list[list[float]]] | None = None
+        try:
+            for batch in batches:
+                wait_started_at = time.perf_counter()
+                embedding_task = await pending.get()
+                embeddings = await embedding_task
+                write_started_at = time.perf_counter()
+                embed_wait_seconds += write_started_at - wait_started_at
+
+                await write_embedded_chunks(
+                    session,
+                    doc_id=doc_id,
+                    doc_type=doc_type,
+                    chunks=[
+                        EmbeddedChunk(
+                            chunk_index=chunk_index,
+                            content=chunk_text,
+                            metadata=chunk_metadata,
+                            embedding=embedding,
+                        )
+                        for (chunk_index, chunk_text, chunk_metadata), embedding in zip(batch, embeddings, strict=True)
+                    ],
+                    mode=self.chunk_write_mode,
+                )
+                write_seconds += time.perf_counter() - write_started_at
+                in_flight.release()
+            await scheduler
+        finally:
+            scheduler.cancel()
+            abandoned_tasks: list[asyncio.Task[list[list[float]]]] = []
+            if embedding_task is not None and not embedding_task.done():
+                embedding_task.cancel()
+                abandoned_tasks.append(embedding_task)
+            while not pending.empty():
+                abandoned_task = pending.get_nowait()
+                abandoned_task.cancel()
+                abandoned_tasks.append(abandoned_task)
+            await asyncio.gather(scheduler, *abandoned_tasks, return_exceptions=True)
+
+        logger.debug(
+            "rag.ingest.pipeline",
+            extra={
+                "doc_id": str(doc_id),
+                "batches": len(batches),
+                "max_in_flight_batches": in_flight_limit,
+                "embed_wait_ms": round(embed_wait_seconds * 1000, 2),
+                "write_ms": round(write_seconds * 1000, 2),
+            },
+        )
+
     async def search(
         self,
         session: AsyncSession,
@@ -244,12 +464,54 @@ class VectorRAG:
         doc_id: uuid.UUID | None = None,
         course_id: uuid.UUID | None = None,
     ) -> list[SearchResult]:
-        """Perform hybrid dense and lexical search scoped to optional identifiers."""
+        """Perform hybrid dense and lexical search scoped to optional identifiers.
+
+        In ``fused`` search mode dense and lexical candidates are retrieved and fused
+        with RRF in a single statement; ``staged`` mode runs them as separate queries
+        and fuses in Python. Neighbor context for every hit is fetched in one batch.
+        Results are served from the in-process search cache while fresh.
+        """
+        cache_key = SearchCacheKey(
+            model=self.embedding_model,
+            search_mode=self.search_mode,
+            doc_type=doc_type,
+            doc_id=doc_id,
+            course_id=course_id,
+            query=normalize_query(query),
+            limit=limit,
+        )
+        cached_results = self.search_cache.get_results(cache_key)
+        if cached_results is not None:
+            return cached_results
+
+        search_results = await self._search_uncached(
+            session,
+            doc_type=doc_type,
+            query=query,
+            limit=limit,
+            doc_id=doc_id,
+            course_id=course_id,
+        )
+        self.search_cache.put_results(cache_key, search_results)
+        return search_results
+
+    async def _search_uncached(
+        self,
+        session: AsyncSession,
+        *,
+        doc_type: str,
+        query: str,
+        limit: int,
+        doc_id: uuid.UUID | None,
+        course_id: uuid.UUID | None,
+    ) -> list[SearchResult]:
         try:
+            started_at = time.perf_counter()
             await self._ensure_dimensions(session)
             query_embedding = await self.generate_embedding(query)
             embedding_str = self._format_vector(query_embedding)
             candidate_limit = limit * _HYBRID_CANDIDATE_MULTIPLIER
+            embedded_at = time.perf_counter()
 
             where_sql, scope_params = self._build_search_scope(doc_type=doc_type, doc_id=doc_id, course_id=course_id)
 
@@ -260,38 +522,41 @@ class VectorRAG:
                 "candidate_limit": candidate_limit,
             }
 
-            # Ensure HNSW search quality is configurable per-query
-            # Requires a transaction; SQLAlchemy manages one per session usage
-            # Note: PostgreSQL does not allow bind parameters in SET statements.
-            # Use a validated literal integer to avoid syntax errors like
-            # "syntax error at or near $1" from psycopg.
-            ef_val = get_rag_config().hnsw_ef_search
-            await session.execute(text(f"SET LOCAL hnsw.ef_search = {ef_val}"))
-
-            dense_result = await session.execute(text(self._build_dense_search_sql(where_sql)), params)
-            lexical_result = await session.execute(text(self._build_lexical_search_sql(where_sql)), params)
-            rows = self._fuse_search_rows(dense_result.mappings().all(), lexical_result.mappings().all(), limit)
-
-            search_results: list[SearchResult] = []
-            for row in rows:
-                metadata = self._normalize_metadata({**row.metadata, **row.score_metadata()})
-                content = await self._expand_search_result_content(
-                    session=session,
-                    doc_type=doc_type,
-                    doc_id=row.doc_id,
-                    chunk_index=row.chunk_index,
-                    content=row.content,
+            await self._apply_hnsw_search_settings(session)
+
+            rows = await self._retrieve_fused_rows(session, where_sql=where_sql, params=params, limit=limit)
+            retrieved_at = time.perf_counter()
+
+            rows_with_metadata = [
+                (row, self._normalize_metadata({**row.metadata, **row.score_metadata()})) for row in rows
+            ]
+            expanded_contents = await self._expand_search_results_content(
+                session=session,
+                doc_type=doc_type,
+                rows=rows_with_metadata,
+            )
+            expanded_at = time.perf_counter()
+
+            search_results = [
+                SearchResult(
+                    chunk_id=f"{row.doc_id}_{row.chunk_index}",
+                    content=content,
+                    similarity_score=row.fused_score,
                     metadata=metadata,
                 )
-                search_results.append(
-                    SearchResult(
-                        chunk_id=f"{row.doc_id}_{row.chunk_index}",
-                        content=content,
-                        similarity_score=row.fused_score,
-                        metadata=metadata,
-                    )
-                )
-
+                for (row, metadata), content in zip(rows_with_metadata, expanded_contents, strict=True)
+            ]
+
+            self._record_search_timings(
+                doc_type=doc_type,
+                result_count=len(search_results),
+                stage_seconds={
+                    "embed": embedded_at - started_at,
+                    "retrieve": retrieved_at - embedded_at,
+                    "expand": expanded_at - retrieved_at,
+                    "total": expanded_at - started_at,
+                },
+            )
             logger.debug(
                 "Vector search retrieved %s results for doc_type=%s doc_id=%s course_id=%s",
                 len(search_results),
@@ -306,6 +571,65 @@ class VectorRAG:
             message = "RAG vector search is unavailable"
             raise RagUnavailableError(message) from error
 
+    async def _retrieve_fused_rows(
+        self,
+        session: AsyncSession,
+        *,
+        where_sql: str,
+        params: dict[str, object],
+        limit: int,
+    ) -> list[_FusedSearchItem]:
+        """Retrieve dense and lexical candidates and fuse them with RRF per the configured search mode."""
+        if self.search_mode == SEARCH_MODE_FUSED:
+            fused_result = await session.execute(
+                text(self._build_fused_search_sql(where_sql)),
+                {**params, "limit": limit, "rrf_k": _RRF_K},
+            )
+            return [self._fused_item_from_row(row) for row in fused_result.mappings().all()]
+
+        dense_result = await session.execute(text(self._build_dense_search_sql(where_sql)), params)
+        lexical_result = await session.execute(text(self._build_lexical_search_sql(where_sql)), params)
+        return self._fuse_search_rows(dense_result.mappings().all(), lexical_result.mappings().all(), limit)
+
+    @staticmethod
+    async def _apply_hnsw_search_settings(session: AsyncSession) -> None:
+        """Apply HNSW search settings once per transaction rather than once per search."""
+        # A rolled-back savepoint reverts transaction-local settings, so the innermost transaction is the scope.
+        transaction = session.get_nested_transaction() or session.get_transaction()
+        if transaction is not None and session.info.get(_HNSW_SETTINGS_TRANSACTION_KEY) is transaction:
+            return
+
+        # set_config(..., true) behaves like SET LOCAL but accepts bind parameters,
+        # so every HNSW setting is applied in a single round trip.
+        config = get_rag_config()
+        settings_sql = "SELECT set_config('hnsw.ef_search', :ef_search, true)"
+        settings_params: dict[str, object] = {"ef_search": str(config.hnsw_ef_search)}
+        if config.hnsw_iterative_scan != "off":
+            # Iterative scans (pgvector >= 0.8) keep walking the graph until enough rows pass
+            # the course/doc scope filter instead of returning fewer than the candidate limit.
+            settings_sql += ", set_config('hnsw.iterative_scan', :iterative_scan, true)"
+            settings_params["iterative_scan"] = config.hnsw_iterative_scan
+        await session.execute(text(settings_sql), settings_params)
+        session.info[_HNSW_SETTINGS_TRANSACTION_KEY] = session.get_nested_transaction() or session.get_transaction()
+
+    def _record_search_timings(self, *, doc_type: str, result_count: int, stage_seconds: dict[str, float]) -> None:
+        """Publish per-stage search latency so fused and staged modes can be compared."""
+        stage_ms = {stage: round(seconds * 1000, 2) for stage, seconds in stage_seconds.items()}
+        for stage, milliseconds in stage_ms.items():
+            _search_stage_duration.record(
+                milliseconds,
+                {"stage": stage, "search_mode": self.search_mode, "doc_type": doc_type},
+            )
+        logger.debug(
+            "rag.search.timings",
+            extra={
+                "search_mode": self.search_mode,
+                "doc_type": doc_type,
+                "result_count": result_count,
+                **{f"{stage}_ms": milliseconds for stage, milliseconds in stage_ms.items()},
+            },
+        )
+
     @staticmethod
     def _build_search_scope(
         *, doc_type: str, doc_id: uuid.UUID | None, course_id: uuid.UUID | None
@@ -317,36 +641,42 @@ class VectorRAG:
             predicates.append("doc_id = :doc_id")
             params["doc_id"] = str(doc_id)
         if course_id:
-            predicates.append("metadata->>'course_id' = :course_id")
+            predicates.append("course_id = :course_id")
             params["course_id"] = str(course_id)
 
         return " AND ".join(predicates), params
 
     @staticmethod
     def _build_dense_search_sql(where_sql: str) -> str:
+        # Relaxed-order iterative scans may return candidates slightly out of order, so rank them
+        # again outside the index scan.
         return """
-            SELECT
-                doc_id,
-                doc_type,
-                chunk_index,
-                content,
-                metadata,
-                1 - (embedding <=> CAST(:query_embedding AS vector)) AS dense_score
-            FROM rag_document_chunks
-            WHERE __SEARCH_SCOPE__
-              AND embedding IS NOT NULL
-            ORDER BY embedding <=> CAST(:query_embedding AS vector)
-            LIMIT :candidate_limit
+            SELECT *
+            FROM (
+                SELECT
+                    doc_id,
+                    doc_type,
+                    chunk_index,
+                    content,
+                    metadata,
+                    1 - (embedding <=> CAST(:query_embedding AS vector)) AS dense_score
+                FROM rag_document_chunks
+                WHERE __SEARCH_SCOPE__
+                  AND embedding IS NOT NULL
+                ORDER BY embedding <=> CAST(:query_embedding AS vector)
+                LIMIT :candidate_limit
+            ) AS dense_candidates
+            ORDER BY dense_score DESC
         """.replace("__SEARCH_SCOPE__", where_sql)
 
     @staticmethod
     def _build_lexical_search_sql(where_sql: str) -> str:
-        # Tokenize the query with the same 'simple' config used document-side, then OR-fold the
-        # lexemes into a tsquery. 'simple' is language-agnostic (no stemming, no stopword list),
-        # so natural-language questions in any language still produce a non-empty tsquery instead
-        # of being AND-collapsed to zero hits by websearch_to_tsquery. NULLIF guards the all-noise
-        # case (e.g. punctuation-only query) by producing NULL, which the IS NOT NULL filter then
-        # short-circuits.
+        # Tokenize the query with the same 'simple' config as the stored, GIN-indexed content_tsv
+        # column, then OR-fold the lexemes into a tsquery. 'simple' is language-agnostic (no
+        # stemming, no stopword list), so natural-language questions in any language still produce
+        # a non-empty tsquery instead of being AND-collapsed to zero hits by websearch_to_tsquery.
+        # NULLIF guards the all-noise case (e.g. punctuation-only query) by producing NULL, which
+        # the IS NOT NULL filter then short-circuits.
         return """
             WITH lexical_query AS (
                 SELECT NULLIF(
@@ -360,15 +690,103 @@ class VectorRAG:
                 chunk_index,
                 content,
                 metadata,
-                ts_rank_cd(to_tsvector('simple', content), lexical_query.query) AS lexical_score
+                ts_rank_cd(content_tsv, lexical_query.query) AS lexical_score
             FROM rag_document_chunks, lexical_query
             WHERE __SEARCH_SCOPE__
               AND lexical_query.query IS NOT NULL
-              AND to_tsvector('simple', content) @@ lexical_query.query
+              AND content_tsv @@ lexical_query.query
             ORDER BY lexical_score DESC, chunk_index
             LIMIT :candidate_limit
         """.replace("__SEARCH_SCOPE__", where_sql)
 
+    @staticmethod
+    def _build_fused_search_sql(where_sql: str) -> str:
+        # Same candidate sets and RRF formula as the staged path, fused server-side so a
+        # search costs one round trip. The lexical query uses the same OR-folded 'simple'
+        # tsquery as _build_lexical_search_sql.
+        return """
+            WITH lexical_query AS (
+                SELECT NULLIF(
+                    array_to_string(tsvector_to_array(to_tsvector('simple', :query)), ' | '),
+                    ''
+                )::tsquery AS query
+            ),
+            dense AS (
+                SELECT
+                    id,
+                    dense_score,
+                    ROW_NUMBER() OVER (ORDER BY dense_score DESC) AS dense_rank
+                FROM (
+                    SELECT id, 1 - (embedding <=> CAST(:query_embedding AS vector)) AS dense_score
+                    FROM rag_document_chunks
+                    WHERE __SEARCH_SCOPE__
+                      AND embedding IS NOT NULL
+                    ORDER BY embedding <=> CAST(:query_embedding AS vector)
+                    LIMIT :candidate_limit
+                ) AS dense_candidates
+            ),
+            lexical AS (
+                SELECT
+                    id,
+                    lexical_score,
+                    ROW_NUMBER() OVER (ORDER BY lexical_score DESC, chunk_index) AS lexical_rank
+                FROM (
+                    SELECT
+                        id,
+                        chunk_index,
+                        ts_rank_cd(content_tsv, lexical_query.query) AS lexical_score
+                    FROM rag_document_chunks, lexical_query
+                    WHERE __SEARCH_SCOPE__
+                      AND lexical_query.query IS NOT NULL
+                      AND content_tsv @@ lexical_query.query
+                    ORDER BY lexical_score DESC, chunk_index
+                    LIMIT :candidate_limit
+                ) AS lexical_candidates
+            ),
+            fused AS (
+                SELECT
+                    COALESCE(dense.id, lexical.id) AS id,
+                    dense.dense_score,
+                    dense.dense_rank,
+                    lexical.lexical_score,
+                    lexical.lexical_rank,
+                    COALESCE(1.0 / (:rrf_k + dense.dense_rank), 0)
+                        + COALESCE(1.0 / (:rrf_k + lexical.lexical_rank), 0) AS fused_score
+                FROM dense
+                FULL OUTER JOIN lexical ON lexical.id = dense.id
+            )
+            SELECT
+                chunks.doc_id,
+                chunks.doc_type,
+                chunks.chunk_index,
+                chunks.content,
+                chunks.metadata,
+                fused.fused_score,
+                fused.dense_score,
+                fused.dense_rank,
+                fused.lexical_score,
+                fused.lexical_rank
+            FROM fused
+            JOIN rag_document_chunks AS chunks ON chunks.id = fused.id
+            ORDER BY fused.fused_score DESC, COALESCE(fused.lexical_score, 0) DESC
+            LIMIT :limit
+        """.replace("__SEARCH_SCOPE__", where_sql)
+
+    @staticmethod
+    def _fused_item_from_row(row: RowMapping) -> _FusedSearchItem:
+        return _FusedSearchItem(
+            doc_id=str(row["doc_id"]),
+            doc_type=str(row["doc_type"]),
+            chunk_index=int(row["chunk_index"]),
+            content=str(row["content"]),
+            metadata=dict(row["metadata"]) if isinstance(row["metadata"], dict) else {},
+            fused_score=float(row["fused_score"]),
+            dense_score=None if row["dense_score"] is None else float(row["dense_score"]),
+            lexical_score=None if row["lexical_score"] is None else float(row["lexical_score"]),
+            dense_rank=None if row["dense_rank"] is None else int(row["dense_rank"]),
+            lexical_rank=None if row["lexical_rank"] is None else int(row["lexical_rank"]),
+        )
+
     def _fuse_search_rows(
         self, dense_rows: Sequence[RowMapping], lexical_rows: Sequence[RowMapping], limit: int
     ) -> list[_FusedSearchItem]:
@@ -411,51 +829,82 @@ class VectorRAG:
     def _rrf_score(rank: int) -> float:
         return 1.0 / (_RRF_K + rank)
 
-    async def _expand_search_result_content(
+    async def _expand_search_results_content(
         self,
         *,
         session: AsyncSession,
         doc_type: str,
-        doc_id: str,
-        chunk_index: int,
-        content: str,
-        metadata: dict[str, JsonValue],
-    ) -> str:
-        """Add adjacent same-section chunks for structured document retrieval."""
-        if metadata.get("contextualized") is not True:
-            return content
+        rows: Sequence[tuple[_FusedSearchItem, dict[str, JsonValue]]],
+    ) -> list[str]:
+        """Add adjacent same-section chunks for structured document hits, fetching every window at once."""
+        contextualized_rows = [row for row, metadata in rows if metadata.get("contextualized") is True]
+        if not contextualized_rows:
+            return [row.content for row, _ in rows]
 
         result = await session.execute(
             text(
                 """
-                SELECT chunk_index, content, metadata
-                FROM rag_document_chunks
-                WHERE doc_type = :doc_type
-                  AND doc_id = :doc_id
-                  AND chunk_index BETWEEN :start_index AND :end_index
-                ORDER BY chunk_index
+                SELECT DISTINCT chunks.doc_id, chunks.chunk_index, chunks.content, chunks.metadata
+                FROM unnest(
+                    CAST(:doc_ids AS uuid[]),
+                    CAST(:chunk_indexes AS integer[])
+                ) AS hit(doc_id, chunk_index)
+                JOIN rag_document_chunks AS chunks
+                  ON chunks.doc_type = :doc_type
+                 AND chunks.doc_id = hit.doc_id
+                 AND chunks.chunk_index BETWEEN hit.chunk_index - :window AND hit.chunk_index + :window
                 """
             ),
             {
                 "doc_type": doc_type,
-                "doc_id": doc_id,
-                "start_index": chunk_index - _NEIGHBOR_CONTEXT_WINDOW,
-                "end_index": chunk_index + _NEIGHBOR_CONTEXT_WINDOW,
+                "doc_ids": [row.doc_id for row in contextualized_rows],
+                "chunk_indexes": [row.chunk_index for row in contextualized_rows],
+                "window": _NEIGHBOR_CONTEXT_WINDOW,
             },
         )
+        neighbors: dict[tuple[str, int], tuple[str, dict[str, object]]] = {}
+        for neighbor in result.mappings().all():
+            neighbor_metadata = dict(neighbor["metadata"]) if isinstance(neighbor["metadata"], dict) else {}
+            neighbors[str(neighbor["doc_id"]), int(neighbor["chunk_index"])] = (
+                str(neighbor["content"]),
+                neighbor_metadata,
+            )
 
+        return [
+            self._assemble_neighbor_context(row=row, metadata=metadata, neighbors=neighbors)
+            if metadata.get("contextualized") is True
+            else row.content
+            for row, metadata in rows
+        ]
+
+    @staticmethod
+    def _assemble_neighbor_context(
+        *,
+        row: _FusedSearchItem,
+        metadata: dict[str, JsonValue],
+        neighbors: dict[tuple[str, int], tuple[str, dict[str, object]]],
+    ) -> str:
         section_path = metadata.get("section_path")
         parts: list[str] = []
-        for row in result.fetchall():
-            row_metadata = dict(row.metadata) if isinstance(row.metadata, dict) else {}
-            row_section_path = row_metadata.get("section_path")
-            if row.chunk_index != chunk_index and section_path and row_section_path != section_path:
+        for neighbor_index in range(
+            row.chunk_index - _NEIGHBOR_CONTEXT_WINDOW,
+            row.chunk_index + _NEIGHBOR_CONTEXT_WINDOW + 1,
+        ):
+            neighbor = neighbors.get((row.doc_id, neighbor_index))
+            if neighbor is None:
+                continue
+            neighbor_content, neighbor_metadata = neighbor
+            if (
+                neighbor_index != row.chunk_index
+                and section_path
+                and neighbor_metadata.get("section_path") != section_path
+            ):
                 continue
-            parts.append(str(row.content).strip())
+            parts.append(neighbor_content.strip())
 
         expanded_content = "\n\n".join(part for part in parts if part)
         if not expanded_content or len(expanded_content) > _NEIGHBOR_CONTEXT_MAX_CHARS:
-            return content
+            return row.content
         return expanded_content
 
     async def _ensure_dimensions(self, session: AsyncSession) -> None:
@@ -511,40 +960,84 @@ class VectorRAG:
         return int(row)
 
     async def _embed_texts(self, texts: Sequence[str]) -> list[list[float]]:
-        """Embed a batch of texts with manual retries."""
+        """Embed a batch of texts, requesting only content missing from the embedding cache."""
         if not texts:
             return []
+        if self.embedding_cache is None:
+            return await self._request_embeddings(texts)
+
+        hashes = [content_hash(text_item) for text_item in texts]
+        embeddings_by_hash = await self.embedding_cache.get_many(hashes)
+
+        # Identical texts within one batch are requested once.
+        missing_texts: dict[bytes, str] = {}
+        for digest, text_item in zip(hashes, texts, strict=True):
+            if digest not in embeddings_by_hash:
+                missing_texts.setdefault(digest, text_item)
+
+        if missing_texts:
+            fresh_embeddings = await self._request_embeddings(list(missing_texts.values()))
+            fresh_by_hash = dict(zip(missing_texts, fresh_embeddings, strict=True))
+            await self.embedding_cache.put_many(fresh_by_hash)
+            embeddings_by_hash.update(fresh_by_hash)
+
+        return [embeddings_by_hash[digest] for digest in hashes]
 
+    async def _request_embeddings(self, texts: Sequence[str]) -> list[list[float]]:
+        """Request embeddings from the provider with manual retries and shared rate-limit backoff."""
         embed_kwargs = self._build_embedding_kwargs(texts)
         attempts = self.manual_retry_attempts + 1
+        rate_limit_gate = _get_rate_limit_gate(self.embedding_model)
+        failed_attempts = 0
+        rate_limit_hits = 0
 
-        for attempt in range(1, attempts + 1):
+        while True:
+            await rate_limit_gate.wait()
             try:
                 response = await self._invoke_embedding(embed_kwargs)
-                embeddings = self._normalize_embedding_response(response)
-                if len(embeddings) != len(texts):
-                    message = "Embedding provider returned an unexpected number of embeddings"
-                    raise RagUnavailableError(message)
-                logger.debug("Generated %s embeddings (attempt %s)", len(embeddings), attempt)
-                return embeddings
+            except _EMBEDDING_RATE_LIMIT_ERROR_TYPES as exc:
+                rate_limit_hits += 1
+                if rate_limit_hits > self.rate_limit_retry_attempts:
+                    logger.exception("Embedding provider still rate limited after %s retries", rate_limit_hits - 1)
+                    raise
+
+                delay_seconds = rate_limit_gate.record_rate_limit(
+                    base_delay_seconds=self.retry_backoff_seconds,
+                    retry_after_seconds=_retry_after_seconds(exc),
+                )
+                logger.warning(
+                    "rag.embeddings.rate_limited",
+                    extra={
+                        "model": self.embedding_model,
+                        "rate_limit_hits": rate_limit_hits,
+                        "backoff_seconds": round(delay_seconds, 2),
+                    },
+                )
+                continue
             except _EMBEDDING_RUNTIME_ERROR_TYPES as exc:
-                last_attempt = attempt == attempts
-                if last_attempt:
+                failed_attempts += 1
+                if failed_attempts >= attempts:
                     logger.exception("Failed to generate embeddings after %s attempts", attempts)
                     raise
 
-                delay_seconds = self.retry_backoff_seconds * math.pow(2, attempt - 1)
+                delay_seconds = self.retry_backoff_seconds * math.pow(2, failed_attempts - 1)
                 logger.warning(
                     "Embedding call failed on attempt %s/%s (%s). Retrying in %.2fs",
-                    attempt,
+                    failed_attempts,
                     attempts,
                     exc,
                     delay_seconds,
                 )
                 await asyncio.sleep(delay_seconds)
+                continue
 
-        message = "Exhausted embedding retries unexpectedly"
-        raise RagUnavailableError(message)
+            rate_limit_gate.record_success()
+            embeddings = self._normalize_embedding_response(response)
+            if len(embeddings) != len(texts):
+                message = "Embedding provider returned an unexpected number of embeddings"
+                raise RagUnavailableError(message)
+            logger.debug("Generated %s embeddings (attempt %s)", len(embeddings), failed_attempts + 1)
+            return embeddings
 
     def _build_embedding_kwargs(self, texts: Sequence[str]) -> dict[str, object]:
         """Construct kwargs for LiteLLM embedding call."""
@@ -590,7 +1083,7 @@ class VectorRAG:
     @staticmethod
     def _format_vector(values: Sequence[float]) -> str:
         """Format embedding sequence for pgvector insertion."""
-        return "[" + ",".join(str(value) for value in values) + "]"
+        return format_vector(values)
 
     @staticmethod
     def _normalize_metadata(metadata: dict[str, object]) -> dict[str, JsonValue]:
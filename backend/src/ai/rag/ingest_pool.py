@@ -0,0 +1,147 @@
+"""Process pool for CPU-heavy document parsing and chunking."""
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
+
+from opentelemetry import metrics
+
+from src.ai.rag.config import get_rag_config
+from src.ai.rag.exceptions import RagUnavailableError
+
+
+logger = logging.getLogger(__name__)
+
+_meter = metrics.get_meter(__name__)
+_queue_depth = _meter.create_up_down_counter(
+    "rag.ingest_pool.queue_depth",
+    unit="{task}",
+    description="Parse/chunk tasks waiting for a free ingest worker process",
+)
+_active_tasks = _meter.create_up_down_counter(
+    "rag.ingest_pool.active",
+    unit="{task}",
+    description="Parse/chunk tasks currently running in ingest worker processes",
+)
+_queue_wait_duration = _meter.create_histogram(
+    "rag.ingest_pool.wait.duration",
+    unit="ms",
+    description="Time a parse/chunk task waited for a free ingest worker process",
+)
+
+
+def _initialize_worker() -> None:
+    """Warm a freshly spawned worker so the first document does not pay for tokenizer loading."""
+    from src.ai.rag.chunker import preload_chunk_tokenizer
+
+    try:
+        preload_chunk_tokenizer()
+    except OSError, RuntimeError, ValueError:
+        # The task that first needs the tokenizer will retry the load and surface the error.
+        logger.warning("rag.ingest_pool.tokenizer_preload_failed", exc_info=True)
+
+
+class IngestProcessPool:
+    """Bounded process pool that keeps parsing and tokenization off the API event loop's GIL.
+
+    At most ``max_workers`` tasks are submitted at once; the rest wait on the
+    event loop, where they are counted as queue depth, instead of piling up
+    inside the executor.
+    """
+
+    def __init__(self, *, max_workers: int) -> None:
+        self.max_workers = max_workers
+        self.queued = 0
+        self.active = 0
+        self._executor: ProcessPoolExecutor | None = None
+        self._slots: asyncio.Semaphore | None = None
+
+    async def run[T](self, func: Callable[..., T], /, *args: object, **kwargs: object) -> T:
+        """Run a picklable top-level ``func`` in a worker process and return its result."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers)
+
+        task_name = getattr(func, "__name__", "task")
+        queued_at = time.perf_counter()
+        self._change_queued(1)
+        try:
+            await self._slots.acquire()
+        finally:
+            self._change_queued(-1)
+        wait_ms = round((time.perf_counter() - queued_at) * 1000, 2)
+        _queue_wait_duration.record(wait_ms, {"task": task_name})
+
+        self._change_active(1)
+        started_at = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), partial(func, *args, **kwargs))
+        except BrokenProcessPool as error:
+            # A crashed worker (e.g. OOM on a hostile PDF) poisons the executor; start fresh next time.
+            self._discard_executor()
+            message = "RAG ingest worker process crashed"
+            raise RagUnavailableError(message) from error
+        finally:
+            self._change_active(-1)
+            self._slots.release()
+            logger.debug(
+                "rag.ingest_pool.task_finished",
+                extra={
+                    "task": task_name,
+                    "wait_ms": wait_ms,
+                    "run_ms": round((time.perf_counter() - started_at) * 1000, 2),
+                    "queued": self.queued,
+                    "active": self.active,
+                },
+            )
+
+    def shutdown(self) -> None:
+        """Stop worker processes; queued work is cancelled."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Spawned workers do not inherit the parent's event loop, threads, or open DB connections.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_initialize_worker,
+            )
+        return self._executor
+
+    def _discard_executor(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _change_queued(self, delta: int) -> None:
+        self.queued += delta
+        _queue_depth.add(delta)
+
+    def _change_active(self, delta: int) -> None:
+        self.active += delta
+        _active_tasks.add(delta)
+
+
+@lru_cache(maxsize=1)
+def get_ingest_pool() -> IngestProcessPool | None:
+    """Return the shared ingest pool, or ``None`` when parsing runs on the thread pool."""
+    max_workers = get_rag_config().ingest_pool_workers
+    if max_workers <= 0:
+        return None
+    return IngestProcessPool(max_workers=max_workers)
+
+
+def shutdown_ingest_pool() -> None:
+    """Stop the shared ingest pool's worker processes if it was started."""
+    if get_ingest_pool.cache_info().currsize:
+        pool = get_ingest_pool()
+        if pool is not None:
+            pool.shutdown()
@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import os
-from contextlib import redirect_stderr
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager, redirect_stderr
 from pathlib import Path
 
 import pymupdf
 from fastapi.concurrency import run_in_threadpool
 
+from src.ai.rag.chunker import chunk_pages_with_metadata, chunk_pages_with_metadata_async
 from src.ai.rag.exceptions import RagUnavailableError
+from src.ai.rag.ingest_pool import get_ingest_pool
 
 
 pymupdf.TOOLS.mupdf_display_errors(on=False)
@@ -28,6 +31,7 @@ _DOCUMENT_FILE_TYPES_BY_EXTENSION = {
     ".md": "txt",
     ".markdown": "txt",
 }
+_PARSER_ERROR_TYPES = (OSError, RuntimeError, TypeError, ValueError)
 
 
 def _file_type_for_path(file_path: str) -> str:
@@ -40,22 +44,76 @@ def _file_type_for_path(file_path: str) -> str:
     return file_type
 
 
-def _extract_text_with_pymupdf(file_path: str) -> str:
-    """Extract selectable text from a document with PyMuPDF."""
-    file_type = _file_type_for_path(file_path)
+@contextmanager
+def _silenced_mupdf() -> Generator[None]:
+    """Keep MuPDF's C-level chatter out of application logs."""
+    with Path(os.devnull).open("w", encoding="utf-8") as devnull, redirect_stderr(devnull):
+        yield
+
+
+def open_document(source: str | bytes, *, file_type: str | None = None) -> pymupdf.Document:
+    """Open a path or in-memory document with PyMuPDF, usable as a context manager.
+
+    ``source`` is a path, read in place by PyMuPDF, or the document bytes already
+    in memory (``file_type`` is then the extension, e.g. ``"pdf"``).
+    """
+    if isinstance(source, str):
+        resolved_file_type = _file_type_for_path(source)
+        open_kwargs: dict[str, object] = {"filename": source, "filetype": resolved_file_type}
+    else:
+        resolved_file_type = _file_type_for_path(f"document.{file_type or ''}")
+        open_kwargs = {"stream": source, "filetype": resolved_file_type}
 
     try:
-        with (
-            Path(os.devnull).open("w", encoding="utf-8") as devnull,
-            redirect_stderr(devnull),
-            pymupdf.open(file_path, filetype=file_type) as document,
-        ):
-            pages = [page.get_text("text", sort=True).strip() for page in document]
-    except (OSError, RuntimeError, TypeError, ValueError) as error:
+        with _silenced_mupdf():
+            return pymupdf.open(**open_kwargs)
+    except _PARSER_ERROR_TYPES as error:
         message = "RAG document parser failed to read the source file"
         raise RagUnavailableError(message) from error
 
-    return "\n\n".join(page_text for page_text in pages if page_text)
+
+def iter_open_document_pages(document: pymupdf.Document) -> Iterator[str]:
+    """Yield the selectable text of each non-empty page of an already open document."""
+    for page_number in range(document.page_count):
+        try:
+            with _silenced_mupdf():
+                page_text = document.load_page(page_number).get_text("text", sort=True).strip()
+        except _PARSER_ERROR_TYPES as error:
+            message = "RAG document parser failed to read the source file"
+            raise RagUnavailableError(message) from error
+        if page_text:
+            yield page_text
+
+
+def iter_document_pages(source: str | bytes, *, file_type: str | None = None) -> Iterator[str]:
+    """Yield the selectable text of each non-empty page, one page at a time.
+
+    See :func:`open_document` for ``source`` and ``file_type``. Only the
+    current page's text is held, so memory does not grow with page count.
+    """
+    with open_document(source, file_type=file_type) as document:
+        yield from iter_open_document_pages(document)
+
+
+def _extract_text_with_pymupdf(file_path: str) -> str:
+    """Extract selectable text from a document with PyMuPDF."""
+    return "\n\n".join(iter_document_pages(file_path))
+
+
+def _chunk_document_sync(
+    source: str | bytes,
+    file_type: str | None,
+    document_title: str | None,
+    chunk_size: int,
+    chunk_overlap_ratio: float,
+) -> tuple[list[str], list[dict[str, object]]]:
+    """Parse and chunk a document in one call so it can run inside an ingest worker process."""
+    return chunk_pages_with_metadata(
+        iter_document_pages(source, file_type=file_type),
+        document_title=document_title,
+        chunk_size=chunk_size,
+        chunk_overlap_ratio=chunk_overlap_ratio,
+    )
 
 
 class DocumentProcessor:
@@ -63,4 +121,38 @@ class DocumentProcessor:
 
     async def process_document(self, file_path: str) -> str:
         """Extract text from a document on disk."""
+        ingest_pool = get_ingest_pool()
+        if ingest_pool is not None:
+            return await ingest_pool.run(_extract_text_with_pymupdf, file_path)
         return await run_in_threadpool(_extract_text_with_pymupdf, file_path)
+
+    async def chunk_document(
+        self,
+        source: str | bytes,
+        *,
+        file_type: str | None = None,
+        document_title: str | None = None,
+        chunk_size: int = 400,
+        chunk_overlap_ratio: float = 0.12,
+    ) -> tuple[list[str], list[dict[str, object]]]:
+        """Parse and chunk a document page by page without materializing its full text.
+
+        With an ingest process pool configured, the whole parse-and-chunk job runs in
+        one worker process and only the chunk texts and metadata are sent back.
+        """
+        ingest_pool = get_ingest_pool()
+        if ingest_pool is not None:
+            return await ingest_pool.run(
+                _chunk_document_sync,
+                source,
+                file_type,
+                document_title,
+                chunk_size,
+                chunk_overlap_ratio,
+            )
+        return await chunk_pages_with_metadata_async(
+            iter_document_pages(source, file_type=file_type),
+            document_title=document_title,
+            chunk_size=chunk_size,
+            chunk_overlap_ratio=chunk_overlap_ratio,
+        )
@@ -0,0 +1,137 @@
+"""Content-diff planning for re-indexing a document's RAG chunks."""
+
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Literal
+
+from pydantic import JsonValue
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.ai.rag.chunk_writer import ReusedChunk
+from src.ai.rag.embedding_cache import content_hash
+
+
+type ReindexMode = Literal["incremental", "full"]
+
+REINDEX_MODE_INCREMENTAL: ReindexMode = "incremental"
+REINDEX_MODE_FULL: ReindexMode = "full"
+
+type ChunkPayload = tuple[int, str, dict[str, JsonValue]]
+
+
+@dataclass(frozen=True, slots=True)
+class ExistingChunk:
+    """Fingerprint of a chunk row already stored for a document."""
+
+    chunk_index: int
+    fingerprint: bytes
+    metadata: dict[str, JsonValue]
+
+
+@dataclass(slots=True)
+class ChunkReindexPlan:
+    """Work needed to bring a document's stored chunks in line with a fresh chunking."""
+
+    to_embed: list[ChunkPayload] = field(default_factory=list)
+    to_reuse: list[ReusedChunk] = field(default_factory=list)
+    unchanged_count: int = 0
+    keep_indexes: list[int] = field(default_factory=list)
+
+
+@dataclass(frozen=True, slots=True)
+class ChunkReindexReport:
+    """Outcome of storing a document's chunks, including the work that was skipped."""
+
+    mode: ReindexMode
+    total_chunks: int
+    embedded_chunks: int
+    reused_chunks: int
+    unchanged_chunks: int
+    deleted_chunks: int
+
+    @property
+    def skipped_embeddings(self) -> int:
+        """Chunks that were stored without calling the embedding provider."""
+        return self.total_chunks - self.embedded_chunks
+
+
+async def fetch_existing_chunks(session: AsyncSession, doc_id: uuid.UUID) -> dict[int, ExistingChunk]:
+    """Load content fingerprints and metadata for every stored chunk of a document."""
+    result = await session.execute(
+        text(
+            """
+            SELECT chunk_index, sha256(convert_to(content, 'UTF8')) AS fingerprint, metadata
+            FROM rag_document_chunks
+            WHERE doc_id = :doc_id
+            """
+        ),
+        {"doc_id": str(doc_id)},
+    )
+    return {
+        row.chunk_index: ExistingChunk(
+            chunk_index=row.chunk_index,
+            fingerprint=bytes(row.fingerprint),
+            metadata=row.metadata or {},
+        )
+        for row in result
+    }
+
+
+def plan_chunk_reindex(
+    chunk_payloads: Sequence[ChunkPayload],
+    existing_chunks: dict[int, ExistingChunk],
+) -> ChunkReindexPlan:
+    """Split fresh chunks into unchanged, reusable, and to-embed sets.
+
+    A chunk is unchanged when the same index already holds the same content and
+    metadata. When the content exists anywhere in the document (same index with
+    new metadata, or shifted to another index) its stored embedding is reused.
+    Only content the document has never held is sent to the embedding provider.
+    """
+    source_index_by_fingerprint: dict[bytes, int] = {}
+    for existing in existing_chunks.values():
+        source_index_by_fingerprint.setdefault(existing.fingerprint, existing.chunk_index)
+
+    plan = ChunkReindexPlan()
+    for chunk_index, content, metadata in chunk_payloads:
+        plan.keep_indexes.append(chunk_index)
+        fingerprint = content_hash(content)
+        existing = existing_chunks.get(chunk_index)
+        if existing is not None and existing.fingerprint == fingerprint:
+            if existing.metadata == metadata:
+                plan.unchanged_count += 1
+            else:
+                plan.to_reuse.append(
+                    ReusedChunk(
+                        chunk_index=chunk_index,
+                        source_chunk_index=chunk_index,
+                        content=content,
+                        metadata=metadata,
+                    )
+                )
+            continue
+
+        source_chunk_index = source_index_by_fingerprint.get(fingerprint)
+        if source_chunk_index is not None:
+            plan.to_reuse.append(
+                ReusedChunk(
+                    chunk_index=chunk_index,
+                    source_chunk_index=source_chunk_index,
+                    content=content,
+                    metadata=metadata,
+                )
+            )
+            continue
+
+        plan.to_embed.append((chunk_index, content, metadata))
+    return plan
+
+
+def plan_full_reindex(chunk_payloads: Sequence[ChunkPayload]) -> ChunkReindexPlan:
+    """Plan that re-embeds every chunk, e.g. after switching embedding models."""
+    return ChunkReindexPlan(
+        to_embed=list(chunk_payloads),
+        keep_indexes=[chunk_index for chunk_index, _, _ in chunk_payloads],
+    )
@@ -0,0 +1,209 @@
+"""In-process TTL + LRU caches for repeated RAG queries."""
+
+import logging
+import uuid
+from dataclasses import dataclass
+from functools import lru_cache
+
+from opentelemetry import metrics
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.ai.rag.config import get_rag_config
+from src.ai.rag.schemas import SearchResult
+from src.cache import TTLLRUCache
+
+
+logger = logging.getLogger(__name__)
+
+_meter = metrics.get_meter(__name__)
+_cache_hits = _meter.create_counter(
+    "rag.search_cache.hits",
+    unit="{lookup}",
+    description="RAG query embeddings and search results served from the in-process cache",
+)
+_cache_misses = _meter.create_counter(
+    "rag.search_cache.misses",
+    unit="{lookup}",
+    description="RAG query embedding and search lookups that missed the in-process cache",
+)
+_cache_invalidations = _meter.create_counter(
+    "rag.search_cache.invalidations",
+    unit="{entry}",
+    description="Cached RAG search results dropped because their scope was re-indexed or deleted",
+)
+
+_PENDING_SCOPES_KEY = "rag_search_cache_pending_scopes"
+_LISTENERS_KEY = "rag_search_cache_listeners"
+
+type _PendingScope = tuple[RAGSearchCache, str, uuid.UUID | None, uuid.UUID | None]
+
+
+def normalize_query(query: str) -> str:
+    """Collapse whitespace so trivially different spellings of a query share a cache entry."""
+    return " ".join(query.split())
+
+
+@dataclass(frozen=True, slots=True)
+class SearchCacheKey:
+    """Identity of one search: the model, ranking mode, scope, and normalized query."""
+
+    model: str
+    search_mode: str
+    doc_type: str
+    doc_id: uuid.UUID | None
+    course_id: uuid.UUID | None
+    query: str
+    limit: int
+
+
+class RAGSearchCache:
+    """Caches query embeddings and search results in front of ``VectorRAG``.
+
+    Entries are process-local. Ingest and delete paths invalidate affected scopes
+    in the process that performs them, when they write and again when their
+    transaction ends; other worker processes only converge once their copies
+    expire, so the TTL bounds cross-process staleness.
+    """
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int) -> None:
+        self.enabled = ttl_seconds > 0 and max_entries > 0
+        self.hits = 0
+        self.misses = 0
+        self._embeddings: TTLLRUCache[tuple[str, int | None, str], tuple[float, ...]] = TTLLRUCache(
+            ttl_seconds=ttl_seconds,
+            max_entries=max_entries,
+        )
+        self._results: TTLLRUCache[SearchCacheKey, tuple[SearchResult, ...]] = TTLLRUCache(
+            ttl_seconds=ttl_seconds,
+            max_entries=max_entries,
+        )
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache since startup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get_embedding(self, *, model: str, dimensions: int | None, text: str) -> list[float] | None:
+        """Return a cached query embedding."""
+        if not self.enabled:
+            return None
+        cached = self._embeddings.get((model, dimensions, normalize_query(text)))
+        self._record_lookup("embedding", hit=cached is not None)
+        return list(cached) if cached is not None else None
+
+    def put_embedding(self, *, model: str, dimensions: int | None, text: str, embedding: list[float]) -> None:
+        """Cache a query embedding."""
+        if self.enabled:
+            self._embeddings.put((model, dimensions, normalize_query(text)), tuple(embedding))
+
+    def get_results(self, key: SearchCacheKey) -> list[SearchResult] | None:
+        """Return copies of cached search results so callers can mutate them freely."""
+        if not self.enabled:
+            return None
+        cached = self._results.get(key)
+        self._record_lookup("search", hit=cached is not None)
+        if cached is None:
+            return None
+        return [result.model_copy(deep=True) for result in cached]
+
+    def put_results(self, key: SearchCacheKey, results: list[SearchResult]) -> None:
+        """Cache search results for ``key``."""
+        if self.enabled:
+            self._results.put(key, tuple(result.model_copy(deep=True) for result in results))
+
+    def invalidate_scope(
+        self,
+        *,
+        doc_type: str,
+        doc_id: uuid.UUID | None = None,
+        course_id: uuid.UUID | None = None,
+    ) -> int:
+        """Drop cached results that could include chunks of the changed document or course.
+
+        Without a ``doc_id`` the whole course (or doc type) changed, so every
+        document-scoped search of that doc type is dropped. Course-scoped searches
+        survive only when the changed course is known and differs; unscoped searches
+        of the doc type are always dropped.
+        """
+        if not self.enabled:
+            return 0
+
+        def is_affected(key: SearchCacheKey) -> bool:
+            if key.doc_type != doc_type:
+                return False
+            if key.doc_id is not None:
+                return doc_id is None or key.doc_id == doc_id
+            if key.course_id is not None:
+                return course_id is None or key.course_id == course_id
+            return True
+
+        dropped = self._results.discard_where(is_affected)
+        if dropped:
+            _cache_invalidations.add(dropped, {"doc_type": doc_type})
+        logger.debug(
+            "rag.search_cache.invalidated",
+            extra={
+                "doc_type": doc_type,
+                "doc_id": str(doc_id) if doc_id else None,
+                "course_id": str(course_id) if course_id else None,
+                "dropped": dropped,
+            },
+        )
+        return dropped
+
+    def invalidate_scope_on_commit(
+        self,
+        session: AsyncSession,
+        *,
+        doc_type: str,
+        doc_id: uuid.UUID | None = None,
+        course_id: uuid.UUID | None = None,
+    ) -> None:
+        """Invalidate the scope now and again when ``session``'s transaction commits or rolls back.
+
+        Until then other sessions still read the committed chunks and may cache
+        them again, so invalidating only after a flush would leave those entries
+        in place once the new chunks become visible.
+        """
+        if not self.enabled:
+            return
+        self.invalidate_scope(doc_type=doc_type, doc_id=doc_id, course_id=course_id)
+        pending: set[_PendingScope] = session.info.setdefault(_PENDING_SCOPES_KEY, set())
+        pending.add((self, doc_type, doc_id, course_id))
+        if not session.info.get(_LISTENERS_KEY):
+            event.listen(session.sync_session, "after_commit", _invalidate_pending_scopes)
+            event.listen(session.sync_session, "after_rollback", _invalidate_pending_scopes)
+            session.info[_LISTENERS_KEY] = True
+
+    def clear(self) -> None:
+        """Drop every cached embedding and search result."""
+        self._embeddings.clear()
+        self._results.clear()
+
+    def _record_lookup(self, kind: str, *, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+            _cache_hits.add(1, {"kind": kind})
+        else:
+            self.misses += 1
+            _cache_misses.add(1, {"kind": kind})
+        logger.debug(
+            "rag.search_cache.lookup",
+            extra={"kind": kind, "hit": hit, "hit_rate": round(self.hit_rate, 4)},
+        )
+
+
+def _invalidate_pending_scopes(session: Session) -> None:
+    pending: set[_PendingScope] = session.info.pop(_PENDING_SCOPES_KEY, set())
+    for cache, doc_type, doc_id, course_id in pending:
+        cache.invalidate_scope(doc_type=doc_type, doc_id=doc_id, course_id=course_id)
+
+
+@lru_cache(maxsize=1)
+def get_rag_search_cache() -> RAGSearchCache:
+    """Return the process-wide search cache shared by every ``VectorRAG`` instance."""
+    config = get_rag_config()
+    return RAGSearchCache(ttl_seconds=config.search_cache_ttl_seconds, max_entries=config.search_cache_max_entries)
@@ -3,7 +3,6 @@
 
 import asyncio
 import logging
-import tempfile
 import time
 import uuid
 from datetime import UTC, datetime
@@ -11,7 +10,6 @@ from pathlib import Path
 from typing import cast
 
 import litellm
-from fastapi import BackgroundTasks
 from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import select, text
 from sqlalchemy.exc import SQLAlchemyError
@@ -26,7 +24,6 @@ from src.ai.prompts import (
     QUERY2DOC_EXPANSION_PROMPT,
     UTILITY_BATCH_FILTER_PROMPT,
 )
-from src.ai.rag.chunker import chunk_text_with_metadata_async
 from src.ai.rag.config import get_rag_config
 from src.ai.rag.embeddings import VectorRAG
 from src.ai.rag.exceptions import (
@@ -39,9 +36,11 @@ from src.ai.rag.exceptions import (
 from src.ai.rag.filters import deduplicate_by_similarity
 from src.ai.rag.parser import DocumentProcessor
 from src.ai.rag.schemas import DocumentResponse, MultiViewQueryExpansion, SearchResult, UtilityBatchFilterResponse
+from src.ai.rag.search_cache import get_rag_search_cache
 from src.books.models import Book
 from src.courses.models import Course, CourseDocument
 from src.database.session import async_session_maker
+from src.jobs import JobKind, enqueue_job
 from src.storage.exceptions import StorageError
 from src.storage.factory import get_storage_provider
 from src.videos.models import Video
@@ -283,7 +282,6 @@ class RAGService:
         file_content: bytes | None = None,
         filename: str | None = None,
         process_in_background: bool = True,
-        background_tasks: BackgroundTasks | None = None,
     ) -> DocumentResponse:
         """Upload a document to a course, ensuring user ownership."""
         await self._ensure_course_owned(session, user_id, course_id)
@@ -317,10 +315,13 @@ class RAGService:
             await session.flush()
 
             if process_in_background:
+                await enqueue_job(
+                    session,
+                    JobKind.RAG_PROCESS_DOCUMENT,
+                    {"document_id": doc.id},
+                    dedupe_key=f"{JobKind.RAG_PROCESS_DOCUMENT}:{doc.id}",
+                )
                 await session.commit()
-                doc_id = doc.id
-                if background_tasks is not None:
-                    background_tasks.add_task(self._process_document_background, doc_id)
 
             result = await session.execute(
                 text("SELECT * FROM course_documents WHERE id = :doc_id"), {"doc_id": doc.id}
@@ -358,29 +359,15 @@ class RAGService:
             )
             await session.flush()
 
-            text_content = ""
-            if doc_dict["file_path"]:
-                stored_file_path = Path(doc_dict["file_path"])
-                if not await run_in_threadpool(stored_file_path.exists):
-                    raise FileNotFoundError(stored_file_path)
-
-                with tempfile.NamedTemporaryFile(delete=False, suffix=stored_file_path.suffix) as temp_file:
-                    temp_file.write(await run_in_threadpool(stored_file_path.read_bytes))
-                    temp_file_path = temp_file.name
-
-                try:
-                    text_content = await self.document_processor.process_document(temp_file_path)
-                finally:
-                    cleanup_path = Path(temp_file_path)
-                    try:
-                        await run_in_threadpool(cleanup_path.unlink)
-                    except OSError:
-                        logger.warning("rag.document.temp_cleanup_failed", extra={"document_id": document_id}, exc_info=True)
-            else:
+            if not doc_dict["file_path"]:
                 raise RagValidationError(MISSING_FILE_PATH_ERROR_MESSAGE)
+            stored_file_path = Path(doc_dict["file_path"])
+            if not await run_in_threadpool(stored_file_path.exists):
+                raise FileNotFoundError(stored_file_path)
 
-            chunks, per_chunk_metadata = await chunk_text_with_metadata_async(
-                text_content,
+            # Parse straight from the stored file, page by page, instead of copying it to a temp file first.
+            chunks, per_chunk_metadata = await self.document_processor.chunk_document(
+                str(stored_file_path),
                 document_title=str(doc_dict.get("title") or ""),
                 chunk_size=self.config.chunk_size,
                 chunk_overlap_ratio=self.config.chunk_overlap_ratio,
@@ -419,7 +406,7 @@ class RAGService:
             await session.flush()
             raise
 
-    async def _process_document_background(self, document_id: int) -> None:
+    async def process_document_background(self, document_id: int) -> None:
         """Process a document in the background with its own session."""
         async with async_session_maker() as session:
             try:
@@ -473,26 +460,31 @@ class RAGService:
 
         return True
 
-    async def _download_book_bytes(self, book: Book) -> bytes:
+    async def _chunk_book(self, book: Book) -> tuple[list[str], list[dict[str, object]]]:
+        """Parse the book from a local copy page by page and chunk it incrementally."""
+        file_type = (book.file_type or "").lower()
         storage = get_storage_provider(book.storage_provider)
-        return await storage.download(book.file_path)
+        async with storage.local_path(book.file_path, content_hash=book.file_hash, suffix=f".{file_type}") as book_path:
+            return await self.document_processor.chunk_document(
+                str(book_path),
+                file_type=file_type,
+                document_title=book.title or "",
+                chunk_size=self.config.chunk_size,
+                chunk_overlap_ratio=self.config.chunk_overlap_ratio,
+            )
 
-    async def _parse_book_to_text(self, book: Book, file_bytes: bytes) -> str:
-        file_type = (book.file_type or "").lower()
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f".{file_type}") as temp_file:
-            temp_file.write(file_bytes)
-            temp_path = temp_file.name
-        try:
-            return await self.document_processor.process_document(temp_path)
-        finally:
-            temp_file_path = Path(temp_path)
-            try:
-                await run_in_threadpool(temp_file_path.unlink)
-            except OSError:
-                logger.warning("rag.book.temp_cleanup_failed", extra={"book_id": str(book.id)}, exc_info=True)
+    async def process_book(
+        self,
+        session: AsyncSession,
+        book_id: uuid.UUID,
+        *,
+        prepared_chunks: tuple[list[str], list[dict[str, object]]] | None = None,
+    ) -> None:
+        """Process a book (parse, chunk, embed, index) with unified RAG pipeline.
 
-    async def process_book(self, session: AsyncSession, book_id: uuid.UUID) -> None:
-        """Process a book (parse, chunk, embed, index) with unified RAG pipeline."""
+        ``prepared_chunks`` skips the download and parse when the caller already
+        chunked the file, e.g. the upload pipeline that parses each book once.
+        """
         try:
             # Load book
             book = await session.get(Book, book_id)
@@ -508,22 +500,16 @@ class RAGService:
             book.rag_status = RAG_STATUS_PROCESSING
             await session.flush()
 
-            file_bytes = await self._download_book_bytes(book)
-            text_content = await self._parse_book_to_text(book, file_bytes)
-
-            # Chunk
-            chunks, per_chunk_metadata = await chunk_text_with_metadata_async(
-                text_content,
-                document_title=book.title or "",
-                chunk_size=self.config.chunk_size,
-                chunk_overlap_ratio=self.config.chunk_overlap_ratio,
-            )
+            if prepared_chunks is None:
+                chunks, per_chunk_metadata = await self._chunk_book(book)
+            else:
+                chunks, per_chunk_metadata = prepared_chunks
             if not self._has_valid_chunks(chunks):
                 await self._mark_book_failed_without_chunks(session, book, book_id)
                 return
 
             # Store chunks
-            await self.vector_rag.store_document_chunks_with_embeddings(
+            report = await self.vector_rag.store_document_chunks_with_embeddings(
                 session=session,
                 doc_type=CONTENT_TYPE_BOOK,
                 doc_id=book.id,
@@ -537,7 +523,13 @@ class RAGService:
             book.rag_processed_at = datetime.now(UTC)
             await session.flush()
 
-            logger.info("Successfully processed book %s", book_id)
+            logger.info(
+                "Successfully processed book %s (embedded %s of %s chunks, deleted %s stale)",
+                book_id,
+                report.embedded_chunks,
+                report.total_chunks,
+                report.deleted_chunks,
+            )
 
             # Note: We do not delete the original book file here; keep for user access
 
@@ -585,7 +577,7 @@ class RAGService:
                 await session.flush()
                 return
 
-            await self.vector_rag.store_document_chunks_with_embeddings(
+            report = await self.vector_rag.store_document_chunks_with_embeddings(
                 session=session,
                 doc_type=CONTENT_TYPE_VIDEO,
                 doc_id=video.id,
@@ -605,7 +597,13 @@ class RAGService:
             video.rag_processed_at = datetime.now(UTC)
             await session.flush()
 
-            logger.info("Successfully processed video %s", video_id)
+            logger.info(
+                "Successfully processed video %s (embedded %s of %s chunks, deleted %s stale)",
+                video_id,
+                report.embedded_chunks,
+                report.total_chunks,
+                report.deleted_chunks,
+            )
 
         except _RAG_RUNTIME_ERROR_TYPES:
             logger.exception("Failed to process video %s", video_id)
@@ -681,7 +679,7 @@ class RAGService:
             logger.info("Storing %s chunks for document %s using LiteLLM + pgvector", valid_chunk_count, document_id)
 
             # Use VectorRAG's existing method to store chunks with embeddings
-            await self.vector_rag.store_document_chunks_with_embeddings(
+            report = await self.vector_rag.store_document_chunks_with_embeddings(
                 session=session,
                 doc_type=CONTENT_TYPE_COURSE,
                 doc_id=doc_uuid,
@@ -694,7 +692,13 @@ class RAGService:
                 per_chunk_metadata=per_chunk_metadata,
             )
 
-            logger.info("Successfully stored %s chunks for document %s in pgvector", len(chunks), document_id)
+            logger.info(
+                "Successfully stored %s chunks for document %s in pgvector (embedded %s, deleted %s stale)",
+                report.total_chunks,
+                document_id,
+                report.embedded_chunks,
+                report.deleted_chunks,
+            )
 
         except _RAG_RUNTIME_ERROR_TYPES:
             logger.exception("Failed to store document chunks")
@@ -792,7 +796,7 @@ class RAGService:
                     SELECT 1
                     FROM rag_document_chunks chunk
                     WHERE chunk.doc_type = :doc_type
-                      AND chunk.metadata->>'course_id' = :course_id
+                      AND chunk.course_id = :course_id
                     LIMIT 1
                 )
                 """,
@@ -1129,6 +1133,9 @@ class RAGService:
                 text("DELETE FROM rag_document_chunks WHERE doc_id = :doc_uuid AND doc_type = 'course'"),
                 {"doc_uuid": str(doc_uuid)},
             )
+            get_rag_search_cache().invalidate_scope_on_commit(
+                session, doc_type=CONTENT_TYPE_COURSE, doc_id=doc_uuid, course_id=doc.course_id
+            )
             chunks_deleted = int(getattr(chunks_result, "rowcount", 0) or 0)
             if chunks_deleted > 0:
                 logger.info("Deleted %s RAG chunks for document %s", chunks_deleted, document_id)
@@ -1194,6 +1201,8 @@ class RAGService:
                     text("DELETE FROM rag_document_chunks WHERE doc_id = :doc_id AND doc_type = :doc_type"),
                     {"doc_id": document_id, "doc_type": doc_type},
                 )
+                if isinstance(document_id, uuid.UUID):
+                    get_rag_search_cache().invalidate_scope_on_commit(session, doc_type=doc_type, doc_id=document_id)
             else:
                 # For courses, compute the UUID from the course_documents row.
                 course_id = await session.scalar(
@@ -1210,6 +1219,9 @@ class RAGService:
                     text("DELETE FROM rag_document_chunks WHERE doc_id = :doc_uuid AND doc_type = :doc_type"),
                     {"doc_uuid": doc_uuid, "doc_type": doc_type},
                 )
+                get_rag_search_cache().invalidate_scope_on_commit(
+                    session, doc_type=doc_type, doc_id=doc_uuid, course_id=course_id
+                )
 
             await session.flush()
             rowcount = int(getattr(result, "rowcount", 0) or 0)
@@ -1236,21 +1248,20 @@ class RAGService:
         course_id: uuid.UUID,
     ) -> int:
         """
-        Delete all RAG chunks for a specific course using metadata.
+        Delete all RAG chunks for a specific course.
 
-        Deletes from rag_document_chunks WHERE metadata->>'course_id' = :course_id
+        Deletes from rag_document_chunks WHERE course_id = :course_id
 
         Returns the number of chunks deleted.
         """
         import time
 
         start_time = time.time()
+        get_rag_search_cache().invalidate_scope_on_commit(session, doc_type=CONTENT_TYPE_COURSE, course_id=course_id)
 
         try:
             result = await session.execute(
-                text(
-                    "DELETE FROM rag_document_chunks WHERE metadata->>'course_id' = :course_id AND doc_type = :doc_type"
-                ),
+                text("DELETE FROM rag_document_chunks WHERE course_id = :course_id AND doc_type = :doc_type"),
                 {"course_id": str(course_id), "doc_type": CONTENT_TYPE_COURSE},
             )
 
@@ -1280,7 +1291,7 @@ class RAGService:
     ) -> int:
         """Unified RAG purge entrypoint for content delete.
 
-        - course: delete by metadata->>'course_id'
+        - course: delete by course_id
         - book: delete by doc_id + doc_type='book'
         - video: delete by doc_id + doc_type='video'
         Returns number of chunks deleted (best-effort).
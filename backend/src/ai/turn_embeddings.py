@@ -0,0 +1,154 @@
+"""Request-scoped sharing of embeddings computed during one assistant turn."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from opentelemetry import metrics
+
+
+logger = logging.getLogger(__name__)
+
+_meter = metrics.get_meter(__name__)
+_requested_per_turn = _meter.create_histogram(
+    "ai.turn_embeddings.requested",
+    unit="1",
+    description="Embedding lookups issued during one turn, i.e. provider calls without per-turn dedupe",
+)
+_computed_per_turn = _meter.create_histogram(
+    "ai.turn_embeddings.computed",
+    unit="1",
+    description="Distinct embeddings computed during one turn after per-turn dedupe",
+)
+
+type EmbeddingKey = tuple[str, int | None, str]
+
+
+def embedding_key_text(text: str) -> str:
+    """Collapse whitespace as the RAG search cache's query keys do, so differently cleaned texts share a vector."""
+    return " ".join(text.split())
+
+
+class TurnEmbeddings:
+    """Compute each distinct ``(model, dimensions, text)`` embedding at most once per turn.
+
+    Concurrent callers asking for the same key share one in-flight computation;
+    a caller cancelled while waiting does not cancel it for the others. Failed
+    computations are not remembered, so a later caller retries.
+
+    ``requested`` counts embeddings callers needed and ``computed`` the provider
+    calls actually made, so their difference is what the turn saved.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.requested = 0
+        self.computed = 0
+        self._vectors: dict[EmbeddingKey, list[float]] = {}
+        self._pending: dict[EmbeddingKey, asyncio.Task[list[float]]] = {}
+
+    async def get(self, key: EmbeddingKey, compute: Callable[[], Awaitable[list[float]]]) -> list[float]:
+        """Return the embedding for ``key``, computing it with ``compute`` on first use."""
+        self.requested += 1
+        vector = self._vectors.get(key)
+        if vector is not None:
+            return vector
+        task = self._pending.get(key)
+        if task is None:
+            self.computed += 1
+            task = asyncio.create_task(self._compute(key, compute), name=f"turn_embeddings.{self.name}")
+            self._pending[key] = task
+        return await asyncio.shield(task)
+
+    def lookup(self, key: EmbeddingKey) -> list[float] | None:
+        """Return an already computed embedding for ``key`` without waiting.
+
+        A hit serves a vector that was primed, and counted, through :meth:`get`,
+        so it is not counted again. A miss means the caller computes the vector
+        itself, which counts as both requested and computed.
+        """
+        vector = self._vectors.get(key)
+        if vector is None:
+            self.requested += 1
+            self.computed += 1
+        return vector
+
+    def close(self) -> None:
+        """Cancel computations nobody waited for and record the turn's counts."""
+        for task in self._pending.values():
+            task.cancel()
+        self._pending.clear()
+        attributes = {"turn": self.name}
+        _requested_per_turn.record(self.requested, attributes)
+        _computed_per_turn.record(self.computed, attributes)
+        logger.info(
+            "ai.turn_embeddings.completed",
+            extra={"turn": self.name, "requested": self.requested, "computed": self.computed},
+        )
+
+    async def _compute(self, key: EmbeddingKey, compute: Callable[[], Awaitable[list[float]]]) -> list[float]:
+        try:
+            vector = await compute()
+        finally:
+            self._pending.pop(key, None)
+        self._vectors[key] = vector
+        return vector
+
+
+_current_turn: ContextVar[TurnEmbeddings | None] = ContextVar("turn_embeddings", default=None)
+
+
+@contextmanager
+def turn_embedding_scope(name: str) -> Generator[TurnEmbeddings]:
+    """Share embeddings across everything the block runs, including tasks and threads it starts.
+
+    The scope lives in a context variable, so it must be entered and exited
+    without yielding to a caller in between (not across ``yield`` in an async
+    generator).
+    """
+    turn = TurnEmbeddings(name)
+    token = _current_turn.set(turn)
+    try:
+        yield turn
+    finally:
+        _current_turn.reset(token)
+        turn.close()
+
+
+def turn_embedding_scope_active() -> bool:
+    """Return whether the caller runs inside a :func:`turn_embedding_scope`."""
+    return _current_turn.get() is not None
+
+
+async def shared_embedding(
+    *,
+    model: str,
+    dimensions: int | None,
+    text: str,
+    compute: Callable[[], Awaitable[list[float]]],
+) -> list[float]:
+    """Return ``text``'s embedding, shared with the rest of the current turn when in a scope.
+
+    Callers only share when they pass the same ``model`` and ``dimensions``: mem0
+    and VectorRAG share the query embedding only if ``MEMORY_EMBEDDING_MODEL``
+    and ``MEMORY_EMBEDDING_OUTPUT_DIM`` equal the RAG embedding settings. Texts
+    that differ only in whitespace share one vector.
+    """
+    turn = _current_turn.get()
+    if turn is None:
+        return await compute()
+    return await turn.get((model, dimensions, embedding_key_text(text)), compute)
+
+
+def precomputed_embedding(*, model: str, dimensions: int | None, text: str) -> list[float] | None:
+    """Return ``text``'s embedding if the current turn already computed it.
+
+    Safe to call from worker threads started with :func:`asyncio.to_thread`,
+    which inherit the caller's context.
+    """
+    turn = _current_turn.get()
+    if turn is None:
+        return None
+    return turn.lookup((model, dimensions, embedding_key_text(text)))
@@ -1,16 +1,22 @@
 """Books module facade."""
 
+import asyncio
 import json
 import logging
+import time
 import uuid
+from collections.abc import Generator
+from contextlib import AsyncExitStack, contextmanager
 from typing import cast
 
-from fastapi import BackgroundTasks, status
+from fastapi import status
+from opentelemetry import metrics
 from pydantic import JsonValue
 from sqlalchemy import select, text
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.ai.rag.exceptions import RagUnavailableError
 from src.ai.rag.service import RAGService
 from src.books.models import Book
 from src.books.schemas import (
@@ -26,15 +32,25 @@ from src.books.schemas import (
 )
 from src.database.session import async_session_maker
 from src.exceptions import ConflictError, DomainError, ErrorCategory, ErrorCode, NotFoundError, ValidationError
+from src.jobs import JobKind, enqueue_job
 from src.storage.factory import get_storage_provider
 
 from .services.book_content_service import BookContentService
-from .services.book_metadata_service import BookMetadata, BookMetadataExtractionError, BookMetadataService
+from .services.book_ingest_pipeline import BookArtifacts, analyze_book_async, format_tagging_excerpt
+from .services.book_metadata_service import BookMetadata
 from .services.book_progress_service import BookProgressService
 from .services.book_response_builder import BookResponseBuilder
 
 
 logger = logging.getLogger(__name__)
+
+_meter = metrics.get_meter(__name__)
+_ingest_stage_duration = _meter.create_histogram(
+    "books.ingest.stage.duration",
+    unit="ms",
+    description="Time per stage of the download-once book upload pipeline",
+)
+
 BOOK_RESOURCE_TYPE = "book"
 BOOK_RAG_STATUS_PENDING: BookRagStatus = "pending"
 BOOK_RAG_STATUS_PROCESSING: BookRagStatus = "processing"
@@ -63,6 +79,18 @@ class BooksFacadeInternalError(DomainError):
         super().__init__(detail, feature_area="books")
 
 
+@contextmanager
+def _timed_stage(stage_ms: dict[str, float], stage: str) -> Generator[None]:
+    """Record how long one upload pipeline stage took, including when it raises."""
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = round((time.perf_counter() - started_at) * 1000, 2)
+        stage_ms[stage] = elapsed_ms
+        _ingest_stage_duration.record(elapsed_ms, {"stage": stage})
+
+
 def _parse_json_tags(raw_tags: str | None) -> list[str]:
     """Parse serialized tags JSON into a list."""
     if not raw_tags:
@@ -160,50 +188,72 @@ class BooksFacade:
             message = "Failed to retrieve book"
             raise BooksFacadeInternalError(message) from error
 
-    async def embed_book_background(self, book_id: uuid.UUID) -> None:
-        """Process embeddings for a book in a dedicated background session."""
-        async with async_session_maker() as session:
-            try:
-                await RAGService().process_book(session, book_id)
-                await session.commit()
-            except (SQLAlchemyError, RuntimeError, ValueError):
-                try:
-                    await session.commit()
-                except SQLAlchemyError:
-                    logger.debug("Failed to commit failed RAG status for book %s", book_id, exc_info=True)
-                logger.exception("Failed to embed book %s", book_id)
-
-    async def extract_book_metadata_background(self, book_id: uuid.UUID) -> None:
-        """Download the uploaded file once and persist page count + table of contents.
-
-        Runs in a dedicated short-lived session so request transactions stay short.
-        Uses the single ``storage.download(key)`` primitive that all providers
-        implement (local/R2/GCS), so the same code path works identically across
-        every backend with zero branching.
+    async def process_uploaded_book_background(self, book_id: uuid.UUID, user_id: uuid.UUID) -> None:
+        """Stream an uploaded book to disk once and derive metadata, tags and RAG chunks from a single parse.
 
-        Idempotent: only fills empty fields, so re-scheduling on a book that
-        already has metadata is a no-op and re-running after partial failure is safe.
+        Each stage uses its own short-lived session so no transaction spans the
+        download or the LLM calls. Storage errors propagate so the job queue
+        retries the pipeline; metadata only fills empty fields and re-indexing
+        is incremental, so a rerun is safe.
         """
         async with async_session_maker() as session:
             book = await session.get(Book, book_id)
             if book is None or not book.file_path:
                 return
-
-            storage = get_storage_provider(book.storage_provider)
-            try:
-                content = await storage.download(book.file_path)
-            except (OSError, RuntimeError, ValueError):
-                logger.exception("books.metadata.download_failed", extra={"book_id": str(book_id)})
-                return
-
-            if not content:
-                logger.warning("books.metadata.empty_content", extra={"book_id": str(book_id)})
-                return
-
-            try:
-                metadata = BookMetadataService().extract_metadata(content, f".{book.file_type}")
-            except BookMetadataExtractionError:
-                logger.exception("books.metadata.extract_failed", extra={"book_id": str(book_id)})
+            storage_provider, file_path, file_hash = book.storage_provider, book.file_path, book.file_hash
+            file_type, title = (book.file_type or "").lower(), book.title
+
+        stage_ms: dict[str, float] = {}
+        rag_service = RAGService()
+        artifacts: BookArtifacts | None = None
+        if file_type in MEDIA_TYPES:
+            # Parse from a local copy (disk cache, temp download or the local file) so memory stays flat.
+            async with AsyncExitStack() as stack:
+                with _timed_stage(stage_ms, "download"):
+                    try:
+                        book_path = await stack.enter_async_context(
+                            get_storage_provider(storage_provider).local_path(
+                                file_path, content_hash=file_hash, suffix=f".{file_type}"
+                            )
+                        )
+                    except (OSError, RuntimeError, ValueError):
+                        logger.exception("books.ingest.download_failed", extra={"book_id": str(book_id)})
+                        raise
+
+                with _timed_stage(stage_ms, "parse"):
+                    try:
+                        artifacts = await analyze_book_async(
+                            str(book_path),
+                            file_type=file_type,
+                            title=title,
+                            chunk_size=rag_service.config.chunk_size,
+                            chunk_overlap_ratio=rag_service.config.chunk_overlap_ratio,
+                        )
+                    except RagUnavailableError:
+                        logger.exception("books.ingest.parse_failed", extra={"book_id": str(book_id)})
+        else:
+            logger.warning("books.ingest.unparseable_file", extra={"book_id": str(book_id), "file_type": file_type})
+
+        if artifacts is not None:
+            with _timed_stage(stage_ms, "metadata"):
+                await self._store_extracted_metadata(book_id, artifacts.metadata)
+
+        excerpt = format_tagging_excerpt(artifacts) if artifacts is not None else ""
+        chunks = (artifacts.chunks, artifacts.chunk_metadata) if artifacts is not None else ([], [])
+        await asyncio.gather(
+            self._auto_tag_book(book_id, user_id, excerpt, stage_ms=stage_ms),
+            self._embed_book(rag_service, book_id, chunks, stage_ms=stage_ms),
+        )
+        logger.info(
+            "books.ingest.completed",
+            extra={"book_id": str(book_id), "chunk_count": len(chunks[0]), "stage_ms": stage_ms},
+        )
+
+    async def _store_extracted_metadata(self, book_id: uuid.UUID, metadata: BookMetadata) -> None:
+        """Persist extracted page count, table of contents and bibliographic fields that are still empty."""
+        async with async_session_maker() as session:
+            book = await session.get(Book, book_id)
+            if book is None:
                 return
 
             updated = False
@@ -239,43 +289,68 @@ class BooksFacade:
             except SQLAlchemyError:
                 logger.exception("books.metadata.commit_failed", extra={"book_id": str(book_id)})
 
-    async def auto_tag_book_background(self, book_id: uuid.UUID, user_id: uuid.UUID) -> None:
-        """Generate and persist tags for a book in a dedicated background session."""
-        try:
-            from src.tagging.processors.book_processor import process_book_for_tagging
-            from src.tagging.service import TaggingService, update_content_tags_json
-
+    async def _embed_book(
+        self,
+        rag_service: RAGService,
+        book_id: uuid.UUID,
+        chunks: tuple[list[str], list[dict[str, object]]],
+        *,
+        stage_ms: dict[str, float],
+    ) -> None:
+        """Embed and index already chunked book text in a dedicated background session."""
+        with _timed_stage(stage_ms, "embedding"):
             async with async_session_maker() as session:
-                content_data = await process_book_for_tagging(book_id, user_id, session)
-                if not content_data:
-                    logger.warning("Skipping tagging for missing book %s", book_id)
-                    return
-
-                generated_tags = await TaggingService(session).tag_content(
-                    content_id=book_id,
-                    content_type="book",
-                    user_id=user_id,
-                    title=content_data.get("title", ""),
-                    content_preview=content_data.get("content_preview", ""),
-                )
-
-                book = await session.get(Book, book_id)
-                if book is None:
-                    logger.warning("Skipping tag JSON update for missing book %s", book_id)
-                    return
-
-                merged_tags = _merge_tags(_parse_json_tags(book.tags), generated_tags)
-                await update_content_tags_json(
-                    session=session,
-                    content_id=book_id,
-                    content_type="book",
-                    tags=merged_tags,
-                    user_id=user_id,
-                )
-                await session.commit()
-                logger.info("Successfully tagged book %s with tags: %s", book_id, generated_tags)
-        except (SQLAlchemyError, RuntimeError, ValueError, OSError):
-            logger.exception("Failed to tag book %s", book_id)
+                try:
+                    await rag_service.process_book(session, book_id, prepared_chunks=chunks)
+                    await session.commit()
+                except (SQLAlchemyError, RuntimeError, ValueError):
+                    try:
+                        await session.commit()
+                    except SQLAlchemyError:
+                        logger.debug("Failed to commit failed RAG status for book %s", book_id, exc_info=True)
+                    logger.exception("Failed to embed book %s", book_id)
+
+    async def _auto_tag_book(
+        self,
+        book_id: uuid.UUID,
+        user_id: uuid.UUID,
+        excerpt: str,
+        *,
+        stage_ms: dict[str, float],
+    ) -> None:
+        """Generate and persist tags from the parsed excerpt in a dedicated background session."""
+        with _timed_stage(stage_ms, "tagging"):
+            try:
+                from src.tagging.processors.book_processor import BookProcessor
+                from src.tagging.service import TaggingService, update_content_tags_json
+
+                async with async_session_maker() as session:
+                    book = await session.get(Book, book_id)
+                    if book is None or book.user_id != user_id:
+                        logger.warning("Skipping tagging for missing book %s", book_id)
+                        return
+
+                    content_data = BookProcessor(session).build_tagging_content(book, excerpt)
+                    generated_tags = await TaggingService(session).tag_content(
+                        content_id=book_id,
+                        content_type="book",
+                        user_id=user_id,
+                        title=content_data.get("title", ""),
+                        content_preview=content_data.get("content_preview", ""),
+                    )
+
+                    merged_tags = _merge_tags(_parse_json_tags(book.tags), generated_tags)
+                    await update_content_tags_json(
+                        session=session,
+                        content_id=book_id,
+                        content_type="book",
+                        tags=merged_tags,
+                        user_id=user_id,
+                    )
+                    await session.commit()
+                    logger.info("Successfully tagged book %s with tags: %s", book_id, generated_tags)
+            except (SQLAlchemyError, RuntimeError, ValueError, OSError):
+                logger.exception("Failed to tag book %s", book_id)
 
     async def upload_book(
         self,
@@ -350,7 +425,7 @@ class BooksFacade:
         publication_year: int | None = None,
         publisher: str | None = None,
         tags: list[str] | None = None,
-        background_tasks: BackgroundTasks | None = None,
+        process_in_background: bool = False,
     ) -> BookResponse:
         """Create a book record after a browser-direct upload completes."""
         expected_prefix = f"books/{user_id!s}/direct/"
@@ -414,11 +489,14 @@ class BooksFacade:
                 raise
             raise
 
-        if background_tasks is not None:
+        if process_in_background:
+            await enqueue_job(
+                self._session,
+                JobKind.BOOK_INGEST,
+                {"book_id": str(book_id), "user_id": str(user_id)},
+                dedupe_key=f"{JobKind.BOOK_INGEST}:{book_id}",
+            )
             await self._session.commit()
-            background_tasks.add_task(self.extract_book_metadata_background, book_id)
-            background_tasks.add_task(self.embed_book_background, book_id)
-            background_tasks.add_task(self.auto_tag_book_background, book_id, user_id)
 
         return book_response
 
@@ -0,0 +1,102 @@
+"""Single-pass analysis of an uploaded book: metadata, RAG chunks and a tagging excerpt from one parse."""
+
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
+from fastapi.concurrency import run_in_threadpool
+
+from src.ai.rag.chunker import chunk_pages_with_metadata
+from src.ai.rag.ingest_pool import get_ingest_pool
+from src.ai.rag.parser import iter_open_document_pages, open_document
+
+from .book_metadata_service import BookMetadata, BookMetadataExtractionError, BookMetadataService
+
+
+# Tagging only needs the opening of a book; these match the previous standalone PDF tagging preview.
+_TAGGING_EXCERPT_PAGES = 5
+_TAGGING_EXCERPT_PAGE_CHARS = 2_000
+_TAGGING_TOC_ENTRIES = 20
+
+
+@dataclass(slots=True)
+class BookArtifacts:
+    """Everything the upload pipeline derives from one open document."""
+
+    metadata: BookMetadata
+    chunks: list[str]
+    chunk_metadata: list[dict[str, object]]
+    excerpt_pages: list[str] = field(default_factory=list)
+    toc_entries: list[tuple[int, str]] = field(default_factory=list)
+
+
+def analyze_book(
+    source: str | bytes,
+    file_type: str,
+    title: str | None,
+    chunk_size: int,
+    chunk_overlap_ratio: float,
+) -> BookArtifacts:
+    """Open the book (a file path or its bytes) once and derive metadata, RAG chunks and the tagging excerpt.
+
+    Pages are streamed into the chunker as they are read; only the first few
+    are kept for tagging. Metadata failures fall back to empty metadata so they
+    never block indexing. Top-level and picklable so it can run in the ingest pool.
+    """
+    with open_document(source, file_type=file_type) as document:
+        try:
+            metadata = BookMetadataService().extract_from_document(document, file_type)
+            toc = document.get_toc()
+        except BookMetadataExtractionError, AttributeError, RuntimeError:
+            metadata, toc = BookMetadata(file_type=file_type), []
+
+        excerpt_pages: list[str] = []
+
+        def pages() -> Iterator[str]:
+            for page_text in iter_open_document_pages(document):
+                if len(excerpt_pages) < _TAGGING_EXCERPT_PAGES:
+                    excerpt_pages.append(page_text[:_TAGGING_EXCERPT_PAGE_CHARS])
+                yield page_text
+
+        chunks, chunk_metadata = chunk_pages_with_metadata(
+            pages(),
+            document_title=title,
+            chunk_size=chunk_size,
+            chunk_overlap_ratio=chunk_overlap_ratio,
+        )
+
+    return BookArtifacts(
+        metadata=metadata,
+        chunks=chunks,
+        chunk_metadata=chunk_metadata,
+        excerpt_pages=excerpt_pages,
+        toc_entries=[(int(level), str(entry_title)) for level, entry_title, *_ in toc[:_TAGGING_TOC_ENTRIES]],
+    )
+
+
+async def analyze_book_async(
+    source: str | bytes,
+    *,
+    file_type: str,
+    title: str | None,
+    chunk_size: int,
+    chunk_overlap_ratio: float,
+) -> BookArtifacts:
+    """Run :func:`analyze_book` off the event loop, in the ingest process pool when one is configured.
+
+    Prefer passing a file path: the worker process then reads the book itself
+    instead of receiving a pickled copy of its bytes.
+    """
+    ingest_pool = get_ingest_pool()
+    if ingest_pool is not None:
+        return await ingest_pool.run(analyze_book, source, file_type, title, chunk_size, chunk_overlap_ratio)
+    return await run_in_threadpool(analyze_book, source, file_type, title, chunk_size, chunk_overlap_ratio)
+
+
+def format_tagging_excerpt(artifacts: BookArtifacts) -> str:
+    """Format the table of contents and opening pages as the content excerpt sent to the tagger."""
+    parts: list[str] = []
+    if artifacts.toc_entries:
+        toc_text = "\n".join(f"{'  ' * (level - 1)}{entry_title}" for level, entry_title in artifacts.toc_entries)
+        parts.append(f"Table of Contents:\n{toc_text}\n")
+    parts.extend(artifacts.excerpt_pages)
+    return "\n\n".join(parts)
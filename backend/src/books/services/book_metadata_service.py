@@ -88,20 +88,7 @@ class BookMetadataService:
 
         try:
             with pymupdf.open(stream=file_content, filetype="pdf") as pdf_document:
-                metadata.total_pages = pdf_document.page_count
-
-                pdf_metadata = pdf_document.metadata
-                if pdf_metadata:
-                    self._extract_document_basic_fields(metadata, pdf_metadata)
-                    self._extract_document_publication_year(metadata, pdf_metadata)
-
-                # Extract table of contents
-                try:
-                    toc = pdf_document.get_toc()
-                    if toc:
-                        metadata.table_of_contents = self._process_toc(toc)
-                except AttributeError:
-                    logger.debug("PDF document does not support get_toc method")
+                self._fill_from_document(metadata, pdf_document)
         except (RuntimeError, TypeError, ValueError) as error:
             message = "Failed to extract PDF metadata"
             logger.warning("%s: %s", message, error)
@@ -129,22 +116,7 @@ class BookMetadataService:
                 redirect_stderr(devnull),
                 pymupdf.open(stream=file_content, filetype="epub") as epub_document,
             ):
-                # Get page count (EPUBs in PyMuPDF are treated as pages)
-                metadata.total_pages = epub_document.page_count
-
-                # Extract metadata (similar to PDF)
-                epub_metadata = epub_document.metadata
-                if epub_metadata:
-                    self._extract_document_basic_fields(metadata, epub_metadata)
-                    self._extract_document_publication_year(metadata, epub_metadata)
-
-                # Extract table of contents - this works for EPUB too!
-                try:
-                    toc = epub_document.get_toc()
-                    if toc:
-                        metadata.table_of_contents = self._process_toc(toc)
-                except AttributeError:
-                    logger.debug("EPUB document does not support get_toc method")
+                self._fill_from_document(metadata, epub_document)
         except (OSError, RuntimeError, TypeError, ValueError) as error:
             message = "Failed to extract EPUB metadata"
             logger.warning("%s: %s", message, error)
@@ -152,6 +124,33 @@ class BookMetadataService:
 
         return metadata
 
+    def extract_from_document(self, document: pymupdf.Document, file_type: str) -> BookMetadata:
+        """Extract metadata from a PDF or EPUB that is already open, e.g. shared with RAG chunking."""
+        metadata = BookMetadata(file_type=file_type)
+        try:
+            self._fill_from_document(metadata, document)
+        except (RuntimeError, TypeError, ValueError) as error:
+            message = f"Failed to extract {file_type.upper()} metadata"
+            logger.warning("%s: %s", message, error)
+            raise BookMetadataExtractionError(message) from error
+        return metadata
+
+    def _fill_from_document(self, metadata: BookMetadata, document: pymupdf.Document) -> None:
+        """Read page count, document info and table of contents (PDF and EPUB alike; EPUB pages are reflowed)."""
+        metadata.total_pages = document.page_count
+
+        doc_metadata = document.metadata
+        if doc_metadata:
+            self._extract_document_basic_fields(metadata, doc_metadata)
+            self._extract_document_publication_year(metadata, doc_metadata)
+
+        try:
+            toc = document.get_toc()
+            if toc:
+                metadata.table_of_contents = self._process_toc(toc)
+        except AttributeError:
+            logger.debug("Document does not support get_toc method")
+
     def _extract_document_basic_fields(self, metadata: BookMetadata, doc_metadata: dict) -> None:
         """Extract basic fields from document metadata (works for both PDF and EPUB)."""
         if doc_metadata.get("title"):
@@ -0,0 +1,59 @@
+"""Small in-process caches shared across domains."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class _CacheEntry[V]:
+    value: V
+    expires_at: float
+
+
+class TTLLRUCache[K, V]:
+    """Bounded mapping whose entries expire after a TTL and are evicted least recently used first.
+
+    Not thread-safe; it is meant to be shared by coroutines on one event loop.
+    """
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[K, _CacheEntry[V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including any not yet found expired."""
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        """Return the live value for ``key`` and mark it most recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def put(self, key: K, value: V) -> None:
+        """Store ``value``, evicting the least recently used entries beyond capacity."""
+        if self.max_entries <= 0 or self.ttl_seconds <= 0:
+            return
+        self._entries[key] = _CacheEntry(value=value, expires_at=time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def discard_where(self, predicate: Callable[[K], bool]) -> int:
+        """Drop every entry whose key matches ``predicate`` and return how many were dropped."""
+        stale_keys = [key for key in self._entries if predicate(key)]
+        for key in stale_keys:
+            del self._entries[key]
+        return len(stale_keys)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
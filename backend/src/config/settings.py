@@ -2,7 +2,7 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
-from pydantic import SecretStr, field_validator, model_validator
+from pydantic import SecretStr, ValidationInfo, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -76,6 +76,8 @@ class Settings(BaseSettings):
     # Storage settings
     STORAGE_PROVIDER: str = "local"  # "local", "r2", or "gcs"
     LOCAL_STORAGE_PATH: str = "uploads"  # Path for local file storage (e.g., "uploads", "/app/uploads")
+    STORAGE_CACHE_DIR: str = ""  # Local read-through cache for remote (R2/GCS) book files; empty disables it
+    STORAGE_CACHE_MAX_MB: int = 2048  # Disk budget for STORAGE_CACHE_DIR, evicted least recently used first
 
     # R2 Configuration (optional)
     R2_ACCOUNT_ID: str = ""
@@ -96,6 +98,8 @@ class Settings(BaseSettings):
     )
     ADAPTIVE_CONFUSION_LAMBDA: float = 0.3  # Weight for confusion risk in scheduling
     ADAPTIVE_RISK_RECENT_K: int = 3  # Number of recent concepts to consider for sigma context
+    ADAPTIVE_CONFUSOR_ENGINE: Literal["numpy", "sql"] = "numpy"  # "numpy" = blockwise top-k, "sql" = all-pairs join
+    ADAPTIVE_CONFUSOR_TOP_K: int = 8  # Most similar neighbours kept per concept by the numpy confusor engine
 
     # Learning Algorithm Parameters
     LEARNING_DELTA_CORRECT: float = 0.18  # Mastery increase for correct answers
@@ -113,6 +117,20 @@ class Settings(BaseSettings):
     DURATION_ADJUSTMENT_MAX: float = 1.2  # Maximum duration-based adjustment factor
     DURATION_BASE_MS: int = 90000  # Base duration for adjustment calculations (90 seconds)
 
+    # Practice grading
+    GRADING_VERIFIER_POOL_WORKERS: int = 2  # Worker processes for SymPy answer checks, at least 1
+    GRADING_VERIFIER_CPU_BUDGET_SECONDS: float = 2.0  # Symbolic check budget before numeric-only fallback, 0 = none
+
+    # Background jobs
+    JOBS_RUN_IN_API: bool = True  # Run a job worker inside the API process; disable when running src.jobs.worker
+    JOBS_POLL_INTERVAL_SECONDS: float = 1.0  # Idle delay between claim rounds
+    JOBS_RETENTION_HOURS: int = 168  # Finished jobs are pruned after this many hours
+
+    # Assistant chat
+    ASSISTANT_CONTEXT_BUDGET_SECONDS: float = 1.5  # Wait for optional per-turn context, then drop it; 0 = no budget
+    ASSISTANT_CONTEXT_MAX_SESSIONS: int = 4  # Extra DB sessions one turn's context lookups may hold at once, 0 = no cap
+    ASSISTANT_HISTORY_TOKEN_BUDGET: int = 6000  # Prior-turn tokens sent per turn; older turns are folded into a summary
+
     # AI Configuration
     PRIMARY_LLM_MODELS: str = ""
     FAST_LLM_MODEL: str = ""
@@ -122,8 +140,11 @@ class Settings(BaseSettings):
     RAG_EMBEDDING_MANUAL_RETRIES: int = 1
     RAG_EMBEDDING_RETRY_DELAY_SECONDS: float = 1.0
     RAG_EMBEDDING_BATCH_SIZE: int = 1
+    RAG_EMBEDDING_MAX_IN_FLIGHT_BATCHES: int = 4  # Concurrent embedding calls per ingest
+    RAG_EMBEDDING_RATE_LIMIT_RETRIES: int = 5  # 429 retries, separate from RAG_EMBEDDING_MANUAL_RETRIES
     RAG_CHUNK_SIZE: int = 400
     RAG_CHUNK_OVERLAP_RATIO: float = 0.12
+    RAG_INGEST_POOL_WORKERS: int = 2  # Worker processes for parsing/chunking, 0 = run on the thread pool
     RAG_EMBEDDING_OUTPUT_DIM: int | None = None
     RAG_RERANK_MODEL: str = ""
     MEMORY_LLM_MODEL: str = ""
@@ -132,12 +153,21 @@ class Settings(BaseSettings):
 
     # RAG Configuration
     RAG_HNSW_EF_SEARCH: int = 80
+    RAG_HNSW_ITERATIVE_SCAN: Literal["off", "relaxed_order", "strict_order"] = "relaxed_order"  # pgvector >= 0.8
+    RAG_SEARCH_MODE: Literal["fused", "staged"] = "fused"  # "fused" = one-statement hybrid search with SQL-side RRF
     RAG_MAX_FILE_SIZE_MB: int = 10
+    RAG_CHUNK_WRITE_MODE: Literal["copy", "statement"] = "copy"  # "copy" = binary COPY, "statement" = multi-row upsert
+    RAG_REINDEX_MODE: Literal["incremental", "full"] = "incremental"  # "full" re-embeds every chunk (model switch)
+    RAG_EMBEDDING_CACHE_MAX_ENTRIES: int = 200_000  # Content-addressed embedding cache rows, 0 disables
+    RAG_SEARCH_CACHE_TTL_SECONDS: float = 300.0  # In-process query embedding/result cache lifetime, 0 disables
+    RAG_SEARCH_CACHE_MAX_ENTRIES: int = 1_024  # Per-process entries for each of the query caches, 0 disables
 
     # AI Tooling Configuration
     AI_ENABLED_TOOLS: str = ""  # Comma-separated allowlist; empty means allow all.
     AI_DISABLED_TOOLS: str = ""  # Comma-separated blocklist.
     AI_ENABLE_EXPERIMENTAL_MCP_TOOLS: bool = False
+    MCP_SESSION_IDLE_SECONDS: float = 300.0  # Idle time before a pooled MCP session is closed, 0 disables pooling
+    MCP_TOOL_CATALOG_TTL_SECONDS: float = 300.0  # Per-user MCP tool list cache lifetime, 0 disables
     AI_ENABLE_HOSTED_WEB_SEARCH: bool = True
     EXA_API_KEY: SecretStr | None = None
     EXA_SEARCH_TIMEOUT_SECONDS: float = 12.0
@@ -199,12 +229,17 @@ class Settings(BaseSettings):
 
     @field_validator(
         "AUTH_PASSWORD_MIN_LENGTH",
+        "ADAPTIVE_CONFUSOR_TOP_K",
+        "JOBS_RETENTION_HOURS",
+        "STORAGE_CACHE_MAX_MB",
+        "ASSISTANT_HISTORY_TOKEN_BUDGET",
+        "GRADING_VERIFIER_POOL_WORKERS",
     )
     @classmethod
-    def validate_positive_integers(cls, value: int) -> int:
-        """Ensure integer auth settings are positive."""
+    def validate_positive_integers(cls, value: int, info: ValidationInfo) -> int:
+        """Ensure integer sizes, counts and budgets that have no off switch are positive."""
         if value <= 0:
-            msg = "Auth settings integer values must be greater than zero"
+            msg = f"{info.field_name} must be greater than zero"
             raise ValueError(msg)
         return value
 
@@ -242,6 +277,7 @@ class Settings(BaseSettings):
 
     @field_validator(
         "RAG_EMBEDDING_BATCH_SIZE",
+        "RAG_EMBEDDING_MAX_IN_FLIGHT_BATCHES",
         "RAG_CHUNK_SIZE",
         "RAG_HNSW_EF_SEARCH",
         "RAG_MAX_FILE_SIZE_MB",
@@ -254,12 +290,45 @@ class Settings(BaseSettings):
             raise ValueError(msg)
         return value
 
-    @field_validator("RAG_EMBEDDING_MANUAL_RETRIES")
+    @field_validator("RAG_EMBEDDING_MANUAL_RETRIES", "RAG_EMBEDDING_RATE_LIMIT_RETRIES")
     @classmethod
     def validate_non_negative_rag_retries(cls, value: int) -> int:
         """Ensure manual embedding retries are not negative."""
         if value < 0:
-            msg = "Manual embedding retries cannot be negative"
+            msg = "Embedding retries cannot be negative"
+            raise ValueError(msg)
+        return value
+
+    @field_validator("RAG_EMBEDDING_CACHE_MAX_ENTRIES", "RAG_SEARCH_CACHE_MAX_ENTRIES", "RAG_INGEST_POOL_WORKERS")
+    @classmethod
+    def validate_non_negative_rag_capacity(cls, value: int) -> int:
+        """Ensure cache bounds and pool sizes are not negative."""
+        if value < 0:
+            msg = "RAG cache sizes and pool sizes cannot be negative"
+            raise ValueError(msg)
+        return value
+
+    @field_validator("GRADING_VERIFIER_CPU_BUDGET_SECONDS")
+    @classmethod
+    def validate_non_negative_grading_verifier_budget(cls, value: float) -> float:
+        """Ensure the grading verifier CPU budget is not negative."""
+        if value < 0:
+            msg = "Grading verifier CPU budget cannot be negative"
+            raise ValueError(msg)
+        return value
+
+    @field_validator(
+        "RAG_SEARCH_CACHE_TTL_SECONDS",
+        "ASSISTANT_CONTEXT_BUDGET_SECONDS",
+        "ASSISTANT_CONTEXT_MAX_SESSIONS",
+        "MCP_SESSION_IDLE_SECONDS",
+        "MCP_TOOL_CATALOG_TTL_SECONDS",
+    )
+    @classmethod
+    def validate_non_negative_lifetimes_and_limits(cls, value: float, info: ValidationInfo) -> float:
+        """Ensure cache lifetimes and limits where 0 turns the feature off are not negative."""
+        if value < 0:
+            msg = f"{info.field_name} must be greater than or equal to zero"
             raise ValueError(msg)
         return value
 
@@ -0,0 +1,61 @@
+"""Blockwise cosine similarity with top-k sparsification for embedding-based concept confusors."""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+
+# Query rows per similarity block; bounds peak memory at roughly ``block x concepts`` doubles.
+_BLOCK_ROWS = 256
+
+
+def top_k_confusor_pairs(
+    embeddings: np.ndarray,
+    *,
+    threshold: float,
+    top_k: int,
+    query_rows: Sequence[int] | None = None,
+    block_rows: int = _BLOCK_ROWS,
+) -> dict[tuple[int, int], float]:
+    """Return the most similar neighbours of each query row, keyed by ordered row pair.
+
+    Similarity is ``max(0, cosine)``, matching ``1 - (a <=> b)`` in pgvector.
+    Each query row keeps at most ``top_k`` neighbours at or above ``threshold``;
+    a pair survives when either endpoint keeps the other. Rows with a zero norm
+    have no defined similarity and are skipped. ``query_rows`` limits the work
+    to those rows against every row (incremental mode); by default every row is
+    a query row.
+
+    Returns
+    -------
+    dict[tuple[int, int], float]
+        Similarity per ``(low_row, high_row)`` pair.
+    """
+    row_count = embeddings.shape[0]
+    if row_count < 2 or top_k <= 0:
+        return {}
+
+    vectors = np.asarray(embeddings, dtype=np.float64)
+    norms = np.linalg.norm(vectors, axis=1)
+    valid = norms > 0
+    unit_vectors = np.divide(vectors, norms[:, None], out=np.zeros_like(vectors), where=valid[:, None])
+
+    queries = np.arange(row_count) if query_rows is None else np.asarray(sorted(set(query_rows)), dtype=np.intp)
+    queries = queries[valid[queries]]
+    keep = min(top_k, row_count - 1)
+
+    pairs: dict[tuple[int, int], float] = {}
+    for start in range(0, len(queries), block_rows):
+        block = queries[start : start + block_rows]
+        similarities = np.maximum(unit_vectors[block] @ unit_vectors.T, 0.0)
+        # Never pair a concept with itself or with a concept that has no usable embedding.
+        similarities[np.arange(len(block)), block] = -np.inf
+        similarities[:, ~valid] = -np.inf
+
+        neighbours = np.argpartition(similarities, -keep, axis=1)[:, -keep:]
+        neighbour_similarities = np.take_along_axis(similarities, neighbours, axis=1)
+        for row, columns, values in zip(block.tolist(), neighbours, neighbour_similarities, strict=True):
+            for column, value in zip(columns.tolist(), values.tolist(), strict=True):
+                if value >= threshold:
+                    pairs[min(row, column), max(row, column)] = value
+    return pairs
@@ -1,5 +1,5 @@
 
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -9,16 +9,24 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 import logging
 import re
+import time
 import uuid
 from typing import TypedDict
 
-from sqlalchemy import and_, bindparam, select, text, update
+import numpy as np
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import Float, and_, bindparam, select, text, update
 from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
 from sqlalchemy.exc import IntegrityError
 
 from src.ai.rag.embeddings import VectorRAG
 from src.config.settings import get_settings
-from src.courses.models import Concept, ConceptPrerequisite, CourseConcept, UserConceptState
+from src.courses.models import Concept, CourseConcept, UserConceptState
+from src.courses.services.concept_confusors import top_k_confusor_pairs
+from src.courses.services.concept_graph_snapshot import (
+    get_concept_graph_snapshot,
+    mark_concept_graph_changed,
+)
 from src.exceptions import ConflictError, ValidationError
 
 
@@ -145,6 +153,7 @@ class ConceptGraphService:
             logger.debug("Prerequisite already exists for concept %s -> %s", concept_id, prereq_id)
             msg = "Prerequisite already exists"
             raise ConflictError(msg)
+        mark_concept_graph_changed(self._session)
         await self._session.flush()
 
     async def add_prerequisites_bulk(self, edges: Sequence[tuple[uuid.UUID, uuid.UUID]]) -> int:
@@ -188,10 +197,11 @@ class ConceptGraphService:
                 "prereq_ids": prereq_ids,
             },
         )
+        mark_concept_graph_changed(self._session)
         return len(unique_edges)
 
-    async def backfill_embeddings_for_course(self, course_id: uuid.UUID) -> int:
-        """Generate embeddings for all concepts in a course that lack vectors."""
+    async def backfill_embeddings_for_course(self, course_id: uuid.UUID) -> list[uuid.UUID]:
+        """Generate embeddings for all concepts in a course that lack vectors and return their ids."""
         result = await self._session.execute(
             select(Concept.id, Concept.name, Concept.description)
             .join(CourseConcept, CourseConcept.concept_id == Concept.id)
@@ -208,7 +218,7 @@ class ConceptGraphService:
             for row in rows
         ]
         if not concepts:
-            return 0
+            return []
 
         batch_size = max(self._vector.batch_size, 1)
         total_updated = 0
@@ -226,7 +236,7 @@ class ConceptGraphService:
             total_updated,
             course_id,
         )
-        return total_updated
+        return [item["id"] for item in concepts]
 
     async def get_frontier(self, *, user_id: uuid.UUID, course_id: uuid.UUID) -> list[FrontierEntry]:
         """Return unlocked concepts for the learner."""
@@ -248,20 +258,12 @@ class ConceptGraphService:
             return []
 
         concepts = [(row[0], row[1], row[2]) for row in records]
-        concept_ids = [concept.id for concept, _, _ in concepts]
-        prereq_rows = await self._session.execute(
-            select(ConceptPrerequisite.concept_id, ConceptPrerequisite.prereq_id).where(
-                ConceptPrerequisite.concept_id.in_(concept_ids)
-            )
-        )
-        prereq_map: dict[uuid.UUID, set[uuid.UUID]] = {}
-        for child_id, prereq_id in prereq_rows:
-            prereq_map.setdefault(child_id, set()).add(prereq_id)
+        snapshot = await get_concept_graph_snapshot(self._session, course_id)
 
         state_lookup = {state.concept_id: state for _, state, _ in concepts if state is not None}
         frontier: list[FrontierEntry] = []
         for concept, state, order_hint in concepts:
-            prereqs = prereq_map.get(concept.id, set())
+            prereqs = snapshot.prerequisite_ids(concept.id)
             unlocked = True
             for prereq in prereqs:
                 prereq_state = state_lookup.get(prereq)
@@ -277,7 +279,7 @@ class ConceptGraphService:
                 FrontierEntry(
                     concept=concept,
                     state=state,
-                    prerequisites=list(prereqs),
+                    prerequisites=prereqs,
                     unlocked=unlocked,
                     order_hint=order_hint,
                 )
@@ -340,13 +342,21 @@ class ConceptGraphService:
             msg = "Adding prerequisite would create a cycle"
             raise ConflictError(msg)
 
-    async def recompute_embedding_confusors_for_course(self, course_id: uuid.UUID) -> int:
+    async def recompute_embedding_confusors_for_course(
+        self,
+        course_id: uuid.UUID,
+        *,
+        concept_ids: Collection[uuid.UUID] | None = None,
+    ) -> int:
         """Compute and upsert concept similarities for a course using embeddings only.
 
-        This computes cosine similarity for all concept pairs in the course where both
-        concepts have non-empty embeddings, then upserts symmetric pairs into
-        concept_similarities with the ordered (a,b) key. Pairs below the configured
-        ADAPTIVE_SIMILARITY_THRESHOLD are ignored.
+        Pairs below the configured ADAPTIVE_SIMILARITY_THRESHOLD are ignored and
+        pairs are upserted with the ordered (a,b) key. The ``numpy`` engine
+        (ADAPTIVE_CONFUSOR_ENGINE) loads the course's embeddings once, scores them
+        blockwise and keeps each concept's ADAPTIVE_CONFUSOR_TOP_K nearest
+        neighbours; given ``concept_ids`` it only scores those concepts against the
+        rest of the course. The ``sql`` engine upserts every pair above the
+        threshold with one self-join in Postgres and always covers the whole course.
 
         Returns
         -------
@@ -355,7 +365,106 @@ class ConceptGraphService:
         """
         settings = get_settings()
         threshold = float(settings.ADAPTIVE_SIMILARITY_THRESHOLD)
+        started_at = time.perf_counter()
+
+        if settings.ADAPTIVE_CONFUSOR_ENGINE == "sql":
+            written = await self._upsert_confusors_in_database(course_id, threshold=threshold)
+        else:
+            written = await self._upsert_top_k_confusors(
+                course_id,
+                threshold=threshold,
+                top_k=settings.ADAPTIVE_CONFUSOR_TOP_K,
+                concept_ids=concept_ids,
+            )
+        mark_concept_graph_changed(self._session, course_id)
+
+        await self._session.flush()
+        logger.info(
+            "courses.confusors.recomputed",
+            extra={
+                "course_id": str(course_id),
+                "engine": settings.ADAPTIVE_CONFUSOR_ENGINE,
+                "incremental": concept_ids is not None,
+                "pairs": written,
+                "duration_ms": round((time.perf_counter() - started_at) * 1000, 2),
+            },
+        )
+        return written
+
+    async def _upsert_top_k_confusors(
+        self,
+        course_id: uuid.UUID,
+        *,
+        threshold: float,
+        top_k: int,
+        concept_ids: Collection[uuid.UUID] | None,
+    ) -> int:
+        rows = (
+            await self._session.execute(
+                select(Concept.id, Concept.embedding)
+                .join(CourseConcept, CourseConcept.concept_id == Concept.id)
+                .where(CourseConcept.course_id == course_id, Concept.embedding.is_not(None))
+            )
+        ).all()
+        if len(rows) < 2:
+            return 0
+
+        row_ids = [row.id for row in rows]
+        query_rows = None
+        if concept_ids is not None:
+            requested = set(concept_ids)
+            query_rows = [position for position, concept_id in enumerate(row_ids) if concept_id in requested]
+            if not query_rows:
+                return 0
+
+        embeddings = np.vstack([np.asarray(row.embedding, dtype=np.float64) for row in rows])
+        # NumPy releases the GIL in the matrix products, so scoring does not stall the event loop.
+        pairs = await run_in_threadpool(
+            top_k_confusor_pairs,
+            embeddings,
+            threshold=threshold,
+            top_k=top_k,
+            query_rows=query_rows,
+        )
+        if not pairs:
+            return 0
+
+        concept_a_ids: list[uuid.UUID] = []
+        concept_b_ids: list[uuid.UUID] = []
+        similarities: list[float] = []
+        for (row_a, row_b), similarity in pairs.items():
+            low_id, high_id = sorted((row_ids[row_a], row_ids[row_b]))
+            concept_a_ids.append(low_id)
+            concept_b_ids.append(high_id)
+            similarities.append(similarity)
+
+        stmt = text(
+            """
+            INSERT INTO concept_similarities (concept_a_id, concept_b_id, similarity, computed_at)
+            SELECT pairs.concept_a_id, pairs.concept_b_id, pairs.similarity, NOW()
+            FROM UNNEST(:concept_a_ids, :concept_b_ids, :similarities)
+                AS pairs(concept_a_id, concept_b_id, similarity)
+            ON CONFLICT (concept_a_id, concept_b_id)
+            DO UPDATE SET
+                similarity = EXCLUDED.similarity,
+                computed_at = EXCLUDED.computed_at
+            """
+        ).bindparams(
+            bindparam("concept_a_ids", type_=ARRAY(PG_UUID(as_uuid=True))),
+            bindparam("concept_b_ids", type_=ARRAY(PG_UUID(as_uuid=True))),
+            bindparam("similarities", type_=ARRAY(Float(precision=53))),
+        )
+        await self._session.execute(
+            stmt,
+            {
+                "concept_a_ids": concept_a_ids,
+                "concept_b_ids": concept_b_ids,
+                "similarities": similarities,
+            },
+        )
+        return len(similarities)
 
+    async def _upsert_confusors_in_database(self, course_id: uuid.UUID, *, threshold: float) -> int:
         result = await self._session.execute(
             text(
                 """
@@ -392,7 +501,4 @@ class ConceptGraphService:
             ),
             {"course_id": str(course_id), "threshold": threshold},
         )
-        written = result.scalar() or 0
-
-        await self._session.flush()
-        return int(written)
+        return int(result.scalar() or 0)
@@ -0,0 +1,357 @@
+"""Immutable per-course concept graph snapshots, cached per process and invalidated by version.
+
+A snapshot holds one course's prerequisite DAG and concept similarities in
+integer-indexed form, so frontier unlocking, cycle checks, prerequisite paths
+and similarity lookups run in memory instead of re-querying
+``concept_prerequisites``/``concept_similarities`` with recursive CTEs.
+
+Graph writes bump a version: prerequisite edits bump the global version (an
+edge names concepts, not a course), similarity recomputes bump the course's.
+Writes made in a session bump again once it commits or rolls back, and
+snapshots are never cached from a session holding uncommitted graph writes.
+Like the RAG search cache, other worker processes only converge once their
+copy expires, so the TTL bounds cross-process staleness.
+"""
+
+import logging
+import time
+import uuid
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+from opentelemetry import metrics
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.cache import TTLLRUCache
+from src.courses.models import ConceptPrerequisite, ConceptSimilarity, CourseConcept
+
+
+logger = logging.getLogger(__name__)
+
+# Course graphs only change when concepts are generated; the TTL bounds staleness in other workers.
+_SNAPSHOT_TTL_SECONDS = 300.0
+_MAX_CACHED_COURSE_GRAPHS = 256
+_PENDING_CHANGES_KEY = "concept_graph_pending_changes"
+_LISTENERS_KEY = "concept_graph_listeners"
+
+_meter = metrics.get_meter(__name__)
+_snapshot_lookups = _meter.create_counter(
+    "courses.concept_graph_snapshot.lookups",
+    unit="{lookup}",
+    description="Per-course concept graph snapshot lookups, by result (hit, miss, or uncached)",
+)
+_snapshot_build_duration = _meter.create_histogram(
+    "courses.concept_graph_snapshot.build.duration",
+    unit="ms",
+    description="Time to load and index one course's concept graph",
+)
+
+type GraphVersion = tuple[int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class ConceptGraphSnapshot:
+    """One course's concept graph, indexed by position in ``concept_ids``.
+
+    Course concepts come first; prerequisites that live outside the course are
+    appended after them as nodes without known prerequisites of their own.
+    """
+
+    course_id: uuid.UUID
+    version: GraphVersion
+    concept_ids: tuple[uuid.UUID, ...]
+    course_concept_count: int
+    index: dict[uuid.UUID, int]
+    # Direct prerequisites and dependents of each node, as node indexes.
+    prerequisites: tuple[tuple[int, ...], ...]
+    dependents: tuple[tuple[int, ...], ...]
+    topological_order: tuple[int, ...]
+    # Bit ``j`` of ``ancestors[i]`` is set when node ``j`` is a transitive prerequisite of node ``i``.
+    ancestors: tuple[int, ...]
+    # Symmetric stored similarities between course concepts; NaN where no pair is stored.
+    similarity: np.ndarray
+
+    def contains(self, concept_id: uuid.UUID) -> bool:
+        """Return whether ``concept_id`` belongs to the course itself."""
+        position = self.index.get(concept_id)
+        return position is not None and position < self.course_concept_count
+
+    def prerequisite_ids(self, concept_id: uuid.UUID) -> list[uuid.UUID]:
+        """Return the direct prerequisites of ``concept_id``."""
+        position = self.index.get(concept_id)
+        if position is None:
+            return []
+        return [self.concept_ids[prereq] for prereq in self.prerequisites[position]]
+
+    def depends_on(self, concept_id: uuid.UUID, prereq_id: uuid.UUID) -> bool:
+        """Return whether ``prereq_id`` is a direct or transitive prerequisite of ``concept_id``."""
+        position = self.index.get(concept_id)
+        prereq_position = self.index.get(prereq_id)
+        if position is None or prereq_position is None:
+            return False
+        return bool(self.ancestors[position] >> prereq_position & 1)
+
+    def prerequisite_path(self, concept_id: uuid.UUID) -> list[uuid.UUID]:
+        """Return every transitive prerequisite of ``concept_id``, nearest first."""
+        start = self.index.get(concept_id)
+        if start is None:
+            return []
+        path: list[uuid.UUID] = []
+        seen = {start}
+        queue = deque(self.prerequisites[start])
+        seen.update(queue)
+        while queue:
+            position = queue.popleft()
+            path.append(self.concept_ids[position])
+            for prereq in self.prerequisites[position]:
+                if prereq not in seen:
+                    seen.add(prereq)
+                    queue.append(prereq)
+        return path
+
+    def similarity_neighbors(
+        self,
+        concept_ids: set[uuid.UUID],
+        context_ids: set[uuid.UUID],
+    ) -> dict[uuid.UUID, dict[uuid.UUID, float]]:
+        """Map each concept to its stored similarity with every context concept it has a pair for."""
+        context_positions = [
+            (context_id, self.index[context_id]) for context_id in context_ids if self.contains(context_id)
+        ]
+        neighbors: dict[uuid.UUID, dict[uuid.UUID, float]] = {}
+        if not context_positions:
+            return neighbors
+        for concept_id in concept_ids:
+            if not self.contains(concept_id):
+                continue
+            row = self.similarity[self.index[concept_id]]
+            similarities = {
+                context_id: float(row[position])
+                for context_id, position in context_positions
+                if not np.isnan(row[position])
+            }
+            if similarities:
+                neighbors[concept_id] = similarities
+        return neighbors
+
+    def pair_similarity(self, concept_a_id: uuid.UUID, concept_b_id: uuid.UUID) -> float | None:
+        """Return the stored similarity between two course concepts, if any."""
+        if not (self.contains(concept_a_id) and self.contains(concept_b_id)):
+            return None
+        value = float(self.similarity[self.index[concept_a_id], self.index[concept_b_id]])
+        return None if np.isnan(value) else value
+
+
+class ConceptGraphSnapshotCache:
+    """Process-local snapshots keyed by course, valid only while their graph version is current."""
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int) -> None:
+        self._snapshots: TTLLRUCache[uuid.UUID, ConceptGraphSnapshot] = TTLLRUCache(
+            ttl_seconds=ttl_seconds,
+            max_entries=max_entries,
+        )
+        self._global_version = 0
+        self._course_versions: dict[uuid.UUID, int] = {}
+
+    def version(self, course_id: uuid.UUID) -> GraphVersion:
+        """Return the current graph version for ``course_id``."""
+        return self._global_version, self._course_versions.get(course_id, 0)
+
+    def get(self, course_id: uuid.UUID) -> ConceptGraphSnapshot | None:
+        """Return the cached snapshot when it was built at the current version."""
+        snapshot = self._snapshots.get(course_id)
+        if snapshot is None or snapshot.version != self.version(course_id):
+            return None
+        return snapshot
+
+    def put(self, snapshot: ConceptGraphSnapshot) -> None:
+        """Cache ``snapshot`` unless the graph changed while it was being built."""
+        if snapshot.version == self.version(snapshot.course_id):
+            self._snapshots.put(snapshot.course_id, snapshot)
+
+    def bump(self, course_id: uuid.UUID | None = None) -> None:
+        """Invalidate one course's snapshot, or every snapshot when no course is given."""
+        if course_id is None:
+            self._global_version += 1
+            self._snapshots.clear()
+        else:
+            self._course_versions[course_id] = self._course_versions.get(course_id, 0) + 1
+            self._snapshots.discard_where(lambda key: key == course_id)
+        logger.debug(
+            "courses.concept_graph_snapshot.invalidated",
+            extra={"course_id": str(course_id) if course_id else None},
+        )
+
+    def clear(self) -> None:
+        """Drop every cached snapshot."""
+        self._snapshots.clear()
+
+
+@lru_cache(maxsize=1)
+def get_concept_graph_snapshot_cache() -> ConceptGraphSnapshotCache:
+    """Return the process-wide concept graph snapshot cache."""
+    return ConceptGraphSnapshotCache(ttl_seconds=_SNAPSHOT_TTL_SECONDS, max_entries=_MAX_CACHED_COURSE_GRAPHS)
+
+
+async def get_concept_graph_snapshot(session: AsyncSession, course_id: uuid.UUID) -> ConceptGraphSnapshot:
+    """Return the course's graph snapshot, building and caching it on a miss."""
+    cache = get_concept_graph_snapshot_cache()
+    if session.info.get(_PENDING_CHANGES_KEY):
+        # This session sees its own uncommitted graph writes; never share a snapshot built from them.
+        _snapshot_lookups.add(1, {"result": "uncached"})
+        return await _build_snapshot(session, course_id, cache.version(course_id))
+
+    snapshot = cache.get(course_id)
+    _snapshot_lookups.add(1, {"result": "hit" if snapshot is not None else "miss"})
+    if snapshot is not None:
+        return snapshot
+
+    snapshot = await _build_snapshot(session, course_id, cache.version(course_id))
+    # An empty graph usually means the course is still being generated in another transaction.
+    if snapshot.course_concept_count:
+        cache.put(snapshot)
+    return snapshot
+
+
+def mark_concept_graph_changed(session: AsyncSession, course_id: uuid.UUID | None = None) -> None:
+    """Bump the graph version now and again when ``session``'s transaction ends."""
+    get_concept_graph_snapshot_cache().bump(course_id)
+    session.info.setdefault(_PENDING_CHANGES_KEY, set()).add(course_id)
+    if not session.info.get(_LISTENERS_KEY):
+        event.listen(session.sync_session, "after_commit", _bump_pending_changes)
+        event.listen(session.sync_session, "after_rollback", _bump_pending_changes)
+        session.info[_LISTENERS_KEY] = True
+
+
+def _bump_pending_changes(session: Session) -> None:
+    cache = get_concept_graph_snapshot_cache()
+    for course_id in session.info.pop(_PENDING_CHANGES_KEY, ()):
+        cache.bump(course_id)
+
+
+async def _build_snapshot(session: AsyncSession, course_id: uuid.UUID, version: GraphVersion) -> ConceptGraphSnapshot:
+    started_at = time.perf_counter()
+    course_concept_ids = list(
+        await session.scalars(select(CourseConcept.concept_id).where(CourseConcept.course_id == course_id))
+    )
+    edge_rows = await session.execute(
+        select(ConceptPrerequisite.concept_id, ConceptPrerequisite.prereq_id).where(
+            ConceptPrerequisite.concept_id.in_(course_concept_ids)
+        )
+    )
+    similarity_rows = await session.execute(
+        select(
+            ConceptSimilarity.concept_a_id,
+            ConceptSimilarity.concept_b_id,
+            ConceptSimilarity.similarity,
+        ).where(
+            ConceptSimilarity.concept_a_id.in_(course_concept_ids),
+            ConceptSimilarity.concept_b_id.in_(course_concept_ids),
+        )
+    )
+    snapshot = index_concept_graph(
+        course_id=course_id,
+        version=version,
+        course_concept_ids=course_concept_ids,
+        prerequisite_edges=edge_rows.tuples().all(),
+        similarities=[
+            (concept_a_id, concept_b_id, float(value)) for concept_a_id, concept_b_id, value in similarity_rows
+        ],
+    )
+    _snapshot_build_duration.record(round((time.perf_counter() - started_at) * 1000, 2))
+    return snapshot
+
+
+def index_concept_graph(
+    *,
+    course_id: uuid.UUID,
+    version: GraphVersion,
+    course_concept_ids: Sequence[uuid.UUID],
+    prerequisite_edges: Sequence[tuple[uuid.UUID, uuid.UUID]],
+    similarities: Sequence[tuple[uuid.UUID, uuid.UUID, float]],
+) -> ConceptGraphSnapshot:
+    """Index loaded ``(concept_id, prereq_id)`` edges and similarity pairs into a snapshot."""
+    concept_ids = list(course_concept_ids)
+    index = {concept_id: position for position, concept_id in enumerate(concept_ids)}
+
+    edges: list[tuple[int, int]] = []
+    for dependent_id, prereq_id in prerequisite_edges:
+        if prereq_id not in index:
+            index[prereq_id] = len(concept_ids)
+            concept_ids.append(prereq_id)
+        edges.append((index[dependent_id], index[prereq_id]))
+
+    node_count = len(concept_ids)
+    prerequisites: list[list[int]] = [[] for _ in range(node_count)]
+    dependents: list[list[int]] = [[] for _ in range(node_count)]
+    for dependent, prereq in edges:
+        prerequisites[dependent].append(prereq)
+        dependents[prereq].append(dependent)
+
+    topological_order = _topological_order(prerequisites, dependents)
+    ancestors = _transitive_prerequisites(prerequisites, topological_order)
+    if len(topological_order) < node_count:
+        logger.warning(
+            "courses.concept_graph_snapshot.cycle_detected",
+            extra={"course_id": str(course_id), "cyclic_nodes": node_count - len(topological_order)},
+        )
+
+    similarity = np.full((len(course_concept_ids), len(course_concept_ids)), np.nan)
+    for concept_a_id, concept_b_id, value in similarities:
+        position_a, position_b = index[concept_a_id], index[concept_b_id]
+        similarity[position_a, position_b] = similarity[position_b, position_a] = value
+    similarity.setflags(write=False)
+
+    return ConceptGraphSnapshot(
+        course_id=course_id,
+        version=version,
+        concept_ids=tuple(concept_ids),
+        course_concept_count=len(course_concept_ids),
+        index=index,
+        prerequisites=tuple(tuple(prereqs) for prereqs in prerequisites),
+        dependents=tuple(tuple(children) for children in dependents),
+        topological_order=tuple(topological_order),
+        ancestors=tuple(ancestors),
+        similarity=similarity,
+    )
+
+
+def _topological_order(prerequisites: list[list[int]], dependents: list[list[int]]) -> list[int]:
+    """Kahn's algorithm, prerequisites first; nodes on a cycle are left out."""
+    remaining = [len(prereqs) for prereqs in prerequisites]
+    ready = deque(position for position, count in enumerate(remaining) if count == 0)
+    order: list[int] = []
+    while ready:
+        position = ready.popleft()
+        order.append(position)
+        for dependent in dependents[position]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                ready.append(dependent)
+    return order
+
+
+def _transitive_prerequisites(prerequisites: list[list[int]], topological_order: list[int]) -> list[int]:
+    ancestors = [0] * len(prerequisites)
+    for position in topological_order:
+        for prereq in prerequisites[position]:
+            ancestors[position] |= (1 << prereq) | ancestors[prereq]
+
+    # Nodes on a cycle have no topological position; propagate to a fixed point instead.
+    cyclic = set(range(len(prerequisites))) - set(topological_order)
+    changed = bool(cyclic)
+    while changed:
+        changed = False
+        for position in cyclic:
+            closure = ancestors[position]
+            for prereq in prerequisites[position]:
+                closure |= (1 << prereq) | ancestors[prereq]
+            if closure != ancestors[position]:
+                ancestors[position] = closure
+                changed = True
+    return ancestors
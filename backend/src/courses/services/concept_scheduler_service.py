@@ -1,5 +1,5 @@
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from operator import itemgetter
 
@@ -12,7 +12,8 @@ from .concept_graph_service import FrontierEntry
 
 Embedding-based confusors are computed and persisted at course creation (or
 immediately after backfilling embeddings). The scheduler reads ConceptSimilarity
-and does not compute on-the-fly fallback from embeddings.
+through the course's cached graph snapshot (pairs are only stored between
+concepts of one course) and does not compute on-the-fly fallback from embeddings.
 """
 
 
@@ -21,18 +22,18 @@ import uuid
 from datetime import UTC, datetime, timedelta
 from typing import Literal, TypedDict
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, func, select
 
 from src.config.settings import get_settings
 from src.courses.models import (
     _DEFAULT_LEARNER_PROFILE,
     Concept,
     ConceptPrerequisite,
-    ConceptSimilarity,
     CourseConcept,
     ProbeEvent,
     UserConceptState,
 )
+from src.courses.services.concept_graph_snapshot import get_concept_graph_snapshot
 
 
 logger = logging.getLogger(__name__)
@@ -53,6 +54,7 @@ LEARNER_PROFILE_SENSITIVITY_MIN = 0.4
 LEARNER_PROFILE_SENSITIVITY_MAX = 1.6
 _UNKNOWN_DIFFICULTY_RANK = 6
 _UNKNOWN_ORDER_HINT_RANK = 1_000_000
+_RECENT_ACCURACY_WINDOW = 5
 
 
 class DueConceptEntry(TypedDict):
@@ -72,6 +74,17 @@ class AdaptivePassRecommendation:
     reason: str
 
 
+@dataclass(slots=True)
+class _AdaptivePassSignals:
+    """Per-concept learner evidence behind an adaptive pass decision."""
+
+    recent_accuracy: float | None
+    downstream_pressure: float
+    downstream_miss_count: int
+    competing_due_count: int
+    semantic_confusion: float
+
+
 class LectorSchedulerService:
     """Service implementing LECTOR review interval calculations and caching."""
 
@@ -86,6 +99,7 @@ class LectorSchedulerService:
         self,
         *,
         user_id: uuid.UUID,
+        course_id: uuid.UUID,
         entries: Sequence[FrontierEntry],
         due_entries: Sequence[DueConceptEntry],
     ) -> list[FrontierEntry]:
@@ -108,7 +122,7 @@ class LectorSchedulerService:
                 locked.append(entry)
 
         unlocked_concept_ids = {entry["concept"].id for entry in unlocked}
-        sigma_map = await self._sigma_for_concepts(unlocked_concept_ids, context_ids)
+        sigma_map = await self._sigma_for_concepts(course_id, unlocked_concept_ids, context_ids)
 
         unlocked.sort(
             key=lambda entry: self._frontier_sort_key(
@@ -159,17 +173,6 @@ class LectorSchedulerService:
         except (TypeError, ValueError):
             return baseline
 
-    @staticmethod
-    def _coerce_uuid(value: object) -> uuid.UUID:
-        """Normalize database-returned identifiers to uuid.UUID instances."""
-        if isinstance(value, uuid.UUID):
-            return value
-        try:
-            return uuid.UUID(str(value))
-        except (TypeError, ValueError) as exc:
-            message = f"Expected uuid.UUID-compatible value, got {value!r}"
-            raise ValueError(message) from exc
-
     async def _recent_concept_ids(self, user_id: uuid.UUID) -> list[uuid.UUID]:
         if self._risk_recent_k <= 0:
             return []
@@ -189,44 +192,16 @@ class LectorSchedulerService:
 
     async def _sigma_for_concepts(
         self,
+        course_id: uuid.UUID,
         concept_ids: set[uuid.UUID],
         context_ids: set[uuid.UUID],
     ) -> dict[uuid.UUID, float]:
-        if not concept_ids or not context_ids:
-            return dict.fromkeys(concept_ids, 0.0)
-
-        concept_list = list(concept_ids)
-        context_list = list(context_ids)
-
-        result = await self._session.execute(
-            select(
-                ConceptSimilarity.concept_a_id,
-                ConceptSimilarity.concept_b_id,
-                ConceptSimilarity.similarity,
-            ).where(
-                or_(
-                    and_(
-                        ConceptSimilarity.concept_a_id.in_(concept_list),
-                        ConceptSimilarity.concept_b_id.in_(context_list),
-                    ),
-                    and_(
-                        ConceptSimilarity.concept_b_id.in_(concept_list),
-                        ConceptSimilarity.concept_a_id.in_(context_list),
-                    ),
-                )
-            )
-        )
-
-        sigma_map: dict[uuid.UUID, float] = dict.fromkeys(concept_ids, 0.0)
-        for concept_a_raw, concept_b_raw, similarity in result.all():
-            concept_a_id = self._coerce_uuid(concept_a_raw)
-            concept_b_id = self._coerce_uuid(concept_b_raw)
-            similarity_value = float(similarity)
-            if concept_a_id in sigma_map and concept_b_id in context_ids:
-                sigma_map[concept_a_id] = max(sigma_map[concept_a_id], similarity_value)
-            if concept_b_id in sigma_map and concept_a_id in context_ids:
-                sigma_map[concept_b_id] = max(sigma_map[concept_b_id], similarity_value)
-        return sigma_map
+        snapshot = await get_concept_graph_snapshot(self._session, course_id)
+        neighbors = snapshot.similarity_neighbors(concept_ids, context_ids)
+        return {
+            concept_id: max(neighbors.get(concept_id, {}).values(), default=0.0)
+            for concept_id in concept_ids
+        }
 
     async def _due_concept_ids(self, *, user_id: uuid.UUID, course_id: uuid.UUID) -> set[uuid.UUID]:
         now = _utc_now()
@@ -292,7 +267,7 @@ class LectorSchedulerService:
         context_ids.discard(concept_id)
         sigma = 0.0
         if context_ids:
-            sigma = (await self._sigma_for_concepts({concept_id}, context_ids)).get(concept_id, 0.0)
+            sigma = (await self._sigma_for_concepts(course_id, {concept_id}, context_ids)).get(concept_id, 0.0)
         dampener = 1.0 / (1.0 + (self._confusion_lambda * sigma)) if sigma > 0 else 1.0
         interval_minutes = max(interval_minutes * dampener, 1.0)
 
@@ -352,7 +327,12 @@ class LectorSchedulerService:
         now = _utc_now()
         recent_ids = await self._recent_concept_ids(user_id)
         due_ids = {item["concept"].id for item in entry_list}
-        sigma_map = await self._sigma_for_concepts(due_ids, set(recent_ids) | due_ids)
+        sigma_map = await self._sigma_for_concepts(course_id, due_ids, set(recent_ids) | due_ids)
+        downstream_pressure_map = await self._downstream_pressure_map(
+            user_id=user_id,
+            course_id=course_id,
+            concept_ids=due_ids,
+        )
 
         ranked_entries: list[tuple[tuple[float, float, str], DueConceptEntry]] = []
         for entry in entry_list:
@@ -364,14 +344,14 @@ class LectorSchedulerService:
             hours_overdue = max(0.0, (now - next_review_at).total_seconds() / 3600)
             mastery = self._mastery_value(state)
             sigma_value = sigma_map.get(entry["concept"].id, 0.0)
-            downstream_pressure = await self._downstream_pressure(
-                user_id=user_id,
-                course_id=course_id,
-                concept_id=entry["concept"].id,
-            )
             identifier = (entry["concept"].name or "").strip().lower() or (entry["concept"].slug or "").strip().lower()
             key = (
-                -(hours_overdue + downstream_pressure + ((1.0 - mastery) * 2.0) - (sigma_value * 0.2)),
+                -(
+                    hours_overdue
+                    + downstream_pressure_map.get(entry["concept"].id, 0.0)
+                    + ((1.0 - mastery) * 2.0)
+                    - (sigma_value * 0.2)
+                ),
                 next_review_at.timestamp(),
                 identifier,
             )
@@ -379,37 +359,19 @@ class LectorSchedulerService:
 
         ranked_entries.sort(key=itemgetter(0))
         ordered_entries = [entry for _, entry in ranked_entries]
-        return await self._space_due_entries(entries=ordered_entries)
+        return await self._space_due_entries(course_id=course_id, entries=ordered_entries)
 
     async def _space_due_entries(
         self,
         *,
+        course_id: uuid.UUID,
         entries: Sequence[DueConceptEntry],
     ) -> list[DueConceptEntry]:
         entry_list = list(entries)
         if len(entry_list) <= 2:
             return entry_list
 
-        concept_ids = [entry["concept"].id for entry in entry_list]
-        rows = await self._session.execute(
-            select(
-                ConceptSimilarity.concept_a_id,
-                ConceptSimilarity.concept_b_id,
-                ConceptSimilarity.similarity,
-            ).where(
-                and_(
-                    ConceptSimilarity.concept_a_id.in_(concept_ids),
-                    ConceptSimilarity.concept_b_id.in_(concept_ids),
-                )
-            )
-        )
-        similarity_by_pair: dict[tuple[uuid.UUID, uuid.UUID], float] = {}
-        for concept_a_raw, concept_b_raw, similarity in rows.all():
-            concept_a_id = self._coerce_uuid(concept_a_raw)
-            concept_b_id = self._coerce_uuid(concept_b_raw)
-            similarity_value = float(similarity)
-            similarity_by_pair[concept_a_id, concept_b_id] = similarity_value
-            similarity_by_pair[concept_b_id, concept_a_id] = similarity_value
+        snapshot = await get_concept_graph_snapshot(self._session, course_id)
 
         spaced = [entry_list.pop(0)]
         while entry_list:
@@ -417,7 +379,7 @@ class LectorSchedulerService:
             next_index, next_entry = min(
                 enumerate(entry_list),
                 key=lambda item: (
-                    similarity_by_pair.get((previous_concept_id, item[1]["concept"].id), 0.0),
+                    snapshot.pair_similarity(previous_concept_id, item[1]["concept"].id) or 0.0,
                     item[0],
                 ),
             )
@@ -434,34 +396,84 @@ class LectorSchedulerService:
         current_major_version: int,
     ) -> AdaptivePassRecommendation:
         """Decide whether a revisit should stay review-only or deepen into a new pass."""
-        state = await self._session.scalar(
-            select(UserConceptState).where(
-                and_(
-                    UserConceptState.user_id == user_id,
-                    UserConceptState.concept_id == concept_id,
-                )
-            )
+        recommendations = await self.recommend_adaptive_passes(
+            user_id=user_id,
+            course_id=course_id,
+            current_major_versions={concept_id: current_major_version},
         )
-        if state is None:
-            return AdaptivePassRecommendation(
+        return recommendations[concept_id]
+
+    async def recommend_adaptive_passes(
+        self,
+        *,
+        user_id: uuid.UUID,
+        course_id: uuid.UUID,
+        current_major_versions: Mapping[uuid.UUID, int],
+    ) -> dict[uuid.UUID, AdaptivePassRecommendation]:
+        """Decide adaptive passes for many concepts with a fixed number of set-based queries."""
+        if not current_major_versions:
+            return {}
+
+        states = await self._states_for_concepts(user_id=user_id, concept_ids=set(current_major_versions))
+        recommendations: dict[uuid.UUID, AdaptivePassRecommendation] = {
+            concept_id: AdaptivePassRecommendation(
                 action="review_now",
                 recommended_major_version=max(current_major_version, 1),
                 reason="No learner history exists for this concept yet.",
             )
-
-        mastery = self._mastery_value(state)
-        exposures = max(state.exposures, 0)
-        recent_accuracy = await self._recent_accuracy(user_id=user_id, concept_id=concept_id)
-        downstream_pressure = await self._downstream_pressure(
+            for concept_id, current_major_version in current_major_versions.items()
+            if concept_id not in states
+        }
+        if not states:
+            return recommendations
+
+        concept_ids = set(states)
+        recent_accuracy = await self._recent_accuracy_map(user_id=user_id, concept_ids=concept_ids)
+        downstream_pressure = await self._downstream_pressure_map(
             user_id=user_id,
             course_id=course_id,
-            concept_id=concept_id,
+            concept_ids=concept_ids,
+        )
+        downstream_misses = await self._downstream_recent_miss_counts(
+            user_id=user_id,
+            course_id=course_id,
+            concept_ids=concept_ids,
+        )
+        due_ids = await self._due_concept_ids(user_id=user_id, course_id=course_id)
+        semantic_confusion = await self._confusion_pressure_map(
+            user_id=user_id,
+            course_id=course_id,
+            concept_ids=concept_ids,
+            due_ids=due_ids,
         )
-        downstream_miss_count = await self._downstream_recent_miss_count(user_id=user_id, course_id=course_id, concept_id=concept_id)
-        competing_due_count = len((await self._due_concept_ids(user_id=user_id, course_id=course_id)) - {concept_id})
-        semantic_confusion = await self._current_confusion_pressure(user_id=user_id, course_id=course_id, concept_id=concept_id)
 
         now = _utc_now()
+        for concept_id, state in states.items():
+            recommendations[concept_id] = self._adaptive_pass_decision(
+                state=state,
+                current_major_version=current_major_versions[concept_id],
+                signals=_AdaptivePassSignals(
+                    recent_accuracy=recent_accuracy.get(concept_id),
+                    downstream_pressure=downstream_pressure.get(concept_id, 0.0),
+                    downstream_miss_count=downstream_misses.get(concept_id, 0),
+                    competing_due_count=len(due_ids - {concept_id}),
+                    semantic_confusion=semantic_confusion.get(concept_id, 0.0),
+                ),
+                now=now,
+            )
+        return recommendations
+
+    def _adaptive_pass_decision(
+        self,
+        *,
+        state: UserConceptState,
+        current_major_version: int,
+        signals: _AdaptivePassSignals,
+        now: datetime,
+    ) -> AdaptivePassRecommendation:
+        mastery = self._mastery_value(state)
+        exposures = max(state.exposures, 0)
+
         review_is_due = False
         if state.next_review_at is not None:
             next_review_at = state.next_review_at
@@ -473,9 +485,14 @@ class LectorSchedulerService:
             review_is_due
             and exposures >= max(current_major_version, 1)
             and mastery >= 0.76
-            and (recent_accuracy is None or recent_accuracy >= 0.6)
-            and (downstream_pressure > 0.0 or downstream_miss_count > 0 or semantic_confusion >= 0.45 or mastery >= 0.9)
-            and competing_due_count <= 1
+            and (signals.recent_accuracy is None or signals.recent_accuracy >= 0.6)
+            and (
+                signals.downstream_pressure > 0.0
+                or signals.downstream_miss_count > 0
+                or signals.semantic_confusion >= 0.45
+                or mastery >= 0.9
+            )
+            and signals.competing_due_count <= 1
         )
         if should_deepen:
             return AdaptivePassRecommendation(
@@ -484,7 +501,12 @@ class LectorSchedulerService:
                 reason="The learner is retaining this concept well enough for a broader revisit that still reviews the core idea.",
             )
 
-        if not review_is_due and mastery >= 0.9 and competing_due_count > 0 and downstream_pressure <= 0.01:
+        if (
+            not review_is_due
+            and mastery >= 0.9
+            and signals.competing_due_count > 0
+            and signals.downstream_pressure <= 0.01
+        ):
             return AdaptivePassRecommendation(
                 action="defer_for_now",
                 recommended_major_version=current_major_version,
@@ -497,111 +519,144 @@ class LectorSchedulerService:
             reason="The learner still benefits more from review than from a new major pass right now.",
         )
 
-    async def _recent_accuracy(self, *, user_id: uuid.UUID, concept_id: uuid.UUID) -> float | None:
-        outcomes = (
-            (
-                await self._session.execute(
-                    select(ProbeEvent.correct)
-                    .where(
-                        ProbeEvent.user_id == user_id,
-                        ProbeEvent.concept_id == concept_id,
-                    )
-                    .order_by(ProbeEvent.ts.desc())
-                    .limit(5)
-                )
+    async def _states_for_concepts(
+        self,
+        *,
+        user_id: uuid.UUID,
+        concept_ids: set[uuid.UUID],
+    ) -> dict[uuid.UUID, UserConceptState]:
+        states = await self._session.scalars(
+            select(UserConceptState).where(
+                UserConceptState.user_id == user_id,
+                UserConceptState.concept_id.in_(concept_ids),
             )
-            .scalars()
-            .all()
         )
-        if not outcomes:
-            return None
-        return sum(1 for outcome in outcomes if outcome) / len(outcomes)
-
-    async def _downstream_pressure(self, *, user_id: uuid.UUID, course_id: uuid.UUID, concept_id: uuid.UUID) -> float:
-        rows = (
-            await self._session.execute(
-                select(UserConceptState.s_mastery)
-                .select_from(ConceptPrerequisite)
-                .join(
-                    CourseConcept,
-                    and_(
-                        CourseConcept.concept_id == ConceptPrerequisite.concept_id,
-                        CourseConcept.course_id == course_id,
-                    ),
-                )
-                .outerjoin(
-                    UserConceptState,
-                    and_(
-                        UserConceptState.concept_id == ConceptPrerequisite.concept_id,
-                        UserConceptState.user_id == user_id,
-                    ),
-                )
-                .where(ConceptPrerequisite.prereq_id == concept_id)
+        return {state.concept_id: state for state in states}
+
+    async def _recent_accuracy_map(
+        self,
+        *,
+        user_id: uuid.UUID,
+        concept_ids: set[uuid.UUID],
+    ) -> dict[uuid.UUID, float]:
+        """Share of correct answers among each concept's most recent probes; concepts without probes are absent."""
+        ranked_events = (
+            select(
+                ProbeEvent.concept_id,
+                ProbeEvent.correct,
+                func.row_number()
+                .over(partition_by=ProbeEvent.concept_id, order_by=ProbeEvent.ts.desc())
+                .label("recency"),
             )
-        ).scalars().all()
-        if not rows:
-            return 0.0
+            .where(
+                ProbeEvent.user_id == user_id,
+                ProbeEvent.concept_id.in_(concept_ids),
+            )
+            .subquery()
+        )
+        rows = await self._session.execute(
+            select(ranked_events.c.concept_id, ranked_events.c.correct).where(
+                ranked_events.c.recency <= _RECENT_ACCURACY_WINDOW
+            )
+        )
+        outcomes_by_concept: dict[uuid.UUID, list[bool]] = {}
+        for concept_id, correct in rows.all():
+            outcomes_by_concept.setdefault(concept_id, []).append(bool(correct))
+        return {
+            concept_id: sum(1 for outcome in outcomes if outcome) / len(outcomes)
+            for concept_id, outcomes in outcomes_by_concept.items()
+        }
+
+    async def _downstream_pressure_map(
+        self,
+        *,
+        user_id: uuid.UUID,
+        course_id: uuid.UUID,
+        concept_ids: set[uuid.UUID],
+    ) -> dict[uuid.UUID, float]:
+        """Sum how far each concept's in-course dependents sit below the unlock threshold."""
+        rows = await self._session.execute(
+            select(ConceptPrerequisite.prereq_id, UserConceptState.s_mastery)
+            .select_from(ConceptPrerequisite)
+            .join(
+                CourseConcept,
+                and_(
+                    CourseConcept.concept_id == ConceptPrerequisite.concept_id,
+                    CourseConcept.course_id == course_id,
+                ),
+            )
+            .outerjoin(
+                UserConceptState,
+                and_(
+                    UserConceptState.concept_id == ConceptPrerequisite.concept_id,
+                    UserConceptState.user_id == user_id,
+                ),
+            )
+            .where(ConceptPrerequisite.prereq_id.in_(concept_ids))
+        )
 
-        pressure = 0.0
-        for mastery in rows:
+        pressure_by_concept: dict[uuid.UUID, float] = dict.fromkeys(concept_ids, 0.0)
+        for prereq_id, mastery in rows.all():
             mastery_value = float(mastery) if mastery is not None else 0.0
             if mastery_value < self._unlock_threshold:
-                pressure += 1.0 - mastery_value
-        return round(pressure, 3)
+                pressure_by_concept[prereq_id] += 1.0 - mastery_value
+        return {concept_id: round(pressure, 3) for concept_id, pressure in pressure_by_concept.items()}
 
-    async def _downstream_recent_miss_count(
+    async def _downstream_recent_miss_counts(
         self,
         *,
         user_id: uuid.UUID,
         course_id: uuid.UUID,
-        concept_id: uuid.UUID,
-    ) -> int:
-        downstream_ids = (
-            (
-                await self._session.execute(
-                    select(ConceptPrerequisite.concept_id)
-                    .join(
-                        CourseConcept,
-                        and_(
-                            CourseConcept.concept_id == ConceptPrerequisite.concept_id,
-                            CourseConcept.course_id == course_id,
-                        ),
-                    )
-                    .where(ConceptPrerequisite.prereq_id == concept_id)
-                )
+        concept_ids: set[uuid.UUID],
+    ) -> dict[uuid.UUID, int]:
+        """Count missed probes on each concept's in-course dependents; concepts without misses are absent."""
+        rows = await self._session.execute(
+            select(ConceptPrerequisite.prereq_id, func.count(ProbeEvent.id))
+            .select_from(ConceptPrerequisite)
+            .join(
+                CourseConcept,
+                and_(
+                    CourseConcept.concept_id == ConceptPrerequisite.concept_id,
+                    CourseConcept.course_id == course_id,
+                ),
             )
-            .scalars()
-            .all()
-        )
-        if not downstream_ids:
-            return 0
-
-        recent_misses = await self._session.scalar(
-            select(func.count())
-            .select_from(ProbeEvent)
-            .where(
-                ProbeEvent.user_id == user_id,
-                ProbeEvent.concept_id.in_(downstream_ids),
-                ProbeEvent.correct.is_(False),
+            .join(
+                ProbeEvent,
+                and_(
+                    ProbeEvent.concept_id == ConceptPrerequisite.concept_id,
+                    ProbeEvent.user_id == user_id,
+                    ProbeEvent.correct.is_(False),
+                ),
             )
+            .where(ConceptPrerequisite.prereq_id.in_(concept_ids))
+            .group_by(ConceptPrerequisite.prereq_id)
         )
-        return int(recent_misses or 0)
+        return {prereq_id: int(miss_count) for prereq_id, miss_count in rows.all()}
 
-    async def _current_confusion_pressure(
+    async def _confusion_pressure_map(
         self,
         *,
         user_id: uuid.UUID,
         course_id: uuid.UUID,
-        concept_id: uuid.UUID,
-    ) -> float:
-        context_ids = (await self._due_concept_ids(user_id=user_id, course_id=course_id)) - {concept_id}
-        if not context_ids:
-            recent_ids = await self._recent_concept_ids(user_id)
-            context_ids = set(recent_ids) - {concept_id}
-        if not context_ids:
-            return 0.0
-        sigma_map = await self._sigma_for_concepts({concept_id}, context_ids)
-        return float(sigma_map.get(concept_id, 0.0))
+        concept_ids: set[uuid.UUID],
+        due_ids: set[uuid.UUID],
+    ) -> dict[uuid.UUID, float]:
+        """Max similarity of each concept to the other due concepts, or to recent ones when nothing else is due."""
+        recent_ids: set[uuid.UUID] = set()
+        if any(not (due_ids - {concept_id}) for concept_id in concept_ids):
+            recent_ids = set(await self._recent_concept_ids(user_id))
+
+        snapshot = await get_concept_graph_snapshot(self._session, course_id)
+        neighbors = snapshot.similarity_neighbors(concept_ids, due_ids | recent_ids)
+        confusion: dict[uuid.UUID, float] = {}
+        for concept_id in concept_ids:
+            context_ids = (due_ids - {concept_id}) or (recent_ids - {concept_id})
+            similarities = neighbors.get(concept_id, {})
+            confusion[concept_id] = max(
+                (similarities[context_id] for context_id in context_ids if context_id in similarities),
+                default=0.0,
+            )
+        return confusion
 
     async def update_learner_profile(
         self,
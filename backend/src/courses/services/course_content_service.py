@@ -19,6 +19,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.ai.models import AdaptiveConceptGraph, AdaptiveCourseStructure
+from src.ai.rag.search_cache import get_rag_search_cache
 from src.ai.rag.service import RAGService
 from src.ai.service import AIService
 from src.books.models import Book
@@ -32,6 +33,7 @@ from src.courses.models import (
 )
 from src.database.session import async_session_maker
 from src.exceptions import NotFoundError
+from src.jobs import JobKind, enqueue_job
 
 from .concept_graph_service import ConceptGraphService
 from .setup_commands_normalizer import normalize_setup_commands_payload
@@ -213,7 +215,6 @@ class CourseContentService:
                         session=session,
                         course=course,
                         user_id=user_id,
-                        background_tasks=None,
                     )
                     await session.commit()
                     span.set_attribute("app.course_module_count", module_count)
@@ -593,6 +594,12 @@ class CourseContentService:
         )
         copied_rows = result.fetchall()
         await session.flush()
+        get_rag_search_cache().invalidate_scope_on_commit(
+            session,
+            doc_type=_RAG_DOC_TYPE_COURSE,
+            doc_id=course_doc_id,
+            course_id=course_id,
+        )
         return len(copied_rows)
 
     async def _build_augmented_prompt(
@@ -749,32 +756,21 @@ class CourseContentService:
         session: AsyncSession,
         course: Course,
         user_id: uuid.UUID,
-        background_tasks: BackgroundTasks | None,
     ) -> None:
-        """Kick off background work for embeddings and tagging."""
+        """Queue embedding and tagging jobs; they become runnable when the caller commits."""
         if course.adaptive_enabled:
-            await self._handle_adaptive_embeddings(
-                session=session,
-                course_id=course.id,
-                background_tasks=background_tasks,
+            await enqueue_job(
+                session,
+                JobKind.COURSE_EMBED_CONCEPTS,
+                {"course_id": str(course.id)},
+                dedupe_key=f"{JobKind.COURSE_EMBED_CONCEPTS}:{course.id}",
             )
-
-        if background_tasks is not None:
-            background_tasks.add_task(self._run_background_auto_tagging, course.id, user_id)
-        else:
-            await self._auto_tag_course(session, course, user_id)
-
-    async def _handle_adaptive_embeddings(
-        self,
-        *,
-        session: AsyncSession,
-        course_id: uuid.UUID,
-        background_tasks: BackgroundTasks | None,
-    ) -> None:
-        if background_tasks is not None:
-            background_tasks.add_task(self._run_background_embeddings, course_id)
-            return
-        await self._run_embedding_pipeline(session, course_id)
+        await enqueue_job(
+            session,
+            JobKind.COURSE_AUTO_TAG,
+            {"course_id": str(course.id), "user_id": str(user_id)},
+            dedupe_key=f"{JobKind.COURSE_AUTO_TAG}:{course.id}",
+        )
 
     async def _run_embedding_pipeline(
         self,
@@ -782,16 +778,20 @@ class CourseContentService:
         course_id: uuid.UUID,
     ) -> tuple[int, int]:
         graph_service = ConceptGraphService(session)
-        updated = await graph_service.backfill_embeddings_for_course(course_id)
+        backfilled_ids = await graph_service.backfill_embeddings_for_course(course_id)
         try:
-            pairs = await graph_service.recompute_embedding_confusors_for_course(course_id)
+            # Only newly embedded concepts need scoring; with none, rescore the whole course.
+            pairs = await graph_service.recompute_embedding_confusors_for_course(
+                course_id,
+                concept_ids=backfilled_ids or None,
+            )
         except (SQLAlchemyError, RuntimeError, TimeoutError, TypeError, ValueError):
             logger.exception("courses.confusor_recompute.failed", extra={"course_id": str(course_id)})
             pairs = 0
         await session.flush()
-        return updated, pairs
+        return len(backfilled_ids), pairs
 
-    async def _run_background_embeddings(self, course_id: uuid.UUID) -> None:
+    async def run_background_embeddings(self, course_id: uuid.UUID) -> None:
         """Generate embeddings for any concepts that were deferred and compute confusors.
 
         Runs both steps in a single background task to ensure confusor computation
@@ -810,8 +810,8 @@ class CourseContentService:
         except (SQLAlchemyError, RuntimeError, TimeoutError, TypeError, ValueError):
             logger.exception("courses.background_embedding.failed", extra={"course_id": str(course_id)})
 
-    async def _run_background_auto_tagging(self, course_id: uuid.UUID, user_id: uuid.UUID) -> None:
-        """Run auto-tagging in a new session after the response is sent."""
+    async def run_background_auto_tagging(self, course_id: uuid.UUID, user_id: uuid.UUID) -> None:
+        """Run auto-tagging for a course in its own session."""
         try:
             async with async_session_maker() as tagging_session:
                 course = await tagging_session.get(Course, course_id)
@@ -169,6 +169,7 @@ async def _build_recommended_lesson_entries(
     ).all()
 
     recommendations: dict[uuid.UUID, RecommendedLessonEntry] = {}
+    current_major_versions: dict[uuid.UUID, int] = {}
     for _, concept_id, lesson_content, _current_version_id, current_major_version, current_version_content in lesson_rows:
         if concept_id is None:
             continue
@@ -176,14 +177,17 @@ async def _build_recommended_lesson_entries(
         current_pass_has_content = bool((current_version_content or lesson_content or "").strip())
         if not current_pass_has_content:
             recommendations[concept_id] = "open_current"
+            current_major_versions.pop(concept_id, None)
             continue
 
-        recommendation = await scheduler_service.recommend_adaptive_pass(
-            user_id=user_id,
-            course_id=course_id,
-            concept_id=concept_id,
-            current_major_version=int(current_major_version or 1),
-        )
+        current_major_versions[concept_id] = int(current_major_version or 1)
+
+    adaptive_passes = await scheduler_service.recommend_adaptive_passes(
+        user_id=user_id,
+        course_id=course_id,
+        current_major_versions=current_major_versions,
+    )
+    for concept_id, recommendation in adaptive_passes.items():
         recommendations[concept_id] = (
             "start_next_pass"
             if recommendation.action == "deepen_with_next_major_pass"
@@ -224,6 +228,7 @@ async def build_course_frontier(
     )
     ranked_frontier = await scheduler_service.rank_frontier_entries(
         user_id=user_id,
+        course_id=course_id,
         entries=frontier_entries,
         due_entries=ranked_due_entries,
     )
@@ -16,10 +16,8 @@ from src.config.schema_casing import build_camel_config
 from src.config.settings import get_settings
 from src.courses.schemas import GradeErrorHighlight, GradeRequest, GradeResponse, VerifierInfo
 from src.courses.services.jxg_state_verifier import JXGStateVerifier
-from src.courses.services.latex_expression_verifier import (
-    LatexExpressionVerificationResult,
-    LatexExpressionVerifier,
-)
+from src.courses.services.latex_expression_verifier import LatexExpressionVerificationResult
+from src.courses.services.latex_verification_pool import get_latex_verification_pool
 
 
 class GradingCoachFeedback(BaseModel):
@@ -48,7 +46,6 @@ class GradingService:
     """Grade deterministic practice answers and generate feedback."""
 
     def __init__(self, session: AsyncSession) -> None:
-        self._verifier = LatexExpressionVerifier()
         self._jxg_state_verifier = JXGStateVerifier()
         self._llm_client = LLMClient()
         self._session = session
@@ -89,7 +86,7 @@ class GradingService:
                 tags=["parse-error"],
             )
 
-        verification = self._verifier.verify(expected_latex, answer_text)
+        verification = await self._verify_latex_expression(expected_latex, answer_text)
         feedback_markdown, coach_tags, error_highlight = await self._generate_feedback(
             request=request,
             verification=verification,
@@ -114,6 +111,14 @@ class GradingService:
             error_highlight=error_highlight,
         )
 
+    async def _verify_latex_expression(
+        self,
+        expected_latex: str,
+        answer_text: str,
+    ) -> LatexExpressionVerificationResult:
+        """Run SymPy verification in the worker pool, off the event loop and within its CPU budget."""
+        return await get_latex_verification_pool().verify(expected_latex, answer_text)
+
     def _grade_jxg_state(self, request: GradeRequest) -> GradeResponse:
         expected_state = request.expected.expected_state
         answer_state = request.answer.answer_state
@@ -0,0 +1,90 @@
+"""Per-process memo of parsed and normalized expected LaTeX answers."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import sympy
+from opentelemetry import metrics
+from sympy.core.relational import Relational
+
+
+# Distinct expected answers kept per process; popular lessons reuse a small working set.
+_MAX_CACHED_EXPECTED_ANSWERS = 2_048
+
+_meter = metrics.get_meter(__name__)
+_cache_lookups = _meter.create_counter(
+    "grading.expected_latex_cache.lookups",
+    unit="{lookup}",
+    description="Expected LaTeX answer memo lookups, by result (hit or miss)",
+)
+
+
+@dataclass(frozen=True)
+class ExpectedLatexEntry:
+    """Everything about an expected answer that does not depend on the learner's answer."""
+
+    parsed: sympy.Expr | Relational | None
+    parse_error: str | None
+    # Equations are normalized to their simplified ``lhs - rhs``; ``None`` when unparsed or unsupported.
+    normalized: sympy.Expr | None
+    free_symbols: frozenset[sympy.Symbol]
+    # ``normalized`` sampled over its sorted free symbols, reused by numeric-only checks.
+    sample_values: tuple[complex | None, ...]
+
+
+def expected_latex_key(expected_latex: str, max_samples: int) -> str:
+    """Key an expected answer by a digest of its LaTeX and the sample count its values were taken at."""
+    digest = hashlib.sha256(expected_latex.encode()).hexdigest()
+    return f"{digest}:{max_samples}"
+
+
+class ExpectedLatexCache:
+    """Bounded LRU of expected answers, safe to share across thread-pool graders."""
+
+    def __init__(self, *, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, ExpectedLatexEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key: str, build: Callable[[], ExpectedLatexEntry]) -> ExpectedLatexEntry:
+        """Return the cached entry for ``key``, building and storing it on a miss."""
+        entry = self.get(key)
+        if entry is not None:
+            return entry
+        # Built outside the lock: parsing and simplification are slow, and a duplicate build is harmless.
+        entry = build()
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def get(self, key: str) -> ExpectedLatexEntry | None:
+        """Return the cached entry for ``key`` without building it."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        _cache_lookups.add(1, {"result": "hit" if entry is not None else "miss"})
+        return entry
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached expected answers."""
+        return len(self._entries)
+
+
+_expected_latex_cache = ExpectedLatexCache(max_entries=_MAX_CACHED_EXPECTED_ANSWERS)
+
+
+def get_expected_latex_cache() -> ExpectedLatexCache:
+    """Return this process's expected-answer memo."""
+    return _expected_latex_cache
@@ -1,9 +1,12 @@
 """Numeric sampling helpers for LaTeX expression verification."""
 
 import math
-from collections.abc import Mapping
-from itertools import islice, product
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from functools import reduce
+from itertools import islice, product, repeat
+from operator import itemgetter
 
+import numpy as np
 import sympy
 
 
@@ -16,6 +19,23 @@ _SAMPLE_VALUES = (
     sympy.Integer(2),
     sympy.Integer(3),
 )
+# Elementwise NumPy counterparts of the single-argument SymPy functions graders commonly see.
+_NUMPY_FUNCTIONS: dict[type[sympy.Basic], Callable[[np.ndarray], np.ndarray]] = {
+    sympy.sin: np.sin,
+    sympy.cos: np.cos,
+    sympy.tan: np.tan,
+    sympy.asin: np.arcsin,
+    sympy.acos: np.arccos,
+    sympy.atan: np.arctan,
+    sympy.sinh: np.sinh,
+    sympy.cosh: np.cosh,
+    sympy.tanh: np.tanh,
+    sympy.exp: np.exp,
+    sympy.log: np.log,
+    sympy.Abs: np.abs,
+}
+
+type _Sampler = Callable[[Sequence[np.ndarray]], np.ndarray | complex]
 
 
 def numeric_equivalence(
@@ -26,11 +46,55 @@ def numeric_equivalence(
     tolerance: float,
     max_samples: int,
 ) -> tuple[bool | None, int]:
-    """Check numeric equivalence by sampling symbol assignments."""
-    symbols = sorted(diff_expr.free_symbols, key=lambda symbol: symbol.name)
+    """Check numeric equivalence by sampling symbol assignments.
+
+    Expressions are compiled to NumPy and evaluated over every sample point in
+    one vectorized pass; expressions with nodes NumPy cannot evaluate fall back
+    to SymPy substitution point by point, stopping at the first mismatch.
+    """
+    symbols = sampling_symbols(diff_expr)
     if not symbols:
         return _constant_equivalence(diff_expr, sum_expr, allow_sign_flip, tolerance=tolerance)
 
+    sample_points = _sample_points(symbols, max_samples)
+    diff_values = _evaluate_samples(diff_expr, symbols, sample_points)
+    sum_values = (
+        _evaluate_samples(sum_expr, symbols, sample_points)
+        if allow_sign_flip and sum_expr is not None
+        else repeat(None, len(sample_points))
+    )
+    return sampled_equivalence(diff_values, sum_values, allow_sign_flip=allow_sign_flip, tolerance=tolerance)
+
+
+def sampling_symbols(expr: sympy.Expr) -> list[sympy.Symbol]:
+    """Return the free symbols of ``expr`` in the order sample points assign them."""
+    return sorted(expr.free_symbols, key=lambda symbol: symbol.name)
+
+
+def sample_expression(
+    expr: sympy.Expr,
+    symbols: Sequence[sympy.Symbol],
+    *,
+    max_samples: int,
+) -> Iterator[complex | None]:
+    """Lazily evaluate ``expr`` at the first ``max_samples`` sample points over ``symbols``.
+
+    ``None`` marks points where the expression has no finite value.
+    """
+    return _evaluate_samples(expr, symbols, _sample_points(symbols, max_samples))
+
+
+def sampled_equivalence(
+    diff_values: Iterable[complex | None],
+    sum_values: Iterable[complex | None],
+    *,
+    allow_sign_flip: bool,
+    tolerance: float,
+) -> tuple[bool | None, int]:
+    """Decide equivalence from sampled differences (and sums, for sign-flipped equations).
+
+    Values are consumed in order and the rest are left unevaluated once a mismatch decides the result.
+    """
     diff_valid = 0
     sum_valid = 0
     diff_matches = True
@@ -39,11 +103,7 @@ def numeric_equivalence(
     result: bool | None = None
     samples = 0
 
-    for values in islice(product(_SAMPLE_VALUES, repeat=len(symbols)), max_samples):
-        subs = dict(zip(symbols, values, strict=True))
-        diff_value = _evaluate_numeric(diff_expr, subs)
-        sum_value = _evaluate_numeric(sum_expr, subs) if allow_sign_flip and sum_expr is not None else None
-
+    for diff_value, sum_value in zip(diff_values, sum_values, strict=True):
         if diff_value is not None:
             diff_valid += 1
             diff_matches = diff_matches and abs(diff_value) <= tolerance
@@ -78,6 +138,118 @@ def numeric_equivalence(
     return result, samples
 
 
+def _sample_points(symbols: Sequence[sympy.Symbol], max_samples: int) -> list[tuple[sympy.Expr, ...]]:
+    return list(islice(product(_SAMPLE_VALUES, repeat=len(symbols)), max_samples))
+
+
+def _evaluate_samples(
+    expr: sympy.Expr,
+    symbols: Sequence[sympy.Symbol],
+    sample_points: Sequence[tuple[sympy.Expr, ...]],
+) -> Iterator[complex | None]:
+    """Yield ``expr`` at each sample point; ``None`` marks points with no finite value.
+
+    The NumPy pass covers every point at once, since it costs less than one
+    SymPy substitution. The SymPy fallback substitutes a point only when the
+    consumer asks for it.
+    """
+    compiled = _compile_expression(expr, symbols)
+    if compiled is not None:
+        values = _evaluate_compiled(compiled, len(symbols), sample_points)
+        if values is not None:
+            yield from values
+            return
+    for point in sample_points:
+        yield _evaluate_numeric(expr, dict(zip(symbols, point, strict=True)))
+
+
+def _compile_expression(expr: sympy.Expr, symbols: Sequence[sympy.Symbol]) -> _Sampler | None:
+    """Compile ``expr`` into a NumPy sampler, or return ``None`` when a node has no NumPy counterpart.
+
+    The sampler walks a prebuilt closure tree rather than generated source, so
+    compiling costs about as much as one SymPy substitution.
+    """
+    # Rule out functions with no NumPy counterpart before walking the tree, so the fallback pays little extra.
+    if any(type(function) not in _NUMPY_FUNCTIONS for function in expr.atoms(sympy.Function)):
+        return None
+    # Symbols the sampled variables do not cover cannot be given values.
+    if not expr.free_symbols <= set(symbols):
+        return None
+    try:
+        return _compile_node(expr, {symbol: index for index, symbol in enumerate(symbols)})
+    except RecursionError:
+        return None
+
+
+def _compile_node(node: sympy.Basic, symbol_indexes: Mapping[sympy.Basic, int]) -> _Sampler | None:
+    if not node.free_symbols:
+        constant = _constant_value(node)
+        return lambda _columns: constant
+    if node.is_Symbol:
+        return itemgetter(symbol_indexes[node])
+
+    operands = _compile_args(node.args, symbol_indexes)
+    if operands is None:
+        return None
+    if node.is_Add or node.is_Mul:
+        combine = np.add if node.is_Add else np.multiply
+        return lambda columns: reduce(combine, (operand(columns) for operand in operands))
+    if node.is_Pow:
+        base, exponent = operands
+        return lambda columns: np.power(base(columns), exponent(columns))
+    return _compile_function(node, operands)
+
+
+def _compile_function(node: sympy.Basic, operands: Sequence[_Sampler]) -> _Sampler | None:
+    if isinstance(node, sympy.log) and len(operands) == 2:
+        # latex2sympy keeps the base, e.g. log(x, 10) for \log x.
+        argument, log_base = operands
+        return lambda columns: np.log(argument(columns)) / np.log(log_base(columns))
+
+    function = _NUMPY_FUNCTIONS.get(type(node))
+    if function is None or len(operands) != 1:
+        return None
+    (argument,) = operands
+    return lambda columns: function(argument(columns))
+
+
+def _compile_args(args: Sequence[sympy.Basic], symbol_indexes: Mapping[sympy.Basic, int]) -> list[_Sampler] | None:
+    compiled_args: list[_Sampler] = []
+    for arg in args:
+        compiled_arg = _compile_node(arg, symbol_indexes)
+        if compiled_arg is None:
+            return None
+        compiled_args.append(compiled_arg)
+    return compiled_args
+
+
+def _constant_value(node: sympy.Basic) -> complex:
+    try:
+        return complex(node.evalf())
+    except TypeError, ValueError, OverflowError:
+        # zoo, nan, and other non-numeric constants poison every sample they touch.
+        return complex("nan")
+
+
+def _evaluate_compiled(
+    compiled: _Sampler,
+    symbol_count: int,
+    sample_points: Sequence[tuple[sympy.Expr, ...]],
+) -> list[complex | None] | None:
+    """Evaluate a compiled expression over all sample points in one complex-valued NumPy pass."""
+    # Complex inputs give principal-branch results for sqrt/log of negatives, matching SymPy's evalf.
+    points = np.array([[complex(value) for value in point] for point in sample_points], dtype=np.complex128)
+    columns = list(points.reshape(len(sample_points), symbol_count).T)
+    try:
+        with np.errstate(all="ignore"):
+            values = np.broadcast_to(np.asarray(compiled(columns), dtype=np.complex128), (len(sample_points),))
+    except TypeError, ValueError, OverflowError:
+        return None
+
+    finite = np.isfinite(values.real) & np.isfinite(values.imag)
+    return [complex(value) if is_finite else None for value, is_finite in zip(values, finite, strict=True)]
+
+
 def _constant_equivalence(
     diff_expr: sympy.Expr,
     sum_expr: sympy.Expr | None,
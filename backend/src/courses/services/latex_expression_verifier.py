@@ -1,13 +1,26 @@
 """SymPy-based verifier for LaTeX expressions."""
 
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from itertools import tee
+from typing import cast
 
 import sympy
 from latex2sympy2_extended import latex2sympy
 from sympy.core.relational import Equality, Relational
 
 from src.courses.schemas import GradeStatus
-from src.courses.services.latex_expression_sampling import numeric_equivalence
+from src.courses.services.latex_expected_cache import (
+    ExpectedLatexEntry,
+    expected_latex_key,
+    get_expected_latex_cache,
+)
+from src.courses.services.latex_expression_sampling import (
+    numeric_equivalence,
+    sample_expression,
+    sampled_equivalence,
+    sampling_symbols,
+)
 
 
 _MAX_SAMPLE_COMBOS = 8
@@ -43,17 +56,30 @@ class LatexExpressionVerifier:
     def __init__(self, *, tolerance: float = _DEFAULT_TOLERANCE, max_samples: int = _MAX_SAMPLE_COMBOS) -> None:
         self._tolerance = tolerance
         self._max_samples = max_samples
+        self._expected_cache = get_expected_latex_cache()
 
-    def verify(self, expected_latex: str, learner_latex: str) -> LatexExpressionVerificationResult:
-        """Verify whether the answer matches the expected expression."""
-        expected_expr, expected_error = self._parse_latex(expected_latex)
+    def verify(  # noqa: PLR0911
+        self,
+        expected_latex: str,
+        learner_latex: str,
+        *,
+        numeric_only: bool = False,
+    ) -> LatexExpressionVerificationResult:
+        """Verify whether the answer matches the expected expression.
+
+        ``numeric_only`` skips symbolic simplification and decides by numeric
+        sampling alone, a bounded-cost fallback for inputs that exhaust the
+        verification time budget.
+        """
+        expected = self._expected_entry(expected_latex, numeric_only=numeric_only)
+        expected_expr = expected.parsed
         answer_expr, answer_error = self._parse_latex(learner_latex)
 
         method_attempts: list[str] = []
         tags: list[str] = []
 
-        if expected_error or answer_error or expected_expr is None or answer_expr is None:
-            if expected_error or expected_expr is None:
+        if expected.parse_error or answer_error or expected_expr is None or answer_expr is None:
+            if expected.parse_error or expected_expr is None:
                 tags.append("expected-parse-error")
             if answer_error or answer_expr is None:
                 tags.append("answer-parse-error")
@@ -62,10 +88,10 @@ class LatexExpressionVerifier:
                 status="parse_error",
                 method=None,
                 notes="Failed to parse expected or answer expression."
-                if expected_error or answer_error
+                if expected.parse_error or answer_error
                 else "Parsed expression missing.",
                 diagnostics=LatexExpressionVerificationDiagnostics(
-                    expected_parse_error=expected_error or ("Parser returned None" if expected_expr is None else None),
+                    expected_parse_error=expected.parse_error or ("Parser returned None" if expected_expr is None else None),
                     answer_parse_error=answer_error or ("Parser returned None" if answer_expr is None else None),
                     method_attempts=method_attempts,
                     numeric_samples=0,
@@ -90,9 +116,11 @@ class LatexExpressionVerifier:
                 tags=[*tags, "unsupported-relation"],
             )
 
-        normalized_expected, _ = self._normalize_expression(expected_expr)
-        normalized_answer, _ = self._normalize_expression(answer_expr)
+        normalized_expected = cast("sympy.Expr", expected.normalized)
+        normalized_answer, _ = self._normalize_expression(answer_expr, simplify=not numeric_only)
         allow_sign_flip = isinstance(expected_expr, Equality) and isinstance(answer_expr, Equality)
+        if numeric_only:
+            return self._verify_numerically(expected, normalized_answer, allow_sign_flip=allow_sign_flip)
 
         diff_expr = sympy.simplify(normalized_expected - normalized_answer)
         sum_expr = sympy.simplify(normalized_expected + normalized_answer) if allow_sign_flip else None
@@ -150,6 +178,91 @@ class LatexExpressionVerifier:
             tags=tags + self._build_mistake_tags(diagnostics.likely_mistake),
         )
 
+    def _expected_entry(self, expected_latex: str, *, numeric_only: bool) -> ExpectedLatexEntry:
+        """Return the parsed, normalized, and sampled expected answer, memoized per process.
+
+        Numeric-only checks run after a budget overrun, so on a miss they build an
+        unsimplified entry for this call instead of paying for simplification.
+        """
+        key = expected_latex_key(expected_latex, self._max_samples)
+        if numeric_only:
+            cached = self._expected_cache.get(key)
+            return cached if cached is not None else self._build_expected_entry(expected_latex, simplify=False)
+        return self._expected_cache.get_or_build(key, lambda: self._build_expected_entry(expected_latex, simplify=True))
+
+    def _build_expected_entry(self, expected_latex: str, *, simplify: bool) -> ExpectedLatexEntry:
+        parsed, parse_error = self._parse_latex(expected_latex)
+        if parse_error or parsed is None or self._is_unsupported_relation(parsed):
+            return ExpectedLatexEntry(
+                parsed=parsed,
+                parse_error=parse_error,
+                normalized=None,
+                free_symbols=frozenset(),
+                sample_values=(),
+            )
+
+        normalized, _ = self._normalize_expression(parsed, simplify=simplify)
+        symbols = sampling_symbols(normalized)
+        return ExpectedLatexEntry(
+            parsed=parsed,
+            parse_error=None,
+            normalized=normalized,
+            free_symbols=frozenset(symbols),
+            sample_values=tuple(sample_expression(normalized, symbols, max_samples=self._max_samples)),
+        )
+
+    def _verify_numerically(
+        self,
+        expected: ExpectedLatexEntry,
+        answer_expr: sympy.Expr,
+        *,
+        allow_sign_flip: bool,
+    ) -> LatexExpressionVerificationResult:
+        expected_expr = cast("sympy.Expr", expected.normalized)
+        if expected.free_symbols and answer_expr.free_symbols <= expected.free_symbols:
+            # Reuse the memoized expected samples; only the learner's answer is evaluated.
+            answer_values = sample_expression(
+                answer_expr,
+                sampling_symbols(expected_expr),
+                max_samples=self._max_samples,
+            )
+            diff_answer_values, sum_answer_values = tee(answer_values)
+            numeric_result, numeric_samples = sampled_equivalence(
+                _combine_samples(expected.sample_values, diff_answer_values, sign=-1),
+                _combine_samples(expected.sample_values, sum_answer_values, sign=1),
+                allow_sign_flip=allow_sign_flip,
+                tolerance=self._tolerance,
+            )
+        else:
+            numeric_result, numeric_samples = numeric_equivalence(
+                expected_expr - answer_expr,
+                expected_expr + answer_expr if allow_sign_flip else None,
+                allow_sign_flip,
+                tolerance=self._tolerance,
+                max_samples=self._max_samples,
+            )
+        diagnostics = LatexExpressionVerificationDiagnostics(
+            expected_parse_error=None,
+            answer_parse_error=None,
+            method_attempts=["numeric_sampling"],
+            numeric_samples=numeric_samples,
+            likely_mistake=None,
+        )
+        if numeric_result is True:
+            notes = None
+        elif numeric_samples > 0:
+            notes = "Numeric sampling did not establish equivalence."
+        else:
+            notes = "No valid samples found."
+        return LatexExpressionVerificationResult(
+            is_correct=numeric_result is True,
+            status="correct" if numeric_result is True else "incorrect",
+            method="numeric_sampling",
+            notes=notes,
+            diagnostics=diagnostics,
+            tags=["numeric-only"],
+        )
+
     def _parse_latex(self, value: str) -> tuple[sympy.Expr | Relational | None, str | None]:
         try:
             parsed = latex2sympy(value)
@@ -157,9 +270,10 @@ class LatexExpressionVerifier:
             return None, str(exc)
         return parsed, None
 
-    def _normalize_expression(self, expr: sympy.Expr | Relational) -> tuple[sympy.Expr, bool]:
+    def _normalize_expression(self, expr: sympy.Expr | Relational, *, simplify: bool = True) -> tuple[sympy.Expr, bool]:
         if isinstance(expr, Relational):
-            return sympy.simplify(expr.lhs - expr.rhs), True
+            difference = expr.lhs - expr.rhs
+            return (sympy.simplify(difference) if simplify else difference), True
         return expr, False
 
     def _is_unsupported_relation(self, expr: sympy.Expr | Relational) -> bool:
@@ -208,3 +322,16 @@ class LatexExpressionVerifier:
         if not likely_mistake:
             return []
         return [likely_mistake]
+
+
+def _combine_samples(
+    expected_values: tuple[complex | None, ...],
+    answer_values: Iterable[complex | None],
+    *,
+    sign: int,
+) -> Iterator[complex | None]:
+    """Lazily pointwise ``expected + sign * answer``; undefined wherever either side is."""
+    return (
+        None if expected_value is None or answer_value is None else expected_value + sign * answer_value
+        for expected_value, answer_value in zip(expected_values, answer_values, strict=True)
+    )
@@ -0,0 +1,301 @@
+"""Process pool that runs SymPy LaTeX verification off the API event loop under a CPU budget."""
+
+import asyncio
+import logging
+import multiprocessing
+import signal
+import time
+from collections.abc import Generator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from functools import lru_cache
+from types import FrameType
+
+from opentelemetry import metrics
+
+from src.config.settings import get_settings
+from src.courses.services.latex_expression_verifier import (
+    LatexExpressionVerificationDiagnostics,
+    LatexExpressionVerificationResult,
+    LatexExpressionVerifier,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Wall-clock slack beyond the CPU budgets before a stuck worker is killed.
+_WALL_CLOCK_GRACE_SECONDS = 1.0
+_NUMERIC_FALLBACK_TAG = "verification-budget-exhausted"
+_TIMEOUT_TAG = "verification-timeout"
+_UNAVAILABLE_TAG = "verification-unavailable"
+_DEGRADED_TAGS = frozenset({_NUMERIC_FALLBACK_TAG, _TIMEOUT_TAG, _UNAVAILABLE_TAG})
+
+_meter = metrics.get_meter(__name__)
+_queue_depth = _meter.create_up_down_counter(
+    "grading.latex_verifier.queue_depth",
+    unit="{answer}",
+    description="LaTeX answers waiting for a free verifier worker process",
+)
+_active_jobs = _meter.create_up_down_counter(
+    "grading.latex_verifier.active",
+    unit="{answer}",
+    description="LaTeX answers currently being verified in worker processes",
+)
+_saturated_submissions = _meter.create_counter(
+    "grading.latex_verifier.saturated",
+    unit="{answer}",
+    description="LaTeX answers submitted while every verifier worker was busy",
+)
+_queue_wait_duration = _meter.create_histogram(
+    "grading.latex_verifier.wait.duration",
+    unit="ms",
+    description="Time a LaTeX answer waited for a free verifier worker process",
+)
+_degraded_answers = _meter.create_counter(
+    "grading.latex_verifier.degraded",
+    unit="{answer}",
+    description="LaTeX answers not fully verified (numeric fallback, timeout, or worker failure), by outcome",
+)
+
+
+class _CpuBudgetExceeded(BaseException):
+    """Raised inside a worker when a verification step uses up its CPU budget.
+
+    Derives from ``BaseException`` so broad ``except Exception`` blocks inside
+    SymPy cannot swallow it.
+    """
+
+
+def _raise_budget_exceeded(_signum: int, _frame: FrameType | None) -> None:
+    raise _CpuBudgetExceeded
+
+
+@contextmanager
+def _cpu_budget(seconds: float) -> Generator[None]:
+    """Interrupt the enclosed block once the process has used ``seconds`` of CPU time.
+
+    Relies on ``SIGPROF``, so it must run on the main thread of a worker process.
+    A budget of zero leaves the block unbounded.
+    """
+    previous_handler = signal.signal(signal.SIGPROF, _raise_budget_exceeded)
+    signal.setitimer(signal.ITIMER_PROF, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, previous_handler)
+
+
+def verify_with_cpu_budget(
+    expected_latex: str,
+    learner_latex: str,
+    cpu_budget_seconds: float,
+) -> LatexExpressionVerificationResult:
+    """Verify in a worker process, degrading to numeric-only checking when the budget runs out."""
+    verifier = LatexExpressionVerifier()
+    try:
+        with _cpu_budget(cpu_budget_seconds):
+            return verifier.verify(expected_latex, learner_latex)
+    except _CpuBudgetExceeded:
+        pass
+
+    try:
+        with _cpu_budget(cpu_budget_seconds):
+            result = verifier.verify(expected_latex, learner_latex, numeric_only=True)
+    except _CpuBudgetExceeded:
+        return _degraded_result("Verification exceeded its time budget.", _TIMEOUT_TAG)
+    return LatexExpressionVerificationResult(
+        is_correct=result.is_correct,
+        status=result.status,
+        method=result.method,
+        notes=result.notes,
+        diagnostics=result.diagnostics,
+        tags=[*result.tags, _NUMERIC_FALLBACK_TAG],
+    )
+
+
+def _degraded_result(notes: str, tag: str) -> LatexExpressionVerificationResult:
+    return LatexExpressionVerificationResult(
+        is_correct=False,
+        status="unsupported",
+        method=None,
+        notes=notes,
+        diagnostics=LatexExpressionVerificationDiagnostics(
+            expected_parse_error=None,
+            answer_parse_error=None,
+            method_attempts=[],
+            numeric_samples=0,
+            likely_mistake=None,
+        ),
+        tags=[tag],
+    )
+
+
+def _initialize_worker() -> None:
+    """Warm SymPy and the LaTeX parser so the first answer does not pay for their import and caches."""
+    LatexExpressionVerifier().verify("x + 1", "1 + x")
+
+
+def _worker_ready() -> None:
+    """Return once a worker has started; its initializer always runs before its first task."""
+
+
+class LatexVerificationPool:
+    """Bounded process pool that keeps SymPy verification off the API event loop.
+
+    Each answer gets ``cpu_budget_seconds`` of CPU for full symbolic checking
+    and the same again for the numeric-only fallback. A worker stuck in native
+    code past both budgets is killed, and the answer is reported as unsupported
+    instead of holding its slot. Every worker is spawned and initialized before
+    answers are submitted, so the wall-clock limit only covers verification.
+    """
+
+    def __init__(self, *, max_workers: int, cpu_budget_seconds: float) -> None:
+        self.max_workers = max_workers
+        self.cpu_budget_seconds = cpu_budget_seconds
+        self.queued = 0
+        self.active = 0
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_lock: asyncio.Lock | None = None
+        self._slots: asyncio.Semaphore | None = None
+
+    async def verify(self, expected_latex: str, learner_latex: str) -> LatexExpressionVerificationResult:
+        """Verify a learner answer in a worker process within the configured budget."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers)
+
+        if self.active >= self.max_workers:
+            _saturated_submissions.add(1)
+        queued_at = time.perf_counter()
+        self._change_queued(1)
+        try:
+            await self._slots.acquire()
+        finally:
+            self._change_queued(-1)
+        wait_ms = round((time.perf_counter() - queued_at) * 1000, 2)
+        _queue_wait_duration.record(wait_ms)
+
+        self._change_active(1)
+        started_at = time.perf_counter()
+        try:
+            result = await self._run_with_retry(expected_latex, learner_latex)
+        finally:
+            self._change_active(-1)
+            self._slots.release()
+
+        degraded_outcome = next((tag for tag in result.tags if tag in _DEGRADED_TAGS), None)
+        if degraded_outcome is not None:
+            _degraded_answers.add(1, {"outcome": degraded_outcome})
+            logger.warning(
+                "grading.latex_verifier.degraded",
+                extra={"outcome": degraded_outcome, "answer_length": len(learner_latex)},
+            )
+        logger.debug(
+            "grading.latex_verifier.verified",
+            extra={
+                "wait_ms": wait_ms,
+                "run_ms": round((time.perf_counter() - started_at) * 1000, 2),
+                "queued": self.queued,
+                "active": self.active,
+            },
+        )
+        return result
+
+    async def warm_up(self) -> None:
+        """Start every worker process now rather than on the first answers."""
+        await self._ready_executor()
+
+    def shutdown(self) -> None:
+        """Stop worker processes; queued work is cancelled."""
+        self._discard_executor()
+
+    async def _run_with_retry(self, expected_latex: str, learner_latex: str) -> LatexExpressionVerificationResult:
+        # Budgets for the symbolic check and the numeric fallback, plus slack for IPC.
+        wall_clock_limit = 2 * self.cpu_budget_seconds + _WALL_CLOCK_GRACE_SECONDS if self.cpu_budget_seconds else None
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            try:
+                future = loop.run_in_executor(
+                    await self._ready_executor(),
+                    verify_with_cpu_budget,
+                    expected_latex,
+                    learner_latex,
+                    self.cpu_budget_seconds,
+                )
+                return await asyncio.wait_for(future, timeout=wall_clock_limit)
+            except TimeoutError:
+                # SIGPROF cannot interrupt native code, so the worker may never return; kill it.
+                self._discard_executor(terminate=True)
+                return _degraded_result("Verification exceeded its time budget.", _TIMEOUT_TAG)
+            except BrokenProcessPool:
+                # Another answer's worker was killed or crashed; this answer did nothing wrong, so retry once.
+                self._discard_executor()
+                logger.info("grading.latex_verifier.worker_pool_restarted", extra={"attempt": attempt + 1})
+        return _degraded_result("Verification worker is unavailable.", _UNAVAILABLE_TAG)
+
+    async def _ready_executor(self) -> ProcessPoolExecutor:
+        """Return the executor once all of its workers have spawned and run their initializer.
+
+        Spawning a worker and importing SymPy takes longer than a small CPU
+        budget, so neither may count against an answer's wall-clock limit.
+        """
+        if self._executor_lock is None:
+            self._executor_lock = asyncio.Lock()
+        async with self._executor_lock:
+            if self._executor is not None:
+                return self._executor
+            # Spawned workers do not inherit the parent's event loop, threads, or open DB connections.
+            executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_initialize_worker,
+            )
+            loop = asyncio.get_running_loop()
+            started_at = time.perf_counter()
+            try:
+                # Workers spawn on demand, one per task submitted while none is idle.
+                await asyncio.gather(*(loop.run_in_executor(executor, _worker_ready) for _ in range(self.max_workers)))
+            except BaseException:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            logger.info(
+                "grading.latex_verifier.workers_started",
+                extra={"workers": self.max_workers, "duration_ms": round((time.perf_counter() - started_at) * 1000, 2)},
+            )
+            self._executor = executor
+            return executor
+
+    def _discard_executor(self, *, terminate: bool = False) -> None:
+        executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        if terminate:
+            # The executor has no public way to stop a running task; its worker processes are the only handle.
+            for process in list(executor._processes.values()):  # noqa: SLF001
+                process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _change_queued(self, delta: int) -> None:
+        self.queued += delta
+        _queue_depth.add(delta)
+
+    def _change_active(self, delta: int) -> None:
+        self.active += delta
+        _active_jobs.add(delta)
+
+
+@lru_cache(maxsize=1)
+def get_latex_verification_pool() -> LatexVerificationPool:
+    """Return the shared verifier pool."""
+    settings = get_settings()
+    return LatexVerificationPool(
+        max_workers=settings.GRADING_VERIFIER_POOL_WORKERS,
+        cpu_budget_seconds=settings.GRADING_VERIFIER_CPU_BUDGET_SECONDS,
+    )
+
+
+def shutdown_latex_verification_pool() -> None:
+    """Stop the shared verifier pool's worker processes if it was started."""
+    if get_latex_verification_pool.cache_info().currsize:
+        get_latex_verification_pool().shutdown()
@@ -0,0 +1,13 @@
+-- Content-addressed embedding cache shared across documents and re-ingests.
+-- The vector column is unconstrained because entries for several models/dimensions can coexist.
+CREATE TABLE IF NOT EXISTS rag_embedding_cache (
+    model TEXT NOT NULL,
+    dimensions INTEGER NOT NULL,
+    content_sha256 BYTEA NOT NULL,
+    embedding VECTOR NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    last_used_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (model, dimensions, content_sha256)
+);
+
+CREATE INDEX IF NOT EXISTS rag_embedding_cache_last_used_at_idx ON rag_embedding_cache (last_used_at);
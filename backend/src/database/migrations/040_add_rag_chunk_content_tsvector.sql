@@ -0,0 +1,6 @@
+-- Lexical RAG search used to tokenize every chunk in scope at query time.
+-- Store the 'simple' tsvector once per row and index it with GIN.
+ALTER TABLE rag_document_chunks
+ADD COLUMN IF NOT EXISTS content_tsv TSVECTOR GENERATED ALWAYS AS (to_tsvector('simple', content)) STORED;
+
+CREATE INDEX IF NOT EXISTS rag_document_chunks_content_tsv_idx ON rag_document_chunks USING gin (content_tsv);
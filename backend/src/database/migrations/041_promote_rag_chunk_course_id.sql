@@ -0,0 +1,17 @@
+-- Course-scoped RAG search filtered on metadata->>'course_id', which the planner cannot combine
+-- well with the HNSW index. Promote it to a typed column. As a stored generated column it is
+-- backfilled for existing rows when added and stays in sync with every chunk writer, including
+-- the ones that copy or rewrite metadata. Malformed legacy values map to NULL instead of failing.
+ALTER TABLE rag_document_chunks
+ADD COLUMN IF NOT EXISTS course_id UUID GENERATED ALWAYS AS (
+    CASE
+        WHEN metadata->>'course_id' ~* '^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
+        THEN CAST(metadata->>'course_id' AS uuid)
+    END
+) STORED;
+
+CREATE INDEX IF NOT EXISTS rag_document_chunks_course_id_doc_type_idx
+ON rag_document_chunks (course_id, doc_type)
+WHERE course_id IS NOT NULL;
+
+DROP INDEX IF EXISTS rag_document_chunks_metadata_course_id_idx;
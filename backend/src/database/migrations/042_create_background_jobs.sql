@@ -0,0 +1,37 @@
+-- Durable queue for ingestion, tagging and embedding pipelines. Jobs are inserted in the same
+-- transaction as the rows they describe and claimed by workers with FOR UPDATE SKIP LOCKED.
+-- A running job holds a lease (locked_until); leases that expire are reclaimed so work survives
+-- worker crashes and deploys.
+CREATE TABLE IF NOT EXISTS background_jobs (
+    id BIGSERIAL PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload JSONB NOT NULL DEFAULT '{}'::jsonb,
+    dedupe_key TEXT NULL,
+    status TEXT NOT NULL DEFAULT 'queued' CHECK (status IN ('queued', 'running', 'succeeded', 'failed')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL CHECK (max_attempts > 0),
+    run_after TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    locked_by TEXT NULL,
+    locked_until TIMESTAMPTZ NULL,
+    last_error TEXT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    started_at TIMESTAMPTZ NULL,
+    finished_at TIMESTAMPTZ NULL
+);
+
+CREATE INDEX IF NOT EXISTS background_jobs_ready_idx
+ON background_jobs (kind, run_after, id)
+WHERE status = 'queued';
+
+CREATE INDEX IF NOT EXISTS background_jobs_running_lease_idx
+ON background_jobs (locked_until)
+WHERE status = 'running';
+
+-- At most one pending or running job per dedupe key; finished jobs free the key.
+CREATE UNIQUE INDEX IF NOT EXISTS background_jobs_active_dedupe_key_idx
+ON background_jobs (dedupe_key)
+WHERE dedupe_key IS NOT NULL AND status IN ('queued', 'running');
+
+CREATE INDEX IF NOT EXISTS background_jobs_finished_at_idx
+ON background_jobs (finished_at)
+WHERE status IN ('succeeded', 'failed');
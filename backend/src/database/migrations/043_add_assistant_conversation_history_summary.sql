@@ -0,0 +1,5 @@
+-- Rolling summary of the older part of an assistant conversation. Turns only load the branch
+-- tail after history_summary_through_message_id and send the summary in place of what came before.
+ALTER TABLE assistant_conversations
+ADD COLUMN IF NOT EXISTS history_summary TEXT,
+ADD COLUMN IF NOT EXISTS history_summary_through_message_id TEXT;
@@ -0,0 +1,4 @@
+-- Set when a job is enqueued again under the dedupe key of a job that is already running, so
+-- the data it was enqueued for is not missed: the running job is queued once more when it ends.
+ALTER TABLE background_jobs
+ADD COLUMN IF NOT EXISTS rerun_requested BOOLEAN NOT NULL DEFAULT FALSE;
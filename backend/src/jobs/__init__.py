@@ -0,0 +1,7 @@
+"""Durable Postgres-backed background jobs."""
+
+from src.jobs.queue import enqueue_job
+from src.jobs.registry import JobKind
+
+
+__all__ = ["JobKind", "enqueue_job"]
@@ -0,0 +1,326 @@
+"""Postgres-backed durable job queue.
+
+Producers call :func:`enqueue_job` inside the transaction that creates the
+rows a job works on, so a job exists exactly when its data was committed.
+Workers claim ready jobs with ``FOR UPDATE SKIP LOCKED`` and hold a lease
+while running, renewing it until the job ends; a job whose lease expires
+(crashed worker, deploy) is put back on the queue.
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.jobs.registry import JOB_SPECS, JobKind, JobPayload, retry_delay_seconds
+
+
+logger = logging.getLogger(__name__)
+
+# Failure messages are kept for debugging, not as full tracebacks.
+_MAX_ERROR_LENGTH = 2_000
+
+
+@dataclass(frozen=True, slots=True)
+class ClaimedJob:
+    """A job leased to one worker."""
+
+    id: int
+    kind: JobKind
+    payload: JobPayload
+    attempts: int
+    max_attempts: int
+    wait_seconds: float
+
+
+@dataclass(frozen=True, slots=True)
+class QueueDepth:
+    """Pending and running job counts for one kind."""
+
+    kind: JobKind
+    queued: int
+    ready: int
+    running: int
+    oldest_ready_age_seconds: float
+
+
+async def enqueue_job(
+    session: AsyncSession,
+    kind: JobKind,
+    payload: JobPayload,
+    *,
+    dedupe_key: str | None = None,
+    run_after: datetime | None = None,
+) -> int | None:
+    """Add a job in the caller's transaction; it becomes visible to workers on commit.
+
+    When ``dedupe_key`` matches a job that is still queued or running, nothing
+    is inserted and ``None`` is returned. A queued job has not started and will
+    see the caller's data. A running job may already have read past it, so it
+    is flagged to run once more, with its own payload, when it ends.
+    """
+    spec = JOB_SPECS[kind]
+    # Flag a running job first: its row lock makes a concurrent completion either see the flag or
+    # finish before it, in which case the key is free and the insert goes through.
+    result = await session.execute(
+        text(
+            """
+            WITH follow_up AS (
+                UPDATE background_jobs
+                SET rerun_requested = TRUE
+                WHERE dedupe_key = :dedupe_key AND status = 'running'
+                RETURNING id
+            )
+            INSERT INTO background_jobs (kind, payload, dedupe_key, max_attempts, run_after)
+            SELECT :kind, CAST(:payload AS jsonb), :dedupe_key, CAST(:max_attempts AS integer),
+                   COALESCE(CAST(:run_after AS timestamptz), NOW())
+            WHERE NOT EXISTS (SELECT 1 FROM follow_up)
+            ON CONFLICT (dedupe_key) WHERE dedupe_key IS NOT NULL AND status IN ('queued', 'running')
+            DO NOTHING
+            RETURNING id
+            """
+        ),
+        {
+            "kind": kind.value,
+            "payload": json.dumps(payload),
+            "dedupe_key": dedupe_key,
+            "max_attempts": spec.max_attempts,
+            "run_after": run_after,
+        },
+    )
+    job_id = result.scalar_one_or_none()
+    logger.debug(
+        "jobs.enqueued" if job_id is not None else "jobs.enqueue_deduplicated",
+        extra={"job_id": job_id, "job_kind": kind.value, "dedupe_key": dedupe_key},
+    )
+    return job_id
+
+
+async def claim_jobs(session: AsyncSession, kind: JobKind, *, worker_id: str, limit: int) -> list[ClaimedJob]:
+    """Lease up to ``limit`` ready jobs of one kind, respecting the kind's global concurrency cap.
+
+    Claims for a kind are serialised with a transaction-scoped advisory lock so
+    two workers cannot both see free capacity and overshoot the cap; a worker
+    that loses the race simply claims nothing this round. Commits on return.
+    """
+    spec = JOB_SPECS[kind]
+    if limit <= 0:
+        return []
+
+    locked = await session.scalar(
+        text("SELECT pg_try_advisory_xact_lock(hashtext('background_jobs:' || :kind))"),
+        {"kind": kind.value},
+    )
+    if not locked:
+        await session.rollback()
+        return []
+
+    result = await session.execute(
+        text(
+            """
+            WITH capacity AS (
+                SELECT GREATEST(LEAST(:limit, :max_concurrency - COUNT(*)), 0) AS free_slots
+                FROM background_jobs
+                WHERE kind = :kind AND status = 'running' AND locked_until > NOW()
+            ),
+            picked AS (
+                SELECT id
+                FROM background_jobs
+                WHERE kind = :kind AND status = 'queued' AND run_after <= NOW()
+                ORDER BY run_after, id
+                LIMIT (SELECT free_slots FROM capacity)
+                FOR UPDATE SKIP LOCKED
+            )
+            UPDATE background_jobs AS job
+            SET status = 'running',
+                attempts = job.attempts + 1,
+                locked_by = :worker_id,
+                locked_until = NOW() + make_interval(secs => :lease_seconds),
+                started_at = NOW()
+            FROM picked
+            WHERE job.id = picked.id
+            RETURNING job.id, job.payload, job.attempts, job.max_attempts,
+                      EXTRACT(EPOCH FROM NOW() - job.run_after) AS wait_seconds
+            """
+        ),
+        {
+            "kind": kind.value,
+            "limit": limit,
+            "max_concurrency": spec.max_concurrency,
+            "worker_id": worker_id,
+            "lease_seconds": spec.lease_seconds,
+        },
+    )
+    rows = result.all()
+    await session.commit()
+    return [
+        ClaimedJob(
+            id=int(row.id),
+            kind=kind,
+            payload=row.payload,
+            attempts=int(row.attempts),
+            max_attempts=int(row.max_attempts),
+            wait_seconds=max(float(row.wait_seconds), 0.0),
+        )
+        for row in sorted(rows, key=lambda row: row.id)
+    ]
+
+
+async def renew_job_lease(session: AsyncSession, job: ClaimedJob, *, worker_id: str) -> bool:
+    """Extend a running job's lease by its kind's ``lease_seconds``; ``False`` when the lease was lost."""
+    result = await session.execute(
+        text(
+            """
+            UPDATE background_jobs
+            SET locked_until = NOW() + make_interval(secs => :lease_seconds)
+            WHERE id = :job_id AND status = 'running' AND locked_by = :worker_id
+            """
+        ),
+        {"job_id": job.id, "worker_id": worker_id, "lease_seconds": JOB_SPECS[job.kind].lease_seconds},
+    )
+    await session.commit()
+    return bool(getattr(result, "rowcount", 0))
+
+
+async def complete_job(session: AsyncSession, job: ClaimedJob, *, worker_id: str) -> None:
+    """Mark a leased job as succeeded, or queue its requested follow-up run. A lost lease is left alone."""
+    await session.execute(
+        text(
+            """
+            UPDATE background_jobs
+            SET status = CASE WHEN rerun_requested THEN 'queued' ELSE 'succeeded' END,
+                attempts = CASE WHEN rerun_requested THEN 0 ELSE attempts END,
+                run_after = CASE WHEN rerun_requested THEN NOW() ELSE run_after END,
+                finished_at = CASE WHEN rerun_requested THEN NULL ELSE NOW() END,
+                rerun_requested = FALSE,
+                locked_by = NULL,
+                locked_until = NULL,
+                last_error = NULL
+            WHERE id = :job_id AND status = 'running' AND locked_by = :worker_id
+            """
+        ),
+        {"job_id": job.id, "worker_id": worker_id},
+    )
+    await session.commit()
+
+
+async def fail_job(session: AsyncSession, job: ClaimedJob, *, worker_id: str, error: str) -> bool:
+    """Record a failed attempt, scheduling a retry with exponential backoff while attempts remain.
+
+    A retry also serves a requested follow-up run. Without attempts left, a
+    requested follow-up still runs, as a fresh job with its attempts reset.
+
+    Returns
+    -------
+    bool
+        ``True`` when the job will be retried, ``False`` when this run is permanently failed.
+    """
+    will_retry = job.attempts < job.max_attempts
+    await session.execute(
+        text(
+            """
+            UPDATE background_jobs
+            SET status = CASE WHEN :will_retry OR rerun_requested THEN 'queued' ELSE 'failed' END,
+                attempts = CASE WHEN NOT :will_retry AND rerun_requested THEN 0 ELSE attempts END,
+                run_after = CASE
+                    WHEN :will_retry THEN NOW() + make_interval(secs => :delay_seconds)
+                    WHEN rerun_requested THEN NOW()
+                    ELSE run_after
+                END,
+                finished_at = CASE WHEN :will_retry OR rerun_requested THEN NULL ELSE NOW() END,
+                rerun_requested = FALSE,
+                locked_by = NULL,
+                locked_until = NULL,
+                last_error = :error
+            WHERE id = :job_id AND status = 'running' AND locked_by = :worker_id
+            """
+        ),
+        {
+            "job_id": job.id,
+            "worker_id": worker_id,
+            "will_retry": will_retry,
+            "delay_seconds": retry_delay_seconds(JOB_SPECS[job.kind], job.attempts),
+            "error": error[:_MAX_ERROR_LENGTH],
+        },
+    )
+    await session.commit()
+    return will_retry
+
+
+async def reclaim_expired_jobs(session: AsyncSession) -> int:
+    """Requeue running jobs whose lease expired, failing those that used up their attempts.
+
+    A job with a requested follow-up run is queued again either way, with its attempts reset when spent.
+    """
+    result = await session.execute(
+        text(
+            """
+            UPDATE background_jobs
+            SET status = CASE WHEN attempts >= max_attempts AND NOT rerun_requested THEN 'failed' ELSE 'queued' END,
+                attempts = CASE WHEN attempts >= max_attempts AND rerun_requested THEN 0 ELSE attempts END,
+                finished_at = CASE WHEN attempts >= max_attempts AND NOT rerun_requested THEN NOW() END,
+                rerun_requested = FALSE,
+                locked_by = NULL,
+                locked_until = NULL,
+                last_error = 'lease expired'
+            WHERE status = 'running' AND locked_until < NOW()
+            """
+        ),
+    )
+    await session.commit()
+    return int(getattr(result, "rowcount", 0) or 0)
+
+
+async def prune_finished_jobs(session: AsyncSession, *, retention_hours: int) -> int:
+    """Delete succeeded and failed jobs that finished more than ``retention_hours`` ago."""
+    result = await session.execute(
+        text(
+            """
+            DELETE FROM background_jobs
+            WHERE status IN ('succeeded', 'failed')
+              AND finished_at < NOW() - make_interval(hours => :retention_hours)
+            """
+        ),
+        {"retention_hours": retention_hours},
+    )
+    await session.commit()
+    return int(getattr(result, "rowcount", 0) or 0)
+
+
+async def queue_depths(session: AsyncSession) -> list[QueueDepth]:
+    """Return pending and running counts for every known job kind."""
+    result = await session.execute(
+        text(
+            """
+            SELECT kind,
+                   COUNT(*) FILTER (WHERE status = 'queued') AS queued,
+                   COUNT(*) FILTER (WHERE status = 'queued' AND run_after <= NOW()) AS ready,
+                   COUNT(*) FILTER (WHERE status = 'running') AS running,
+                   COALESCE(
+                       EXTRACT(EPOCH FROM NOW() - MIN(run_after) FILTER (WHERE status = 'queued' AND run_after <= NOW())),
+                       0
+                   ) AS oldest_ready_age_seconds
+            FROM background_jobs
+            WHERE status IN ('queued', 'running')
+            GROUP BY kind
+            """
+        )
+    )
+    await session.commit()
+    by_kind = {row.kind: row for row in result.all()}
+    depths: list[QueueDepth] = []
+    for kind in JobKind:
+        row = by_kind.get(kind.value)
+        depths.append(
+            QueueDepth(
+                kind=kind,
+                queued=int(row.queued) if row else 0,
+                ready=int(row.ready) if row else 0,
+                running=int(row.running) if row else 0,
+                oldest_ready_age_seconds=float(row.oldest_ready_age_seconds) if row else 0.0,
+            )
+        )
+    return depths
@@ -0,0 +1,129 @@
+"""Typed job kinds, their execution limits, and the handlers that run them."""
+
+import uuid
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from enum import StrEnum
+
+from pydantic import JsonValue
+
+
+type JobPayload = Mapping[str, JsonValue]
+type JobHandler = Callable[[JobPayload], Awaitable[None]]
+
+
+class JobKind(StrEnum):
+    """Every kind of durable background job the worker knows how to run."""
+
+    BOOK_INGEST = "book.ingest"
+    VIDEO_AUTO_TAG = "video.auto_tag"
+    VIDEO_EXTRACT_CHAPTERS = "video.extract_chapters"
+    VIDEO_PROCESS_TRANSCRIPT = "video.process_transcript"
+    COURSE_EMBED_CONCEPTS = "course.embed_concepts"
+    COURSE_AUTO_TAG = "course.auto_tag"
+    RAG_PROCESS_DOCUMENT = "rag.process_document"
+    ASSISTANT_SUMMARIZE_HISTORY = "assistant.summarize_history"
+
+
+@dataclass(frozen=True, slots=True)
+class JobSpec:
+    """Execution limits for one job kind.
+
+    ``max_concurrency`` caps running jobs of the kind across every worker;
+    ``lease_seconds`` is how long a claim is held without renewal before
+    another worker may reclaim it. The running worker renews it several times
+    per period, so it bounds how long a crashed worker's job sits idle, not
+    how long a job may run.
+    """
+
+    handler: JobHandler
+    max_concurrency: int
+    max_attempts: int = 5
+    lease_seconds: int = 900
+    backoff_base_seconds: float = 10.0
+    backoff_max_seconds: float = 900.0
+
+
+def _uuid(payload: JobPayload, key: str) -> uuid.UUID:
+    return uuid.UUID(str(payload[key]))
+
+
+async def _ingest_book(payload: JobPayload) -> None:
+    from src.books.facade import BooksFacade
+    from src.database.session import async_session_maker
+
+    async with async_session_maker() as session:
+        await BooksFacade(session).process_uploaded_book_background(
+            _uuid(payload, "book_id"), _uuid(payload, "user_id")
+        )
+
+
+async def _auto_tag_video(payload: JobPayload) -> None:
+    from src.videos.service import auto_tag_video_background
+
+    await auto_tag_video_background(_uuid(payload, "video_id"), _uuid(payload, "user_id"))
+
+
+async def _extract_video_chapters(payload: JobPayload) -> None:
+    from src.videos.service import extract_chapters_background
+
+    await extract_chapters_background(_uuid(payload, "video_id"), _uuid(payload, "user_id"))
+
+
+async def _process_video_transcript(payload: JobPayload) -> None:
+    from src.videos.service import process_transcript_to_jsonb
+
+    await process_transcript_to_jsonb(_uuid(payload, "video_id"))
+
+
+async def _embed_course_concepts(payload: JobPayload) -> None:
+    from src.courses.services.course_content_service import CourseContentService
+    from src.database.session import async_session_maker
+
+    async with async_session_maker() as session:
+        await CourseContentService(session).run_background_embeddings(_uuid(payload, "course_id"))
+
+
+async def _auto_tag_course(payload: JobPayload) -> None:
+    from src.courses.services.course_content_service import CourseContentService
+    from src.database.session import async_session_maker
+
+    async with async_session_maker() as session:
+        await CourseContentService(session).run_background_auto_tagging(
+            _uuid(payload, "course_id"), _uuid(payload, "user_id")
+        )
+
+
+async def _process_rag_document(payload: JobPayload) -> None:
+    from src.ai.rag.service import RAGService
+
+    document_id = payload["document_id"]
+    if not isinstance(document_id, int):
+        message = f"Invalid RAG document id: {document_id!r}"
+        raise TypeError(message)
+    await RAGService().process_document_background(document_id)
+
+
+async def _summarize_assistant_history(payload: JobPayload) -> None:
+    from src.ai.assistant.service import summarize_assistant_conversation_history
+
+    await summarize_assistant_conversation_history(_uuid(payload, "conversation_id"))
+
+
+# Caps keep provider-bound work (LLM tagging, embeddings, yt-dlp) from starving each other.
+JOB_SPECS: Mapping[JobKind, JobSpec] = {
+    JobKind.BOOK_INGEST: JobSpec(_ingest_book, max_concurrency=2, lease_seconds=3600),
+    JobKind.VIDEO_AUTO_TAG: JobSpec(_auto_tag_video, max_concurrency=4, lease_seconds=300),
+    JobKind.VIDEO_EXTRACT_CHAPTERS: JobSpec(_extract_video_chapters, max_concurrency=2),
+    JobKind.VIDEO_PROCESS_TRANSCRIPT: JobSpec(_process_video_transcript, max_concurrency=2),
+    JobKind.COURSE_EMBED_CONCEPTS: JobSpec(_embed_course_concepts, max_concurrency=2),
+    JobKind.COURSE_AUTO_TAG: JobSpec(_auto_tag_course, max_concurrency=4, lease_seconds=300),
+    JobKind.RAG_PROCESS_DOCUMENT: JobSpec(_process_rag_document, max_concurrency=2, lease_seconds=3600),
+    JobKind.ASSISTANT_SUMMARIZE_HISTORY: JobSpec(_summarize_assistant_history, max_concurrency=4, lease_seconds=300),
+}
+
+
+def retry_delay_seconds(spec: JobSpec, attempts: int) -> float:
+    """Return the exponential backoff before retry number ``attempts`` (1-based)."""
+    exponent = max(attempts - 1, 0)
+    return min(spec.backoff_base_seconds * (2**exponent), spec.backoff_max_seconds)
@@ -0,0 +1,314 @@
+"""Job worker that drains the durable background job queue.
+
+Run standalone with ``python -m src.jobs.worker`` to scale job processing
+independently of the API, or embedded in the API process via
+``JOBS_RUN_IN_API``. Any number of workers may run against one database.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import signal
+import socket
+import time
+import uuid
+from collections import Counter
+
+from fastapi import FastAPI
+from opentelemetry import metrics
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config.logging import setup_logging
+from src.config.settings import get_settings
+from src.database.session import async_session_maker, engine
+from src.jobs.queue import (
+    ClaimedJob,
+    claim_jobs,
+    complete_job,
+    fail_job,
+    prune_finished_jobs,
+    queue_depths,
+    reclaim_expired_jobs,
+    renew_job_lease,
+)
+from src.jobs.registry import JOB_SPECS, JobKind
+from src.observability import configure_observability
+from src.storage.factory import aclose_storage_providers
+
+
+logger = logging.getLogger(__name__)
+
+_meter = metrics.get_meter(__name__)
+_queue_depth = _meter.create_gauge(
+    "jobs.queue.depth",
+    unit="{job}",
+    description="Jobs per kind and state (ready, delayed, running) as last sampled by a worker",
+)
+_oldest_ready_age = _meter.create_gauge(
+    "jobs.queue.oldest_ready_age",
+    unit="s",
+    description="Age of the oldest job that is ready to run but not yet claimed",
+)
+_wait_duration = _meter.create_histogram(
+    "jobs.wait.duration",
+    unit="s",
+    description="Time a job was ready to run before a worker claimed it",
+)
+_run_duration = _meter.create_histogram(
+    "jobs.run.duration",
+    unit="s",
+    description="Handler run time per job attempt",
+)
+_finished_attempts = _meter.create_counter(
+    "jobs.attempts",
+    unit="{attempt}",
+    description="Finished job attempts by kind and outcome (succeeded, retrying, failed)",
+)
+
+# Lease reclaim, pruning and depth sampling do not need to run every poll.
+_MAINTENANCE_INTERVAL_SECONDS = 30.0
+# Running jobs renew their lease this many times per lease period, so one missed renewal is harmless.
+_LEASE_RENEWALS_PER_LEASE = 3
+
+
+class JobWorker:
+    """Claims jobs of every registered kind and runs them as asyncio tasks.
+
+    Each kind runs at most ``JobSpec.max_concurrency`` jobs in this process;
+    the same cap is enforced across processes when claiming. While a job runs,
+    its lease is renewed in the background, so only a stopped or stuck worker
+    lets it expire.
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory: async_sessionmaker[AsyncSession],
+        poll_interval_seconds: float,
+        retention_hours: int,
+        kinds: tuple[JobKind, ...] = tuple(JobKind),
+    ) -> None:
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._session_factory = session_factory
+        self._poll_interval_seconds = poll_interval_seconds
+        self._retention_hours = retention_hours
+        self._kinds = kinds
+        self._running: Counter[JobKind] = Counter()
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._wake = asyncio.Event()
+        self._stopping = asyncio.Event()
+        self._loop_task: asyncio.Task[None] | None = None
+        self._next_maintenance_at = 0.0
+
+    def start(self) -> None:
+        """Start the claim loop on the running event loop."""
+        if self._loop_task is None:
+            self._loop_task = asyncio.create_task(self.run(), name="jobs.worker")
+
+    async def stop(self, *, timeout_seconds: float = 30.0) -> None:
+        """Stop claiming and give running jobs ``timeout_seconds`` to finish.
+
+        Jobs still running afterwards are cancelled; their leases expire and
+        another worker picks them up again.
+        """
+        self._stopping.set()
+        self._wake.set()
+        if self._loop_task is not None:
+            await self._loop_task
+        if self._tasks:
+            _done, pending = await asyncio.wait(self._tasks, timeout=timeout_seconds)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        logger.info("jobs.worker.stopped", extra={"worker_id": self.worker_id})
+
+    async def run(self) -> None:
+        """Claim and dispatch jobs until :meth:`stop` is called."""
+        logger.info("jobs.worker.started", extra={"worker_id": self.worker_id, "kinds": [k.value for k in self._kinds]})
+        while not self._stopping.is_set():
+            try:
+                if time.monotonic() >= self._next_maintenance_at:
+                    await self._run_maintenance()
+                    self._next_maintenance_at = time.monotonic() + _MAINTENANCE_INTERVAL_SECONDS
+                claimed = await self._claim_round()
+            except SQLAlchemyError, OSError:
+                logger.warning("jobs.worker.poll_failed", extra={"worker_id": self.worker_id}, exc_info=True)
+                claimed = 0
+
+            if claimed:
+                continue
+            self._wake.clear()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), timeout=self._poll_interval_seconds)
+
+    async def _claim_round(self) -> int:
+        claimed = 0
+        for kind in self._kinds:
+            free_slots = JOB_SPECS[kind].max_concurrency - self._running[kind]
+            if free_slots <= 0:
+                continue
+            async with self._session_factory() as session:
+                jobs = await claim_jobs(session, kind, worker_id=self.worker_id, limit=free_slots)
+            for job in jobs:
+                self._dispatch(job)
+            claimed += len(jobs)
+        return claimed
+
+    def _dispatch(self, job: ClaimedJob) -> None:
+        _wait_duration.record(job.wait_seconds, {"kind": job.kind.value})
+        self._running[job.kind] += 1
+        task = asyncio.create_task(self._execute(job), name=f"jobs.{job.kind.value}.{job.id}")
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _execute(self, job: ClaimedJob) -> None:
+        started_at = time.perf_counter()
+        try:
+            outcome = await self._run_and_record(job)
+        finally:
+            self._running[job.kind] -= 1
+            self._wake.set()
+
+        duration_seconds = time.perf_counter() - started_at
+        _run_duration.record(duration_seconds, {"kind": job.kind.value, "outcome": outcome})
+        _finished_attempts.add(1, {"kind": job.kind.value, "outcome": outcome})
+        logger.info(
+            "jobs.attempt.finished",
+            extra={
+                "job_id": job.id,
+                "job_kind": job.kind.value,
+                "attempt": job.attempts,
+                "outcome": outcome,
+                "duration_ms": round(duration_seconds * 1000, 2),
+            },
+        )
+
+    async def _run_and_record(self, job: ClaimedJob) -> str:
+        heartbeat = asyncio.create_task(self._renew_lease(job), name=f"jobs.{job.kind.value}.{job.id}.lease")
+        try:
+            await JOB_SPECS[job.kind].handler(job.payload)
+        except Exception as error:  # noqa: BLE001 - any handler failure is recorded and retried
+            failure = error
+        else:
+            failure = None
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+
+        try:
+            async with self._session_factory() as session:
+                if failure is None:
+                    await complete_job(session, job, worker_id=self.worker_id)
+                    return "succeeded"
+                return await self._record_failure(session, job, failure)
+        except SQLAlchemyError:
+            # The lease expires and the job is retried by whichever worker reclaims it.
+            logger.warning(
+                "jobs.worker.result_not_recorded", extra={"job_id": job.id, "job_kind": job.kind.value}, exc_info=True
+            )
+            return "unrecorded"
+
+    async def _renew_lease(self, job: ClaimedJob) -> None:
+        interval_seconds = JOB_SPECS[job.kind].lease_seconds / _LEASE_RENEWALS_PER_LEASE
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                async with self._session_factory() as session:
+                    renewed = await renew_job_lease(session, job, worker_id=self.worker_id)
+            except SQLAlchemyError, OSError:
+                logger.warning(
+                    "jobs.worker.lease_renewal_failed",
+                    extra={"job_id": job.id, "job_kind": job.kind.value},
+                    exc_info=True,
+                )
+                continue
+            if not renewed:
+                # Reclaimed after an expiry; the job's result is no longer recorded by this worker.
+                logger.warning("jobs.worker.lease_lost", extra={"job_id": job.id, "job_kind": job.kind.value})
+                return
+
+    async def _record_failure(self, session: AsyncSession, job: ClaimedJob, error: Exception) -> str:
+        will_retry = await fail_job(session, job, worker_id=self.worker_id, error=f"{type(error).__name__}: {error}")
+        logger.log(
+            logging.WARNING if will_retry else logging.ERROR,
+            "jobs.attempt.failed",
+            extra={
+                "job_id": job.id,
+                "job_kind": job.kind.value,
+                "attempt": job.attempts,
+                "max_attempts": job.max_attempts,
+                "will_retry": will_retry,
+            },
+            exc_info=error,
+        )
+        return "retrying" if will_retry else "failed"
+
+    async def _run_maintenance(self) -> None:
+        async with self._session_factory() as session:
+            reclaimed = await reclaim_expired_jobs(session)
+            pruned = await prune_finished_jobs(session, retention_hours=self._retention_hours)
+            depths = await queue_depths(session)
+        if reclaimed or pruned:
+            logger.info("jobs.maintenance.completed", extra={"reclaimed": reclaimed, "pruned": pruned})
+        for depth in depths:
+            kind = depth.kind.value
+            _queue_depth.set(depth.ready, {"kind": kind, "state": "ready"})
+            _queue_depth.set(depth.queued - depth.ready, {"kind": kind, "state": "delayed"})
+            _queue_depth.set(depth.running, {"kind": kind, "state": "running"})
+            _oldest_ready_age.set(depth.oldest_ready_age_seconds, {"kind": kind})
+
+
+_embedded_worker: JobWorker | None = None
+
+
+def start_embedded_job_worker() -> None:
+    """Start a job worker inside the API process when ``JOBS_RUN_IN_API`` is enabled."""
+    global _embedded_worker  # noqa: PLW0603
+    settings = get_settings()
+    if not settings.JOBS_RUN_IN_API or _embedded_worker is not None:
+        return
+    _embedded_worker = JobWorker(
+        session_factory=async_session_maker,
+        poll_interval_seconds=settings.JOBS_POLL_INTERVAL_SECONDS,
+        retention_hours=settings.JOBS_RETENTION_HOURS,
+    )
+    _embedded_worker.start()
+
+
+async def stop_embedded_job_worker() -> None:
+    """Stop the API-embedded job worker, if one was started."""
+    global _embedded_worker
+    if _embedded_worker is None:
+        return
+    worker, _embedded_worker = _embedded_worker, None
+    await worker.stop()
+
+
+async def main() -> None:
+    """Run a standalone worker until SIGINT or SIGTERM."""
+    settings = get_settings()
+    # Exporters are configured per app; the worker has no routes, so it registers a bare one.
+    configure_observability(FastAPI(), settings=settings, engine=engine)
+
+    worker = JobWorker(
+        session_factory=async_session_maker,
+        poll_interval_seconds=settings.JOBS_POLL_INTERVAL_SECONDS,
+        retention_hours=settings.JOBS_RETENTION_HOURS,
+    )
+    stop_requested = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop_requested.set)
+
+    worker.start()
+    await stop_requested.wait()
+    await worker.stop()
+    await aclose_storage_providers()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    setup_logging(get_settings())
+    asyncio.run(main())
@@ -5,7 +5,9 @@ from collections.abc import Mapping
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.ai.context_assembly import ContextAssembly
 from src.courses.facade import CoursesFacade
+from src.database.session import async_session_maker
 from src.learning_capabilities import capability_registry
 from src.learning_capabilities.errors import LearningCapabilitiesBadRequestError
 from src.learning_capabilities.schemas import (
@@ -62,7 +64,10 @@ class LearningCapabilitiesFacade:  # noqa: PLR0904
             authorization_service=authorization_service,
             course_capability_port=CoursesFacade(session),
         )
-        self._context_packet_service = LearningContextPacketService(self._query_service)
+        self._context_packet_service = LearningContextPacketService(
+            self._query_service,
+            session_factory=async_session_maker,
+        )
 
     def list_capabilities(self) -> tuple[CapabilityDescriptor, ...]:
         """Return the stable capability registry."""
@@ -167,9 +172,14 @@ class LearningCapabilitiesFacade:  # noqa: PLR0904
         *,
         user_id: uuid.UUID,
         payload: BuildContextBundleCapabilityInput,
+        assembly: ContextAssembly | None = None,
     ) -> BuildContextBundleCapabilityOutput:
-        """Execute `build_context_bundle` capability."""
-        return await self._context_packet_service.build_context_bundle(user_id=user_id, payload=payload)
+        """Execute `build_context_bundle` capability, optionally as stages of the caller's context assembly."""
+        return await self._context_packet_service.build_context_bundle(
+            user_id=user_id,
+            payload=payload,
+            assembly=assembly,
+        )
 
     async def create_course(
         self,
@@ -1,16 +1,34 @@
 """Context packet assembly for assistant turns."""
 
 import uuid
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.ai.context_assembly import ContextAssembly
+from src.config.settings import get_settings
 from src.learning_capabilities.schemas import (
+    ActiveChatProbe,
+    ActiveProbeSuggestion,
+    AdaptiveCatalogEntry,
     BuildContextBundleCapabilityInput,
     BuildContextBundleCapabilityOutput,
+    ConceptFocus,
+    CourseCatalogEntry,
+    CourseFrontierState,
     CourseMatch,
+    CourseMode,
+    CourseOutlineState,
+    CourseState,
     GetCourseFrontierCapabilityInput,
     GetCourseOutlineStateCapabilityInput,
     GetCourseStateCapabilityInput,
+    LearnerProfileSignals,
+    LessonFocus,
     ListRelevantCoursesCapabilityInput,
+    SourceFocus,
 )
 from src.learning_capabilities.services.query_service import LearningCapabilityQueryService
 
@@ -18,126 +36,232 @@ from src.learning_capabilities.services.query_service import LearningCapabilityQ
 class LearningContextPacketService:
     """Build compact capability-backed context packets."""
 
-    def __init__(self, query_service: LearningCapabilityQueryService) -> None:
+    def __init__(
+        self,
+        query_service: LearningCapabilityQueryService,
+        *,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
         self._query_service = query_service
+        self._session_factory = session_factory
 
-    async def build_context_bundle(  # noqa: PLR0914
+    @asynccontextmanager
+    async def _scoped_query_service(self, assembly: ContextAssembly) -> AsyncGenerator[LearningCapabilityQueryService]:
+        """Yield a query service on its own short session so a read-only lookup can run concurrently."""
+        async with assembly.session_slot(), self._session_factory() as session:
+            yield LearningCapabilityQueryService(session)
+
+    async def build_context_bundle(
         self,
         *,
         user_id: uuid.UUID,
         payload: BuildContextBundleCapabilityInput,
+        assembly: ContextAssembly | None = None,
+    ) -> BuildContextBundleCapabilityOutput:
+        """Build a compact context packet for one assistant request.
+
+        Read-only lookups run concurrently, each on its own session. Optional
+        parts (related courses, catalogs, outline, sources, probe suggestion,
+        frontier) are dropped when they miss the assistant context budget.
+        Given the turn's ``assembly``, lookups run as its stages under its one
+        budget and session cap instead of a nested assembly of their own.
+        """
+        if assembly is not None:
+            return await self._build_context_bundle(assembly, user_id=user_id, payload=payload)
+        settings = get_settings()
+        async with ContextAssembly(
+            "learning_context_bundle",
+            budget_seconds=settings.ASSISTANT_CONTEXT_BUDGET_SECONDS,
+            max_sessions=settings.ASSISTANT_CONTEXT_MAX_SESSIONS,
+        ) as own_assembly:
+            return await self._build_context_bundle(own_assembly, user_id=user_id, payload=payload)
+
+    async def _build_context_bundle(
+        self,
+        assembly: ContextAssembly,
+        *,
+        user_id: uuid.UUID,
+        payload: BuildContextBundleCapabilityInput,
     ) -> BuildContextBundleCapabilityOutput:
-        """Build a compact context packet for one assistant request."""
         selected_quote = payload.selected_quote or _extract_leading_blockquote(payload.latest_user_text)
         query_text = (selected_quote or payload.latest_user_text or "").strip()
-        context_id = payload.context_id
         context_type = payload.context_type
-        relevant_courses = []
-        if query_text:
-            include_archived = context_type == "course"
-            relevant_courses = (
-                await self._query_service.list_relevant_courses(
+        relevant_courses_task = assembly.start(
+            "relevant_courses",
+            self._list_relevant_courses(assembly, user_id=user_id, query_text=query_text, context_type=context_type),
+        )
+        bundle = BuildContextBundleCapabilityOutput(
+            app_surface=context_type,
+            context_type=context_type,
+            context_id=payload.context_id,
+            selected_quote=selected_quote or None,
+            generated_at=datetime.now(UTC),
+        )
+        if context_type is None:
+            await self._add_catalogs(assembly, bundle, user_id=user_id)
+        elif context_type == "course" and payload.context_id is not None:
+            await self._add_course_context(
+                assembly,
+                bundle,
+                user_id=user_id,
+                course_id=payload.context_id,
+                payload=payload,
+                query_text=query_text,
+            )
+        bundle.relevant_courses = await assembly.optional(relevant_courses_task) or []
+
+        course_state = bundle.course_state
+        if course_state is not None and not bundle.relevant_courses:
+            bundle.relevant_courses = [
+                CourseMatch(
+                    id=course_state.course_id,
+                    title=course_state.title,
+                    description=course_state.description,
+                    adaptive_enabled=course_state.adaptive_enabled,
+                    completion_percentage=course_state.completion_percentage,
+                )
+            ]
+        bundle.generated_at = datetime.now(UTC)
+        return bundle
+
+    async def _list_relevant_courses(
+        self,
+        assembly: ContextAssembly,
+        *,
+        user_id: uuid.UUID,
+        query_text: str,
+        context_type: str | None,
+    ) -> list[CourseMatch]:
+        if not query_text:
+            return []
+        async with self._scoped_query_service(assembly) as query_service:
+            return (
+                await query_service.list_relevant_courses(
                     user_id=user_id,
                     payload=ListRelevantCoursesCapabilityInput(query=query_text, limit=6),
-                    include_archived=include_archived,
+                    include_archived=context_type == "course",
                 )
             ).items
 
-        course_state = None
-        course_mode = None
-        learner_profile = None
-        concept_focus = None
-        lesson_focus = None
-        source_focus = None
-        active_probe_suggestion = None
-        active_chat_probe = None
-        course_outline = None
-        frontier_state = None
-        course_catalog = None
-        adaptive_catalog = None
+    async def _add_catalogs(
+        self,
+        assembly: ContextAssembly,
+        bundle: BuildContextBundleCapabilityOutput,
+        *,
+        user_id: uuid.UUID,
+    ) -> None:
+        async def course_catalog() -> list[CourseCatalogEntry]:
+            async with self._scoped_query_service(assembly) as query_service:
+                return await query_service.list_course_catalog(user_id=user_id)
 
-        if context_type is None:
-            course_catalog = await self._query_service.list_course_catalog(user_id=user_id)
-            adaptive_catalog = await self._query_service.list_adaptive_catalog(user_id=user_id)
+        async def adaptive_catalog() -> list[AdaptiveCatalogEntry]:
+            async with self._scoped_query_service(assembly) as query_service:
+                return await query_service.list_adaptive_catalog(user_id=user_id)
 
-        if context_type == "course" and context_id is not None:
-            course_state = (
-                await self._query_service.get_course_state(
-                    user_id=user_id,
-                    payload=GetCourseStateCapabilityInput(course_id=context_id),
-                )
-            ).state
-            course_outline = (
-                await self._query_service.get_course_outline_state(
+        course_catalog_task = assembly.start("course_catalog", course_catalog())
+        adaptive_catalog_task = assembly.start("adaptive_catalog", adaptive_catalog())
+        bundle.course_catalog = await assembly.optional(course_catalog_task)
+        bundle.adaptive_catalog = await assembly.optional(adaptive_catalog_task)
+
+    async def _add_course_context(
+        self,
+        assembly: ContextAssembly,
+        bundle: BuildContextBundleCapabilityOutput,
+        *,
+        user_id: uuid.UUID,
+        course_id: uuid.UUID,
+        payload: BuildContextBundleCapabilityInput,
+        query_text: str,
+    ) -> None:
+        lesson_id = _parse_lesson_id(payload.context_meta.get("lesson_id"))
+
+        async def course_state() -> CourseState:
+            async with self._scoped_query_service(assembly) as query_service:
+                return (
+                    await query_service.get_course_state(
+                        user_id=user_id,
+                        payload=GetCourseStateCapabilityInput(course_id=course_id),
+                    )
+                ).state
+
+        async def course_outline() -> CourseOutlineState:
+            async with self._scoped_query_service(assembly) as query_service:
+                return (
+                    await query_service.get_course_outline_state(
+                        user_id=user_id,
+                        payload=GetCourseOutlineStateCapabilityInput(course_id=course_id),
+                    )
+                ).state
+
+        async def mode_aware_focus() -> tuple[
+            CourseMode, LearnerProfileSignals | None, ConceptFocus | None, LessonFocus | None
+        ]:
+            async with self._scoped_query_service(assembly) as query_service:
+                return await query_service.get_mode_aware_focus(
                     user_id=user_id,
-                    payload=GetCourseOutlineStateCapabilityInput(course_id=context_id),
+                    course_id=course_id,
+                    lesson_id=lesson_id,
+                    latest_user_text=payload.latest_user_text,
                 )
-            ).state
-            lesson_id = _parse_lesson_id(payload.context_meta.get("lesson_id"))
-            course_mode, learner_profile, concept_focus, lesson_focus = await self._query_service.get_mode_aware_focus(
+
+        async def source_focus() -> SourceFocus | None:
+            async with self._scoped_query_service(assembly) as query_service:
+                return await query_service.get_source_focus(user_id=user_id, course_id=course_id, query_text=query_text)
+
+        course_state_task = assembly.start("course_state", course_state())
+        course_outline_task = assembly.start("course_outline", course_outline())
+        focus_task = assembly.start("mode_aware_focus", mode_aware_focus())
+        source_focus_task = assembly.start("source_focus", source_focus())
+
+        async def active_chat_probe() -> ActiveChatProbe | None:
+            course_mode = (await focus_task)[0]
+            if course_mode != "adaptive" or lesson_id is None:
+                return None
+            # Runs on the request session: it may expire an invalid probe, and that write must commit with the turn.
+            return await self._query_service.get_active_chat_probe(
                 user_id=user_id,
-                course_id=context_id,
+                course_id=course_id,
+                thread_id=_parse_lesson_id(payload.context_meta.get("thread_id")),
                 lesson_id=lesson_id,
-                latest_user_text=payload.latest_user_text,
-            )
-            source_focus = await self._query_service.get_source_focus(
-                user_id=user_id,
-                course_id=context_id,
-                query_text=query_text,
             )
-            if course_mode == "adaptive" and lesson_id is not None:
-                active_chat_probe = await self._query_service.get_active_chat_probe(
-                    user_id=user_id,
-                    course_id=context_id,
-                    thread_id=_parse_lesson_id(payload.context_meta.get("thread_id")),
-                    lesson_id=lesson_id,
-                )
-            if course_mode == "adaptive":
-                active_probe_suggestion = await self._query_service.get_active_probe_suggestion(
+
+        async def active_probe_suggestion() -> ActiveProbeSuggestion | None:
+            course_mode, _profile, concept_focus, _lesson_focus = await focus_task
+            if course_mode != "adaptive":
+                return None
+            async with self._scoped_query_service(assembly) as query_service:
+                return await query_service.get_active_probe_suggestion(
                     user_id=user_id,
-                    course_id=context_id,
+                    course_id=course_id,
                     course_mode=course_mode,
                     concept_focus=concept_focus,
                     latest_user_text=payload.latest_user_text,
                 )
-                frontier_state = (
-                    await self._query_service.get_course_frontier(
+
+        async def frontier_state() -> CourseFrontierState | None:
+            if (await focus_task)[0] != "adaptive":
+                return None
+            async with self._scoped_query_service(assembly) as query_service:
+                return (
+                    await query_service.get_course_frontier(
                         user_id=user_id,
-                        payload=GetCourseFrontierCapabilityInput(course_id=context_id),
+                        payload=GetCourseFrontierCapabilityInput(course_id=course_id),
                     )
                 ).state
 
-            if not relevant_courses:
-                relevant_courses = [
-                    CourseMatch(
-                        id=course_state.course_id,
-                        title=course_state.title,
-                        description=course_state.description,
-                        adaptive_enabled=course_state.adaptive_enabled,
-                        completion_percentage=course_state.completion_percentage,
-                    )
-                ]
+        active_chat_probe_task = assembly.start("active_chat_probe", active_chat_probe())
+        suggestion_task = assembly.start("active_probe_suggestion", active_probe_suggestion())
+        frontier_task = assembly.start("frontier_state", frontier_state())
 
-        return BuildContextBundleCapabilityOutput(
-            app_surface=context_type,
-            context_type=context_type,
-            context_id=context_id,
-            selected_quote=selected_quote or None,
-            relevant_courses=relevant_courses,
-            course_catalog=course_catalog,
-            adaptive_catalog=adaptive_catalog,
-            course_state=course_state,
-            course_mode=course_mode,
-            learner_profile=learner_profile,
-            concept_focus=concept_focus,
-            lesson_focus=lesson_focus,
-            source_focus=source_focus,
-            active_probe_suggestion=active_probe_suggestion,
-            active_chat_probe=active_chat_probe,
-            course_outline=course_outline,
-            frontier_state=frontier_state,
-            generated_at=datetime.now(UTC),
+        bundle.course_state = await assembly.required(course_state_task)
+        bundle.course_mode, bundle.learner_profile, bundle.concept_focus, bundle.lesson_focus = await assembly.required(
+            focus_task
         )
+        bundle.active_chat_probe = await assembly.required(active_chat_probe_task)
+        bundle.course_outline = await assembly.optional(course_outline_task)
+        bundle.source_focus = await assembly.optional(source_focus_task)
+        bundle.active_probe_suggestion = await assembly.optional(suggestion_task)
+        bundle.frontier_state = await assembly.optional(frontier_task)
 
 
 def _extract_leading_blockquote(text: str) -> str:
@@ -21,7 +21,9 @@ from starlette.routing import Match
 from .ai.assistant.router import router as assistant_router
 from .ai.client import cleanup_ai_background_tasks
 from .ai.litellm_config import cleanup_litellm_async_clients
+from .ai.mcp.client import shutdown_mcp_client
 from .ai.mcp.router import router as mcp_router
+from .ai.rag.ingest_pool import shutdown_ingest_pool
 from .ai.rag.router import router as rag_router
 from .auth.router import router as auth_router
 from .auth.security import get_session_signing_key
@@ -36,10 +38,12 @@ setup_logging(get_settings())
 logger = logging.getLogger(__name__)
 from .content.router import router as content_router
 from .courses.router import router as courses_router
+from .courses.services.latex_verification_pool import get_latex_verification_pool, shutdown_latex_verification_pool
 from .database.migrate import apply_migrations, assert_migrations_current, validate_vector_schema_dimensions
 from .database.session import DbSession, engine
 from .exceptions import DomainError, ErrorCategory, ErrorCode
 from .highlights.router import router as highlights_router
+from .jobs.worker import start_embedded_job_worker, stop_embedded_job_worker
 from .middleware.error_handlers import (
     ExternalServiceError,
     format_error_response,
@@ -55,6 +59,7 @@ from .middleware.security import SimpleSecurityMiddleware
 from .observability import configure_observability
 from .observability.log_context import update_log_context
 from .progress.router import router as progress_router
+from .storage.factory import aclose_storage_providers
 from .tagging.router import router as tagging_router
 from .upload_sessions.router import router as upload_sessions_router
 from .user.router import router as user_router
@@ -99,15 +104,42 @@ async def _startup() -> None:
     await validate_vector_schema_dimensions(engine)
     logger.info("startup.vector_schema.checked")
 
+    start_embedded_job_worker()
+
+    try:
+        await get_latex_verification_pool().warm_up()
+        logger.debug("startup.latex_verification_pool.warmed")
+    except (OSError, RuntimeError):
+        # Answers start the workers themselves if they could not be started here.
+        logger.warning("startup.latex_verification_pool.warm_up_failed", exc_info=True)
+
 
 async def _shutdown() -> None:
     """Release resources on shutdown."""
+    try:
+        await stop_embedded_job_worker()
+        logger.debug("shutdown.job_worker.stopped")
+    except (RuntimeError, TimeoutError, SQLAlchemyError):
+        logger.warning("shutdown.job_worker.stop_failed", exc_info=True)
+
+    try:
+        await aclose_storage_providers()
+        logger.debug("shutdown.storage_clients.closed")
+    except (OSError, RuntimeError):
+        logger.warning("shutdown.storage_clients.close_failed", exc_info=True)
+
     try:
         await cleanup_ai_background_tasks()
         logger.debug("shutdown.ai_background_tasks.cleaned")
     except (RuntimeError, TimeoutError, TypeError, ValueError):
         logger.warning("shutdown.ai_background_tasks.cleanup_failed", exc_info=True)
 
+    try:
+        await shutdown_mcp_client()
+        logger.debug("shutdown.mcp_client.closed")
+    except (OSError, RuntimeError):
+        logger.warning("shutdown.mcp_client.close_failed", exc_info=True)
+
     try:
         await cleanup_litellm_async_clients()
         logger.debug("shutdown.litellm.cleaned")
@@ -122,6 +154,18 @@ async def _shutdown() -> None:
     except (RuntimeError, TimeoutError, TypeError, ValueError):
         logger.warning("shutdown.memory.cleanup_failed", exc_info=True)
 
+    try:
+        shutdown_ingest_pool()
+        logger.debug("shutdown.rag_ingest_pool.stopped")
+    except (OSError, RuntimeError):
+        logger.warning("shutdown.rag_ingest_pool.stop_failed", exc_info=True)
+
+    try:
+        shutdown_latex_verification_pool()
+        logger.debug("shutdown.latex_verification_pool.stopped")
+    except (OSError, RuntimeError):
+        logger.warning("shutdown.latex_verification_pool.stop_failed", exc_info=True)
+
     try:
         await engine.dispose()
         logger.debug("shutdown.database_engine.disposed")
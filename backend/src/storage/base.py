@@ -1,7 +1,22 @@
 """Abstract storage interface for different storage providers."""
 
+import os
+import tempfile
 from abc import ABC, abstractmethod
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, suppress
 from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Protocol
+
+import aiofiles
+import aiofiles.os
+
+
+# Chunk size for streamed reads and the part size for multipart uploads.
+# S3-compatible APIs require every part except the last to be at least 5 MiB.
+STREAM_CHUNK_SIZE = 1024 * 1024
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
 
 
 @dataclass(frozen=True, slots=True)
@@ -13,8 +28,23 @@ class StorageUploadSession:
     headers: dict[str, str] = field(default_factory=dict)
 
 
+class StorageReadStream(Protocol):
+    """Incremental reader over one stored object or byte range."""
+
+    content_length: int | None
+
+    async def read(self, size: int = -1) -> bytes:
+        """Read up to ``size`` bytes, or the rest of the stream when negative; ``b""`` at the end."""
+        ...
+
+
 class AbstractStorage(ABC):
-    """Abstract base class for storage providers."""
+    """Abstract base class for storage providers.
+
+    Besides whole-object ``upload``/``download``, providers stream reads
+    (``open_read``, ``iter_chunks``, ``read_range``) and writes
+    (``upload_stream``) so large files move in constant memory.
+    """
 
     @abstractmethod
     async def upload(self, file_content: bytes, key: str) -> None:
@@ -69,3 +99,92 @@ class AbstractStorage(ABC):
     async def create_upload_session(self, *, key: str, content_type: str, content_length: int | None = None) -> StorageUploadSession:
         """Create a direct upload session for a storage key."""
         raise NotImplementedError
+
+    @abstractmethod
+    def open_read(
+        self, key: str, *, start: int = 0, end: int | None = None
+    ) -> AbstractAsyncContextManager[StorageReadStream]:
+        """Open a streaming reader over bytes ``[start, end)`` of an object (to the end when ``end`` is None).
+
+        Raises
+        ------
+            StorageFileNotFoundError: If the file is not found.
+            FileDownloadError: If the read fails.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def upload_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        key: str,
+        *,
+        content_type: str | None = None,
+        part_size: int = MULTIPART_PART_SIZE,
+    ) -> int:
+        """Upload an object from an async byte stream without buffering it whole.
+
+        Cloud providers use a multipart upload with ``part_size`` parts, so at
+        most one part is held in memory. Returns the number of bytes written.
+
+        Raises
+        ------
+            FileUploadError: If the upload fails; partial uploads are discarded.
+        """
+        raise NotImplementedError
+
+    async def iter_chunks(
+        self,
+        key: str,
+        *,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        start: int = 0,
+        end: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Yield an object (or the byte range ``[start, end)``) in chunks of at most ``chunk_size`` bytes."""
+        # Close the reader deterministically via ``contextlib.aclosing`` when breaking out early.
+        async with self.open_read(key, start=start, end=end) as stream:
+            while chunk := await stream.read(chunk_size):
+                yield chunk  # noqa: ASYNC119
+
+    async def read_range(self, key: str, start: int, end: int) -> bytes:
+        """Return bytes ``[start, end)`` of an object with a single ranged request."""
+        if end <= start:
+            return b""
+        async with self.open_read(key, start=start, end=end) as stream:
+            return await stream.read()
+
+    @asynccontextmanager
+    async def download_to_temp_file(self, key: str, *, suffix: str = "") -> AsyncGenerator[Path]:
+        """Stream an object into a temporary file that is removed when the context exits.
+
+        For consumers such as PyMuPDF that can read from a path, this keeps
+        memory flat regardless of object size.
+        """
+        file_descriptor, temp_name = tempfile.mkstemp(suffix=suffix)
+        os.close(file_descriptor)
+        path = Path(temp_name)
+        try:
+            async with aiofiles.open(path, "wb") as temp_file, self.open_read(key) as stream:
+                while chunk := await stream.read(STREAM_CHUNK_SIZE):
+                    await temp_file.write(chunk)
+            yield path
+        finally:
+            with suppress(FileNotFoundError):
+                await aiofiles.os.remove(path)
+
+    def local_path(
+        self, key: str, *, content_hash: str | None = None, suffix: str = ""
+    ) -> AbstractAsyncContextManager[Path]:
+        """Yield a local filesystem path holding the object, valid until the context exits.
+
+        Remote providers download to a temp file; local storage and the disk
+        cache return their own file, which readers like PyMuPDF can map directly.
+        ``content_hash`` lets caches tell a replaced object from the cached copy.
+        """
+        del content_hash
+        return self.download_to_temp_file(key, suffix=suffix)
+
+    async def aclose(self) -> None:
+        """Release pooled connections; the provider reconnects lazily if used again."""
+        return
@@ -0,0 +1,227 @@
+"""Size-bounded local read-through disk cache in front of a remote storage provider."""
+
+import asyncio
+import hashlib
+import logging
+import re
+import uuid
+from collections import Counter, OrderedDict
+from collections.abc import AsyncGenerator, AsyncIterable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, suppress
+from pathlib import Path
+
+import aiofiles
+import aiofiles.os
+from opentelemetry import metrics
+
+from .base import MULTIPART_PART_SIZE, STREAM_CHUNK_SIZE, AbstractStorage, StorageReadStream, StorageUploadSession
+
+
+logger = logging.getLogger(__name__)
+
+_meter = metrics.get_meter(__name__)
+_cache_lookups = _meter.create_counter(
+    "storage.disk_cache.lookups",
+    unit="1",
+    description="Disk cache lookups for remote storage objects, by result",
+)
+_cache_evicted_bytes = _meter.create_counter(
+    "storage.disk_cache.evicted",
+    unit="By",
+    description="Bytes evicted from the storage disk cache",
+)
+
+_SAFE_SUFFIX = re.compile(r"\.[A-Za-z0-9]{1,10}")
+_TEMP_FILE_PREFIX = "."
+
+
+def _key_digest(key: str) -> str:
+    return hashlib.sha256(key.encode()).hexdigest()[:32]
+
+
+class DiskCachedStorage(AbstractStorage):
+    """Remote provider wrapper that keeps recently processed objects on local disk.
+
+    Entries are keyed by storage key plus content hash, so a replaced object is
+    never served stale; objects read without a content hash are not cached, and
+    uploads drop the key's old entries. Fills are written to a temp name and renamed into place;
+    the least recently used entries are evicted once the cache exceeds
+    ``max_bytes``, except those currently handed out by :meth:`local_path`.
+    The bound is per process: the API and a standalone worker sharing a
+    directory each track their own fills.
+    """
+
+    def __init__(self, inner: AbstractStorage, *, cache_dir: str | Path, max_bytes: int) -> None:
+        self.inner = inner
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        self._pins: Counter[str] = Counter()
+        self._fill_locks: dict[str, asyncio.Lock] = {}
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._load_entries()
+
+    def _load_entries(self) -> None:
+        """Index entries left by a previous run, oldest first, and drop interrupted fills."""
+        files: list[tuple[float, str, int]] = []
+        for path in self.cache_dir.iterdir():
+            if not path.is_file():
+                continue
+            if path.name.startswith(_TEMP_FILE_PREFIX):
+                path.unlink(missing_ok=True)
+                continue
+            stat = path.stat()
+            files.append((stat.st_mtime, path.name, stat.st_size))
+        for _mtime, name, size in sorted(files):
+            self._entries[name] = size
+            self._total_bytes += size
+        self._evict()
+
+    @staticmethod
+    def _entry_name(key: str, content_hash: str, suffix: str) -> str:
+        hash_digest = hashlib.sha256(content_hash.encode()).hexdigest()[:16]
+        safe_suffix = suffix if _SAFE_SUFFIX.fullmatch(suffix) else ""
+        return f"{_key_digest(key)}-{hash_digest}{safe_suffix}"
+
+    @asynccontextmanager
+    async def local_path(self, key: str, *, content_hash: str | None = None, suffix: str = "") -> AsyncGenerator[Path]:
+        """Yield the cached copy of ``key``, downloading it on a miss; pinned until the context exits.
+
+        Objects without a ``content_hash``, or larger than the whole cache,
+        bypass it via a temp-file download.
+        """
+        if content_hash is None:
+            async with self.inner.local_path(key, suffix=suffix) as uncached_path:
+                yield uncached_path
+            return
+
+        name = self._entry_name(key, content_hash, suffix)
+        self._pins[name] += 1
+        try:
+            path = await self._ensure_entry(key, name)
+            if path is None:
+                async with self.inner.local_path(key, content_hash=content_hash, suffix=suffix) as uncached_path:
+                    yield uncached_path
+            else:
+                yield path
+        finally:
+            self._pins[name] -= 1
+            if self._pins[name] <= 0:
+                del self._pins[name]
+
+    async def _ensure_entry(self, key: str, name: str) -> Path | None:
+        lock = self._fill_locks.setdefault(name, asyncio.Lock())
+        async with lock:
+            path = self.cache_dir / name
+            if name in self._entries and await aiofiles.os.path.exists(path):
+                self._entries.move_to_end(name)
+                _cache_lookups.add(1, {"result": "hit"})
+                return path
+
+            self._forget(name)
+            _cache_lookups.add(1, {"result": "miss"})
+            size = await self._fill(key, path)
+        if not lock.locked():
+            self._fill_locks.pop(name, None)
+        if size is None:
+            logger.info("storage.disk_cache.bypassed", extra={"storage_key": key, "max_bytes": self.max_bytes})
+            return None
+
+        self._entries[name] = size
+        self._total_bytes += size
+        self._evict()
+        return path
+
+    async def _fill(self, key: str, path: Path) -> int | None:
+        """Stream ``key`` into ``path`` atomically; None when the object is too large to cache."""
+        temp_path = path.with_name(f"{_TEMP_FILE_PREFIX}{path.name}.{uuid.uuid4().hex}.part")
+        size = 0
+        try:
+            async with self.inner.open_read(key) as stream, aiofiles.open(temp_path, "wb") as temp_file:
+                if stream.content_length is not None and stream.content_length > self.max_bytes:
+                    return None
+                while chunk := await stream.read(STREAM_CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > self.max_bytes:
+                        return None
+                    await temp_file.write(chunk)
+            await aiofiles.os.replace(temp_path, path)
+        finally:
+            with suppress(FileNotFoundError):
+                await aiofiles.os.remove(temp_path)
+        return size
+
+    def _forget(self, name: str) -> None:
+        size = self._entries.pop(name, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    def _evict(self) -> None:
+        """Drop least recently used, unpinned entries until the cache fits its budget."""
+        for name in list(self._entries):
+            if self._total_bytes <= self.max_bytes:
+                return
+            if self._pins[name]:
+                continue
+            size = self._entries.pop(name)
+            self._total_bytes -= size
+            (self.cache_dir / name).unlink(missing_ok=True)
+            _cache_evicted_bytes.add(size)
+
+    def _invalidate_key(self, key: str) -> None:
+        prefix = f"{_key_digest(key)}-"
+        for name in [name for name in self._entries if name.startswith(prefix) and not self._pins[name]]:
+            self._forget(name)
+            (self.cache_dir / name).unlink(missing_ok=True)
+
+    async def upload(self, file_content: bytes, key: str) -> None:
+        """Upload to the remote provider and drop cached copies of the replaced object."""
+        await self.inner.upload(file_content, key)
+        self._invalidate_key(key)
+
+    async def get_download_url(self, key: str) -> str:
+        """Return the remote provider's download URL."""
+        return await self.inner.get_download_url(key)
+
+    async def download(self, key: str) -> bytes:
+        """Download from the remote provider."""
+        return await self.inner.download(key)
+
+    async def delete(self, key: str) -> None:
+        """Delete from the remote provider and drop any cached copies."""
+        await self.inner.delete(key)
+        self._invalidate_key(key)
+
+    async def create_upload_session(
+        self,
+        *,
+        key: str,
+        content_type: str,
+        content_length: int | None = None,
+    ) -> StorageUploadSession:
+        """Create a direct upload session with the remote provider."""
+        return await self.inner.create_upload_session(key=key, content_type=content_type, content_length=content_length)
+
+    def open_read(
+        self, key: str, *, start: int = 0, end: int | None = None
+    ) -> AbstractAsyncContextManager[StorageReadStream]:
+        """Stream from the remote provider."""
+        return self.inner.open_read(key, start=start, end=end)
+
+    async def upload_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        key: str,
+        *,
+        content_type: str | None = None,
+        part_size: int = MULTIPART_PART_SIZE,
+    ) -> int:
+        """Stream an upload to the remote provider and drop cached copies of the replaced object."""
+        size = await self.inner.upload_stream(chunks, key, content_type=content_type, part_size=part_size)
+        self._invalidate_key(key)
+        return size
+
+    async def aclose(self) -> None:
+        """Close the remote provider's pooled connections."""
+        await self.inner.aclose()
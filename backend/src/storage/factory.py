@@ -1,10 +1,12 @@
 """Storage provider factory for creating the appropriate storage instance."""
 
 from functools import lru_cache
+from pathlib import Path
 
 from src.config import get_settings
 
 from .base import AbstractStorage
+from .disk_cache import DiskCachedStorage
 from .gcs import GCSStorage
 from .local import LocalStorage
 from .r2 import R2Storage
@@ -14,13 +16,14 @@ STORAGE_PROVIDER_LOCAL = "local"
 STORAGE_PROVIDER_R2 = "r2"
 STORAGE_PROVIDER_GCS = "gcs"
 
+_created_providers: list[AbstractStorage] = []
+
 
 def get_default_storage_provider_name() -> str:
     """Return the normalized provider used for new writes."""
     return get_settings().STORAGE_PROVIDER.lower()
 
 
-@lru_cache
 def get_storage_provider(provider_name: str | None = None) -> AbstractStorage:
     """Get a cached storage provider instance by name.
 
@@ -30,10 +33,35 @@ def get_storage_provider(provider_name: str | None = None) -> AbstractStorage:
 
     Note:
         This function is cached to ensure we reuse the same instance
-        throughout the application lifecycle.
+        throughout the application lifecycle. The default provider and the
+        same provider requested by name share one instance and client pool.
     """
+    return _get_storage_provider((provider_name or get_settings().STORAGE_PROVIDER).lower())
+
+
+@lru_cache
+def _get_storage_provider(provider: str) -> AbstractStorage:
+    storage = _create_storage_provider(provider)
+    settings = get_settings()
+    if settings.STORAGE_CACHE_DIR and not isinstance(storage, LocalStorage):
+        # One subdirectory per provider so equal keys in different buckets never collide.
+        storage = DiskCachedStorage(
+            storage,
+            cache_dir=Path(settings.STORAGE_CACHE_DIR) / provider,
+            max_bytes=settings.STORAGE_CACHE_MAX_MB * 1024 * 1024,
+        )
+    _created_providers.append(storage)
+    return storage
+
+
+async def aclose_storage_providers() -> None:
+    """Close the pooled connections of every provider handed out so far."""
+    for storage in _created_providers:
+        await storage.aclose()
+
+
+def _create_storage_provider(provider: str) -> AbstractStorage:
     settings = get_settings()
-    provider = (provider_name or settings.STORAGE_PROVIDER).lower()
 
     if provider == STORAGE_PROVIDER_LOCAL:
         return LocalStorage(base_path=settings.LOCAL_STORAGE_PATH)
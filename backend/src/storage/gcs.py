@@ -19,42 +19,27 @@ References
 - https://cloud.google.com/storage/docs/xml-api/post-object-multipart
 """
 
-from contextlib import AbstractAsyncContextManager
-from typing import Protocol, cast
+from collections.abc import AsyncGenerator, AsyncIterable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, nullcontext
 
-import aioboto3
 from botocore.client import Config
 from botocore.exceptions import ClientError
 
-from .base import AbstractStorage, StorageUploadSession
+from .base import MULTIPART_PART_SIZE, AbstractStorage, StorageReadStream, StorageUploadSession
 from .exceptions import (
     FileDeleteError,
     FileDownloadError,
     FileUploadError,
     StorageFileNotFoundError,
 )
-
-
-class _S3Body(Protocol):
-    async def read(self) -> bytes: ...
-
-
-class _S3Client(Protocol):
-    async def put_object(self, **kwargs: object) -> object: ...
-
-    async def get_object(self, **kwargs: object) -> dict[str, _S3Body]: ...
-
-    async def delete_object(self, **kwargs: object) -> object: ...
-
-    async def generate_presigned_url(self, **kwargs: object) -> str: ...
-
-    async def create_multipart_upload(self, **kwargs: object) -> dict[str, str]: ...
-
-    async def complete_multipart_upload(self, **kwargs: object) -> dict[str, object]: ...
-
-    async def abort_multipart_upload(self, **kwargs: object) -> object: ...
-
-    async def list_parts(self, **kwargs: object) -> dict[str, object]: ...
+from .s3_compat import (
+    PooledS3Client,
+    _S3Client,
+    get_object_stream,
+    is_missing_key_error,
+    read_object,
+    upload_object_stream,
+)
 
 
 class GCSStorage(AbstractStorage):
@@ -74,7 +59,13 @@ class GCSStorage(AbstractStorage):
         self.hmac_access_key_id = hmac_access_key_id
         self.hmac_secret_key = hmac_secret_key
         self.region = region
-        self._session = aioboto3.Session()
+        self._client_pool = PooledS3Client(
+            endpoint_url=self._ENDPOINT_URL,
+            access_key_id=hmac_access_key_id,
+            secret_access_key=hmac_secret_key,
+            region=region,
+            config=self._BOTO_CONFIG,
+        )
 
     # boto3 1.36+ auto-injects x-amz-checksum-* headers on PUT which GCS XML
     # API rejects with SignatureDoesNotMatch.  Disable auto checksums so
@@ -86,18 +77,12 @@ class GCSStorage(AbstractStorage):
     )
 
     async def _get_client(self) -> AbstractAsyncContextManager[_S3Client]:
-        """Return an async S3 client configured for GCS XML API."""
-        return cast(
-            "AbstractAsyncContextManager[_S3Client]",
-            self._session.client(
-                "s3",
-                endpoint_url=self._ENDPOINT_URL,
-                aws_access_key_id=self.hmac_access_key_id,
-                aws_secret_access_key=self.hmac_secret_key,
-                region_name=self.region,
-                config=self._BOTO_CONFIG,
-            ),
-        )
+        """Return the pooled S3 client configured for GCS XML API; exiting the context leaves it open."""
+        return nullcontext(await self._client_pool.get())
+
+    async def aclose(self) -> None:
+        """Close the pooled S3 client."""
+        await self._client_pool.aclose()
 
     async def upload(self, file_content: bytes, key: str) -> None:
         """Upload file content to GCS via simple PUT."""
@@ -116,8 +101,12 @@ class GCSStorage(AbstractStorage):
         """Download file content from GCS."""
         try:
             async with await self._get_client() as client:
-                response = await client.get_object(Bucket=self.bucket_name, Key=key)
-                return await response["Body"].read()
+                return await read_object(
+                    client,
+                    bucket=self.bucket_name,
+                    key=key,
+                    error_message=f"Failed to download from GCS: {key}",
+                )
         except ClientError as e:
             if e.response.get("Error", {}).get("Code") == "NoSuchKey":
                 msg = f"File not found: {key}"
@@ -125,6 +114,53 @@ class GCSStorage(AbstractStorage):
             msg = f"Failed to download from GCS: {key}"
             raise FileDownloadError(msg) from e
 
+    @asynccontextmanager
+    async def open_read(self, key: str, *, start: int = 0, end: int | None = None) -> AsyncGenerator[StorageReadStream]:
+        """Stream an object (or a byte range of it) from GCS over one ranged GET."""
+        try:
+            async with await self._get_client() as client:
+                stream = await get_object_stream(
+                    client,
+                    bucket=self.bucket_name,
+                    key=key,
+                    start=start,
+                    end=end,
+                    error_message=f"Failed to download from GCS: {key}",
+                )
+        except ClientError as e:
+            if is_missing_key_error(e):
+                msg = f"File not found: {key}"
+                raise StorageFileNotFoundError(msg) from e
+            msg = f"Failed to download from GCS: {key}"
+            raise FileDownloadError(msg) from e
+        try:
+            yield stream
+        finally:
+            stream.close()
+
+    async def upload_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        key: str,
+        *,
+        content_type: str | None = None,
+        part_size: int = MULTIPART_PART_SIZE,
+    ) -> int:
+        """Stream an upload to GCS, switching to a server-side multipart upload past one part."""
+        try:
+            async with await self._get_client() as client:
+                return await upload_object_stream(
+                    client,
+                    bucket=self.bucket_name,
+                    key=key,
+                    chunks=chunks,
+                    content_type=content_type,
+                    part_size=part_size,
+                )
+        except ClientError as e:
+            msg = f"Failed to upload to GCS: {key}"
+            raise FileUploadError(msg) from e
+
     async def get_download_url(self, key: str, expires_in: int = 3600) -> str:
         """Return a presigned download URL using the XML API."""
         try:
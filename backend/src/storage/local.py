@@ -1,16 +1,39 @@
 """Local filesystem storage implementation."""
 
+import uuid
+from collections.abc import AsyncGenerator, AsyncIterable
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 import aiofiles
+import aiofiles.os
+from aiofiles.threadpool.binary import AsyncBufferedReader
 
-from .base import AbstractStorage, StorageUploadSession
-from .exceptions import FileDeleteError, FileUploadError, StorageFileNotFoundError
+from .base import MULTIPART_PART_SIZE, AbstractStorage, StorageReadStream, StorageUploadSession
+from .exceptions import FileDeleteError, FileDownloadError, FileUploadError, StorageFileNotFoundError
 
 
 _LOCAL_UPLOAD_URL_PREFIX = "/api/v1/upload-sessions/local"
 
 
+class _LocalReadStream:
+    """:class:`~src.storage.base.StorageReadStream` over an open file, bounded to a byte range."""
+
+    def __init__(self, file_obj: AsyncBufferedReader, content_length: int) -> None:
+        self.content_length = content_length
+        self._file_obj = file_obj
+        self._remaining = content_length
+
+    async def read(self, size: int = -1) -> bytes:
+        """Read up to ``size`` bytes without running past the end of the range."""
+        if self._remaining <= 0:
+            return b""
+        size = self._remaining if size < 0 else min(size, self._remaining)
+        data = await self._file_obj.read(size)
+        self._remaining -= len(data)
+        return data
+
+
 class LocalStorage(AbstractStorage):
     """Local filesystem storage provider."""
 
@@ -84,6 +107,85 @@ class LocalStorage(AbstractStorage):
         async with aiofiles.open(path, "rb") as file_obj:
             return await file_obj.read()
 
+    @asynccontextmanager
+    async def open_read(self, key: str, *, start: int = 0, end: int | None = None) -> AsyncGenerator[StorageReadStream]:
+        """Open a local file positioned at ``start`` and bounded to ``end``.
+
+        Raises
+        ------
+            StorageFileNotFoundError: If the file does not exist.
+            FileDownloadError: If the file cannot be opened.
+        """
+        path = self._get_full_path(key)
+        try:
+            file_size = path.stat().st_size
+            file_obj = await aiofiles.open(path, "rb")
+        except FileNotFoundError as e:
+            msg = f"File not found: {key}"
+            raise StorageFileNotFoundError(msg) from e
+        except OSError as e:
+            msg = f"Failed to read local file: {key}"
+            raise FileDownloadError(msg) from e
+
+        stop = file_size if end is None else min(end, file_size)
+        try:
+            await file_obj.seek(start)
+            yield _LocalReadStream(file_obj, max(stop - start, 0))
+        finally:
+            await file_obj.close()
+
+    @asynccontextmanager
+    async def local_path(self, key: str, *, content_hash: str | None = None, suffix: str = "") -> AsyncGenerator[Path]:
+        """Yield the stored file itself; no copy is needed for local storage.
+
+        Raises
+        ------
+            StorageFileNotFoundError: If the file does not exist.
+        """
+        del content_hash, suffix
+        path = self._get_full_path(key)
+        if not await aiofiles.os.path.exists(path):
+            msg = f"File not found: {key}"
+            raise StorageFileNotFoundError(msg)
+        yield path
+
+    async def upload_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        key: str,
+        *,
+        content_type: str | None = None,
+        part_size: int = MULTIPART_PART_SIZE,
+    ) -> int:
+        """Stream chunks to a sibling temp file, then atomically move it into place.
+
+        Readers never observe a half-written file, and a failed upload leaves
+        any previous file at ``key`` untouched.
+
+        Raises
+        ------
+            FileUploadError: If the upload fails.
+        """
+        del content_type, part_size
+        path = self._get_full_path(key)
+        temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.part")
+        total_bytes = 0
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            async with aiofiles.open(temp_path, "wb") as f:
+                async for chunk in chunks:
+                    await f.write(chunk)
+                    total_bytes += len(chunk)
+            await aiofiles.os.replace(temp_path, path)
+        except OSError as e:
+            temp_path.unlink(missing_ok=True)
+            msg = f"Failed to upload file locally: {key}"
+            raise FileUploadError(msg) from e
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        return total_bytes
+
     async def delete(self, key: str) -> None:
         """Delete a file from local storage.
 
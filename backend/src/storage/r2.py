@@ -1,35 +1,27 @@
 """Cloudflare R2 storage implementation using aioboto3."""
 
-from contextlib import AbstractAsyncContextManager
-from typing import Protocol, cast
+from collections.abc import AsyncGenerator, AsyncIterable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, nullcontext
 
-import aioboto3
 from botocore.client import Config
 from botocore.exceptions import ClientError
 
-from .base import AbstractStorage, StorageUploadSession
+from .base import MULTIPART_PART_SIZE, AbstractStorage, StorageReadStream, StorageUploadSession
 from .exceptions import (
     CORSConfigError,
     FileDeleteError,
     FileDownloadError,
     FileUploadError,
+    StorageFileNotFoundError,
+)
+from .s3_compat import (
+    PooledS3Client,
+    _S3Client,
+    get_object_stream,
+    is_missing_key_error,
+    read_object,
+    upload_object_stream,
 )
-
-
-class _StorageBody(Protocol):
-    async def read(self) -> bytes: ...
-
-
-class _S3Client(Protocol):
-    async def put_object(self, **kwargs: object) -> object: ...
-
-    async def generate_presigned_url(self, **kwargs: object) -> str: ...
-
-    async def delete_object(self, **kwargs: object) -> object: ...
-
-    async def get_object(self, **kwargs: object) -> dict[str, _StorageBody]: ...
-
-    async def put_bucket_cors(self, **kwargs: object) -> object: ...
 
 
 class R2Storage(AbstractStorage):
@@ -57,21 +49,21 @@ class R2Storage(AbstractStorage):
         self.access_key_id = access_key_id
         self.secret_access_key = secret_access_key
         self.region = region
-        self._session = aioboto3.Session()
+        self._client_pool = PooledS3Client(
+            endpoint_url=self.endpoint_url,
+            access_key_id=access_key_id,
+            secret_access_key=secret_access_key,
+            region=region,
+            config=Config(signature_version="s3v4"),
+        )
 
     async def _get_client(self) -> AbstractAsyncContextManager[_S3Client]:
-        """Get an S3 client instance."""
-        return cast(
-            "AbstractAsyncContextManager[_S3Client]",
-            self._session.client(
-                "s3",
-                endpoint_url=self.endpoint_url,
-                aws_access_key_id=self.access_key_id,
-                aws_secret_access_key=self.secret_access_key,
-                region_name=self.region,
-                config=Config(signature_version="s3v4"),
-            ),
-        )
+        """Get the provider's pooled S3 client; exiting the context leaves it open."""
+        return nullcontext(await self._client_pool.get())
+
+    async def aclose(self) -> None:
+        """Close the pooled S3 client."""
+        await self._client_pool.aclose()
 
     async def upload(self, file_content: bytes, key: str) -> None:
         """Upload file content to R2 storage.
@@ -150,12 +142,63 @@ class R2Storage(AbstractStorage):
         """
         try:
             async with await self._get_client() as client:
-                response = await client.get_object(Bucket=self.bucket_name, Key=key)
-                return await response["Body"].read()
+                return await read_object(
+                    client,
+                    bucket=self.bucket_name,
+                    key=key,
+                    error_message=f"Failed to download from R2: {key}",
+                )
         except ClientError as e:
             msg = f"Failed to download from R2: {key}"
             raise FileDownloadError(msg) from e
 
+    @asynccontextmanager
+    async def open_read(self, key: str, *, start: int = 0, end: int | None = None) -> AsyncGenerator[StorageReadStream]:
+        """Stream an object (or a byte range of it) from R2 over one ranged GET."""
+        try:
+            async with await self._get_client() as client:
+                stream = await get_object_stream(
+                    client,
+                    bucket=self.bucket_name,
+                    key=key,
+                    start=start,
+                    end=end,
+                    error_message=f"Failed to download from R2: {key}",
+                )
+        except ClientError as e:
+            if is_missing_key_error(e):
+                msg = f"File not found: {key}"
+                raise StorageFileNotFoundError(msg) from e
+            msg = f"Failed to download from R2: {key}"
+            raise FileDownloadError(msg) from e
+        try:
+            yield stream
+        finally:
+            stream.close()
+
+    async def upload_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        key: str,
+        *,
+        content_type: str | None = None,
+        part_size: int = MULTIPART_PART_SIZE,
+    ) -> int:
+        """Stream an upload to R2, switching to a multipart upload past one part."""
+        try:
+            async with await self._get_client() as client:
+                return await upload_object_stream(
+                    client,
+                    bucket=self.bucket_name,
+                    key=key,
+                    chunks=chunks,
+                    content_type=content_type,
+                    part_size=part_size,
+                )
+        except ClientError as e:
+            msg = f"Failed to upload to R2: {key}"
+            raise FileUploadError(msg) from e
+
     async def set_cors_policy(self) -> None:
         """Set CORS policy on the R2 bucket."""
         cors_configuration = {
@@ -0,0 +1,245 @@
+"""Shared aioboto3 plumbing for the S3-compatible providers (R2 and the GCS XML API)."""
+
+import asyncio
+from collections.abc import AsyncIterable
+from contextlib import AsyncExitStack, suppress
+from typing import Protocol, cast
+
+import aioboto3
+from botocore.client import Config
+from botocore.exceptions import BotoCoreError, ClientError
+
+from .exceptions import FileDownloadError
+
+
+# Concurrent HTTP connections kept open per provider client (botocore defaults to 10).
+MAX_POOL_CONNECTIONS = 32
+
+
+class _S3Body(Protocol):
+    """Minimal protocol for a ``get_object`` streaming body."""
+
+    async def read(self, amt: int | None = None) -> bytes: ...
+
+    def close(self) -> None: ...
+
+
+class _S3Client(Protocol):
+    """Minimal protocol for the aioboto3 S3 client calls the providers make."""
+
+    async def put_object(self, **kwargs: object) -> object: ...
+
+    async def get_object(self, **kwargs: object) -> dict[str, object]: ...
+
+    async def delete_object(self, **kwargs: object) -> object: ...
+
+    async def generate_presigned_url(self, **kwargs: object) -> str: ...
+
+    async def put_bucket_cors(self, **kwargs: object) -> object: ...
+
+    async def create_multipart_upload(self, **kwargs: object) -> dict[str, str]: ...
+
+    async def upload_part(self, **kwargs: object) -> dict[str, str]: ...
+
+    async def complete_multipart_upload(self, **kwargs: object) -> dict[str, object]: ...
+
+    async def abort_multipart_upload(self, **kwargs: object) -> object: ...
+
+    async def list_parts(self, **kwargs: object) -> dict[str, object]: ...
+
+
+class PooledS3Client:
+    """One long-lived aioboto3 client per provider, so calls reuse its connection pool.
+
+    The client is created on first use. aiobotocore binds its connector to the
+    event loop it was created on, so a client is rebuilt when used from a new loop
+    (e.g. the standalone job worker or a fresh test loop).
+    """
+
+    def __init__(
+        self, *, endpoint_url: str, access_key_id: str, secret_access_key: str, region: str | None, config: Config
+    ) -> None:
+        self._session = aioboto3.Session()
+        self._client_kwargs: dict[str, object] = {
+            "endpoint_url": endpoint_url,
+            "aws_access_key_id": access_key_id,
+            "aws_secret_access_key": secret_access_key,
+            "region_name": region,
+            "config": config.merge(Config(max_pool_connections=MAX_POOL_CONNECTIONS)),
+        }
+        self._client: _S3Client | None = None
+        self._exit_stack: AsyncExitStack | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock: asyncio.Lock | None = None
+
+    async def get(self) -> _S3Client:
+        """Return the shared client, creating it on first use in the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._loop is loop:
+            return self._client
+        if self._loop is not loop:
+            # State from another (likely closed) loop cannot be awaited here; drop it.
+            self._client, self._exit_stack, self._lock = None, None, asyncio.Lock()
+            self._loop = loop
+        async with cast("asyncio.Lock", self._lock):
+            if self._client is None:
+                exit_stack = AsyncExitStack()
+                self._client = cast(
+                    "_S3Client",
+                    await exit_stack.enter_async_context(self._session.client("s3", **self._client_kwargs)),
+                )
+                self._exit_stack = exit_stack
+            return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared client's connections, if one is open in the running loop."""
+        exit_stack, self._client, self._exit_stack = self._exit_stack, None, None
+        if exit_stack is not None and self._loop is asyncio.get_running_loop():
+            await exit_stack.aclose()
+
+
+class S3ReadStream:
+    """:class:`~src.storage.base.StorageReadStream` over a ``get_object`` response body.
+
+    Call :meth:`close` when done; a body left unread to the end otherwise keeps its pooled connection.
+    """
+
+    def __init__(self, body: _S3Body, content_length: int | None, *, error_message: str) -> None:
+        self.content_length = content_length
+        self._body = body
+        self._error_message = error_message
+
+    async def read(self, size: int = -1) -> bytes:
+        """Read up to ``size`` bytes from the response body; everything left when negative.
+
+        Raises
+        ------
+            FileDownloadError: If the connection fails or times out mid-body.
+        """
+        try:
+            return await self._body.read(None if size < 0 else size)
+        except BotoCoreError as e:
+            raise FileDownloadError(self._error_message) from e
+
+    def close(self) -> None:
+        """Release the response and its connection."""
+        self._body.close()
+
+
+def range_header(start: int, end: int | None) -> str | None:
+    """Return the HTTP ``Range`` value for the half-open byte range ``[start, end)``."""
+    if end is not None:
+        return f"bytes={start}-{end - 1}"
+    if start > 0:
+        return f"bytes={start}-"
+    return None
+
+
+async def get_object_stream(
+    client: _S3Client,
+    *,
+    bucket: str,
+    key: str,
+    start: int,
+    end: int | None,
+    error_message: str,
+) -> S3ReadStream:
+    """Issue one (optionally ranged) ``get_object`` and wrap its body for incremental reads.
+
+    Read failures on the returned stream raise :class:`FileDownloadError` with ``error_message``.
+    """
+    request: dict[str, object] = {"Bucket": bucket, "Key": key}
+    byte_range = range_header(start, end)
+    if byte_range is not None:
+        request["Range"] = byte_range
+    response = await client.get_object(**request)
+    content_length = response.get("ContentLength")
+    return S3ReadStream(
+        cast("_S3Body", response["Body"]),
+        int(content_length) if isinstance(content_length, int) else None,
+        error_message=error_message,
+    )
+
+
+async def read_object(client: _S3Client, *, bucket: str, key: str, error_message: str) -> bytes:
+    """Read a whole object with one ``get_object``, releasing the response afterwards."""
+    stream = await get_object_stream(client, bucket=bucket, key=key, start=0, end=None, error_message=error_message)
+    try:
+        return await stream.read()
+    finally:
+        stream.close()
+
+
+def is_missing_key_error(error: ClientError) -> bool:
+    """Return whether a client error means the object does not exist."""
+    return error.response.get("Error", {}).get("Code") in {"NoSuchKey", "404"}
+
+
+class _StreamedUpload:
+    """Buffers a byte stream into parts, starting a multipart upload once a full part is ready."""
+
+    def __init__(self, client: _S3Client, *, bucket: str, key: str, content_type: str | None) -> None:
+        self._client = client
+        self._target: dict[str, object] = {"Bucket": bucket, "Key": key}
+        self._extra: dict[str, object] = {"ContentType": content_type} if content_type else {}
+        self._upload_id: str | None = None
+        self._parts: list[dict[str, object]] = []
+
+    async def run(self, chunks: AsyncIterable[bytes], part_size: int) -> int:
+        buffer = bytearray()
+        total_bytes = 0
+        async for chunk in chunks:
+            buffer += chunk
+            total_bytes += len(chunk)
+            while len(buffer) >= part_size:
+                await self._upload_part(bytes(buffer[:part_size]))
+                del buffer[:part_size]
+
+        if self._upload_id is None:
+            await self._client.put_object(**self._target, Body=bytes(buffer), **self._extra)
+            return total_bytes
+
+        if buffer:
+            await self._upload_part(bytes(buffer))
+        await self._client.complete_multipart_upload(
+            **self._target, UploadId=self._upload_id, MultipartUpload={"Parts": self._parts}
+        )
+        return total_bytes
+
+    async def abort(self) -> None:
+        if self._upload_id is None:
+            return
+        with suppress(ClientError):
+            await self._client.abort_multipart_upload(**self._target, UploadId=self._upload_id)
+
+    async def _upload_part(self, body: bytes) -> None:
+        if self._upload_id is None:
+            response = await self._client.create_multipart_upload(**self._target, **self._extra)
+            self._upload_id = response["UploadId"]
+        part_number = len(self._parts) + 1
+        response = await self._client.upload_part(
+            **self._target, UploadId=self._upload_id, PartNumber=part_number, Body=body
+        )
+        self._parts.append({"PartNumber": part_number, "ETag": response["ETag"]})
+
+
+async def upload_object_stream(
+    client: _S3Client,
+    *,
+    bucket: str,
+    key: str,
+    chunks: AsyncIterable[bytes],
+    content_type: str | None,
+    part_size: int,
+) -> int:
+    """Upload a byte stream, holding at most one part in memory.
+
+    Streams shorter than one part become a single ``put_object``; longer ones
+    a multipart upload that is aborted if anything fails. Returns bytes written.
+    """
+    upload = _StreamedUpload(client, bucket=bucket, key=key, content_type=content_type)
+    try:
+        return await upload.run(chunks, part_size)
+    except BaseException:
+        await upload.abort()
+        raise
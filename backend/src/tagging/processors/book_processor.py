@@ -63,17 +63,7 @@ class BookProcessor:
                 logger.warning("Unsupported file type for content extraction: %s", file_extension)
                 content_preview = ""
 
-            # Combine metadata for better tagging
-            combined_preview = self._build_content_preview(
-                book=book,
-                extracted_content=content_preview,
-            )
-
-            return {
-                "title": f"{book.title} {book.subtitle or ''}".strip(),
-                "author": book.author,
-                "content_preview": combined_preview,
-            }
+            return self.build_tagging_content(book, content_preview)
 
         except (OSError, RuntimeError, TypeError, ValueError):
             logger.exception("tagging.book.extract_failed")
@@ -83,6 +73,23 @@ class BookProcessor:
                 "content_preview": book.description or "",
             }
 
+    def build_tagging_content(self, book: Book, extracted_content: str) -> dict[str, str]:
+        """Combine book metadata with already extracted text into the tagging input.
+
+        Args:
+            book: Book model instance
+            extracted_content: Text excerpt from the book file
+
+        Returns
+        -------
+            Dictionary with title, author, and content_preview
+        """
+        return {
+            "title": f"{book.title} {book.subtitle or ''}".strip(),
+            "author": book.author,
+            "content_preview": self._build_content_preview(book=book, extracted_content=extracted_content),
+        }
+
     def _extract_pdf_content(self, file_content: bytes, max_pages: int = 5) -> str:
         """Extract text from first few pages of PDF.
 
@@ -81,7 +81,8 @@ async def write_local_upload(key: str, request: Request, auth: CurrentAuth) -> R
     file body straight to the URL returned by ``create_upload_session``. For
     local storage that URL is same-origin and points here. We scope writes to
     the caller's ``books/{user_id}/direct/`` prefix to match the validation
-    that ``create_book_from_existing_storage`` performs on finalize.
+    that ``create_book_from_existing_storage`` performs on finalize. The
+    body is streamed to disk rather than read into memory.
     """
     expected_prefix = f"books/{auth.user_id!s}/direct/"
     if not key.startswith(expected_prefix):
@@ -92,7 +93,7 @@ async def write_local_upload(key: str, request: Request, auth: CurrentAuth) -> R
 
     storage = get_storage_provider("local")
     try:
-        await storage.upload(await request.body(), key)
+        await storage.upload_stream(request.stream(), key, content_type=request.headers.get("content-type"))
     except FileUploadError as error:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -8,7 +8,6 @@ import logging
 import uuid
 from typing import cast
 
-from fastapi import BackgroundTasks
 from pydantic import JsonValue
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -54,14 +53,15 @@ class VideosFacade:
         self,
         video_data: VideoCreate,
         user_id: uuid.UUID,
-        background_tasks: BackgroundTasks | None = None,
+        *,
+        process_in_background: bool = False,
     ) -> VideoResponse:
         """Create a video record for the authenticated user."""
         return await self._video_service.create_video(
             self._session,
             video_data,
             user_id,
-            background_tasks=background_tasks,
+            process_in_background=process_in_background,
         )
 
     async def get_videos(
@@ -10,7 +10,6 @@ from urllib.parse import parse_qs, urlparse
 
 import aiohttp
 import yt_dlp
-from fastapi import BackgroundTasks
 from pydantic import JsonValue
 from sqlalchemy import or_, select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
@@ -21,6 +20,7 @@ from src.ai.rag.service import RAGService
 from src.database.pagination import Paginator
 from src.database.session import async_session_maker
 from src.exceptions import ConflictError, NotFoundError, UpstreamUnavailableError
+from src.jobs import JobKind, enqueue_job
 from src.tagging.service import TaggingService
 from src.videos.models import Video, VideoChapter
 from src.videos.schemas import (
@@ -179,7 +179,7 @@ def _merge_tags(existing_tags: list[str], generated_tags: list[str]) -> list[str
     return list(dict.fromkeys([*existing_tags, *generated_tags]))
 
 
-async def _auto_tag_video_background(video_id: uuid.UUID, user_id: uuid.UUID) -> None:
+async def auto_tag_video_background(video_id: uuid.UUID, user_id: uuid.UUID) -> None:
     """Generate and persist video tags in a dedicated background session."""
     try:
         from src.tagging.processors.video_processor import process_video_for_tagging
@@ -278,7 +278,7 @@ async def _try_extract_chapters(video_id: uuid.UUID, user_id: uuid.UUID) -> bool
         return True
 
 
-async def _extract_chapters_background(video_id: uuid.UUID, user_id: uuid.UUID) -> None:
+async def extract_chapters_background(video_id: uuid.UUID, user_id: uuid.UUID) -> None:
     """Extract chapters in background after video creation with retry logic."""
     max_retries = CHAPTER_EXTRACTION_MAX_RETRIES
     retry_delay = CHAPTER_EXTRACTION_RETRY_DELAY_SECONDS
@@ -346,7 +346,7 @@ async def _extract_chapters_background(video_id: uuid.UUID, user_id: uuid.UUID)
             return
 
 
-async def _process_transcript_to_jsonb(video_id: uuid.UUID) -> None:
+async def process_transcript_to_jsonb(video_id: uuid.UUID) -> None:
     """Process transcript segments into JSONB in background."""
     try:
         async with async_session_maker() as db:
@@ -451,7 +451,7 @@ class VideoService:
         video_data: VideoCreate,
         user_id: uuid.UUID,
         *,
-        background_tasks: BackgroundTasks | None = None,
+        process_in_background: bool = False,
     ) -> VideoResponse:
         """Create a new video by fetching metadata from YouTube."""
         # Get the user ID for creation
@@ -518,14 +518,13 @@ class VideoService:
             return VideoResponse.model_validate(video_dict)
 
         video_id = video.id
-        # Persist before queuing background tasks so they can load the row.
+        if process_in_background:
+            # Queued in the same transaction, so workers only ever see jobs for committed videos.
+            payload: dict[str, JsonValue] = {"video_id": str(video_id), "user_id": str(user_id)}
+            for kind in (JobKind.VIDEO_AUTO_TAG, JobKind.VIDEO_EXTRACT_CHAPTERS, JobKind.VIDEO_PROCESS_TRANSCRIPT):
+                await enqueue_job(db, kind, payload, dedupe_key=f"{kind}:{video_id}")
         await db.commit()
 
-        if background_tasks is not None:
-            background_tasks.add_task(_auto_tag_video_background, video_id, user_id)
-            background_tasks.add_task(_extract_chapters_background, video_id, user_id)
-            background_tasks.add_task(_process_transcript_to_jsonb, video_id)
-
         # Reload to ensure server-default timestamps are loaded
         refreshed_video = await db.get(Video, video_id, populate_existing=True)
         if refreshed_video is not None:
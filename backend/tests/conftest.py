@@ -111,12 +111,15 @@ def _patch_database_modules(test_engine: AsyncEngine) -> None:
     database_session_module.async_session_maker = test_session_maker
 
     for module_name in (
+        "src.ai.assistant.service",
         "src.ai.client",
+        "src.ai.rag.embeddings",
         "src.ai.rag.service",
         "src.ai.tools.learning.action_tools",
         "src.ai.tools.learning.query_tools",
         "src.books.facade",
         "src.courses.services.course_content_service",
+        "src.learning_capabilities.facade",
         "src.videos.service",
     ):
         module = sys.modules.get(module_name)
@@ -0,0 +1,170 @@
+# ruff: noqa: S101
+
+"""Integration coverage for the Postgres-backed job queue's claim, dedupe, lease and retention SQL."""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.jobs.queue import (
+    ClaimedJob,
+    claim_jobs,
+    complete_job,
+    enqueue_job,
+    prune_finished_jobs,
+    reclaim_expired_jobs,
+    renew_job_lease,
+)
+from src.jobs.registry import JOB_SPECS, JobKind
+
+
+_WORKER_ID = "worker-a"
+
+
+@pytest.fixture
+def session_factory(test_engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def _enqueue(
+    session_factory: async_sessionmaker[AsyncSession],
+    kind: JobKind,
+    *,
+    dedupe_key: str | None = None,
+) -> int | None:
+    async with session_factory() as session:
+        job_id = await enqueue_job(session, kind, {"n": 1}, dedupe_key=dedupe_key)
+        await session.commit()
+    return job_id
+
+
+async def _claim(session_factory: async_sessionmaker[AsyncSession], kind: JobKind, *, limit: int) -> list[ClaimedJob]:
+    async with session_factory() as session:
+        return await claim_jobs(session, kind, worker_id=_WORKER_ID, limit=limit)
+
+
+async def _job_row(session_factory: async_sessionmaker[AsyncSession], job_id: int) -> dict[str, object]:
+    async with session_factory() as session:
+        row = (
+            await session.execute(
+                text("SELECT status, attempts, rerun_requested, last_error FROM background_jobs WHERE id = :id"),
+                {"id": job_id},
+            )
+        ).one()
+    return dict(row._mapping)  # noqa: SLF001
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_claim_respects_the_kind_cap_and_skips_rows_locked_elsewhere(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    kind = JobKind.BOOK_INGEST
+    job_ids = [await _enqueue(session_factory, kind) for _ in range(4)]
+    assert JOB_SPECS[kind].max_concurrency == 2
+
+    async with session_factory() as locker:
+        await locker.execute(text("SELECT id FROM background_jobs WHERE id = :id FOR UPDATE"), {"id": job_ids[0]})
+        claimed = await _claim(session_factory, kind, limit=10)
+        await locker.rollback()
+
+    assert [job.id for job in claimed] == job_ids[1:3]
+    assert all(job.attempts == 1 for job in claimed)
+    # Both slots are taken until those leases end.
+    assert await _claim(session_factory, kind, limit=10) == []
+
+    async with session_factory() as session:
+        await complete_job(session, claimed[0], worker_id=_WORKER_ID)
+    assert [job.id for job in await _claim(session_factory, kind, limit=10)] == [job_ids[0]]
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_enqueue_dedupes_queued_jobs_and_schedules_a_follow_up_for_running_ones(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    kind = JobKind.ASSISTANT_SUMMARIZE_HISTORY
+    job_id = await _enqueue(session_factory, kind, dedupe_key="conversation-1")
+    assert job_id is not None
+    assert await _enqueue(session_factory, kind, dedupe_key="conversation-1") is None
+
+    (running,) = await _claim(session_factory, kind, limit=10)
+    assert await _enqueue(session_factory, kind, dedupe_key="conversation-1") is None
+    assert (await _job_row(session_factory, job_id))["rerun_requested"] is True
+
+    async with session_factory() as session:
+        await complete_job(session, running, worker_id=_WORKER_ID)
+    assert await _job_row(session_factory, job_id) == {
+        "status": "queued",
+        "attempts": 0,
+        "rerun_requested": False,
+        "last_error": None,
+    }
+
+    (follow_up,) = await _claim(session_factory, kind, limit=10)
+    async with session_factory() as session:
+        await complete_job(session, follow_up, worker_id=_WORKER_ID)
+    assert (await _job_row(session_factory, job_id))["status"] == "succeeded"
+    # A finished job frees its key.
+    assert await _enqueue(session_factory, kind, dedupe_key="conversation-1") not in {None, job_id}
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_expired_leases_are_reclaimed_unless_renewed(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    kind = JobKind.ASSISTANT_SUMMARIZE_HISTORY
+    for _ in range(3):
+        await _enqueue(session_factory, kind)
+    renewed, expired, exhausted = await _claim(session_factory, kind, limit=10)
+    async with session_factory() as session:
+        await session.execute(
+            text("UPDATE background_jobs SET locked_until = NOW() - INTERVAL '1 minute' WHERE status = 'running'")
+        )
+        await session.execute(
+            text("UPDATE background_jobs SET attempts = max_attempts WHERE id = :id"),
+            {"id": exhausted.id},
+        )
+        await session.commit()
+
+        assert await renew_job_lease(session, renewed, worker_id=_WORKER_ID)
+        assert not await renew_job_lease(session, expired, worker_id="worker-b")
+        assert await reclaim_expired_jobs(session) == 2
+        assert not await renew_job_lease(session, expired, worker_id=_WORKER_ID)
+
+    assert (await _job_row(session_factory, renewed.id))["status"] == "running"
+    assert await _job_row(session_factory, expired.id) == {
+        "status": "queued",
+        "attempts": 1,
+        "rerun_requested": False,
+        "last_error": "lease expired",
+    }
+    assert (await _job_row(session_factory, exhausted.id))["status"] == "failed"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_prune_deletes_only_jobs_finished_before_the_retention_window(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with session_factory() as session:
+        result = await session.execute(
+            text(
+                """
+                INSERT INTO background_jobs (kind, status, max_attempts, created_at, finished_at)
+                VALUES
+                    (:kind, 'succeeded', 5, NOW() - INTERVAL '3 days', NOW() - INTERVAL '2 days'),
+                    (:kind, 'failed', 5, NOW() - INTERVAL '3 days', NOW() - INTERVAL '2 days'),
+                    (:kind, 'succeeded', 5, NOW() - INTERVAL '3 days', NOW() - INTERVAL '1 hour'),
+                    (:kind, 'queued', 5, NOW() - INTERVAL '3 days', NULL)
+                RETURNING id, finished_at < NOW() - INTERVAL '1 day' AS expired
+                """
+            ),
+            {"kind": JobKind.COURSE_AUTO_TAG.value},
+        )
+        kept = {row.id for row in result.all() if not row.expired}
+        await session.commit()
+
+        assert await prune_finished_jobs(session, retention_hours=24) == 2
+        remaining = set((await session.execute(text("SELECT id FROM background_jobs"))).scalars())
+
+    assert remaining == kept
@@ -0,0 +1,66 @@
+"""Integration coverage for prerequisite cycle checks that cross course boundaries."""
+
+# ruff: noqa: S101
+
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.courses.models import Concept, ConceptPrerequisite, Course, CourseConcept
+from src.courses.services.concept_graph_service import ConceptGraphService
+from src.courses.services.concept_graph_snapshot import get_concept_graph_snapshot
+from src.exceptions import ConflictError
+from src.user.models import User
+
+
+async def _seed_course_with_outside_prerequisite(
+    session: AsyncSession,
+) -> tuple[uuid.UUID, uuid.UUID, uuid.UUID, uuid.UUID]:
+    """Seed course concepts C and P where P requires X (outside the course) and X requires C."""
+    user_id = uuid.uuid4()
+    course_id = uuid.uuid4()
+    concept_id, prereq_id, outside_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    token = str(user_id).replace("-", "")[:12]
+
+    session.add(
+        User(
+            id=user_id,
+            username=f"graph-user-{token}",
+            email=f"graph-{token}@example.com",
+            password_hash="not-used-in-tests",  # noqa: S106
+        )
+    )
+    session.add(Course(id=course_id, user_id=user_id, title="Graphs", description="Cycle checks."))
+    session.add_all(
+        [
+            Concept(id=concept_id, domain="math", slug=f"c-{concept_id}", name="C", description="In the course."),
+            Concept(id=prereq_id, domain="math", slug=f"p-{prereq_id}", name="P", description="In the course."),
+            Concept(id=outside_id, domain="math", slug=f"x-{outside_id}", name="X", description="Another course."),
+        ]
+    )
+    await session.flush()
+    session.add_all(
+        [
+            CourseConcept(course_id=course_id, concept_id=concept_id, order_hint=0),
+            CourseConcept(course_id=course_id, concept_id=prereq_id, order_hint=1),
+            ConceptPrerequisite(concept_id=prereq_id, prereq_id=outside_id),
+            ConceptPrerequisite(concept_id=outside_id, prereq_id=concept_id),
+        ]
+    )
+    await session.flush()
+    return course_id, concept_id, prereq_id, outside_id
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_add_prerequisite_rejects_a_cycle_through_a_concept_outside_the_course(
+    db_session: AsyncSession,
+) -> None:
+    course_id, concept_id, prereq_id, _ = await _seed_course_with_outside_prerequisite(db_session)
+    # Warm the course snapshot: it only sees P as a leaf, so it must not decide the check.
+    snapshot = await get_concept_graph_snapshot(db_session, course_id)
+    assert not snapshot.depends_on(prereq_id, concept_id)
+
+    with pytest.raises(ConflictError, match="cycle"):
+        await ConceptGraphService(db_session).add_prerequisite(concept_id=concept_id, prereq_id=prereq_id)
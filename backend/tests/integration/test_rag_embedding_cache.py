@@ -0,0 +1,95 @@
+# ruff: noqa: S101
+
+"""Integration coverage for the Postgres-backed content-addressed embedding cache."""
+
+import uuid
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.ai.rag import embedding_cache as embedding_cache_module
+from src.ai.rag.embedding_cache import EmbeddingCache, content_hash
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_embedding_cache_round_trip_is_scoped_by_model_and_dimensions(test_engine: AsyncEngine) -> None:
+    session_factory = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+    model = f"cache-test-{uuid.uuid4()}"
+    cache = EmbeddingCache(model=model, dimensions=3, max_entries=100, session_factory=session_factory)
+    other_dimensions = EmbeddingCache(model=model, dimensions=4, max_entries=100, session_factory=session_factory)
+
+    await cache.put_many({content_hash("alpha"): [0.5, 1.0, 1.5]})
+
+    assert await cache.get_many([content_hash("alpha"), content_hash("beta")]) == {
+        content_hash("alpha"): [0.5, 1.0, 1.5]
+    }
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert await other_dimensions.get_many([content_hash("alpha")]) == {}
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_embedding_cache_evicts_least_recently_used_rows(
+    test_engine: AsyncEngine,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(embedding_cache_module, "_PRUNE_EVERY_NEW_ENTRIES", 1)
+    monkeypatch.setattr(embedding_cache_module, "_prune_schedule", embedding_cache_module._PruneSchedule())  # noqa: SLF001
+    session_factory = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+    model = f"cache-test-{uuid.uuid4()}"
+    cache = EmbeddingCache(model=model, dimensions=3, max_entries=2, session_factory=session_factory)
+
+    await cache.put_many({content_hash("oldest"): [1.0, 1.0, 1.0]})
+    async with session_factory() as session:
+        await session.execute(
+            text("UPDATE rag_embedding_cache SET last_used_at = NOW() - INTERVAL '1 day' WHERE model = :model"),
+            {"model": model},
+        )
+        await session.commit()
+    await cache.put_many({content_hash("newer"): [2.0, 2.0, 2.0]})
+    await cache.put_many({content_hash("newest"): [3.0, 3.0, 3.0]})
+
+    cached = await cache.get_many([content_hash("oldest"), content_hash("newer"), content_hash("newest")])
+
+    assert set(cached) == {content_hash("newer"), content_hash("newest")}
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_embedding_cache_prunes_once_instances_together_cross_the_cap(
+    test_engine: AsyncEngine,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # With a cap of 20 an eviction pass is due every 2 new rows, counted across instances.
+    monkeypatch.setattr(embedding_cache_module, "_prune_schedule", embedding_cache_module._PruneSchedule())  # noqa: SLF001
+    session_factory = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+    model = f"cache-test-{uuid.uuid4()}"
+    async with session_factory() as session:
+        await session.execute(
+            text(
+                """
+                INSERT INTO rag_embedding_cache (model, dimensions, content_sha256, embedding, last_used_at)
+                SELECT :model, 3, sha256(convert_to(g::text, 'UTF8')), CAST('[1,1,1]' AS vector),
+                       NOW() - INTERVAL '1 day'
+                FROM generate_series(1, 25) AS g
+                """
+            ),
+            {"model": model},
+        )
+        await session.commit()
+
+    def per_request_cache() -> EmbeddingCache:
+        return EmbeddingCache(model=model, dimensions=3, max_entries=20, session_factory=session_factory)
+
+    await per_request_cache().put_many({content_hash("first request"): [2.0, 2.0, 2.0]})
+    async with session_factory() as session:
+        assert await session.scalar(text("SELECT count(*) FROM rag_embedding_cache")) > 20
+
+    await per_request_cache().put_many({content_hash("second request"): [3.0, 3.0, 3.0]})
+    async with session_factory() as session:
+        assert await session.scalar(text("SELECT count(*) FROM rag_embedding_cache")) == 20
+
+    cached = await per_request_cache().get_many([content_hash("first request"), content_hash("second request")])
+    assert set(cached) == {content_hash("first request"), content_hash("second request")}
@@ -0,0 +1,131 @@
+# ruff: noqa: S101
+
+"""Throughput of LaTeX answer grading and its numeric-sampling stage."""
+
+import statistics
+import time
+from collections.abc import Callable
+from itertools import islice, product
+
+import pytest
+import sympy
+from latex2sympy2_extended import latex2sympy
+
+from src.courses.services.latex_expected_cache import get_expected_latex_cache
+from src.courses.services.latex_expression_sampling import (
+    _SAMPLE_VALUES,  # noqa: PLC2701
+    _evaluate_numeric,  # noqa: PLC2701
+    numeric_equivalence,
+    sampled_equivalence,
+)
+from src.courses.services.latex_expression_verifier import LatexExpressionVerifier
+
+
+# Expected/learner pairs that simplify cannot settle, so grading reaches numeric sampling.
+_ANSWER_PAIRS = [
+    (r"\sin^{2}(x) + \cos^{2}(x)", "1"),
+    (r"(x + y)^{3}", r"x^{3} + 3x^{2}y + 3xy^{2} + y^{3}"),
+    (r"\frac{x^{2} - 1}{x - 1}", "x + 1"),
+    (r"\sqrt{x^{2}}", "x"),
+    (r"\log(x y)", r"\log(x) + \log(y)"),
+    (r"e^{x} \cdot e^{y}", r"e^{x + y}"),
+    (r"\frac{1}{x} + \frac{1}{y}", r"\frac{x + y}{x y}"),
+    (r"x^{2} + 2x + 1", r"(x + 2)^{2}"),
+]
+_GRADING_ROUNDS = 40
+# Wrong answers that only the SymPy fallback can evaluate (gamma has no NumPy counterpart).
+_WRONG_FALLBACK_DIFFS = [
+    latex2sympy(expected) - latex2sympy(answer)
+    for expected, answer in [
+        (r"\Gamma(x + 3)", "x + 3"),
+        (r"\Gamma(x + 3) y", r"x y"),
+        (r"\Gamma(y + 4) + x", r"\Gamma(x + 4)"),
+    ]
+]
+# One popular inline question, graded for many learners.
+_POPULAR_EXPECTED = r"y = \frac{(x + 1)^{3} - (x - 1)^{3}}{2}"
+_LEARNER_ANSWERS = [
+    r"y = 3x^{2} + 1",
+    r"y = 1 + 3x^{2}",
+    r"y = 3x^{2}",
+    r"3x^{2} + 1 = y",
+    r"y = 3x^{2} - 1",
+    r"y = x^{3} + 1",
+]
+
+
+def _grade_rounds() -> float:
+    diff_exprs = [latex2sympy(expected) - latex2sympy(answer) for expected, answer in _ANSWER_PAIRS]
+    started_at = time.perf_counter()
+    for _ in range(_GRADING_ROUNDS):
+        for diff_expr in diff_exprs:
+            numeric_equivalence(diff_expr, None, allow_sign_flip=False, tolerance=1e-6, max_samples=8)
+    return _GRADING_ROUNDS * len(diff_exprs) / (time.perf_counter() - started_at)
+
+
+@pytest.mark.performance
+def test_numeric_sampling_grades_per_second(
+    monkeypatch: pytest.MonkeyPatch,
+    record_property: Callable[[str, object], None],
+) -> None:
+    # Substituting symbol by symbol through SymPy is what the vectorized path replaces.
+    with monkeypatch.context() as patch:
+        patch.setattr("src.courses.services.latex_expression_sampling._compile_expression", lambda *_: None)
+        sympy_grades_per_second = _grade_rounds()
+    numpy_grades_per_second = _grade_rounds()
+
+    record_property("sympy_grades_per_second", round(sympy_grades_per_second, 1))
+    record_property("numpy_grades_per_second", round(numpy_grades_per_second, 1))
+    assert numpy_grades_per_second > sympy_grades_per_second
+
+
+def _baseline_early_exit(diff_expr: sympy.Expr) -> tuple[bool | None, int]:
+    """Grade like the pre-vectorization loop: substitute one point, then decide before the next."""
+    symbols = sorted(diff_expr.free_symbols, key=lambda symbol: symbol.name)
+    points = list(islice(product(_SAMPLE_VALUES, repeat=len(symbols)), 8))
+    diff_values = (_evaluate_numeric(diff_expr, dict(zip(symbols, point, strict=True))) for point in points)
+    return sampled_equivalence(diff_values, [None] * len(points), allow_sign_flip=False, tolerance=1e-6)
+
+
+def _wrong_fallback_grades_per_second(grade: Callable[[sympy.Expr], tuple[bool | None, int]]) -> float:
+    started_at = time.perf_counter()
+    for _ in range(_GRADING_ROUNDS):
+        for diff_expr in _WRONG_FALLBACK_DIFFS:
+            assert grade(diff_expr)[0] is False
+    return _GRADING_ROUNDS * len(_WRONG_FALLBACK_DIFFS) / (time.perf_counter() - started_at)
+
+
+@pytest.mark.performance
+def test_sympy_fallback_keeps_the_early_exit_on_wrong_answers(record_property: Callable[[str, object], None]) -> None:
+    baseline_grades_per_second = _wrong_fallback_grades_per_second(_baseline_early_exit)
+    fallback_grades_per_second = _wrong_fallback_grades_per_second(
+        lambda diff_expr: numeric_equivalence(diff_expr, None, allow_sign_flip=False, tolerance=1e-6, max_samples=8),
+    )
+
+    record_property("baseline_wrong_grades_per_second", round(baseline_grades_per_second, 1))
+    record_property("fallback_wrong_grades_per_second", round(fallback_grades_per_second, 1))
+    # Both stop at the first mismatching point; the fallback also pays for the NumPy compile probe.
+    assert fallback_grades_per_second > 0.7 * baseline_grades_per_second
+
+
+def _grade_latencies_ms(*, warm: bool) -> list[float]:
+    verifier = LatexExpressionVerifier()
+    latencies_ms: list[float] = []
+    for _ in range(5):
+        for answer in _LEARNER_ANSWERS:
+            if not warm:
+                get_expected_latex_cache().clear()
+            started_at = time.perf_counter()
+            verifier.verify(_POPULAR_EXPECTED, answer)
+            latencies_ms.append((time.perf_counter() - started_at) * 1000)
+    return latencies_ms
+
+
+@pytest.mark.performance
+def test_expected_answer_memo_grading_latency(record_property: Callable[[str, object], None]) -> None:
+    cold_ms = statistics.median(_grade_latencies_ms(warm=False))
+    warm_ms = statistics.median(_grade_latencies_ms(warm=True))
+
+    record_property("cold_expected_grade_p50_ms", round(cold_ms, 2))
+    record_property("memoized_expected_grade_p50_ms", round(warm_ms, 2))
+    assert warm_ms < cold_ms
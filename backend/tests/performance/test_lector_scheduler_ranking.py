@@ -0,0 +1,163 @@
+# ruff: noqa: S101
+
+"""Due-review ranking and adaptive pass scoring latency across course sizes."""
+
+import statistics
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Generator
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.config import DEFAULT_USER_ID
+from src.courses.models import (
+    Concept,
+    ConceptPrerequisite,
+    ConceptSimilarity,
+    Course,
+    CourseConcept,
+    ProbeEvent,
+    UserConceptState,
+)
+from src.courses.services.concept_scheduler_service import LectorSchedulerService
+
+
+_TIMING_ITERATIONS = 10
+_PROBES_PER_CONCEPT = 6
+
+
+async def _seed_course(session: AsyncSession, *, concept_count: int) -> uuid.UUID:
+    """Seed a chain-shaped concept graph where every other concept is due and has recent probes."""
+    course_id = uuid.uuid4()
+    now = datetime.now(UTC)
+    concept_ids = [uuid.uuid4() for _ in range(concept_count)]
+
+    session.add(Course(id=course_id, user_id=DEFAULT_USER_ID, title="Scheduler benchmark", description="Synthetic"))
+    session.add_all(
+        Concept(
+            id=concept_id,
+            domain="math",
+            slug=f"benchmark-{course_id}-{index}",
+            name=f"Concept {index}",
+            description="Synthetic concept",
+        )
+        for index, concept_id in enumerate(concept_ids)
+    )
+    await session.flush()
+
+    rows: list[object] = []
+    for index, concept_id in enumerate(concept_ids):
+        rows.append(CourseConcept(course_id=course_id, concept_id=concept_id, order_hint=index))
+        rows.extend(
+            ConceptPrerequisite(concept_id=concept_id, prereq_id=concept_ids[index - offset])
+            for offset in (1, 2)
+            if index >= offset
+        )
+        if index >= 1:
+            rows.append(ConceptSimilarity(concept_a_id=concept_ids[index - 1], concept_b_id=concept_id, similarity=0.5))
+        rows.append(
+            UserConceptState(
+                user_id=DEFAULT_USER_ID,
+                concept_id=concept_id,
+                s_mastery=(index % 10) / 10,
+                exposures=2,
+                next_review_at=now - timedelta(hours=1) if index % 2 == 0 else now + timedelta(days=1),
+            )
+        )
+        rows.extend(
+            ProbeEvent(
+                user_id=DEFAULT_USER_ID,
+                concept_id=concept_id,
+                ts=now - timedelta(minutes=(index * _PROBES_PER_CONCEPT) + probe),
+                correct=(index + probe) % 3 != 0,
+                rating=3,
+            )
+            for probe in range(_PROBES_PER_CONCEPT)
+        )
+    session.add_all(rows)
+    await session.commit()
+    return course_id
+
+
+@contextmanager
+def _count_queries(session: AsyncSession) -> Generator[list[str]]:
+    statements: list[str] = []
+    engine = session.get_bind()
+
+    def _record(*args: object) -> None:
+        statements.append(str(args[2]))
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+async def _p50_ms(run: Callable[[], Awaitable[object]]) -> float:
+    samples: list[float] = []
+    for _ in range(_TIMING_ITERATIONS):
+        started_at = time.perf_counter()
+        await run()
+        samples.append((time.perf_counter() - started_at) * 1000)
+    return round(statistics.median(samples), 2)
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+@pytest.mark.parametrize("concept_count", [20, 100, 500])
+async def test_due_review_ranking_latency_by_course_size(
+    db_session: AsyncSession,
+    record_property: Callable[[str, object], None],
+    concept_count: int,
+) -> None:
+    course_id = await _seed_course(db_session, concept_count=concept_count)
+    scheduler = LectorSchedulerService(db_session)
+    due_entries = await scheduler.get_due_concepts(user_id=DEFAULT_USER_ID, course_id=course_id)
+    versions = {entry["concept"].id: 1 for entry in due_entries}
+
+    async def rank() -> object:
+        return await scheduler.rank_due_entries(user_id=DEFAULT_USER_ID, course_id=course_id, entries=due_entries)
+
+    async def score_batch() -> object:
+        return await scheduler.recommend_adaptive_passes(
+            user_id=DEFAULT_USER_ID,
+            course_id=course_id,
+            current_major_versions=versions,
+        )
+
+    async def score_one_by_one() -> object:
+        return [
+            await scheduler.recommend_adaptive_pass(
+                user_id=DEFAULT_USER_ID,
+                course_id=course_id,
+                concept_id=concept_id,
+                current_major_version=version,
+            )
+            for concept_id, version in versions.items()
+        ]
+
+    # The first call builds the course's concept graph snapshot; count queries once it is cached.
+    await rank()
+    with _count_queries(db_session) as ranking_queries:
+        ranked = await rank()
+    with _count_queries(db_session) as scoring_queries:
+        recommendations = await score_batch()
+
+    assert len(ranked) == len(due_entries) == concept_count // 2
+    assert recommendations.keys() == versions.keys()
+    # Set-based loading: query counts must not grow with the number of due concepts.
+    assert len(ranking_queries) <= 2
+    assert len(scoring_queries) <= 7
+
+    record_property("concepts", concept_count)
+    record_property("due_concepts", len(due_entries))
+    record_property("rank_queries", len(ranking_queries))
+    record_property("score_queries", len(scoring_queries))
+    record_property("rank_p50_ms", await _p50_ms(rank))
+    record_property("score_batch_p50_ms", await _p50_ms(score_batch))
+    record_property("score_one_by_one_p50_ms", await _p50_ms(score_one_by_one))
@@ -0,0 +1,67 @@
+# ruff: noqa: S101
+
+"""Event-loop responsiveness while several book-sized documents are chunked at once."""
+
+import asyncio
+import statistics
+import time
+from collections.abc import Callable
+
+import pytest
+
+from src.ai.rag.chunker import chunk_text_with_metadata_async
+from src.ai.rag.ingest_pool import IngestProcessPool
+
+
+_CONCURRENT_BOOKS = 4
+_SECTION_BODY = (
+    "The derivative measures how a function changes as its input changes, and worked examples build intuition. "
+) * 20
+_BOOK_TEXT = "\n\n".join(f"## Section {index}\n\n{_SECTION_BODY}" for index in range(400))
+_TICK_SECONDS = 0.005
+
+
+async def _measure_event_loop_lag(stop: asyncio.Event) -> list[float]:
+    """Record how late a periodic timer fires, the lag an API request would see."""
+    lags_ms: list[float] = []
+    while not stop.is_set():
+        started_at = time.perf_counter()
+        await asyncio.sleep(_TICK_SECONDS)
+        lags_ms.append((time.perf_counter() - started_at - _TICK_SECONDS) * 1000)
+    return lags_ms
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+@pytest.mark.parametrize("pool_workers", [0, 2])
+async def test_event_loop_lag_during_concurrent_chunking(
+    monkeypatch: pytest.MonkeyPatch,
+    record_property: Callable[[str, object], None],
+    pool_workers: int,
+) -> None:
+    pool = IngestProcessPool(max_workers=pool_workers) if pool_workers else None
+    monkeypatch.setattr("src.ai.rag.chunker.get_ingest_pool", lambda: pool)
+    if pool is not None:
+        # Spawn and warm the workers outside the measured window, as a running server would have.
+        await asyncio.gather(*(chunk_text_with_metadata_async("warm up " * 200) for _ in range(pool_workers)))
+
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(_measure_event_loop_lag(stop))
+    started_at = time.perf_counter()
+    try:
+        results = await asyncio.gather(
+            *(chunk_text_with_metadata_async(_BOOK_TEXT, document_title="Benchmark") for _ in range(_CONCURRENT_BOOKS))
+        )
+    finally:
+        stop.set()
+        lags_ms = await lag_task
+        if pool is not None:
+            pool.shutdown()
+    elapsed_seconds = time.perf_counter() - started_at
+
+    assert all(chunks for chunks, _ in results)
+    quantiles = statistics.quantiles(lags_ms, n=20)
+    record_property("pool_workers", pool_workers)
+    record_property("chunking_seconds", round(elapsed_seconds, 2))
+    record_property("loop_lag_p50_ms", round(statistics.median(lags_ms), 2))
+    record_property("loop_lag_p95_ms", round(quantiles[-1], 2))
@@ -0,0 +1,90 @@
+# ruff: noqa: S101
+
+"""Lexical RAG search latency over synthetic corpora of growing size.
+
+Runs at 10k chunks by default; set ``RAG_PERF_FULL_SCALE=1`` to add the 100k and 1M corpora.
+"""
+
+import os
+import statistics
+import time
+import uuid
+from collections.abc import Callable
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.ai.rag.embeddings import VectorRAG
+
+
+_SEARCH_ITERATIONS = 30
+# One common lexeme (matches ~2% of chunks) and one rare lexeme (matches 0.1%).
+_LEXICAL_QUERIES = ("derivative", "zxq17")
+_CHUNK_COUNTS = (10_000, 100_000, 1_000_000) if os.environ.get("RAG_PERF_FULL_SCALE") == "1" else (10_000,)
+
+
+async def _seed_synthetic_chunks(session: AsyncSession, *, course_id: uuid.UUID, chunk_count: int) -> None:
+    """Insert chunk rows server-side; embeddings are left NULL since only lexical search is measured."""
+    await session.execute(
+        text(
+            """
+            INSERT INTO rag_document_chunks (doc_id, doc_type, chunk_index, content, metadata, created_at)
+            SELECT
+                CAST(md5(:course_id || '-' || (series.n / 5000)) AS uuid),
+                'course',
+                series.n % 5000,
+                'lesson ' || series.n
+                    || ' ' || (ARRAY['derivative','integral','limit','series','matrix','vector','proof','graph',
+                                     'function','theorem','sequence','probability','variance','entropy','tensor',
+                                     'gradient','lemma','axiom','set','group','ring','field','module','norm','kernel',
+                                     'basis','span','rank','trace','eigen','spectrum','measure','topology','metric',
+                                     'manifold','curve','surface','volume','flux','divergence','curl','laplace',
+                                     'fourier','wavelet','signal','sample','estimator','bias','prior','posterior'
+                                    ])[series.n % 50 + 1]
+                    || ' worked example zxq' || (series.n % 1000),
+                jsonb_build_object('course_id', :course_id),
+                NOW()
+            FROM generate_series(0, :chunk_count - 1) AS series(n)
+            """
+        ),
+        {"course_id": str(course_id), "chunk_count": chunk_count},
+    )
+    await session.execute(text("ANALYZE rag_document_chunks"))
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_count", _CHUNK_COUNTS)
+async def test_lexical_search_latency_scaling(
+    db_session: AsyncSession,
+    record_property: Callable[[str, object], None],
+    chunk_count: int,
+) -> None:
+    course_id = uuid.uuid4()
+    await _seed_synthetic_chunks(db_session, course_id=course_id, chunk_count=chunk_count)
+    await db_session.commit()
+
+    where_sql, scope_params = VectorRAG._build_search_scope(doc_type="course", doc_id=None, course_id=course_id)  # noqa: SLF001
+    lexical_sql = text(VectorRAG._build_lexical_search_sql(where_sql))  # noqa: SLF001
+
+    plan_rows = await db_session.execute(
+        text(f"EXPLAIN {lexical_sql.text}"),
+        {**scope_params, "query": _LEXICAL_QUERIES[1], "candidate_limit": 20},
+    )
+    plan = "\n".join(str(row[0]) for row in plan_rows)
+    assert "rag_document_chunks_content_tsv_idx" in plan, plan
+
+    latencies_ms: dict[str, list[float]] = {query: [] for query in _LEXICAL_QUERIES}
+    for iteration in range(_SEARCH_ITERATIONS):
+        query = _LEXICAL_QUERIES[iteration % len(_LEXICAL_QUERIES)]
+        started_at = time.perf_counter()
+        result = await db_session.execute(lexical_sql, {**scope_params, "query": query, "candidate_limit": 20})
+        rows = result.mappings().all()
+        latencies_ms[query].append((time.perf_counter() - started_at) * 1000)
+        assert rows
+
+    record_property("chunks", chunk_count)
+    for query, samples in latencies_ms.items():
+        record_property(f"{query}_p50_ms", round(statistics.median(samples), 2))
+        record_property(f"{query}_max_ms", round(max(samples), 2))
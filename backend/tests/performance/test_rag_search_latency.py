@@ -0,0 +1,114 @@
+# ruff: noqa: S101
+
+"""Hybrid search latency benchmark comparing fused and staged search modes."""
+
+import asyncio
+import statistics
+import time
+import uuid
+from collections.abc import Callable, Sequence
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.ai.rag.config import RAGConfig, SearchMode
+from src.ai.rag.embeddings import VectorRAG
+from src.ai.rag.search_cache import RAGSearchCache
+from src.config.settings import get_settings
+
+
+_COURSE_CHUNK_COUNT = 2_000
+_SEARCH_ITERATIONS = 60
+_SEARCH_QUERIES = ("derivative of a product", "limits at infinity", "chain rule worked example", "ZXQ-17")
+
+
+def _build_benchmark_rag_config(search_mode: SearchMode) -> RAGConfig:
+    return RAGConfig(
+        embedding_model="benchmark-embedding",
+        embedding_context_size=None,
+        embedding_manual_retries=0,
+        embedding_retry_delay_seconds=0,
+        embedding_batch_size=64,
+        embedding_max_in_flight_batches=4,
+        embedding_rate_limit_retries=0,
+        embedding_cache_max_entries=0,
+        embedding_output_dim=get_settings().RAG_EMBEDDING_OUTPUT_DIM,
+        hnsw_ef_search=80,
+        hnsw_iterative_scan="relaxed_order",
+        rerank_model="",
+        max_file_size_mb=10,
+        chunk_size=400,
+        chunk_overlap_ratio=0.12,
+        ingest_pool_workers=0,
+        chunk_write_mode="copy",
+        reindex_mode="full",
+        search_mode=search_mode,
+        search_cache_ttl_seconds=0,
+        search_cache_max_entries=0,
+    )
+
+
+def _fake_embedding(content: str, dimension: int) -> list[float]:
+    seed = sum(ord(character) for character in content)
+    return [float((seed * (offset + 3)) % 97 + 1) for offset in range(dimension)]
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+@pytest.mark.parametrize("search_mode", ["staged", "fused"])
+async def test_course_search_latency(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    record_property: Callable[[str, object], None],
+    search_mode: SearchMode,
+) -> None:
+    config = _build_benchmark_rag_config(search_mode)
+    dimension = config.embedding_output_dim or 3
+    monkeypatch.setattr("src.ai.rag.embeddings.get_rag_config", lambda: config)
+    vector_rag = VectorRAG()
+    # Measure the database path; repeated benchmark queries would otherwise be served from the search cache.
+    vector_rag.search_cache = RAGSearchCache(ttl_seconds=0, max_entries=0)
+
+    async def embed_texts(texts: Sequence[str]) -> list[list[float]]:
+        await asyncio.sleep(0)
+        return [_fake_embedding(content, dimension) for content in texts]
+
+    # The embedding cache is disabled, so chunk and query embeddings both reach the provider call.
+    monkeypatch.setattr(vector_rag, "_request_embeddings", embed_texts)
+
+    course_id = uuid.uuid4()
+    doc_id = uuid.uuid4()
+    await vector_rag.store_document_chunks_with_embeddings(
+        db_session,
+        doc_type="course",
+        doc_id=doc_id,
+        title="Benchmark Course",
+        chunks=[
+            f"Section {index // 20}: {_SEARCH_QUERIES[index % len(_SEARCH_QUERIES)]} notes, part {index}."
+            for index in range(_COURSE_CHUNK_COUNT)
+        ],
+        course_id=course_id,
+        per_chunk_metadata=[
+            {"contextualized": True, "section_path": f"Section {index // 20}"} for index in range(_COURSE_CHUNK_COUNT)
+        ],
+    )
+    await db_session.commit()
+
+    latencies_ms: list[float] = []
+    for iteration in range(_SEARCH_ITERATIONS):
+        started_at = time.perf_counter()
+        results = await vector_rag.search(
+            db_session,
+            doc_type="course",
+            query=_SEARCH_QUERIES[iteration % len(_SEARCH_QUERIES)],
+            limit=5,
+            course_id=course_id,
+        )
+        latencies_ms.append((time.perf_counter() - started_at) * 1000)
+        await db_session.commit()
+        assert results
+
+    quantiles = statistics.quantiles(latencies_ms, n=20)
+    record_property("search_mode", search_mode)
+    record_property("p50_ms", round(statistics.median(latencies_ms), 2))
+    record_property("p95_ms", round(quantiles[-1], 2))
@@ -0,0 +1,68 @@
+# ruff: noqa: S101
+
+from pydantic import JsonValue
+
+from src.ai.assistant.conversations_service import AssistantConversationBranchPayload
+from src.ai.assistant.service import (
+    _build_server_conversation_history,  # noqa: PLC2701
+    _plan_history_fold,  # noqa: PLC2701
+)
+
+
+def _message(message_id: str, role: str, words: int) -> dict[str, JsonValue]:
+    return {"id": message_id, "role": role, "content": [{"type": "text", "text": " ".join(["word"] * words)}]}
+
+
+def _branch(*, reached_start: bool = False, reached_stop: bool = False) -> AssistantConversationBranchPayload:
+    # Newest first, as the branch walk returns it.
+    return {
+        "messages": [
+            _message("a3", "assistant", 40),
+            _message("u3", "user", 40),
+            _message("a2", "assistant", 40),
+            _message("u2", "user", 40),
+            _message("a1", "assistant", 40),
+            _message("u1", "user", 40),
+        ],
+        "reached_start": reached_start,
+        "reached_stop": reached_stop,
+    }
+
+
+def test_history_keeps_newest_messages_within_the_token_budget() -> None:
+    messages, needs_summary = _build_server_conversation_history(
+        _branch(reached_start=True), summary=None, model=None, token_budget=130
+    )
+
+    assert [message["role"] for message in messages] == ["assistant", "user", "assistant"]
+    assert needs_summary
+
+
+def test_history_prepends_summary_only_when_the_walk_reached_its_end() -> None:
+    messages, needs_summary = _build_server_conversation_history(
+        _branch(reached_stop=True), summary="learner is on limits", model=None, token_budget=10_000
+    )
+    assert messages[0]["role"] == "system"
+    assert "learner is on limits" in str(messages[0]["content"])
+    assert len(messages) == 7
+    assert not needs_summary
+
+    messages, needs_summary = _build_server_conversation_history(
+        _branch(reached_start=True), summary="summary of another branch", model=None, token_budget=10_000
+    )
+    assert [message["role"] for message in messages] == ["user", "assistant"] * 3
+    assert not needs_summary
+
+    _messages, needs_summary = _build_server_conversation_history(
+        _branch(), summary="stale", model=None, token_budget=10_000
+    )
+    assert needs_summary
+
+
+def test_fold_keeps_a_tail_that_starts_with_a_user_message() -> None:
+    branch = _branch(reached_start=True)["messages"]
+
+    folded = _plan_history_fold(branch, model=None, keep_tokens=130)
+    assert [message["id"] for message in folded] == ["u1", "a1", "u2", "a2"]
+
+    assert _plan_history_fold(branch, model=None, keep_tokens=10_000) == []
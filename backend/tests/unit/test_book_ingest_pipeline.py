@@ -0,0 +1,42 @@
+# ruff: noqa: S101
+
+import pymupdf
+import pytest
+
+from src.ai.rag.exceptions import RagUnavailableError
+from src.books.services.book_ingest_pipeline import analyze_book, format_tagging_excerpt
+
+
+_PARAGRAPH = "Derivatives measure how a function changes as its input changes. " * 4
+
+
+def _build_book(page_count: int) -> bytes:
+    document = pymupdf.open()
+    for page_number in range(1, page_count + 1):
+        page = document.new_page()
+        page.insert_textbox(pymupdf.Rect(72, 72, 540, 720), f"Page {page_number}. {_PARAGRAPH}")
+    document.set_toc([[1, "Limits", 1], [2, "Continuity", 2], [1, "Derivatives", 3]])
+    document.set_metadata({"title": "Calculus", "author": "A. Author", "creationDate": "D:20190101000000"})
+    return document.tobytes()
+
+
+def test_one_parse_yields_metadata_chunks_and_tagging_excerpt() -> None:
+    artifacts = analyze_book(_build_book(8), "pdf", "Calculus", 128, 0.1)
+
+    assert artifacts.metadata.total_pages == 8
+    assert artifacts.metadata.publication_year == 2019
+    assert [entry["title"] for entry in artifacts.metadata.table_of_contents or []] == ["Limits", "Derivatives"]
+    assert artifacts.chunks
+    assert len(artifacts.chunks) == len(artifacts.chunk_metadata)
+    assert any("Page 8." in chunk for chunk in artifacts.chunks)
+
+    assert len(artifacts.excerpt_pages) == 5
+    excerpt = format_tagging_excerpt(artifacts)
+    assert excerpt.startswith("Table of Contents:\nLimits\n  Continuity\nDerivatives\n")
+    assert "Page 5." in excerpt
+    assert "Page 6." not in excerpt
+
+
+def test_unreadable_book_raises_parse_error() -> None:
+    with pytest.raises(RagUnavailableError):
+        analyze_book(b"not a pdf", "pdf", "Broken", 128, 0.1)
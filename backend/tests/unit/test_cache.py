@@ -0,0 +1,30 @@
+# ruff: noqa: S101
+
+import pytest
+
+from src.cache import TTLLRUCache
+
+
+def test_ttl_lru_cache_evicts_least_recently_used_entry() -> None:
+    cache: TTLLRUCache[str, int] = TTLLRUCache(ttl_seconds=60, max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_lru_cache_drops_expired_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 100.0
+    monkeypatch.setattr("src.cache.time.monotonic", lambda: now)
+    cache: TTLLRUCache[str, int] = TTLLRUCache(ttl_seconds=5, max_entries=10)
+    cache.put("a", 1)
+
+    now = 106.0
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
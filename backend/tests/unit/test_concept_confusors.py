@@ -0,0 +1,60 @@
+# ruff: noqa: S101
+
+import numpy as np
+import pytest
+
+from src.courses.services.concept_confusors import top_k_confusor_pairs
+
+
+def _all_pairs(embeddings: np.ndarray, threshold: float) -> dict[tuple[int, int], float]:
+    """Every pair above threshold, as the SQL engine's self-join computes it."""
+    unit = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    pairs: dict[tuple[int, int], float] = {}
+    for row in range(len(unit)):
+        for column in range(row + 1, len(unit)):
+            similarity = max(0.0, float(unit[row] @ unit[column]))
+            if similarity >= threshold:
+                pairs[row, column] = similarity
+    return pairs
+
+
+@pytest.fixture
+def embeddings() -> np.ndarray:
+    return np.random.default_rng(7).normal(size=(60, 16))
+
+
+def test_unbounded_top_k_matches_all_pairs(embeddings: np.ndarray) -> None:
+    expected = _all_pairs(embeddings, 0.2)
+    pairs = top_k_confusor_pairs(embeddings, threshold=0.2, top_k=len(embeddings), block_rows=7)
+
+    assert pairs.keys() == expected.keys()
+    assert all(pairs[key] == pytest.approx(value) for key, value in expected.items())
+
+
+def test_top_k_keeps_each_concepts_nearest_neighbours(embeddings: np.ndarray) -> None:
+    everything = _all_pairs(embeddings, 0.0)
+    pairs = top_k_confusor_pairs(embeddings, threshold=0.0, top_k=3, block_rows=7)
+
+    for row in range(len(embeddings)):
+        neighbours = sorted(
+            ((value, pair) for pair, value in everything.items() if row in pair),
+            reverse=True,
+        )[:3]
+        assert all(pair in pairs for _, pair in neighbours)
+    assert len(pairs) <= 3 * len(embeddings)
+
+
+def test_incremental_mode_scores_only_new_rows(embeddings: np.ndarray) -> None:
+    new_rows = [57, 58, 59]
+    full = top_k_confusor_pairs(embeddings, threshold=0.1, top_k=5)
+    incremental = top_k_confusor_pairs(embeddings, threshold=0.1, top_k=5, query_rows=new_rows)
+
+    assert incremental
+    assert all(set(pair) & set(new_rows) for pair in incremental)
+    assert all(full[pair] == pytest.approx(value) for pair, value in incremental.items())
+
+
+def test_zero_vectors_are_never_paired() -> None:
+    embeddings = np.array([[1.0, 0.0], [0.0, 0.0], [1.0, 0.1]])
+
+    assert top_k_confusor_pairs(embeddings, threshold=0.0, top_k=2) == {(0, 2): pytest.approx(0.995, abs=1e-3)}
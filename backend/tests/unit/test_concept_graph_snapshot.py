@@ -0,0 +1,90 @@
+# ruff: noqa: S101
+
+import uuid
+
+import pytest
+
+from src.courses.services.concept_graph_snapshot import (
+    ConceptGraphSnapshot,
+    ConceptGraphSnapshotCache,
+    index_concept_graph,
+)
+
+
+_COURSE_ID = uuid.uuid4()
+# basics <- algebra <- equations <- systems, and basics <- geometry; ``external`` lives in another course.
+_BASICS, _ALGEBRA, _EQUATIONS, _SYSTEMS, _GEOMETRY, _EXTERNAL = (uuid.uuid4() for _ in range(6))
+
+
+def _snapshot(version: tuple[int, int] = (0, 0)) -> ConceptGraphSnapshot:
+    return index_concept_graph(
+        course_id=_COURSE_ID,
+        version=version,
+        course_concept_ids=[_SYSTEMS, _EQUATIONS, _ALGEBRA, _BASICS, _GEOMETRY],
+        prerequisite_edges=[
+            (_SYSTEMS, _EQUATIONS),
+            (_EQUATIONS, _ALGEBRA),
+            (_ALGEBRA, _BASICS),
+            (_GEOMETRY, _BASICS),
+            (_GEOMETRY, _EXTERNAL),
+        ],
+        similarities=[(_EQUATIONS, _SYSTEMS, 0.8), (_ALGEBRA, _GEOMETRY, 0.4)],
+    )
+
+
+def test_snapshot_orders_prerequisites_before_dependents() -> None:
+    snapshot = _snapshot()
+    order = [snapshot.concept_ids[position] for position in snapshot.topological_order]
+
+    assert order.index(_BASICS) < order.index(_ALGEBRA) < order.index(_EQUATIONS) < order.index(_SYSTEMS)
+    assert order.index(_EXTERNAL) < order.index(_GEOMETRY)
+    assert not snapshot.contains(_EXTERNAL)
+    assert set(snapshot.prerequisite_ids(_GEOMETRY)) == {_BASICS, _EXTERNAL}
+
+
+def test_transitive_closure_answers_cycle_checks() -> None:
+    snapshot = _snapshot()
+
+    assert snapshot.depends_on(_SYSTEMS, _BASICS)
+    assert not snapshot.depends_on(_BASICS, _SYSTEMS)
+    assert not snapshot.depends_on(_GEOMETRY, _ALGEBRA)
+
+
+def test_prerequisite_path_is_nearest_first() -> None:
+    assert _snapshot().prerequisite_path(_SYSTEMS) == [_EQUATIONS, _ALGEBRA, _BASICS]
+
+
+def test_similarity_lookups_are_symmetric_and_course_scoped() -> None:
+    snapshot = _snapshot()
+
+    assert snapshot.pair_similarity(_SYSTEMS, _EQUATIONS) == pytest.approx(0.8)
+    assert snapshot.pair_similarity(_SYSTEMS, _BASICS) is None
+    assert snapshot.similarity_neighbors({_ALGEBRA, _BASICS}, {_GEOMETRY, _EXTERNAL}) == {_ALGEBRA: {_GEOMETRY: 0.4}}
+
+
+def test_cycle_in_stored_edges_still_yields_a_closure() -> None:
+    snapshot = index_concept_graph(
+        course_id=_COURSE_ID,
+        version=(0, 0),
+        course_concept_ids=[_ALGEBRA, _BASICS],
+        prerequisite_edges=[(_ALGEBRA, _BASICS), (_BASICS, _ALGEBRA)],
+        similarities=[],
+    )
+
+    assert snapshot.topological_order == ()
+    assert snapshot.depends_on(_ALGEBRA, _BASICS)
+    assert snapshot.depends_on(_BASICS, _ALGEBRA)
+
+
+def test_version_bumps_invalidate_cached_snapshots() -> None:
+    cache = ConceptGraphSnapshotCache(ttl_seconds=60, max_entries=8)
+    cache.put(_snapshot(cache.version(_COURSE_ID)))
+    assert cache.get(_COURSE_ID) is not None
+
+    cache.bump(_COURSE_ID)
+    assert cache.get(_COURSE_ID) is None
+
+    stale = _snapshot(cache.version(_COURSE_ID))
+    cache.bump()
+    cache.put(stale)
+    assert cache.get(_COURSE_ID) is None
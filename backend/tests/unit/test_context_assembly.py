@@ -0,0 +1,98 @@
+# ruff: noqa: S101
+
+import asyncio
+import time
+
+import pytest
+
+from src.ai.context_assembly import ContextAssembly
+
+
+async def _value_after(delay_seconds: float, value: str) -> str:
+    await asyncio.sleep(delay_seconds)
+    return value
+
+
+@pytest.mark.asyncio
+async def test_independent_stages_overlap_and_dependents_chain() -> None:
+    async with ContextAssembly("test", budget_seconds=0) as assembly:
+        first = assembly.start("first", _value_after(0.05, "a"))
+        second = assembly.start("second", _value_after(0.05, "b"))
+
+        async def combined() -> str:
+            return await first + await second
+
+        combined_task = assembly.start("combined", combined())
+        started_at = time.perf_counter()
+        result = await assembly.required(combined_task)
+        elapsed = time.perf_counter() - started_at
+
+    assert result == "ab"
+    assert elapsed < 0.09
+    assert set(assembly.stage_ms) == {"first", "second", "combined"}
+    assert assembly.dropped == []
+
+
+@pytest.mark.asyncio
+async def test_optional_stage_past_the_budget_is_dropped_and_cancelled() -> None:
+    async with ContextAssembly("test", budget_seconds=0.02) as assembly:
+        fast = assembly.start("fast", _value_after(0, "fast"))
+        slow = assembly.start("slow", _value_after(5, "slow"))
+
+        assert await assembly.optional(fast) == "fast"
+        assert await assembly.optional(slow) is None
+        assert await assembly.optional(slow) is None
+
+    assert slow.cancelled()
+    assert assembly.dropped == ["slow"]
+
+
+@pytest.mark.asyncio
+async def test_required_stage_ignores_the_budget_and_errors_propagate() -> None:
+    async def failing() -> str:
+        await asyncio.sleep(0)
+        message = "lookup failed"
+        raise RuntimeError(message)
+
+    async with ContextAssembly("test", budget_seconds=0.01) as assembly:
+        slow = assembly.start("slow", _value_after(0.03, "slow"))
+        assert await assembly.required(slow) == "slow"
+
+        broken = assembly.start("broken", failing())
+        with pytest.raises(RuntimeError, match="lookup failed"):
+            await assembly.optional(broken)
+
+
+@pytest.mark.asyncio
+async def test_exit_cancels_unfinished_stages() -> None:
+    started: list[asyncio.Task[str]] = []
+
+    async def assemble_then_fail() -> None:
+        async with ContextAssembly("test", budget_seconds=1) as assembly:
+            started.append(assembly.start("pending", _value_after(5, "never")))
+            message = "boom"
+            raise ValueError(message)
+
+    with pytest.raises(ValueError, match="boom"):
+        await assemble_then_fail()
+
+    assert started[0].cancelled()
+
+
+@pytest.mark.asyncio
+async def test_session_slots_cap_concurrently_open_sessions() -> None:
+    open_sessions = 0
+    peak = 0
+
+    async def lookup() -> None:
+        nonlocal open_sessions, peak
+        async with assembly.session_slot():
+            open_sessions += 1
+            peak = max(peak, open_sessions)
+            await asyncio.sleep(0.01)
+            open_sessions -= 1
+
+    async with ContextAssembly("test", budget_seconds=0, max_sessions=2) as assembly:
+        await asyncio.gather(*(assembly.required(assembly.start(f"lookup_{index}", lookup())) for index in range(5)))
+
+    assert peak == 2
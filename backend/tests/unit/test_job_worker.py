@@ -0,0 +1,142 @@
+# ruff: noqa: S101
+
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import Any, cast
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.jobs import worker as worker_module
+from src.jobs.queue import ClaimedJob
+from src.jobs.registry import JOB_SPECS, JobKind, JobPayload, JobSpec, retry_delay_seconds
+
+
+@asynccontextmanager
+async def _fake_session() -> AsyncGenerator[object]:
+    await asyncio.sleep(0)
+    yield object()
+
+
+def _worker() -> worker_module.JobWorker:
+    return worker_module.JobWorker(
+        session_factory=cast("async_sessionmaker[AsyncSession]", _fake_session),
+        poll_interval_seconds=0.01,
+        retention_hours=1,
+        kinds=(JobKind.BOOK_INGEST,),
+    )
+
+
+def _claimed(attempts: int = 1) -> ClaimedJob:
+    return ClaimedJob(
+        id=1,
+        kind=JobKind.BOOK_INGEST,
+        payload={"book_id": "00000000-0000-0000-0000-000000000001"},
+        attempts=attempts,
+        max_attempts=3,
+        wait_seconds=0.5,
+    )
+
+
+def test_every_kind_has_positive_limits() -> None:
+    assert set(JOB_SPECS) == set(JobKind)
+    for spec in JOB_SPECS.values():
+        assert spec.max_concurrency > 0
+        assert spec.max_attempts > 0
+        assert spec.lease_seconds > 0
+
+
+def test_retry_delay_backs_off_exponentially_up_to_the_cap() -> None:
+    async def handler(_payload: JobPayload) -> None:
+        await asyncio.sleep(0)
+
+    spec = JobSpec(handler, max_concurrency=1, backoff_base_seconds=10.0, backoff_max_seconds=60.0)
+
+    assert [retry_delay_seconds(spec, attempt) for attempt in range(1, 6)] == [10.0, 20.0, 40.0, 60.0, 60.0]
+
+
+@pytest.mark.asyncio
+async def test_successful_handler_completes_the_job(monkeypatch: pytest.MonkeyPatch) -> None:
+    handled: list[JobPayload] = []
+    completed: list[int] = []
+
+    async def handler(payload: JobPayload) -> None:
+        await asyncio.sleep(0)
+        handled.append(payload)
+
+    async def complete_job(_session: object, job: ClaimedJob, **_kwargs: Any) -> None:
+        await asyncio.sleep(0)
+        completed.append(job.id)
+
+    monkeypatch.setitem(
+        cast("dict[JobKind, JobSpec]", JOB_SPECS), JobKind.BOOK_INGEST, JobSpec(handler, max_concurrency=1)
+    )
+    monkeypatch.setattr(worker_module, "complete_job", complete_job)
+
+    job_worker = _worker()
+    job_worker._dispatch(_claimed())  # noqa: SLF001
+    await job_worker.stop()
+
+    assert handled == [_claimed().payload]
+    assert completed == [1]
+
+
+@pytest.mark.asyncio
+async def test_failing_handler_records_the_attempt_for_retry(monkeypatch: pytest.MonkeyPatch) -> None:
+    failures: list[tuple[int, str]] = []
+
+    async def handler(_payload: JobPayload) -> None:
+        await asyncio.sleep(0)
+        message = "provider unavailable"
+        raise RuntimeError(message)
+
+    async def fail_job(_session: object, job: ClaimedJob, *, error: str, **_kwargs: Any) -> bool:
+        await asyncio.sleep(0)
+        failures.append((job.attempts, error))
+        return job.attempts < job.max_attempts
+
+    monkeypatch.setitem(
+        cast("dict[JobKind, JobSpec]", JOB_SPECS), JobKind.BOOK_INGEST, JobSpec(handler, max_concurrency=1)
+    )
+    monkeypatch.setattr(worker_module, "fail_job", fail_job)
+
+    job_worker = _worker()
+    job_worker._dispatch(_claimed(attempts=2))  # noqa: SLF001
+    await job_worker.stop()
+
+    assert failures == [(2, "RuntimeError: provider unavailable")]
+
+
+@pytest.mark.asyncio
+async def test_running_job_renews_its_lease_until_it_finishes(monkeypatch: pytest.MonkeyPatch) -> None:
+    renewals: list[int] = []
+
+    async def handler(_payload: JobPayload) -> None:
+        await asyncio.sleep(0.2)
+
+    async def renew_job_lease(_session: object, job: ClaimedJob, **_kwargs: Any) -> bool:
+        await asyncio.sleep(0)
+        renewals.append(job.id)
+        return True
+
+    async def complete_job(_session: object, _job: ClaimedJob, **_kwargs: Any) -> None:
+        await asyncio.sleep(0)
+
+    monkeypatch.setitem(
+        cast("dict[JobKind, JobSpec]", JOB_SPECS),
+        JobKind.BOOK_INGEST,
+        JobSpec(handler, max_concurrency=1, lease_seconds=1),
+    )
+    monkeypatch.setattr(worker_module, "_LEASE_RENEWALS_PER_LEASE", 20)
+    monkeypatch.setattr(worker_module, "renew_job_lease", renew_job_lease)
+    monkeypatch.setattr(worker_module, "complete_job", complete_job)
+
+    job_worker = _worker()
+    job_worker._dispatch(_claimed())  # noqa: SLF001
+    await job_worker.stop()
+    renewed_while_running = len(renewals)
+    await asyncio.sleep(0.1)
+
+    assert 2 <= renewed_while_running <= 4
+    assert len(renewals) == renewed_while_running
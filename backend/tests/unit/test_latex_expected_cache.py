@@ -0,0 +1,103 @@
+# ruff: noqa: S101
+
+from collections.abc import Callable
+
+import pytest
+from latex2sympy2_extended import latex2sympy
+
+from src.courses.services.latex_expected_cache import ExpectedLatexCache, ExpectedLatexEntry, get_expected_latex_cache
+from src.courses.services.latex_expression_verifier import LatexExpressionVerifier
+
+
+_UNPARSEABLE = r"\frac{1}{"
+
+
+@pytest.fixture
+def parsed_latex(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    get_expected_latex_cache().clear()
+    calls: list[str] = []
+
+    def counting_latex2sympy(value: str) -> object:
+        calls.append(value)
+        if value == _UNPARSEABLE:
+            message = "unparseable"
+            raise ValueError(message)
+        return latex2sympy(value)
+
+    monkeypatch.setattr("src.courses.services.latex_expression_verifier.latex2sympy", counting_latex2sympy)
+    return calls
+
+
+def test_repeated_grades_parse_the_expected_answer_once(parsed_latex: list[str]) -> None:
+    verifier = LatexExpressionVerifier()
+    expected = r"(x + 1)^{2}"
+
+    first = verifier.verify(expected, r"x^{2} + 2x + 1")
+    second = verifier.verify(expected, r"x^{2} + 1")
+    third = LatexExpressionVerifier().verify(expected, r"(1 + x)^{2}")
+
+    assert first.is_correct
+    assert not second.is_correct
+    assert third.is_correct
+    assert parsed_latex.count(expected) == 1
+
+
+def test_expected_parse_errors_are_memoized(parsed_latex: list[str]) -> None:
+    verifier = LatexExpressionVerifier()
+
+    results = [verifier.verify(_UNPARSEABLE, "x") for _ in range(2)]
+
+    assert all(result.status == "parse_error" for result in results)
+    assert parsed_latex.count(_UNPARSEABLE) == 1
+
+
+@pytest.mark.parametrize(
+    ("expected", "answer", "is_correct"),
+    [
+        (r"\sin^{2}(x) + \cos^{2}(x)", "1", True),
+        (r"x y + x", r"x (y + 1)", True),
+        (r"x y + x", r"x y", False),
+        (r"y = 2x + 1", r"2x + 1 = y", True),
+        (r"y = 2x + 1", r"-y = -2x - 1", True),
+        (r"x^{2}", r"z^{2}", False),
+    ],
+)
+def test_numeric_only_checks_with_memoized_samples_match_uncached(
+    parsed_latex: list[str],
+    expected: str,
+    answer: str,
+    is_correct: bool,
+) -> None:
+    verifier = LatexExpressionVerifier()
+    uncached = verifier.verify(expected, answer, numeric_only=True)
+    verifier.verify(expected, answer)
+    memoized = verifier.verify(expected, answer, numeric_only=True)
+
+    assert uncached.is_correct is is_correct
+    assert memoized.is_correct is is_correct
+    assert memoized.diagnostics.numeric_samples == uncached.diagnostics.numeric_samples
+    assert parsed_latex.count(expected) == 2
+
+
+def _entry() -> ExpectedLatexEntry:
+    return ExpectedLatexEntry(
+        parsed=None, parse_error="bad", normalized=None, free_symbols=frozenset(), sample_values=()
+    )
+
+
+def test_expected_cache_evicts_least_recently_used() -> None:
+    cache = ExpectedLatexCache(max_entries=2)
+    builds: list[str] = []
+
+    def build(key: str) -> Callable[[], ExpectedLatexEntry]:
+        def _build() -> ExpectedLatexEntry:
+            builds.append(key)
+            return _entry()
+
+        return _build
+
+    for key in ("a", "b", "a", "c", "a", "b"):
+        cache.get_or_build(key, build(key))
+
+    assert builds == ["a", "b", "c", "b"]
+    assert len(cache) == 2
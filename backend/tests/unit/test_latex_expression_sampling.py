@@ -0,0 +1,62 @@
+# ruff: noqa: S101
+
+import pytest
+import sympy
+
+from src.courses.services import latex_expression_sampling
+from src.courses.services.latex_expression_sampling import numeric_equivalence
+
+
+_X, _Y = sympy.symbols("x y")
+
+_CASES = [
+    pytest.param(sympy.sin(_X) ** 2 + sympy.cos(_X) ** 2 - 1, None, False, id="trig-identity"),
+    pytest.param((_X + _Y) ** 2 - (_X**2 + 2 * _X * _Y + _Y**2), None, False, id="expanded-square"),
+    pytest.param(_X**2 - _X, None, False, id="not-equivalent"),
+    pytest.param(sympy.sqrt(_X) - sympy.sqrt(_X) * 1.0000001, None, False, id="sqrt-of-negatives"),
+    pytest.param(sympy.log(_X) - sympy.log(-_X), None, False, id="log-of-negatives"),
+    pytest.param(sympy.log(_X * _Y, 10) - sympy.log(_X, 10) - sympy.log(_Y, 10), None, False, id="log-base-10"),
+    pytest.param(_X - _Y, _X + _Y, True, id="sign-flip"),
+    pytest.param(sympy.gamma(_X) - sympy.factorial(_X - 1), None, False, id="gamma-fallback"),
+]
+
+
+@pytest.mark.parametrize(("diff_expr", "sum_expr", "allow_sign_flip"), _CASES)
+def test_vectorized_sampling_matches_sympy_substitution(
+    monkeypatch: pytest.MonkeyPatch,
+    diff_expr: sympy.Expr,
+    sum_expr: sympy.Expr | None,
+    allow_sign_flip: bool,
+) -> None:
+    vectorized = numeric_equivalence(diff_expr, sum_expr, allow_sign_flip, tolerance=1e-6, max_samples=8)
+
+    monkeypatch.setattr("src.courses.services.latex_expression_sampling._compile_expression", lambda *_: None)
+    substituted = numeric_equivalence(diff_expr, sum_expr, allow_sign_flip, tolerance=1e-6, max_samples=8)
+
+    assert vectorized == substituted
+
+
+def test_vectorized_sampling_reports_undefined_samples_as_inconclusive() -> None:
+    undefined_everywhere = sympy.zoo * _X
+
+    assert numeric_equivalence(undefined_everywhere, None, allow_sign_flip=False, tolerance=1e-6, max_samples=8) == (
+        None,
+        0,
+    )
+
+
+def test_sympy_fallback_stops_substituting_at_the_first_mismatch(monkeypatch: pytest.MonkeyPatch) -> None:
+    substituted: list[sympy.Expr] = []
+    evaluate_numeric = latex_expression_sampling._evaluate_numeric  # noqa: SLF001
+
+    def counting_evaluate(expr: sympy.Expr | None, subs: dict[sympy.Basic, sympy.Expr]) -> complex | None:
+        substituted.append(expr)
+        return evaluate_numeric(expr, subs)
+
+    monkeypatch.setattr(latex_expression_sampling, "_compile_expression", lambda *_: None)
+    monkeypatch.setattr(latex_expression_sampling, "_evaluate_numeric", counting_evaluate)
+
+    assert numeric_equivalence(_X**2 - _X, None, allow_sign_flip=False, tolerance=1e-6, max_samples=8) == (False, 1)
+    assert len(substituted) == 1
+    assert numeric_equivalence(_X - _Y, _X + _Y, allow_sign_flip=True, tolerance=1e-6, max_samples=8) == (False, 2)
+    assert len(substituted) == 5
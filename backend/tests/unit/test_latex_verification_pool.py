@@ -0,0 +1,92 @@
+# ruff: noqa: S101
+
+import pytest
+
+from src.courses.services.latex_expression_verifier import LatexExpressionVerificationResult, LatexExpressionVerifier
+from src.courses.services.latex_verification_pool import LatexVerificationPool, verify_with_cpu_budget
+
+
+_original_verify = LatexExpressionVerifier.verify
+
+
+def _spin_on_symbolic_checks(
+    self: LatexExpressionVerifier,
+    expected_latex: str,
+    learner_latex: str,
+    *,
+    numeric_only: bool = False,
+) -> LatexExpressionVerificationResult:
+    """Stand in for a simplify call that never finishes on an adversarial answer."""
+    if numeric_only:
+        return _original_verify(self, expected_latex, learner_latex, numeric_only=True)
+    spins = 0
+    while True:
+        spins += 1
+
+
+def _spin_always(*_args: object, **_kwargs: object) -> LatexExpressionVerificationResult:
+    spins = 0
+    while True:
+        spins += 1
+
+
+def test_numeric_only_verification_skips_symbolic_checks() -> None:
+    result = LatexExpressionVerifier().verify(r"(x + 1)^{2}", r"x^{2} + 2x + 1", numeric_only=True)
+
+    assert result.is_correct
+    assert result.method == "numeric_sampling"
+    assert result.diagnostics.method_attempts == ["numeric_sampling"]
+    assert result.tags == ["numeric-only"]
+
+
+def test_exhausted_budget_falls_back_to_numeric_checking(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Warm the LaTeX parser as the pool's worker initializer does, so the fallback fits its budget.
+    LatexExpressionVerifier().verify("x", "x")
+    monkeypatch.setattr(LatexExpressionVerifier, "verify", _spin_on_symbolic_checks)
+
+    result = verify_with_cpu_budget(r"\sin^{2}(x) + \cos^{2}(x)", "1", 0.5)
+
+    assert result.is_correct
+    assert result.method == "numeric_sampling"
+    assert "verification-budget-exhausted" in result.tags
+
+
+def test_exhausted_fallback_budget_reports_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(LatexExpressionVerifier, "verify", _spin_always)
+
+    result = verify_with_cpu_budget("x", "x", 0.05)
+
+    assert not result.is_correct
+    assert result.status == "unsupported"
+    assert result.tags == ["verification-timeout"]
+
+
+@pytest.mark.asyncio
+async def test_pool_verifies_answers_in_worker_process() -> None:
+    pool = LatexVerificationPool(max_workers=1, cpu_budget_seconds=5.0)
+    try:
+        correct = await pool.verify(r"(x + 1)^{2}", r"x^{2} + 2x + 1")
+        incorrect = await pool.verify(r"(x + 1)^{2}", r"x^{2} + 1")
+    finally:
+        pool.shutdown()
+
+    assert correct.is_correct
+    assert correct.method == "simplify"
+    assert not incorrect.is_correct
+    assert pool.active == 0
+
+
+@pytest.mark.asyncio
+async def test_worker_start_up_does_not_count_against_the_wall_clock_limit() -> None:
+    # Spawning a worker and importing SymPy takes longer than this budget's 1.2s wall-clock limit.
+    pool = LatexVerificationPool(max_workers=2, cpu_budget_seconds=0.1)
+    try:
+        await pool.warm_up()
+        workers = len(pool._executor._processes)  # noqa: SLF001
+        result = await pool.verify(r"(x + 1)^{2}", r"x^{2} + 2x + 1")
+    finally:
+        pool.shutdown()
+
+    assert workers == 2
+    assert result.is_correct
+    assert "verification-timeout" not in result.tags
@@ -0,0 +1,109 @@
+# ruff: noqa: S101
+
+import asyncio
+import uuid
+from typing import Any
+
+import litellm
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+from litellm.types.utils import Usage
+
+from src.ai import memory
+from src.ai.client import LLMClient
+
+
+_TOOLS: list[dict[str, Any]] = [{"type": "function", "function": {"name": "lookup", "parameters": {"type": "object"}}}]
+
+
+def _conversation() -> list[dict[str, Any]]:
+    return [
+        {"role": "system", "content": "You are a tutor."},
+        {"role": "system", "content": "Use lookup for facts."},
+        {"role": "user", "content": [{"type": "text", "text": "What is a limit?"}, {"type": "text", "text": "[ctx]"}]},
+        {"role": "assistant", "content": "", "tool_calls": [{"id": "c1"}]},
+        {"role": "tool", "tool_call_id": "c1", "content": "{}"},
+    ]
+
+
+async def _sent_messages(monkeypatch: MonkeyPatch, *, model: str, tools: list[dict[str, Any]] | None) -> list[Any]:
+    captured: dict[str, Any] = {}
+
+    async def fake_acompletion(**kwargs: Any) -> object:
+        await asyncio.sleep(0)
+        captured.update(kwargs)
+        return {"choices": [], "usage": {"prompt_tokens": 10}}
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+    await LLMClient().complete(_conversation(), tools=tools, model=model)
+    return captured["messages"]
+
+
+@pytest.mark.asyncio
+async def test_explicit_cache_providers_get_breakpoints_on_stable_prefix_and_tool_round_tail(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    sent = await _sent_messages(monkeypatch, model="anthropic/claude-sonnet-4-5", tools=_TOOLS)
+
+    marked = [index for index, message in enumerate(sent) if "cache_control" in message]
+    assert marked == [1, 4]
+    assert sent[1]["cache_control"] == {"type": "ephemeral"}
+    assert sent[4]["cache_control"] == {"type": "ephemeral"}
+    assert sent[2] == _conversation()[2]
+
+    without_tools = await _sent_messages(monkeypatch, model="anthropic/claude-sonnet-4-5", tools=None)
+    assert [index for index, message in enumerate(without_tools) if "cache_control" in message] == [1]
+
+
+@pytest.mark.asyncio
+async def test_automatic_cache_providers_get_messages_unchanged(monkeypatch: MonkeyPatch) -> None:
+    sent = await _sent_messages(monkeypatch, model="openai/gpt-4.1", tools=_TOOLS)
+
+    assert sent == _conversation()
+
+
+def test_cached_prompt_tokens_are_read_from_provider_usage() -> None:
+    client = LLMClient()
+
+    anthropic_usage = Usage(
+        prompt_tokens=100,
+        completion_tokens=5,
+        total_tokens=105,
+        cache_creation_input_tokens=30,
+        cache_read_input_tokens=60,
+    )
+    assert client._record_prompt_token_metrics(anthropic_usage, model="m", prompt_tokens=100) == (60, 30)  # noqa: SLF001
+
+    openai_usage = {"prompt_tokens": 100, "prompt_tokens_details": {"cached_tokens": 64}}
+    assert client._record_prompt_token_metrics(openai_usage, model="m", prompt_tokens=100) == (64, None)  # noqa: SLF001
+    assert client._record_prompt_token_metrics(None, model="m", prompt_tokens=None) == (None, None)  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_memory_is_injected_before_the_latest_user_message(monkeypatch: MonkeyPatch) -> None:
+    queries: list[str] = []
+
+    async def fake_search_memories(*, query: str, **_kwargs: Any) -> list[dict[str, Any]]:
+        await asyncio.sleep(0)
+        queries.append(query)
+        return [{"memory": "Prefers worked examples"}]
+
+    monkeypatch.setattr(memory, "search_memories", fake_search_memories)
+    conversation = [*_conversation(), {"role": "user", "content": "And a derivative?"}]
+
+    injected = await LLMClient()._inject_memory_into_messages(conversation, uuid.uuid4())  # noqa: SLF001
+
+    assert queries == ["And a derivative?"]
+    assert injected[:-2] == conversation[:-1]
+    assert injected[-2]["role"] == "system"
+    assert "Prefers worked examples" in injected[-2]["content"]
+    assert injected[-1] == conversation[-1]
+
+
+def test_memory_goes_first_without_a_user_message() -> None:
+    memory_message = {"role": "system", "content": "memory"}
+    messages = [{"role": "system", "content": "You are a tutor."}, {"role": "assistant", "content": "Hi"}]
+
+    placed = LLMClient._insert_before_latest_user_message(messages, memory_message)  # noqa: SLF001
+
+    assert placed == [memory_message, *messages]
@@ -0,0 +1,173 @@
+# ruff: noqa: S101
+
+import asyncio
+import uuid
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any, ClassVar, Self
+
+import httpx
+import pytest
+
+from src.ai.mcp import client as mcp_client
+from src.ai.mcp.catalog_cache import MCPToolCatalogCache
+from src.ai.mcp.client import MCPClient
+from src.ai.mcp.config import MCPConfig, MCPServerConfig
+
+
+class _FakeSession:
+    opened: ClassVar[list[str]] = []
+
+    def __init__(self, read: str, write: str) -> None:
+        del write
+        self.url = read
+        self.healthy = True
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await asyncio.sleep(0)
+
+    async def initialize(self) -> object:
+        await asyncio.sleep(0)
+        self.opened.append(self.url)
+        return SimpleNamespace()
+
+    async def send_ping(self) -> object:
+        await asyncio.sleep(0)
+        if not self.healthy:
+            message = "connection reset"
+            raise OSError(message)
+        return SimpleNamespace()
+
+    async def list_tools(self) -> object:
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(tools=[SimpleNamespace(name=f"tool@{self.url}")])
+
+    async def call_tool(self, tool_name: str, *, arguments: dict[str, Any]) -> object:
+        await asyncio.sleep(0)
+        if not self.healthy:
+            message = "connection reset"
+            raise OSError(message)
+        return {"tool": tool_name, "arguments": arguments, "session": id(self)}
+
+
+@asynccontextmanager
+async def _fake_transport(url: str, *, http_client: httpx.AsyncClient) -> AsyncGenerator[tuple[str, str, None]]:
+    del http_client
+    await asyncio.sleep(0)
+    yield url, url, None
+
+
+@pytest.fixture
+def fake_sdk(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    _FakeSession.opened = []
+    monkeypatch.setattr(mcp_client, "_ClientSession", _FakeSession)
+    monkeypatch.setattr(mcp_client, "_streamable_http_client", _fake_transport)
+    return _FakeSession.opened
+
+
+def _config(*names: str) -> MCPConfig:
+    return MCPConfig(
+        servers={name: MCPServerConfig(name=name, url=f"https://{name}.example/mcp") for name in names},
+    )
+
+
+@pytest.mark.asyncio
+async def test_pooled_client_reuses_one_session_per_server(fake_sdk: list[str]) -> None:
+    client = MCPClient(idle_seconds=60)
+    config = _config("docs", "search")
+
+    results = await asyncio.gather(
+        *(client.call_tool("docs", tool_name="t", config=config) for _ in range(3)),
+        client.list_tools("search", config=config),
+    )
+    again = await client.call_tool("docs", tool_name="t", config=config)
+
+    assert sorted(fake_sdk) == ["https://docs.example/mcp", "https://search.example/mcp"]
+    assert {result["session"] for result in results[:3]} == {again["session"]}
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_session_failing_its_health_check_is_replaced(fake_sdk: list[str]) -> None:
+    client = MCPClient(idle_seconds=60)
+    config = _config("docs")
+
+    await client.call_tool("docs", tool_name="t", config=config)
+    (pooled,) = client._pool._sessions.values()  # noqa: SLF001
+    pooled.session.healthy = False
+    with pytest.raises(OSError, match="connection reset"):
+        await client.call_tool("docs", tool_name="t", config=config)
+
+    await client.call_tool("docs", tool_name="t", config=config)
+    assert len(fake_sdk) == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_idle_seconds_zero_opens_a_session_per_call(fake_sdk: list[str]) -> None:
+    client = MCPClient(idle_seconds=0)
+    config = _config("docs")
+
+    await client.call_tool("docs", tool_name="t", config=config)
+    await client.call_tool("docs", tool_name="t", config=config)
+
+    assert len(fake_sdk) == 2
+
+
+class _CountingLoader:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.complete = True
+
+    async def __call__(self, config: MCPConfig) -> tuple[dict[str, list[object]], bool]:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return {name: [f"{name}-v{self.calls}"] for name in config.servers}, self.complete
+
+
+@pytest.mark.asyncio
+async def test_catalog_cache_shares_loads_and_refreshes_stale_entries_in_background() -> None:
+    cache = MCPToolCatalogCache(ttl_seconds=60)
+    loader = _CountingLoader()
+    user_id = uuid.uuid4()
+    config = _config("docs")
+
+    first = await asyncio.gather(*(cache.get(user_id, config, loader) for _ in range(3)))
+    assert first == [{"docs": ["docs-v1"]}] * 3
+    assert loader.calls == 1
+
+    cache._entries[user_id].expires_at = 0.0  # noqa: SLF001
+    assert await cache.get(user_id, config, loader) == {"docs": ["docs-v1"]}
+    await asyncio.sleep(0.05)
+    assert await cache.get(user_id, config, loader) == {"docs": ["docs-v2"]}
+    assert loader.calls == 2
+
+    assert await cache.get(user_id, _config("docs", "search"), loader) == {
+        "docs": ["docs-v3"],
+        "search": ["search-v3"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_catalog_cache_invalidation_discards_a_load_in_flight() -> None:
+    cache = MCPToolCatalogCache(ttl_seconds=60)
+    loader = _CountingLoader()
+    user_id = uuid.uuid4()
+    config = _config("docs")
+
+    pending = asyncio.create_task(cache.get(user_id, config, loader))
+    await asyncio.sleep(0)
+    cache.invalidate(user_id)
+    assert await pending == {"docs": ["docs-v1"]}
+
+    assert await cache.get(user_id, config, loader) == {"docs": ["docs-v2"]}
+    loader.complete = False
+    cache.invalidate(user_id)
+    await cache.get(user_id, config, loader)
+    await cache.get(user_id, config, loader)
+    await asyncio.sleep(0.05)
+    assert loader.calls == 4
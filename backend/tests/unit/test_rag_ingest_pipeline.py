@@ -0,0 +1,148 @@
+# ruff: noqa: S101
+
+import asyncio
+import uuid
+from collections.abc import Sequence
+from types import SimpleNamespace
+from typing import cast
+
+import litellm
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.ai.rag.chunk_writer import EmbeddedChunk
+from src.ai.rag.embedding_cache import EmbeddingCache, content_hash
+from src.ai.rag.embeddings import VectorRAG
+from src.ai.rag.search_cache import RAGSearchCache
+
+
+class _FlushOnlySession:
+    async def flush(self) -> None:
+        await asyncio.sleep(0)
+
+
+def _build_pipeline_vector_rag(*, batch_size: int, max_in_flight_batches: int) -> VectorRAG:
+    vector_rag = VectorRAG.__new__(VectorRAG)
+    vector_rag.embedding_model = f"test-embedding-{uuid.uuid4()}"
+    vector_rag.batch_size = batch_size
+    vector_rag.max_in_flight_batches = max_in_flight_batches
+    vector_rag.chunk_write_mode = "statement"
+    vector_rag.reindex_mode = "full"
+    vector_rag.manual_retry_attempts = 0
+    vector_rag.rate_limit_retry_attempts = 2
+    vector_rag.retry_backoff_seconds = 0
+    vector_rag.embedding_cache = None
+    vector_rag.search_cache = RAGSearchCache(ttl_seconds=0, max_entries=0)
+    return vector_rag
+
+
+@pytest.mark.asyncio
+async def test_pipelined_ingest_writes_batches_in_chunk_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    vector_rag = _build_pipeline_vector_rag(batch_size=2, max_in_flight_batches=3)
+    written_indexes: list[int] = []
+    active_embeddings = 0
+    peak_active_embeddings = 0
+
+    async def skip_dimensions(*_args: object, **_kwargs: object) -> None:
+        await asyncio.sleep(0)
+
+    async def embed_texts(texts: Sequence[str]) -> list[list[float]]:
+        nonlocal active_embeddings, peak_active_embeddings
+        active_embeddings += 1
+        peak_active_embeddings = max(peak_active_embeddings, active_embeddings)
+        # Earlier batches finish last so out-of-order completion is exercised.
+        await asyncio.sleep(0.01 / (int(texts[0].split()[-1]) + 1))
+        active_embeddings -= 1
+        return [[1.0, 2.0, 3.0] for _ in texts]
+
+    async def record_write(
+        _session: AsyncSession,
+        *,
+        doc_id: uuid.UUID,
+        doc_type: str,
+        chunks: Sequence[EmbeddedChunk],
+        mode: str,
+    ) -> None:
+        _ = (doc_id, doc_type, mode)
+        await asyncio.sleep(0)
+        written_indexes.extend(chunk.chunk_index for chunk in chunks)
+
+    async def delete_nothing(*_args: object, **_kwargs: object) -> int:
+        await asyncio.sleep(0)
+        return 0
+
+    monkeypatch.setattr(vector_rag, "_ensure_dimensions", skip_dimensions)
+    monkeypatch.setattr(vector_rag, "_embed_texts", embed_texts)
+    monkeypatch.setattr("src.ai.rag.embeddings.write_embedded_chunks", record_write)
+    monkeypatch.setattr("src.ai.rag.embeddings.delete_orphaned_chunks", delete_nothing)
+
+    await vector_rag.store_document_chunks_with_embeddings(
+        cast("AsyncSession", _FlushOnlySession()),
+        doc_type="book",
+        doc_id=uuid.uuid4(),
+        title="Pipeline",
+        chunks=[f"chunk {index}" for index in range(10)],
+    )
+
+    assert written_indexes == list(range(10))
+    assert 1 < peak_active_embeddings <= 3
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_embedding_retries_through_shared_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    vector_rag = _build_pipeline_vector_rag(batch_size=1, max_in_flight_batches=1)
+    calls = 0
+
+    def build_kwargs(texts: object) -> dict[str, object]:
+        return {"input": texts}
+
+    async def invoke_embedding(_kwargs: dict[str, object]) -> litellm.EmbeddingResponse:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        if calls == 1:
+            raise litellm.RateLimitError(message="slow down", llm_provider="test", model="test-embedding")
+        return cast("litellm.EmbeddingResponse", SimpleNamespace(data=[SimpleNamespace(embedding=[1.0, 2.0, 3.0])]))
+
+    monkeypatch.setattr(vector_rag, "_build_embedding_kwargs", build_kwargs)
+    monkeypatch.setattr(vector_rag, "_invoke_embedding", invoke_embedding)
+
+    embeddings = await vector_rag.generate_embeddings(["one"])
+
+    assert embeddings == [[1.0, 2.0, 3.0]]
+    assert calls == 2
+
+
+class _InMemoryEmbeddingCache:
+    def __init__(self, entries: dict[bytes, list[float]]) -> None:
+        self.entries = entries
+        self.stored: dict[bytes, Sequence[float]] = {}
+
+    async def get_many(self, hashes: Sequence[bytes]) -> dict[bytes, list[float]]:
+        await asyncio.sleep(0)
+        return {digest: self.entries[digest] for digest in hashes if digest in self.entries}
+
+    async def put_many(self, embeddings: dict[bytes, Sequence[float]]) -> None:
+        await asyncio.sleep(0)
+        self.stored.update(embeddings)
+
+
+@pytest.mark.asyncio
+async def test_embedding_cache_requests_only_missing_unique_texts(monkeypatch: pytest.MonkeyPatch) -> None:
+    vector_rag = _build_pipeline_vector_rag(batch_size=8, max_in_flight_batches=1)
+    cache = _InMemoryEmbeddingCache({content_hash("cached"): [9.0, 9.0, 9.0]})
+    vector_rag.embedding_cache = cast("EmbeddingCache", cache)
+    requested: list[list[str]] = []
+
+    async def request_embeddings(texts: Sequence[str]) -> list[list[float]]:
+        await asyncio.sleep(0)
+        requested.append(list(texts))
+        return [[float(len(text_item))] * 3 for text_item in texts]
+
+    monkeypatch.setattr(vector_rag, "_request_embeddings", request_embeddings)
+
+    embeddings = await vector_rag.generate_embeddings(["cached", "fresh", "fresh", "other"])
+
+    assert requested == [["fresh", "other"]]
+    assert embeddings == [[9.0, 9.0, 9.0], [5.0, 5.0, 5.0], [5.0, 5.0, 5.0], [5.0, 5.0, 5.0]]
+    assert set(cache.stored) == {content_hash("fresh"), content_hash("other")}
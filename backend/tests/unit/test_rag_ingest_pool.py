@@ -0,0 +1,30 @@
+# ruff: noqa: S101
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from src.ai.rag.ingest_pool import IngestProcessPool
+
+
+@pytest.mark.asyncio
+async def test_ingest_pool_runs_in_worker_process_and_bounds_concurrency() -> None:
+    pool = IngestProcessPool(max_workers=1)
+    try:
+        tasks = [asyncio.create_task(pool.run(time.sleep, 0.2)) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        assert pool.active == 1
+        assert pool.queued == 2
+
+        await asyncio.gather(*tasks)
+        assert await pool.run(pow, 2, 10) == 1024
+        worker_pid = await pool.run(os.getpid)
+    finally:
+        pool.shutdown()
+
+    assert worker_pid != os.getpid()
+    assert pool.active == 0
+    assert pool.queued == 0
@@ -14,6 +14,7 @@ from src.ai.rag.config import RAGConfig
 from src.ai.rag.embeddings import VectorRAG
 from src.ai.rag.exceptions import RagUnavailableError, RagValidationError
 from src.ai.rag.schemas import SearchRequest, SearchResult
+from src.ai.rag.search_cache import RAGSearchCache
 from src.ai.rag.service import RAGService
 
 
@@ -48,19 +49,40 @@ class _SearchResultRows:
 
 
 class _HybridSearchSession:
-    def __init__(self, *, dense_rows: list[dict[str, object]], lexical_rows: list[dict[str, object]]) -> None:
+    def __init__(
+        self,
+        *,
+        dense_rows: list[dict[str, object]],
+        lexical_rows: list[dict[str, object]],
+        fused_rows: list[dict[str, object]] | None = None,
+        neighbor_rows: list[dict[str, object]] | None = None,
+    ) -> None:
         self.dense_rows = dense_rows
         self.lexical_rows = lexical_rows
+        self.fused_rows = fused_rows or []
+        self.neighbor_rows = neighbor_rows or []
         self.statements: list[str] = []
         self.params: list[dict[str, object] | None] = []
+        self.info: dict[str, object] = {}
+        self._transaction = object()
+
+    def get_transaction(self) -> object:
+        return self._transaction
+
+    def get_nested_transaction(self) -> None:
+        return None
 
     async def execute(self, statement: object, params: dict[str, object] | None = None) -> _SearchResultRows:
         sql = str(statement)
         self.statements.append(sql)
         self.params.append(params)
-        if "SET LOCAL" in sql:
+        if "set_config('hnsw.ef_search'" in sql:
             return _SearchResultRows([])
-        if "websearch_to_tsquery" in sql:
+        if "FULL OUTER JOIN" in sql:
+            return _SearchResultRows(self.fused_rows)
+        if "AS hit(doc_id, chunk_index)" in sql:
+            return _SearchResultRows(self.neighbor_rows)
+        if "tsvector_to_array" in sql:
             return _SearchResultRows(self.lexical_rows)
         return _SearchResultRows(self.dense_rows)
 
@@ -91,12 +113,22 @@ def _build_test_rag_config(*, rerank_model: str) -> RAGConfig:
         embedding_manual_retries=0,
         embedding_retry_delay_seconds=0,
         embedding_batch_size=1,
+        embedding_max_in_flight_batches=4,
+        embedding_rate_limit_retries=0,
+        embedding_cache_max_entries=0,
         embedding_output_dim=None,
         hnsw_ef_search=80,
+        hnsw_iterative_scan="relaxed_order",
         rerank_model=rerank_model,
         max_file_size_mb=10,
         chunk_size=400,
         chunk_overlap_ratio=0.12,
+        ingest_pool_workers=0,
+        chunk_write_mode="copy",
+        reindex_mode="incremental",
+        search_mode="fused",
+        search_cache_ttl_seconds=0,
+        search_cache_max_entries=0,
     )
 
 
@@ -112,10 +144,13 @@ def _build_search_result(chunk_id: str, score: float) -> SearchResult:
 @pytest.mark.asyncio
 async def test_vector_search_database_failure_raises_rag_error() -> None:
     vector_rag = VectorRAG.__new__(VectorRAG)
+    vector_rag.embedding_model = "test-embedding"
+    vector_rag.search_cache = RAGSearchCache(ttl_seconds=0, max_entries=0)
     vector_rag.configured_embedding_dim = 3
     vector_rag._db_embedding_dim = None  # noqa: SLF001
     vector_rag._effective_embedding_dim = 3  # noqa: SLF001
     vector_rag._dimensions_validated = False  # noqa: SLF001
+    vector_rag.search_mode = "fused"
 
     with pytest.raises(RagUnavailableError):
         await vector_rag.search(
@@ -169,6 +204,8 @@ def test_embedding_response_validation_raises_typed_rag_error() -> None:
 @pytest.mark.asyncio
 async def test_store_embeddings_rejects_zero_valid_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
     vector_rag = VectorRAG.__new__(VectorRAG)
+    vector_rag.embedding_model = "test-embedding"
+    vector_rag.search_cache = RAGSearchCache(ttl_seconds=0, max_entries=0)
     vector_rag.batch_size = 10
 
     async def skip_dimensions(*_args: object, **_kwargs: object) -> None:
@@ -189,8 +226,11 @@ async def test_store_embeddings_rejects_zero_valid_chunks(monkeypatch: pytest.Mo
 @pytest.mark.asyncio
 async def test_embedding_count_mismatch_raises_typed_rag_error(monkeypatch: pytest.MonkeyPatch) -> None:
     vector_rag = VectorRAG.__new__(VectorRAG)
+    vector_rag.embedding_model = "test-embedding"
     vector_rag.manual_retry_attempts = 0
+    vector_rag.rate_limit_retry_attempts = 0
     vector_rag.retry_backoff_seconds = 0
+    vector_rag.embedding_cache = None
 
     def build_kwargs(texts: object) -> dict[str, object]:
         return {"input": texts}
@@ -209,6 +249,9 @@ async def test_embedding_count_mismatch_raises_typed_rag_error(monkeypatch: pyte
 @pytest.mark.asyncio
 async def test_hybrid_search_returns_exact_match_from_lexical_candidates(monkeypatch: pytest.MonkeyPatch) -> None:
     vector_rag = VectorRAG.__new__(VectorRAG)
+    vector_rag.embedding_model = "test-embedding"
+    vector_rag.search_cache = RAGSearchCache(ttl_seconds=0, max_entries=0)
+    vector_rag.search_mode = "staged"
     course_id = uuid.uuid4()
     dense_doc_id = uuid.uuid4()
     lexical_doc_id = uuid.uuid4()
@@ -258,13 +301,80 @@ async def test_hybrid_search_returns_exact_match_from_lexical_candidates(monkeyp
     assert results[0].metadata["lexical_rank"] == 1
     assert results[0].metadata["lexical_score"] == pytest.approx(0.42)
     assert results[0].metadata["fused_score"] == pytest.approx(1 / 61)
-    assert any("metadata->>'course_id' = :course_id" in statement for statement in session.statements)
-    assert any("websearch_to_tsquery('english', :query)" in statement for statement in session.statements)
+    assert any("course_id = :course_id" in statement for statement in session.statements)
+    assert any("to_tsvector('simple', :query)" in statement for statement in session.statements)
     assert session.params[1] is not None
     assert session.params[1]["candidate_limit"] == 4
     assert session.params[1]["course_id"] == str(course_id)
 
 
+@pytest.mark.asyncio
+async def test_fused_search_uses_one_retrieval_and_one_neighbor_round_trip(monkeypatch: pytest.MonkeyPatch) -> None:
+    vector_rag = VectorRAG.__new__(VectorRAG)
+    vector_rag.embedding_model = "test-embedding"
+    vector_rag.search_cache = RAGSearchCache(ttl_seconds=0, max_entries=0)
+    vector_rag.search_mode = "fused"
+    doc_id = uuid.uuid4()
+    section_metadata = {"contextualized": True, "section_path": "Limits"}
+    session = _HybridSearchSession(
+        dense_rows=[],
+        lexical_rows=[],
+        fused_rows=[
+            {
+                "doc_id": doc_id,
+                "doc_type": "course",
+                "chunk_index": chunk_index,
+                "content": f"Chunk {chunk_index}",
+                "metadata": section_metadata,
+                "fused_score": 1 / (61 + rank),
+                "dense_score": 0.9 - rank / 10,
+                "dense_rank": rank + 1,
+                "lexical_score": None,
+                "lexical_rank": None,
+            }
+            for rank, chunk_index in enumerate([4, 8])
+        ],
+        neighbor_rows=[
+            {"doc_id": doc_id, "chunk_index": chunk_index, "content": f"Chunk {chunk_index}", "metadata": metadata}
+            for chunk_index, metadata in [
+                (3, section_metadata),
+                (4, section_metadata),
+                (5, {"section_path": "Derivatives"}),
+                (7, section_metadata),
+                (8, section_metadata),
+            ]
+        ],
+    )
+
+    async def skip_dimensions(*_args: object, **_kwargs: object) -> None:
+        await asyncio.sleep(0)
+
+    async def generate_embedding(_query: str) -> list[float]:
+        await asyncio.sleep(0)
+        return [0.1, 0.2, 0.3]
+
+    monkeypatch.setattr(vector_rag, "_ensure_dimensions", skip_dimensions)
+    monkeypatch.setattr(vector_rag, "generate_embedding", generate_embedding)
+
+    for _ in range(2):
+        results = await vector_rag.search(
+            cast("AsyncSession", session),
+            doc_type="course",
+            query="limits",
+            limit=2,
+            doc_id=doc_id,
+        )
+
+    assert [result.content for result in results] == ["Chunk 3\n\nChunk 4", "Chunk 7\n\nChunk 8"]
+    assert results[0].metadata["dense_rank"] == 1
+    assert results[0].similarity_score == pytest.approx(1 / 61)
+    # Two searches in one transaction: ef_search is set once, each search is one retrieval plus one neighbor fetch.
+    assert sum("set_config('hnsw.ef_search'" in statement for statement in session.statements) == 1
+    assert sum("FULL OUTER JOIN" in statement for statement in session.statements) == 2
+    assert sum("AS hit(doc_id, chunk_index)" in statement for statement in session.statements) == 2
+    assert len(session.statements) == 5
+
+
 @pytest.mark.asyncio
 async def test_search_course_documents_skips_rerank_when_model_not_configured(monkeypatch: pytest.MonkeyPatch) -> None:
     service = RAGService()
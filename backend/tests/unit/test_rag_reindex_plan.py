@@ -0,0 +1,58 @@
+# ruff: noqa: S101
+
+from pydantic import JsonValue
+
+from src.ai.rag.chunk_writer import ReusedChunk
+from src.ai.rag.embedding_cache import content_hash
+from src.ai.rag.reindex import ExistingChunk, plan_chunk_reindex, plan_full_reindex
+
+
+def _existing(chunk_index: int, content: str, metadata: dict[str, JsonValue]) -> ExistingChunk:
+    return ExistingChunk(chunk_index=chunk_index, fingerprint=content_hash(content), metadata=metadata)
+
+
+def test_incremental_plan_skips_unchanged_and_reuses_shifted_chunks() -> None:
+    existing = {
+        0: _existing(0, "intro", {"chunk_index": 0}),
+        1: _existing(1, "limits", {"chunk_index": 1}),
+        2: _existing(2, "derivatives", {"chunk_index": 2}),
+        3: _existing(3, "stale tail", {"chunk_index": 3}),
+    }
+    payloads: list[tuple[int, str, dict[str, JsonValue]]] = [
+        (0, "intro", {"chunk_index": 0}),
+        (1, "a new section", {"chunk_index": 1}),
+        (2, "limits", {"chunk_index": 2}),
+        (3, "derivatives", {"chunk_index": 3}),
+    ]
+
+    plan = plan_chunk_reindex(payloads, existing)
+
+    assert plan.unchanged_count == 1
+    assert plan.to_embed == [(1, "a new section", {"chunk_index": 1})]
+    assert plan.to_reuse == [
+        ReusedChunk(chunk_index=2, source_chunk_index=1, content="limits", metadata={"chunk_index": 2}),
+        ReusedChunk(chunk_index=3, source_chunk_index=2, content="derivatives", metadata={"chunk_index": 3}),
+    ]
+    assert plan.keep_indexes == [0, 1, 2, 3]
+
+
+def test_incremental_plan_rewrites_metadata_without_reembedding() -> None:
+    existing = {0: _existing(0, "segment", {"start": 0.0, "end": 4.0})}
+
+    plan = plan_chunk_reindex([(0, "segment", {"start": 0.5, "end": 4.0})], existing)
+
+    assert plan.to_embed == []
+    assert plan.unchanged_count == 0
+    assert plan.to_reuse == [
+        ReusedChunk(chunk_index=0, source_chunk_index=0, content="segment", metadata={"start": 0.5, "end": 4.0})
+    ]
+
+
+def test_full_plan_embeds_every_chunk() -> None:
+    payloads: list[tuple[int, str, dict[str, JsonValue]]] = [(0, "intro", {}), (2, "limits", {})]
+
+    plan = plan_full_reindex(payloads)
+
+    assert plan.to_embed == payloads
+    assert plan.to_reuse == []
+    assert plan.keep_indexes == [0, 2]
@@ -0,0 +1,215 @@
+# ruff: noqa: S101
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+from typing import cast
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.ai.rag.embeddings import VectorRAG
+from src.ai.rag.schemas import SearchResult
+from src.ai.rag.search_cache import RAGSearchCache, SearchCacheKey
+from src.ai.rag.service import RAGService
+
+
+def _search_key(
+    *,
+    doc_type: str = "course",
+    doc_id: uuid.UUID | None = None,
+    course_id: uuid.UUID | None = None,
+    query: str = "limits",
+) -> SearchCacheKey:
+    return SearchCacheKey(
+        model="test-embedding",
+        search_mode="fused",
+        doc_type=doc_type,
+        doc_id=doc_id,
+        course_id=course_id,
+        query=query,
+        limit=5,
+    )
+
+
+def _result(chunk_id: str) -> SearchResult:
+    return SearchResult(chunk_id=chunk_id, content="Limits", similarity_score=0.5, metadata={})
+
+
+def test_query_embeddings_share_entries_across_whitespace_variants() -> None:
+    cache = RAGSearchCache(ttl_seconds=60, max_entries=10)
+    cache.put_embedding(model="m", dimensions=3, text="what is  a limit", embedding=[1.0, 2.0, 3.0])
+
+    assert cache.get_embedding(model="m", dimensions=3, text="  what is a limit\n") == [1.0, 2.0, 3.0]
+    assert cache.get_embedding(model="m", dimensions=768, text="what is a limit") is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.hit_rate == pytest.approx(0.5)
+
+
+def test_scope_invalidation_keeps_unrelated_documents_and_courses() -> None:
+    cache = RAGSearchCache(ttl_seconds=60, max_entries=10)
+    changed_doc, other_doc = uuid.uuid4(), uuid.uuid4()
+    changed_course, other_course = uuid.uuid4(), uuid.uuid4()
+    keys = {
+        "changed_doc": _search_key(doc_id=changed_doc),
+        "other_doc": _search_key(doc_id=other_doc),
+        "changed_course": _search_key(course_id=changed_course),
+        "other_course": _search_key(course_id=other_course),
+        "unscoped": _search_key(),
+        "other_type": _search_key(doc_type="book", doc_id=changed_doc),
+    }
+    for name, key in keys.items():
+        cache.put_results(key, [_result(name)])
+
+    dropped = cache.invalidate_scope(doc_type="course", doc_id=changed_doc, course_id=changed_course)
+
+    assert dropped == 3
+    surviving = {name for name, key in keys.items() if cache.get_results(key) is not None}
+    assert surviving == {"other_doc", "other_course", "other_type"}
+
+
+def test_course_invalidation_drops_document_scoped_searches_of_that_doc_type() -> None:
+    cache = RAGSearchCache(ttl_seconds=60, max_entries=10)
+    doc_key = _search_key(doc_id=uuid.uuid4())
+    cache.put_results(doc_key, [_result("doc")])
+
+    cache.invalidate_scope(doc_type="course", course_id=uuid.uuid4())
+
+    assert cache.get_results(doc_key) is None
+
+
+def test_scope_is_invalidated_again_when_the_writing_transaction_ends() -> None:
+    cache = RAGSearchCache(ttl_seconds=60, max_entries=10)
+    course_id = uuid.uuid4()
+    key = _search_key(course_id=course_id)
+    session = AsyncSession()
+
+    cache.invalidate_scope_on_commit(session, doc_type="course", course_id=course_id)
+    # Another session searches before the new chunks are committed.
+    cache.put_results(key, [_result("stale")])
+    session.sync_session.dispatch.after_commit(session.sync_session)
+    assert cache.get_results(key) is None
+
+    cache.put_results(key, [_result("fresh")])
+    session.sync_session.dispatch.after_rollback(session.sync_session)
+    assert cache.get_results(key) is not None
+
+
+class _CountingSearchSession:
+    def __init__(self) -> None:
+        self.info: dict[object, object] = {}
+        self.statement_count = 0
+
+    def get_transaction(self) -> None:
+        return None
+
+    def get_nested_transaction(self) -> None:
+        return None
+
+    async def execute(self, *_args: object, **_kwargs: object) -> object:
+        await asyncio.sleep(0)
+        self.statement_count += 1
+        return _EmptyResult()
+
+
+class _EmptyResult:
+    def mappings(self) -> _EmptyResult:
+        return self
+
+    def all(self) -> list[object]:
+        return []
+
+
+@pytest.mark.asyncio
+async def test_repeated_search_is_served_from_cache_until_scope_is_invalidated(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    vector_rag = VectorRAG.__new__(VectorRAG)
+    vector_rag.embedding_model = "test-embedding"
+    vector_rag.configured_embedding_dim = 3
+    vector_rag.search_mode = "fused"
+    vector_rag.search_cache = RAGSearchCache(ttl_seconds=60, max_entries=10)
+    session = _CountingSearchSession()
+    embedded_queries: list[str] = []
+
+    async def skip_dimensions(*_args: object, **_kwargs: object) -> None:
+        await asyncio.sleep(0)
+
+    async def request_embeddings(texts: list[str]) -> list[list[float]]:
+        await asyncio.sleep(0)
+        embedded_queries.extend(texts)
+        return [[0.1, 0.2, 0.3] for _ in texts]
+
+    monkeypatch.setattr(vector_rag, "_ensure_dimensions", skip_dimensions)
+    monkeypatch.setattr(vector_rag, "_request_embeddings", request_embeddings)
+    course_id = uuid.uuid4()
+
+    async def search(query: str) -> list[SearchResult]:
+        return await vector_rag.search(
+            cast("AsyncSession", session),
+            doc_type="course",
+            query=query,
+            limit=3,
+            course_id=course_id,
+        )
+
+    await search("What is a limit?")
+    statements_after_first_search = session.statement_count
+    await search("  What is a   limit? ")
+
+    assert session.statement_count == statements_after_first_search
+    assert embedded_queries == ["What is a limit?"]
+
+    vector_rag.search_cache.invalidate_scope(doc_type="course", course_id=course_id)
+    await search("What is a limit?")
+
+    assert session.statement_count > statements_after_first_search
+    # The query embedding is independent of indexed content, so it survives scope invalidation.
+    assert embedded_queries == ["What is a limit?"]
+
+
+class _DeleteDocumentResult:
+    def __init__(self, row: object = None) -> None:
+        self.row = row
+        self.rowcount = 1
+
+    def fetchone(self) -> object:
+        return self.row
+
+    def scalar_one_or_none(self) -> object:
+        return self.row
+
+
+@pytest.mark.asyncio
+async def test_deleting_a_course_document_drops_cached_course_searches(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = RAGSearchCache(ttl_seconds=60, max_entries=10)
+    monkeypatch.setattr("src.ai.rag.service.get_rag_search_cache", lambda: cache)
+    course_id = uuid.uuid4()
+    course_key = _search_key(course_id=course_id)
+    other_course_key = _search_key(course_id=uuid.uuid4())
+    cache.put_results(course_key, [_result("deleted-chunk")])
+    cache.put_results(other_course_key, [_result("kept")])
+
+    session = AsyncSession()
+    document = SimpleNamespace(id=7, file_path=None, course_id=course_id)
+    results = iter([_DeleteDocumentResult(document), _DeleteDocumentResult(course_id)])
+
+    async def execute(*_args: object, **_kwargs: object) -> _DeleteDocumentResult:
+        await asyncio.sleep(0)
+        return next(results, _DeleteDocumentResult())
+
+    async def flush() -> None:
+        await asyncio.sleep(0)
+
+    monkeypatch.setattr(session, "execute", execute)
+    monkeypatch.setattr(session, "flush", flush)
+
+    await RAGService.__new__(RAGService).delete_document(session, uuid.uuid4(), document_id=7)
+
+    assert cache.get_results(course_key) is None
+    assert cache.get_results(other_course_key) is not None
+    # A search that re-cached the chunks before the delete committed is dropped on commit.
+    cache.put_results(course_key, [_result("deleted-chunk")])
+    session.sync_session.dispatch.after_commit(session.sync_session)
+    assert cache.get_results(course_key) is None
@@ -0,0 +1,74 @@
+# ruff: noqa: S101
+
+import pymupdf
+import pytest
+
+from src.ai.rag.chunker import chunk_pages_with_metadata_async
+from src.ai.rag.exceptions import RagUnavailableError
+from src.ai.rag.parser import iter_document_pages
+
+
+_PARAGRAPH = (
+    "A limit describes the value a function approaches as its input approaches a point. "
+    "Limits make derivatives and integrals precise, and they explain continuity. "
+) * 3
+
+
+def _book_pages() -> list[str]:
+    pages: list[str] = []
+    for chapter in range(1, 4):
+        pages.append(f"# Chapter {chapter}\n\n{_PARAGRAPH}")
+        for section in range(1, 4):
+            pages.append(f"## Section {chapter}.{section}\n\n{_PARAGRAPH}\n\n{_PARAGRAPH}")
+            # A heading-less page continues the open section from the previous page.
+            pages.append(f"Marker {chapter}.{section} closes the section. {_PARAGRAPH}\n\n{_PARAGRAPH}")
+    return pages
+
+
+@pytest.mark.asyncio
+async def test_windowed_page_chunking_carries_heading_context_across_pages(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Small windows force many window edges, including ones between a heading and its continuation page.
+    monkeypatch.setattr("src.ai.rag.chunker._STREAM_WINDOW_CHARS", 1_500)
+
+    chunks, metadata = await chunk_pages_with_metadata_async(
+        iter(_book_pages()),
+        document_title="Calculus",
+        chunk_size=128,
+    )
+
+    marker_sections = {
+        f"Marker {chapter}.{section}": f"Chapter {chapter} > Section {chapter}.{section}"
+        for chapter in range(1, 4)
+        for section in range(1, 4)
+    }
+    seen_markers: set[str] = set()
+    for chunk, chunk_metadata in zip(chunks, metadata, strict=True):
+        for marker, section_path in marker_sections.items():
+            if marker in chunk:
+                seen_markers.add(marker)
+                assert chunk_metadata["section_path"] == section_path
+                assert chunk.startswith(f"Source: Calculus\nSection: {section_path}\n\n")
+    assert seen_markers == set(marker_sections)
+
+
+def _build_pdf(page_texts: list[str]) -> bytes:
+    document = pymupdf.open()
+    for page_text in page_texts:
+        page = document.new_page()
+        if page_text:
+            page.insert_text((72, 72), page_text)
+    return document.tobytes()
+
+
+def test_iter_document_pages_yields_non_empty_pages_from_bytes() -> None:
+    pdf_bytes = _build_pdf(["First page text", "", "Third page text"])
+
+    pages = iter_document_pages(pdf_bytes, file_type="pdf")
+
+    assert next(pages) == "First page text"
+    assert list(pages) == ["Third page text"]
+
+
+def test_iter_document_pages_rejects_unsupported_file_type() -> None:
+    with pytest.raises(RagUnavailableError):
+        next(iter_document_pages(b"binary", file_type="docx"))
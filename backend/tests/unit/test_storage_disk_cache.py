@@ -0,0 +1,135 @@
+# ruff: noqa: S101
+
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from pathlib import Path
+
+import pytest
+
+from src.storage.base import StorageReadStream
+from src.storage.disk_cache import DiskCachedStorage
+from src.storage.local import LocalStorage
+
+
+class _CountingStorage(LocalStorage):
+    """Local storage standing in for a remote provider, counting object reads."""
+
+    def __init__(self, base_path: str) -> None:
+        super().__init__(base_path)
+        self.reads: list[str] = []
+
+    def open_read(
+        self, key: str, *, start: int = 0, end: int | None = None
+    ) -> AbstractAsyncContextManager[StorageReadStream]:
+        self.reads.append(key)
+        return super().open_read(key, start=start, end=end)
+
+    @asynccontextmanager
+    async def local_path(self, key: str, *, content_hash: str | None = None, suffix: str = "") -> AsyncGenerator[Path]:
+        del content_hash
+        async with self.download_to_temp_file(key, suffix=suffix) as path:
+            yield path
+
+
+async def _remote_with(tmp_path: Path, objects: dict[str, bytes]) -> _CountingStorage:
+    remote = _CountingStorage(str(tmp_path / "remote"))
+    for key, content in objects.items():
+        await remote.upload(content, key)
+    return remote
+
+
+@pytest.mark.asyncio
+async def test_hot_object_is_downloaded_once_and_rekeyed_by_hash(tmp_path: Path) -> None:
+    remote = await _remote_with(tmp_path, {"books/a.pdf": b"a" * 100})
+    cache = DiskCachedStorage(remote, cache_dir=tmp_path / "cache", max_bytes=1_000)
+
+    for _ in range(3):
+        async with cache.local_path("books/a.pdf", content_hash="h1", suffix=".pdf") as path:
+            assert path.read_bytes() == b"a" * 100
+            assert path.parent == tmp_path / "cache"
+            assert path.suffix == ".pdf"
+    assert remote.reads == ["books/a.pdf"]
+
+    async with cache.local_path("books/a.pdf", content_hash="h2", suffix=".pdf"):
+        pass
+    assert remote.reads == ["books/a.pdf", "books/a.pdf"]
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entries_are_evicted_but_pinned_ones_survive(tmp_path: Path) -> None:
+    remote = await _remote_with(tmp_path, {"a": b"a" * 400, "b": b"b" * 400, "c": b"c" * 400})
+    cache = DiskCachedStorage(remote, cache_dir=tmp_path / "cache", max_bytes=1_000)
+
+    async with cache.local_path("a", content_hash="h1") as pinned_a:
+        async with cache.local_path("b", content_hash="h1"):
+            pass
+        async with cache.local_path("c", content_hash="h1"):
+            pass
+        assert pinned_a.exists()
+    assert len(list((tmp_path / "cache").iterdir())) == 2
+
+    remote.reads.clear()
+    async with cache.local_path("b", content_hash="h1"):
+        pass
+    assert remote.reads == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_objects_larger_than_the_cache_bypass_it(tmp_path: Path) -> None:
+    remote = await _remote_with(tmp_path, {"big": b"x" * 2_000})
+    cache = DiskCachedStorage(remote, cache_dir=tmp_path / "cache", max_bytes=1_000)
+
+    async with cache.local_path("big", content_hash="h1") as path:
+        assert path.read_bytes() == b"x" * 2_000
+        assert path.parent != tmp_path / "cache"
+    assert list((tmp_path / "cache").iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_existing_entries_are_reused_after_restart_and_dropped_on_delete(tmp_path: Path) -> None:
+    remote = await _remote_with(tmp_path, {"books/a.pdf": b"a" * 100})
+    async with DiskCachedStorage(remote, cache_dir=tmp_path / "cache", max_bytes=1_000).local_path(
+        "books/a.pdf", content_hash="h1"
+    ):
+        pass
+
+    restarted = DiskCachedStorage(remote, cache_dir=tmp_path / "cache", max_bytes=1_000)
+    async with restarted.local_path("books/a.pdf", content_hash="h1"):
+        pass
+    assert remote.reads == ["books/a.pdf"]
+
+    await restarted.delete("books/a.pdf")
+    assert list((tmp_path / "cache").iterdir()) == []
+
+
+async def _chunks(content: bytes) -> AsyncIterator[bytes]:
+    await asyncio.sleep(0)
+    yield content
+
+
+@pytest.mark.asyncio
+async def test_objects_without_a_content_hash_are_never_cached(tmp_path: Path) -> None:
+    remote = await _remote_with(tmp_path, {"books/a.pdf": b"a" * 100})
+    cache = DiskCachedStorage(remote, cache_dir=tmp_path / "cache", max_bytes=1_000)
+
+    for content in (b"a" * 100, b"b" * 100):
+        await remote.upload(content, "books/a.pdf")
+        async with cache.local_path("books/a.pdf", suffix=".pdf") as path:
+            assert path.read_bytes() == content
+            assert path.parent != tmp_path / "cache"
+    assert list((tmp_path / "cache").iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_uploads_drop_cached_copies_of_the_replaced_object(tmp_path: Path) -> None:
+    remote = await _remote_with(tmp_path, {"a": b"a" * 100, "b": b"b" * 100})
+    cache = DiskCachedStorage(remote, cache_dir=tmp_path / "cache", max_bytes=1_000)
+    for key in ("a", "b"):
+        async with cache.local_path(key, content_hash="h1"):
+            pass
+
+    await cache.upload(b"A" * 100, "a")
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+    await cache.upload_stream(_chunks(b"B" * 100), "b")
+    assert list((tmp_path / "cache").iterdir()) == []
@@ -0,0 +1,213 @@
+# ruff: noqa: S101
+
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+from botocore.exceptions import ResponseStreamingError
+
+from src.storage import factory
+from src.storage.exceptions import FileDownloadError, StorageFileNotFoundError
+from src.storage.local import LocalStorage
+from src.storage.r2 import R2Storage
+from src.storage.s3_compat import range_header, upload_object_stream
+
+
+async def _chunks(*parts: bytes) -> AsyncIterator[bytes]:
+    for part in parts:
+        await asyncio.sleep(0)
+        yield part
+
+
+class _FakeS3Client:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.part_sizes: list[int] = []
+        self.body: bytes | None = None
+
+    async def put_object(self, **kwargs: object) -> object:
+        await asyncio.sleep(0)
+        self.calls.append("put_object")
+        self.body = cast("bytes", kwargs["Body"])
+        return {}
+
+    async def create_multipart_upload(self, **_kwargs: object) -> dict[str, str]:
+        await asyncio.sleep(0)
+        self.calls.append("create_multipart_upload")
+        return {"UploadId": "upload-1"}
+
+    async def upload_part(self, **kwargs: object) -> dict[str, str]:
+        await asyncio.sleep(0)
+        self.calls.append("upload_part")
+        self.part_sizes.append(len(cast("bytes", kwargs["Body"])))
+        return {"ETag": f"etag-{kwargs['PartNumber']}"}
+
+    async def complete_multipart_upload(self, **_kwargs: object) -> dict[str, object]:
+        await asyncio.sleep(0)
+        self.calls.append("complete_multipart_upload")
+        return {}
+
+    async def abort_multipart_upload(self, **_kwargs: object) -> object:
+        await asyncio.sleep(0)
+        self.calls.append("abort_multipart_upload")
+        return {}
+
+
+class _FakeBody:
+    def __init__(self, payload: bytes, *, failing_read: int | None = None) -> None:
+        self._payload = payload
+        self._reads_left = failing_read
+        self.closed = False
+
+    async def read(self, amt: int | None = None) -> bytes:
+        await asyncio.sleep(0)
+        if self._reads_left is not None:
+            self._reads_left -= 1
+            if self._reads_left == 0:
+                raise ResponseStreamingError(error=ConnectionResetError("reset by peer"))
+        size = len(self._payload) if amt is None else amt
+        chunk, self._payload = self._payload[:size], self._payload[size:]
+        return chunk
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeClientPool:
+    def __init__(self, body: _FakeBody) -> None:
+        self.body = body
+
+    async def get(self) -> object:
+        await asyncio.sleep(0)
+        return self
+
+    async def get_object(self, **_kwargs: object) -> dict[str, object]:
+        await asyncio.sleep(0)
+        return {"Body": self.body, "ContentLength": 12}
+
+
+def _r2_storage(body: _FakeBody) -> R2Storage:
+    storage = R2Storage(account_id="a", access_key_id="k", secret_access_key="s", bucket_name="b")  # noqa: S106
+    storage._client_pool = cast("Any", _FakeClientPool(body))  # noqa: SLF001
+    return storage
+
+
+@pytest.mark.asyncio
+async def test_s3_read_stream_closes_the_body_when_the_reader_stops_early() -> None:
+    body = _FakeBody(b"abcdefghijkl")
+
+    chunks = [chunk async for chunk in _r2_storage(body).iter_chunks("k", chunk_size=4)]
+    assert chunks == [b"abcd", b"efgh", b"ijkl"]
+    assert body.closed
+
+    body = _FakeBody(b"abcdefghijkl")
+    async with _r2_storage(body).open_read("k") as stream:
+        assert await stream.read(4) == b"abcd"
+    assert body.closed
+
+
+@pytest.mark.asyncio
+async def test_s3_read_stream_wraps_mid_body_failures() -> None:
+    body = _FakeBody(b"abcdefghijkl", failing_read=2)
+
+    async with _r2_storage(body).open_read("k") as stream:
+        assert await stream.read(4) == b"abcd"
+        with pytest.raises(FileDownloadError, match="Failed to download from R2: k"):
+            await stream.read(4)
+    assert body.closed
+
+
+def test_default_and_named_provider_share_one_instance(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    settings = factory.get_settings()
+    monkeypatch.setattr(settings, "STORAGE_PROVIDER", "local")
+    monkeypatch.setattr(settings, "LOCAL_STORAGE_PATH", str(tmp_path))
+    factory._get_storage_provider.cache_clear()  # noqa: SLF001
+    try:
+        assert factory.get_storage_provider() is factory.get_storage_provider("LOCAL")
+    finally:
+        factory._get_storage_provider.cache_clear()  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_local_storage_streams_ranges_and_chunks(tmp_path: Path) -> None:
+    storage = LocalStorage(str(tmp_path))
+    payload = bytes(range(256)) * 40
+
+    written = await storage.upload_stream(_chunks(payload[:3000], payload[3000:]), "books/a.pdf")
+
+    assert written == len(payload)
+    assert await storage.read_range("books/a.pdf", 100, 200) == payload[100:200]
+    assert await storage.read_range("books/a.pdf", 10_000, 20_000) == payload[10_000:]
+    chunks = [chunk async for chunk in storage.iter_chunks("books/a.pdf", chunk_size=4096)]
+    assert [len(chunk) for chunk in chunks] == [4096, 4096, 2048]
+    assert b"".join(chunks) == payload
+    async with storage.download_to_temp_file("books/a.pdf", suffix=".pdf") as temp_path:
+        assert temp_path.read_bytes() == payload
+    assert not temp_path.exists()
+    assert [path.name for path in (tmp_path / "books").iterdir()] == ["a.pdf"]
+
+
+@pytest.mark.asyncio
+async def test_local_storage_open_read_raises_for_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(StorageFileNotFoundError):
+        async with LocalStorage(str(tmp_path)).open_read("missing.pdf"):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_stream_upload_switches_to_multipart_past_one_part() -> None:
+    small = _FakeS3Client()
+    assert (
+        await upload_object_stream(
+            cast("Any", small), bucket="b", key="k", chunks=_chunks(b"abc", b"de"), content_type=None, part_size=8
+        )
+        == 5
+    )
+    assert small.calls == ["put_object"]
+    assert small.body == b"abcde"
+
+    large = _FakeS3Client()
+    assert (
+        await upload_object_stream(
+            cast("Any", large),
+            bucket="b",
+            key="k",
+            chunks=_chunks(b"x" * 6, b"y" * 6, b"z" * 7),
+            content_type="application/pdf",
+            part_size=8,
+        )
+        == 19
+    )
+    assert large.calls == [
+        "create_multipart_upload",
+        "upload_part",
+        "upload_part",
+        "upload_part",
+        "complete_multipart_upload",
+    ]
+    assert large.part_sizes == [8, 8, 3]
+
+
+@pytest.mark.asyncio
+async def test_stream_upload_aborts_multipart_on_failure() -> None:
+    client = _FakeS3Client()
+
+    async def failing_chunks() -> AsyncIterator[bytes]:
+        yield b"x" * 16
+        await asyncio.sleep(0)
+        message = "client disconnected"
+        raise OSError(message)
+
+    with pytest.raises(OSError, match="client disconnected"):
+        await upload_object_stream(
+            cast("Any", client), bucket="b", key="k", chunks=failing_chunks(), content_type=None, part_size=8
+        )
+    assert client.calls[-1] == "abort_multipart_upload"
+
+
+def test_range_header_is_inclusive_of_the_last_byte() -> None:
+    assert range_header(0, None) is None
+    assert range_header(10, None) == "bytes=10-"
+    assert range_header(10, 20) == "bytes=10-19"
@@ -0,0 +1,132 @@
+# ruff: noqa: S101
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, cast
+
+import litellm
+import pytest
+
+from src.ai.mem0_litellm_embedder_patch import Mem0LiteLLMEmbedding
+from src.ai.turn_embeddings import precomputed_embedding, shared_embedding, turn_embedding_scope
+
+
+class _CountingEmbedder:
+    def __init__(self) -> None:
+        self.texts: list[str] = []
+
+    async def embed(self, text: str) -> list[float]:
+        self.texts.append(text)
+        await asyncio.sleep(0.01)
+        return [float(len(text))]
+
+
+async def _embed(embedder: _CountingEmbedder, text: str, *, model: str = "m") -> list[float]:
+    return await shared_embedding(model=model, dimensions=3, text=text, compute=lambda: embedder.embed(text))
+
+
+@pytest.mark.asyncio
+async def test_scope_computes_each_distinct_embedding_once() -> None:
+    embedder = _CountingEmbedder()
+
+    with turn_embedding_scope("test") as turn:
+        first = await asyncio.gather(_embed(embedder, "hello"), _embed(embedder, "hello"), _embed(embedder, "hi"))
+        again = await _embed(embedder, "hello")
+        other_model = await _embed(embedder, "hello", model="other")
+
+    assert first == [[5.0], [5.0], [2.0]]
+    assert again == [5.0]
+    assert other_model == [5.0]
+    assert sorted(embedder.texts) == ["hello", "hello", "hi"]
+    assert (turn.requested, turn.computed) == (5, 3)
+
+
+@pytest.mark.asyncio
+async def test_without_scope_every_call_computes() -> None:
+    embedder = _CountingEmbedder()
+
+    await _embed(embedder, "hello")
+    await _embed(embedder, "hello")
+
+    assert embedder.texts == ["hello", "hello"]
+    assert precomputed_embedding(model="m", dimensions=3, text="hello") is None
+
+
+@pytest.mark.asyncio
+async def test_failed_embedding_is_retried_and_cancelled_waiter_does_not_cancel_others() -> None:
+    calls = 0
+
+    async def flaky() -> list[float]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        if calls == 1:
+            message = "provider down"
+            raise OSError(message)
+        return [1.0]
+
+    with turn_embedding_scope("test"):
+        with pytest.raises(OSError, match="provider down"):
+            await shared_embedding(model="m", dimensions=None, text="t", compute=flaky)
+
+        impatient = asyncio.create_task(shared_embedding(model="m", dimensions=None, text="t", compute=flaky))
+        patient = asyncio.create_task(shared_embedding(model="m", dimensions=None, text="t", compute=flaky))
+        await asyncio.sleep(0)
+        impatient.cancel()
+
+        assert await patient == [1.0]
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_mem0_search_embedding_reuses_vector_from_the_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    sync_calls: list[object] = []
+    async_calls: list[object] = []
+
+    async def fake_aembedding(**kwargs: object) -> object:
+        await asyncio.sleep(0)
+        async_calls.append(kwargs["input"])
+        return SimpleNamespace(data=[{"embedding": [0.5, 0.25]}])
+
+    monkeypatch.setattr(litellm, "aembedding", fake_aembedding)
+    monkeypatch.setattr(litellm, "embedding", lambda **kwargs: sync_calls.append(kwargs["input"]))
+    embedder = Mem0LiteLLMEmbedding(cast("Any", SimpleNamespace(model="openai/e", embedding_dims=None)))
+
+    with turn_embedding_scope("test") as turn:
+        assert await embedder.aembed("what is\nentropy?") == [0.5, 0.25]
+        threaded = await asyncio.to_thread(embedder.embed, "what is\nentropy?", "search")
+
+    assert threaded == [0.5, 0.25]
+    assert async_calls == [["what is entropy?"]]
+    assert sync_calls == []
+    # mem0 alone needs one embedding either way: nothing was saved.
+    assert (turn.requested, turn.computed) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_mem0_shares_the_rag_query_embedding_only_for_the_same_model_and_dimensions(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def fake_aembedding(**_kwargs: object) -> object:
+        await asyncio.sleep(0)
+        return SimpleNamespace(data=[{"embedding": [9.0]}])
+
+    monkeypatch.setattr(litellm, "aembedding", fake_aembedding)
+    rag = _CountingEmbedder()
+    matching = Mem0LiteLLMEmbedding(cast("Any", SimpleNamespace(model="m", embedding_dims=3)))
+    other_dims = Mem0LiteLLMEmbedding(cast("Any", SimpleNamespace(model="m", embedding_dims=8)))
+
+    with turn_embedding_scope("test") as turn:
+        # VectorRAG embeds the raw message; mem0 cleans newlines first.
+        assert await _embed(rag, "what is\nentropy? ") == [17.0]
+        assert await matching.aembed("what is\nentropy? ") == [17.0]
+        assert await other_dims.aembed("what is\nentropy? ") == [9.0]
+
+    assert (turn.requested, turn.computed) == (3, 2)
+
+
+def test_precomputed_embedding_miss_counts_as_a_computed_embedding() -> None:
+    with turn_embedding_scope("test") as turn:
+        assert precomputed_embedding(model="m", dimensions=3, text="uncached") is None
+
+    assert (turn.requested, turn.computed) == (1, 1)